@@ -54,6 +54,20 @@ class JarvisStorage:
                     )
                 """)
 
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS reminders (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        due REAL NOT NULL,  -- epoch seconds
+                        text TEXT NOT NULL,
+                        session_id TEXT,
+                        created_at TEXT NOT NULL,
+                        fired_at REAL
+                    )
+                """)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_reminders_pending ON reminders(due) WHERE fired_at IS NULL"
+                )
+
                 conn.commit()
 
     def save_conversation(self, user_input: str, response: str, source: str = "unknown"):
@@ -166,6 +180,52 @@ class JarvisStorage:
             for row in rows
         ]
 
+    def save_reminders(self, reminders: List[tuple]) -> List[int]:
+        """Save reminders given as (due, text, session_id) tuples in one transaction. Returns their ids."""
+        created = datetime.now().isoformat()
+        ids = []
+        with self._lock:
+            with sqlite3.connect(self.db_path) as conn:
+                for due, text, session_id in reminders:
+                    cursor = conn.execute(
+                        "INSERT INTO reminders (due, text, session_id, created_at) VALUES (?, ?, ?, ?)",
+                        (due, text, session_id, created)
+                    )
+                    ids.append(cursor.lastrowid)
+                conn.commit()
+        return ids
+
+    def mark_reminders_fired(self, reminder_ids: List[int], fired_at: float):
+        """Mark reminders as delivered."""
+        with self._lock:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "UPDATE reminders SET fired_at = ? WHERE id = ?",
+                    [(fired_at, rid) for rid in reminder_ids]
+                )
+                conn.commit()
+
+    def delete_reminder(self, reminder_id: int) -> bool:
+        """Delete a reminder. Returns True if it existed."""
+        with self._lock:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+                conn.commit()
+                return cursor.rowcount > 0
+
+    def get_pending_reminders(self) -> List[Dict[str, Any]]:
+        """Get reminders not yet delivered, earliest first."""
+        with self._lock:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    "SELECT id, due, text, session_id FROM reminders WHERE fired_at IS NULL ORDER BY due"
+                ).fetchall()
+
+        return [
+            {"id": row[0], "due": row[1], "text": row[2], "session_id": row[3]}
+            for row in rows
+        ]
+
     def get_storage_stats(self) -> Dict[str, Any]:
         """Get storage statistics"""
         with self._lock:
@@ -0,0 +1,294 @@
+# brain/nlu/benchmark.py
+"""
+NLU Benchmark Harness
+Measures per-stage latency, throughput and intent accuracy of the NLU hot path
+against a labelled corpus, so parser speedups can be gated on accuracy.
+
+Usage:
+    python -m brain.nlu.benchmark --repeat 5
+    python -m brain.nlu.benchmark --history ~/Desktop/JarvisData/logs/commands_history.jsonl
+    python -m brain.nlu.benchmark --save baseline.json
+    python -m brain.nlu.benchmark --baseline baseline.json   # exit 1 on accuracy regression
+"""
+import json
+import math
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from brain.nlu.soft_phrases import SOFT_PHRASES
+
+
+STAGES = ("normalize", "entities", "intent", "alternatives", "pipeline")
+
+# Literal alternatives inside a skill regex, e.g. r"\b(hora|time|que hora)\b"
+_LITERAL_ALT = re.compile(r"^[\w\sáéíóúñü|]+$", re.IGNORECASE)
+
+
+class _NullEventBus:
+    """EventBus stand-in so pipeline timings exclude event queueing"""
+
+    def emit(self, event_type, data=None):
+        pass
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile over an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(q / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def _literal_phrases(pattern: str) -> List[str]:
+    """Extract plain-word alternatives from a simple skill regex"""
+    body = pattern.replace(r"\b", "").strip()
+    if body.startswith("(") and body.endswith(")"):
+        body = body[1:-1]
+    if not body or not _LITERAL_ALT.match(body):
+        return []
+    return [alt.strip() for alt in body.split("|") if alt.strip()]
+
+
+def load_corpus(skills_registry: Optional[Dict] = None,
+                history_path: Optional[str] = None,
+                history_limit: int = 1000) -> List[Tuple[str, str, str]]:
+    """
+    Build labelled corpus of (text, expected_intent, source) tuples.
+
+    Sources:
+    - SOFT_PHRASES (only intents present in the registry, if one is given)
+    - literal alternatives in skill `patterns`
+    - commands_history.jsonl (optional; labels are the intents logged at the time)
+    """
+    corpus = []
+    seen = set()
+
+    def _add(text, intent, source):
+        key = (text.lower(), intent)
+        if text and key not in seen:
+            seen.add(key)
+            corpus.append((text, intent, source))
+
+    for intent, phrases in SOFT_PHRASES.items():
+        if skills_registry is not None and intent not in skills_registry:
+            continue
+        for phrase in phrases:
+            _add(phrase, intent, "soft_phrases")
+
+    for intent, skill in (skills_registry or {}).items():
+        for pattern in getattr(skill, "patterns", None) or []:
+            for phrase in _literal_phrases(pattern):
+                _add(phrase, intent, "patterns")
+
+    if history_path and os.path.exists(history_path):
+        loaded = 0
+        with open(history_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if loaded >= history_limit:
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                command, intent = entry.get("command"), entry.get("intent")
+                if command and intent and intent != "unknown":
+                    _add(command, intent, "history")
+                    loaded += 1
+
+    return corpus
+
+
+def build_pipeline(skills_registry: Optional[Dict] = None):
+    """
+    Build a standalone NLUPipeline without booting JarvisCore.
+
+    By default the registry is the skill manifest, same as JarvisCore's: the
+    NLU only reads `patterns` / `entity_hints`, so no skill is imported.
+    """
+    import system.core  # noqa: F401 - engine must load before brain.nlu.pipeline (import cycle)
+    from brain.nlu.pipeline import NLUPipeline
+    from brain.memory.context import ContextManager
+    from brain.memory.storage import JarvisStorage
+
+    from skills.actions.manifest import lazy_registry
+
+    if skills_registry is None:
+        skills_registry = lazy_registry()
+
+    return NLUPipeline(skills_registry, context_manager=ContextManager(JarvisStorage(":memory:")))
+
+
+class NLUBenchmark:
+    """
+    Runs every corpus input through each NLU stage in isolation and through
+    the full pipeline, collecting latencies and intent predictions.
+    """
+
+    def __init__(self, pipeline, corpus: List[Tuple[str, str, str]]):
+        self.pipeline = pipeline
+        self.corpus = corpus
+        self._bus = _NullEventBus()
+
+    def run(self, repeat: int = 3, warmup: int = 1) -> Dict:
+        """Execute the benchmark and return a JSON-serialisable report"""
+        for _ in range(warmup):
+            self._pass(record=False)
+
+        samples = {stage: [] for stage in STAGES}
+        predictions = []
+        for i in range(repeat):
+            stage_times, preds = self._pass(record=True)
+            for stage, values in stage_times.items():
+                samples[stage].extend(values)
+            if i == 0:
+                predictions = preds
+
+        return self._report(samples, predictions, repeat)
+
+    def _pass(self, record: bool):
+        p = self.pipeline
+        clock = time.perf_counter
+        times = {stage: [] for stage in STAGES}
+        preds = []
+
+        for text, expected, source in self.corpus:
+            t0 = clock()
+            clean = p.norm.run(text)
+            t1 = clock()
+            ent = p.entities.extract(clean)
+            t2 = clock()
+            intent, _ = p.intent.parse_with_confidence(clean, ent)
+            t3 = clock()
+            p.intent.get_alternatives(clean, ent, top_n=2)
+            t4 = clock()
+            try:
+                result = p.process(text, self._bus)
+                predicted = result.intent if result else "unknown"
+            except Exception:
+                predicted = "error"
+            t5 = clock()
+
+            if record:
+                times["normalize"].append(t1 - t0)
+                times["entities"].append(t2 - t1)
+                times["intent"].append(t3 - t2)
+                times["alternatives"].append(t4 - t3)
+                times["pipeline"].append(t5 - t4)
+                preds.append((text, expected, predicted, source))
+
+        return times, preds
+
+    def _report(self, samples: Dict[str, List[float]], predictions, repeat: int) -> Dict:
+        stages = {}
+        for stage, values in samples.items():
+            values.sort()
+            total = sum(values)
+            stages[stage] = {
+                "count": len(values),
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "max_ms": (values[-1] * 1000) if values else 0.0,
+                "inputs_per_sec": (len(values) / total) if total > 0 else 0.0,
+            }
+
+        correct = sum(1 for _, expected, predicted, _ in predictions if expected == predicted)
+        by_source = {}
+        by_intent = {}
+        for _, expected, predicted, source in predictions:
+            for bucket, key in ((by_source, source), (by_intent, expected)):
+                entry = bucket.setdefault(key, {"total": 0, "correct": 0})
+                entry["total"] += 1
+                entry["correct"] += int(expected == predicted)
+        for bucket in (by_source, by_intent):
+            for entry in bucket.values():
+                entry["accuracy"] = entry["correct"] / entry["total"]
+
+        return {
+            "corpus_size": len(predictions),
+            "repeat": repeat,
+            "stages": stages,
+            "accuracy": (correct / len(predictions)) if predictions else 0.0,
+            "accuracy_by_source": by_source,
+            "accuracy_by_intent": by_intent,
+            "misses": [
+                {"text": text, "expected": expected, "predicted": predicted}
+                for text, expected, predicted, _ in predictions if expected != predicted
+            ],
+        }
+
+
+def check_regression(baseline: Dict, report: Dict, tolerance: float = 0.0) -> List[str]:
+    """
+    Compare a report against a saved baseline.
+
+    Returns a list of human-readable regressions (empty means the gate passes).
+    Only accuracy is gated; latency is reported but machine-dependent.
+    """
+    problems = []
+    if report["accuracy"] + tolerance < baseline.get("accuracy", 0.0):
+        problems.append(
+            f"accuracy {report['accuracy']:.3f} < baseline {baseline['accuracy']:.3f}"
+        )
+    for intent, base in baseline.get("accuracy_by_intent", {}).items():
+        cur = report["accuracy_by_intent"].get(intent)
+        if cur and cur["accuracy"] + tolerance < base["accuracy"]:
+            problems.append(
+                f"{intent}: accuracy {cur['accuracy']:.3f} < baseline {base['accuracy']:.3f}"
+            )
+    return problems
+
+
+def format_report(report: Dict) -> str:
+    """Render report as a fixed-width table"""
+    lines = [
+        f"NLU benchmark: {report['corpus_size']} inputs x {report['repeat']} runs",
+        f"{'stage':<14}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'inputs/s':>12}",
+    ]
+    for stage in STAGES:
+        s = report["stages"][stage]
+        lines.append(
+            f"{stage:<14}{s['p50_ms']:>10.3f}{s['p95_ms']:>10.3f}{s['p99_ms']:>10.3f}"
+            f"{s['max_ms']:>10.3f}{s['inputs_per_sec']:>12.0f}"
+        )
+    lines.append(f"intent accuracy: {report['accuracy']:.1%}")
+    for source, entry in sorted(report["accuracy_by_source"].items()):
+        lines.append(f"  {source:<14}{entry['correct']:>5}/{entry['total']:<5} {entry['accuracy']:.1%}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the Jarvis NLU pipeline")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--history", help="commands_history.jsonl to add to the corpus")
+    parser.add_argument("--history-limit", type=int, default=1000)
+    parser.add_argument("--save", help="write report JSON (use as future baseline)")
+    parser.add_argument("--baseline", help="baseline report JSON; exit 1 on accuracy regression")
+    parser.add_argument("--tolerance", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    pipeline = build_pipeline()
+    corpus = load_corpus(pipeline.skills_registry, args.history, args.history_limit)
+    report = NLUBenchmark(pipeline, corpus).run(repeat=args.repeat)
+    print(format_report(report))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            problems = check_regression(json.load(f), report, args.tolerance)
+        for p in problems:
+            print(f"[REGRESSION] {p}")
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,7 +34,7 @@ class EntityExtractor:
         self.regex = {
             "time": r"\b(\d{1,2}(:\d{2})?\s*(am|pm)?)\b",
             "date": r"\b(\d{1,2}/\d{1,2}(/\d{2,4})?|hoy|mañana|ma[ñn]ana|pasado mañana)\b",
-            "duration": r"\b(en|dentro de)\s+(\d{1,3})\s*(minutos?|min|horas?|hs|h)\b",
+            "duration": r"\b((?:en|dentro de)\s+\d{1,3}\s*(?:segundos?|seg|minutos?|min|horas?|hs|h|dias?))\b",
             "number": r"\b\d+\b",
             "file": r"\b([a-z0-9_\-]+\.(txt|pdf|docx?|xlsx?|py|js|json|md))\b",
             "path": r"\b([a-z]:[\\\/][^\s]+|\/[^\s]+)\b"
@@ -108,15 +108,16 @@ class IntentParser:
         if entities.get("file") or entities.get("path"):
             return "search_file", 0.9
         
+        # before time/date: "en 10 minutos" also matches the time regex
+        if entities.get("duration"):
+            return "reminder", 0.85
+        
         if entities.get("time") or entities.get("date"):
             return "schedule", 0.85
         
         if entities.get("note_content"):
             return "create_note", 0.9
         
-        if entities.get("number") and entities.get("duration"):
-            return "reminder", 0.8
-        
         return None, 0.0
     
     def _match_patterns(self, text):
@@ -2,6 +2,7 @@
 """
 NLU Pipeline v0.0.4 - Enhanced with confidence scores, tracing, error handling, and context awareness
 """
+import time
 import traceback
 from typing import Dict, List, Optional, Tuple
 from brain.nlu.normalizer import Normalizer
@@ -9,6 +10,7 @@ from brain.nlu.entities import EntityExtractor
 from brain.nlu.parser import IntentParser
 from system.core.exceptions import NLUError
 from brain.memory.context import ContextManager
+from monitoring.metrics import HistogramRegistry
 
 
 class NLUResult:
@@ -23,6 +25,7 @@ class NLUResult:
         self.alternatives = []  # List of (intent, confidence) tuples
         self.trace = []  # Debug trace steps
         self.error = None
+        self.session_id = None  # Ordering key for events emitted from this result
         
     def to_dict(self) -> Dict:
         """Convert to dictionary for event emission"""
@@ -33,7 +36,8 @@ class NLUResult:
             "normalized": self.normalized_text,
             "confidence": self.confidence,
             "alternatives": self.alternatives,
-            "trace": self.trace if self.trace else None
+            "trace": self.trace if self.trace else None,
+            "session_id": self.session_id
         }
 
 
@@ -50,6 +54,7 @@ class NLUPipeline:
         self.skills_registry = skills_registry
         self.confidence_threshold = 0.5  # Minimum confidence for intent recognition
         self.context = context_manager or ContextManager()  # Always use context
+        self.latency = HistogramRegistry()  # per-stage latency: normalize/entities/intent/alternatives/context/total
 
     def _log(self, *msg):
         """Log debug messages if debug mode enabled"""
@@ -65,13 +70,14 @@ class NLUPipeline:
         result.trace.append(trace_entry)
         self._log(f"TRACE[{step}]: {details}")
 
-    def process(self, text: str, eventbus) -> Optional[NLUResult]:
+    def process(self, text: str, eventbus, session_id: Optional[str] = None) -> Optional[NLUResult]:
         """
         Process text through NLU pipeline with confidence scoring and context awareness
         
         Args:
             text: Input text to process
             eventbus: Event bus for emitting results
+            session_id: Session the input belongs to (keeps its events ordered)
             
         Returns:
             NLUResult object with intent, entities, and confidence
@@ -82,6 +88,10 @@ class NLUPipeline:
             raw_text=text.strip(),
             normalized_text=""
         )
+        result.session_id = session_id
+        clock = time.perf_counter
+        record = self.latency.record
+        started = clock()
         
         try:
             raw = text.strip()
@@ -92,7 +102,9 @@ class NLUPipeline:
 
             # Step 1: Normalization
             try:
+                t0 = clock()
                 clean = self.norm.run(raw)
+                record("normalize", (clock() - t0) * 1000)
                 result.normalized_text = clean
                 self._trace(result, "normalize", f"'{raw}' → '{clean}'")
             except Exception as e:
@@ -102,14 +114,17 @@ class NLUPipeline:
 
             # Step 2: Entity Extraction
             try:
+                t0 = clock()
                 ent = self.entities.extract(clean)
+                record("entities", (clock() - t0) * 1000)
                 result.entities = ent
                 self._trace(result, "entities", f"Found {len(ent)} entities: {list(ent.keys())}")
                 
                 eventbus.emit("nlu.entities.detected", {
                     "raw": raw,
                     "normalized": clean,
-                    "entities": ent
+                    "entities": ent,
+                    "session_id": session_id
                 })
             except Exception as e:
                 result.error = f"Entity extraction failed: {str(e)}"
@@ -119,7 +134,9 @@ class NLUPipeline:
 
             # Step 3: Intent Parsing with Confidence
             try:
+                t0 = clock()
                 intent_name, confidence = self.intent.parse_with_confidence(clean, ent)
+                record("intent", (clock() - t0) * 1000)
                 result.intent = intent_name
                 result.confidence = confidence
                 
@@ -127,7 +144,9 @@ class NLUPipeline:
                 
                 # Get alternative intents if confidence is low
                 if confidence < 0.8:
+                    t0 = clock()
                     alternatives = self.intent.get_alternatives(clean, ent, top_n=2)
+                    record("alternatives", (clock() - t0) * 1000)
                     result.alternatives = alternatives
                     self._trace(result, "alternatives", f"Alternatives: {alternatives}")
                 
@@ -140,7 +159,9 @@ class NLUPipeline:
 
             # Step 4: Store in context for future reference
             try:
+                t0 = clock()
                 self.context.add_intent(result.intent, result.confidence, result.entities)
+                record("context", (clock() - t0) * 1000)
                 self._trace(result, "context", f"Stored in context manager")
             except Exception as e:
                 # Log but don't fail on context storage
@@ -148,6 +169,7 @@ class NLUPipeline:
             
             # Emit NLU intent event
             eventbus.emit("nlu.intent", result.to_dict())
+            record("total", (clock() - started) * 1000)
             
             return result
 
@@ -156,7 +178,8 @@ class NLUPipeline:
             eventbus.emit("nlu.error", {
                 "error": result.error,
                 "text": text,
-                "trace": result.trace
+                "trace": result.trace,
+                "session_id": session_id
             })
             raise
         except Exception as e:
@@ -171,6 +194,7 @@ class NLUPipeline:
                 "error": result.error,
                 "text": text,
                 "trace": result.trace,
-                "traceback": traceback.format_exc()
+                "traceback": traceback.format_exc(),
+                "session_id": session_id
             })
             raise NLUError(result.error, {"input": text})
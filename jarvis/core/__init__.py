@@ -11,6 +11,7 @@ from .lifecycle import (
     RuntimeState,
     EventBus,
     EventExecutor,
+    AsyncEventBus,
     Scheduler,
     IOChannel,
     load_consent,
@@ -28,6 +29,7 @@ __all__ = [
     "RuntimeState",
     "EventBus",
     "EventExecutor",
+    "AsyncEventBus",
     "Scheduler",
     "IOChannel",
     "load_consent",
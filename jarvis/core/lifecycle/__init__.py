@@ -2,7 +2,7 @@
 """Lifecycle management for JarvisAI core"""
 
 from .boot import Initializer, Diagnostics, ModuleLoader
-from .runtime import RuntimeState, EventBus, EventExecutor, Scheduler, IOChannel
+from .runtime import RuntimeState, EventBus, EventExecutor, AsyncEventBus, Scheduler, IOChannel
 from .consent import load_consent, save_consent, get_or_request_data_collection_consent
 
 __all__ = [
@@ -12,6 +12,7 @@ __all__ = [
     "RuntimeState",
     "EventBus",
     "EventExecutor",
+    "AsyncEventBus",
     "Scheduler",
     "IOChannel",
     "load_consent",
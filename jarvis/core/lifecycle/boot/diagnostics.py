@@ -121,12 +121,18 @@ class Diagnostics:
             if not eb:
                 return False, "Event bus not initialized"
             
-            # Test start/stop cycle if needed
+            # Round-trip a probe event through the bus (starting it if needed)
             was_started = getattr(eb, "_started", False)
+            probe = lambda event: eb.emit("diagnostics.pong", {"ok": True})
+            eb.subscribe("diagnostics.ping", probe)
             if not was_started:
                 eb.start()
-                time.sleep(0.01)
-                eb.stop()
+            try:
+                eb.request("diagnostics.ping", {}, timeout=1.0, response="diagnostics.pong").result(timeout=2.0)
+            finally:
+                eb.unsubscribe("diagnostics.ping", probe)
+                if not was_started:
+                    eb.stop()
             
             return True, "Event bus operational"
         except Exception as e:
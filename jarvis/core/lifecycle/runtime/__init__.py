@@ -3,7 +3,8 @@
 
 from .state import RuntimeState
 from .events import EventBus, EventExecutor
+from .async_events import AsyncEventBus
 from .scheduler import Scheduler
 from .io import IOChannel
 
-__all__ = ["RuntimeState", "EventBus", "EventExecutor", "Scheduler", "IOChannel"]
+__all__ = ["RuntimeState", "EventBus", "EventExecutor", "AsyncEventBus", "Scheduler", "IOChannel"]
@@ -0,0 +1,283 @@
+# core/lifecycle/runtime/async_events.py
+import asyncio
+import contextvars
+import inspect
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from .events import (
+    Event, DEFAULT_PRIORITIES, PRIORITY_NORMAL, PRIORITY_LOW,
+    RESPONSE_EVENT, RequestFuture, resolve_request, _request_timer,
+)
+
+
+# Ordering key and request future of the handler currently running
+# (inherited by nested emits)
+_current_key = contextvars.ContextVar("jarvis_event_key", default=None)
+_current_reply = contextvars.ContextVar("jarvis_event_reply", default=None)
+
+
+class AsyncEventBus:
+    """
+    asyncio-backed EventBus with the same subscribe/emit API as EventBus.
+
+    - One event loop thread runs `async def` handlers as tasks, so I/O-bound
+      handlers cost a coroutine, not a thread.
+    - Sync handlers are offloaded to a bounded ThreadPoolExecutor (`workers`).
+    - At most `max_concurrency` handler invocations run at once.
+    - Keyed events (data["session_id"] / emit(..., key=)) are chained per key:
+      a session's events run in emit order, different sessions overlap.
+      Unkeyed events run their handlers concurrently.
+    - When `capacity` events are pending, LOW priority (telemetry) events are
+      dropped; everything else is admitted and counted as overcommitted.
+    emit() is thread-safe and may be called from any thread or handler.
+    """
+
+    def __init__(self, workers=4, capacity=1000, priorities=None, max_concurrency=256):
+        self.subscribers = {}
+        self.subscriber_keys = {}
+        self.lock = threading.RLock()
+        self.priorities = dict(DEFAULT_PRIORITIES)
+        self.priorities.update(priorities or {})
+        self.capacity = capacity
+        self.max_concurrency = max_concurrency
+        self.workers = workers
+        self.executor = None
+        self.loop = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._started = False
+        self._semaphore = None
+        self._tails = {}
+        self._tasks = set()
+        self._prestart = deque()
+        self.emitted = 0
+        self.skipped = 0
+        self.pending = 0
+        self.high_water = 0
+        self.completed = 0
+        self.errors = 0
+        self.dropped = 0
+        self.overcommitted = 0
+        self._open_requests = 0
+        self.requests = 0
+        self.request_timeouts = 0
+
+    def start(self):
+        with self.lock:
+            if self._started:
+                return
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="AsyncEventSync")
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._run_loop, name="AsyncEventBus", daemon=True)
+            self._thread.start()
+            self._ready.wait(timeout=2.0)
+            self._started = True
+            while self._prestart:
+                self.loop.call_soon_threadsafe(self._dispatch, self._prestart.popleft())
+
+    def stop(self, timeout=2.0):
+        with self.lock:
+            if not self._started:
+                return
+            self._started = False
+            loop = self.loop
+        try:
+            asyncio.run_coroutine_threadsafe(self._drain(timeout), loop).result(timeout + 1.0)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=2.0)
+        self.executor.shutdown(wait=True)
+
+    def _run_loop(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    async def _drain(self, timeout):
+        if self._tasks:
+            await asyncio.wait(list(self._tasks), timeout=timeout)
+        for task in list(self._tasks):
+            task.cancel()
+
+    def subscribe(self, event_type, handler, key=None):
+        with self.lock:
+            self.subscribers[event_type] = self.subscribers.get(event_type, ()) + (handler,)
+            if key is not None:
+                self.subscriber_keys[handler] = key
+
+    def unsubscribe(self, event_type, handler):
+        with self.lock:
+            handlers = self.subscribers.get(event_type, ())
+            if handler in handlers:
+                idx = handlers.index(handler)
+                remaining = handlers[:idx] + handlers[idx + 1:]
+                if remaining:
+                    self.subscribers[event_type] = remaining
+                else:
+                    del self.subscribers[event_type]
+
+    def has_subscribers(self, event_type):
+        return bool(self.subscribers.get(event_type))
+
+    def emit(self, event_type, data=None, key=None):
+        self.emitted += 1
+        reply = None
+        if self._open_requests:
+            reply = _current_reply.get()
+            if reply is not None and event_type == reply.response_event:
+                resolve_request(reply, data)
+                reply = None
+        handlers = self.subscribers.get(event_type)
+        if not handlers:
+            self.skipped += 1
+            return
+        if key is None:
+            if type(data) is dict:
+                key = data.get("session_id")
+            if key is None:
+                key = _current_key.get()
+
+        if self.pending >= self.capacity:
+            if self.priorities.get(event_type, PRIORITY_NORMAL) == PRIORITY_LOW:
+                self.dropped += 1
+                return
+            self.overcommitted += 1
+
+        event = Event(event_type, data, handlers, key, reply)
+        loop = self.loop
+        if not self._started or loop is None:
+            self._prestart.append(event)
+            return
+        loop.call_soon_threadsafe(self._dispatch, event)
+
+    def request(self, event_type, data=None, timeout=None, key=None, response=RESPONSE_EVENT):
+        """Same contract as EventBus.request(); see arequest() for coroutines."""
+        with self.replying(timeout, response) as future:
+            self.emit(event_type, data, key)
+        if not future.done() and not self.has_subscribers(event_type):
+            resolve_request(future, error=LookupError(f"no subscribers for {event_type}"))
+        return future
+
+    async def arequest(self, event_type, data=None, timeout=None, key=None, response=RESPONSE_EVENT):
+        return await asyncio.wrap_future(self.request(event_type, data, timeout, key, response))
+
+    @contextmanager
+    def replying(self, timeout=None, response=RESPONSE_EVENT):
+        future = RequestFuture(response)
+        with self.lock:
+            self._open_requests += 1
+            self.requests += 1
+        future.add_done_callback(self._close_request)
+        if timeout is not None:
+            _request_timer.add(timeout, future)
+        token = _current_reply.set(future)
+        try:
+            yield future
+        finally:
+            _current_reply.reset(token)
+
+    def _close_request(self, future):
+        with self.lock:
+            self._open_requests -= 1
+            if not future.cancelled() and isinstance(future.exception(), TimeoutError):
+                self.request_timeouts += 1
+
+    def _dispatch(self, event):
+        # runs on the loop thread (the only writer of `pending`)
+        self.pending += 1
+        if self.pending > self.high_water:
+            self.high_water = self.pending
+        if event.key is not None:
+            prev = self._tails.get(event.key)
+            task = self.loop.create_task(self._run_chained(prev, event))
+            self._tails[event.key] = task
+            task.add_done_callback(lambda t, k=event.key: self._release_tail(k, t))
+        else:
+            task = self.loop.create_task(self._run_handlers(event, concurrent=True))
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _release_tail(self, key, task):
+        if self._tails.get(key) is task:
+            del self._tails[key]
+
+    def _task_done(self, task):
+        self._tasks.discard(task)
+        self.pending -= 1
+        self.completed += 1
+
+    async def _run_chained(self, prev, event):
+        if prev is not None:
+            try:
+                await asyncio.shield(prev)
+            except Exception:
+                pass
+        await self._run_handlers(event, concurrent=False)
+
+    async def _run_handlers(self, event, concurrent):
+        if concurrent and len(event.handlers) > 1:
+            await asyncio.gather(*(self._invoke(h, event) for h in event.handlers))
+        else:
+            for h in event.handlers:
+                await self._invoke(h, event)
+
+    async def _invoke(self, handler, event):
+        async with self._semaphore:
+            token = _current_key.set(event.key)
+            reply_token = _current_reply.set(event.reply)
+            try:
+                if inspect.iscoroutinefunction(handler):
+                    await handler(event)
+                else:
+                    result = await self.loop.run_in_executor(self.executor, self._call_sync, handler, event)
+                    if inspect.isawaitable(result):
+                        await result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                print(f"[AsyncEventBus] handler error: {e}")
+                if event.reply is not None:
+                    resolve_request(event.reply, error=e)
+            finally:
+                _current_reply.reset(reply_token)
+                _current_key.reset(token)
+
+    @staticmethod
+    def _call_sync(handler, event):
+        token = _current_key.set(event.key)
+        reply_token = _current_reply.set(event.reply)
+        try:
+            return handler(event)
+        finally:
+            _current_reply.reset(reply_token)
+            _current_key.reset(token)
+
+    def get_stats(self):
+        return {
+            "backend": "asyncio",
+            "emitted": self.emitted,
+            "skipped_no_subscribers": self.skipped,
+            "queue_depth": self.pending,
+            "inflight": self.pending,
+            "high_water": self.high_water,
+            "completed": self.completed,
+            "dropped": self.dropped,
+            "overcommitted": self.overcommitted,
+            "errors": self.errors,
+            "max_concurrency": self.max_concurrency,
+            "sync_workers": self.workers,
+            "subscribed_types": len(self.subscribers),
+            "requests": self.requests,
+            "open_requests": self._open_requests,
+            "request_timeouts": self.request_timeouts,
+        }
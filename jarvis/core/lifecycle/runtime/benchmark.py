@@ -0,0 +1,244 @@
+# core/lifecycle/runtime/benchmark.py
+"""
+Runtime microbenchmarks
+EventBus: emit() cost and queue traffic for the event sequence of one command,
+and ordered-delivery throughput with 1, 4 and 16 concurrent sessions.
+Timing wheel: insert/cancel cost and idle CPU with 100k pending timers.
+
+Usage:
+    python -m core.lifecycle.runtime.benchmark --commands 20000 --timers 100000
+"""
+import sys
+import time
+
+from core.lifecycle.runtime.events import EventBus
+
+
+# Events emitted while handling one text command (input adapter, NLU, handlers)
+COMMAND_EVENTS = (
+    "input.text",
+    "nlu.entities.detected",
+    "nlu.intent",
+    "jarvis.response",
+    "memory.short_term.updated",
+)
+
+# Subscriptions made by JarvisCore.__init__
+CORE_SUBSCRIPTIONS = (
+    "nlu.intent",
+    "input.text",
+    "input.voice",
+    "jarvis.response",
+    "nlu.intent",
+)
+
+
+def _noop(event):
+    pass
+
+
+def run_emit_benchmark(commands: int = 20000, bus_factory=EventBus) -> dict:
+    """
+    Emit COMMAND_EVENTS `commands` times on a started bus wired like JarvisCore.
+
+    Returns ns per emit (overall, and for an event type nobody subscribes to)
+    and queue pushes per command.
+    """
+    bus = bus_factory(workers=2)
+    for event_type in CORE_SUBSCRIPTIONS:
+        bus.subscribe(event_type, _noop)
+
+    pushes = [0]
+    original_push = bus.executor.push
+
+    def counting_push(event, *args):
+        pushes[0] += 1
+        original_push(event, *args)
+
+    bus.executor.push = counting_push
+    bus.start()
+    try:
+        clock = time.perf_counter
+        start = clock()
+        for _ in range(commands):
+            for event_type in COMMAND_EVENTS:
+                bus.emit(event_type, {"text": "que hora es"})
+        elapsed = clock() - start
+        command_pushes = pushes[0]
+
+        start = clock()
+        for _ in range(commands):
+            bus.emit("nlu.entities.detected", None)
+        unsubscribed_elapsed = clock() - start
+    finally:
+        bus.stop()
+
+    total_emits = commands * len(COMMAND_EVENTS)
+    return {
+        "commands": commands,
+        "emits_per_command": len(COMMAND_EVENTS),
+        "ns_per_emit": elapsed / total_emits * 1e9,
+        "ns_per_unsubscribed_emit": unsubscribed_elapsed / commands * 1e9,
+        "queue_pushes_per_command": command_pushes / commands,
+        "queue_pushes_unsubscribed": pushes[0] - command_pushes,
+    }
+
+
+def run_session_throughput(sessions: int, commands_per_session: int = 50,
+                           handler_ms: float = 2.0, workers: int = 8) -> dict:
+    """
+    Simulate `sessions` clients each sending commands through an
+    nlu.intent -> jarvis.response chain with an I/O-bound (sleeping) handler.
+
+    Returns commands/sec and the number of per-session ordering violations
+    observed at the response handler.
+    """
+    import threading
+
+    bus = EventBus(workers=workers, capacity=100_000)
+    lock = threading.Lock()
+    last_seen = {}
+    violations = [0]
+    done = threading.Event()
+    total = sessions * commands_per_session
+    handled = [0]
+
+    def handle_intent(event):
+        time.sleep(handler_ms / 1000.0)
+        bus.emit("jarvis.response", {"seq": event.data["seq"]})
+
+    def handle_response(event):
+        session, seq = event.key, event.data["seq"]
+        with lock:
+            if seq <= last_seen.get(session, -1):
+                violations[0] += 1
+            last_seen[session] = seq
+            handled[0] += 1
+            if handled[0] == total:
+                done.set()
+
+    bus.subscribe("nlu.intent", handle_intent)
+    bus.subscribe("jarvis.response", handle_response)
+    bus.start()
+    try:
+        start = time.perf_counter()
+        for seq in range(commands_per_session):
+            for s in range(sessions):
+                bus.emit("nlu.intent", {"seq": seq, "session_id": f"session-{s}"})
+        done.wait(60)
+        elapsed = time.perf_counter() - start
+    finally:
+        bus.stop()
+
+    return {
+        "sessions": sessions,
+        "commands": handled[0],
+        "commands_per_sec": handled[0] / elapsed if elapsed > 0 else 0.0,
+        "order_violations": violations[0],
+    }
+
+
+def run_timing_wheel_benchmark(pending: int = 100_000, idle_seconds: float = 2.0,
+                               burst: int = 10_000) -> dict:
+    """
+    Load a WheelTimer with `pending` timers spread over the next 30 days and
+    measure: add/cancel cost, process CPU while idle for `idle_seconds`, and
+    how late a burst of `burst` timers due in one second actually fires.
+    """
+    import random
+    import threading
+
+    from core.lifecycle.runtime.timing_wheel import TimingWheel, WheelTimer
+
+    rng = random.Random(42)
+    now = time.time()
+    dues = [now + 3600 + rng.random() * 30 * 86400 for _ in range(pending)]
+
+    wheel = TimingWheel(1.0, now=now)
+    start = time.perf_counter()
+    for i, due in enumerate(dues):
+        wheel.add(i, due)
+    add_ns = (time.perf_counter() - start) / pending * 1e9
+    start = time.perf_counter()
+    for i in range(0, pending, 2):
+        wheel.cancel(i)
+    cancel_ns = (time.perf_counter() - start) / (pending // 2) * 1e9
+
+    fired_at = {}
+    done = threading.Event()
+
+    def on_expired(expired):
+        t = time.time()
+        for key, due in expired:
+            fired_at[key] = t - due
+        if len(fired_at) >= burst:
+            done.set()
+
+    timer = WheelTimer(on_expired, tick=1.0, name="WheelBenchmark")
+    timer.schedule_many((("idle", i), due, due) for i, due in enumerate(dues))
+    timer.start()
+    try:
+        time.sleep(0.2)  # let the thread settle into its long wait
+        wakeups = timer.wakeups
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        time.sleep(idle_seconds)
+        idle_cpu = time.process_time() - cpu_start
+        idle_wall = time.perf_counter() - wall_start
+        idle_wakeups = timer.wakeups - wakeups
+
+        due = time.time() + 1.0
+        timer.schedule_many((("burst", i), due, due) for i in range(burst))
+        done.wait(5.0)
+    finally:
+        timer.stop()
+
+    lateness = sorted(fired_at.values())
+    return {
+        "pending": pending,
+        "add_ns": add_ns,
+        "cancel_ns": cancel_ns,
+        "idle_cpu_percent": idle_cpu / idle_wall * 100,
+        "idle_wakeups": idle_wakeups,
+        "burst": burst,
+        "burst_fired": len(lateness),
+        "burst_lateness_ms_max": lateness[-1] * 1000 if lateness else None,
+    }
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="EventBus emit microbenchmark")
+    parser.add_argument("--commands", type=int, default=20000)
+    parser.add_argument("--capacity", type=int, default=1_000_000,
+                        help="lane capacity; keep large to time emit() rather than backpressure")
+    parser.add_argument("--timers", type=int, default=100_000,
+                        help="pending timers for the timing wheel benchmark")
+    args = parser.parse_args(argv)
+
+    r = run_emit_benchmark(
+        args.commands, lambda workers: EventBus(workers=workers, capacity=args.capacity)
+    )
+    print(f"EventBus emit: {r['commands']} commands x {r['emits_per_command']} events")
+    print(f"  ns/emit (command mix):      {r['ns_per_emit']:.0f}")
+    print(f"  ns/emit (no subscribers):   {r['ns_per_unsubscribed_emit']:.0f}")
+    print(f"  queue pushes per command:   {r['queue_pushes_per_command']:.2f}")
+
+    print("Per-session ordered delivery (2ms I/O handler, 8 workers):")
+    for sessions in (1, 4, 16):
+        t = run_session_throughput(sessions)
+        print(f"  {sessions:>2} sessions: {t['commands_per_sec']:>8.0f} commands/s, "
+              f"{t['order_violations']} ordering violations")
+
+    w = run_timing_wheel_benchmark(args.timers)
+    print(f"Timing wheel: {w['pending']} pending timers")
+    print(f"  add / cancel:               {w['add_ns']:.0f} / {w['cancel_ns']:.0f} ns")
+    print(f"  idle CPU:                   {w['idle_cpu_percent']:.3f}% ({w['idle_wakeups']} wakeups)")
+    late = w["burst_lateness_ms_max"]
+    print(f"  burst of {w['burst']} due together: {w['burst_fired']} fired, "
+          f"max {'n/a' if late is None else f'{late:.0f}ms'} late")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,59 +1,408 @@
 # core/lifecycle/runtime/events.py
+import asyncio
+import heapq
+import inspect
+import itertools
 import threading
-from queue import Queue
-from concurrent.futures import ThreadPoolExecutor
+import time
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+from contextlib import contextmanager
 
 
-class EventExecutor:
-    def __init__(self, workers=4):
-        self.queue = Queue()
-        self.pool = ThreadPoolExecutor(max_workers=workers)
+class Event:
+    """Queued event. Supports dict-style `.get()` / `[]` for existing handlers."""
+    __slots__ = ("type", "data", "handlers", "key", "timestamp", "reply")
+
+    def __init__(self, event_type, data, handlers, key=None, reply=None):
+        self.type = event_type
+        self.data = data
+        self.handlers = handlers
+        self.key = key
+        self.timestamp = time.time()
+        # RequestFuture of the request() this event descends from, if any
+        self.reply = reply
+
+    def get(self, key, default=None):
+        if key in Event.__slots__:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key):
+        if key in Event.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __repr__(self):
+        return f"Event({self.type!r}, handlers={len(self.handlers)})"
+
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_COALESCE = "coalesce"
+
+# User-facing events jump ahead of telemetry; unlisted types are NORMAL
+DEFAULT_PRIORITIES = {
+    "jarvis.response": PRIORITY_HIGH,
+    "input.text": PRIORITY_HIGH,
+    "input.voice": PRIORITY_HIGH,
+    "nlu.entities.detected": PRIORITY_LOW,
+    "memory.short_term.updated": PRIORITY_LOW,
+}
+
+DEFAULT_OVERFLOW = {
+    PRIORITY_HIGH: OVERFLOW_BLOCK,
+    PRIORITY_NORMAL: OVERFLOW_BLOCK,
+    PRIORITY_LOW: OVERFLOW_COALESCE,
+}
+
+RESPONSE_EVENT = "jarvis.response"
+
+
+class RequestFuture(Future):
+    """Future returned by EventBus.request(); resolved by the first `response_event`."""
+
+    def __init__(self, response_event=RESPONSE_EVENT):
+        super().__init__()
+        self.response_event = response_event
+
+
+def resolve_request(future, result=None, error=None):
+    """Complete a request future once; later responses/errors are ignored."""
+    if future.done():
+        return
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class _RequestTimer:
+    """Single daemon thread that fails request futures whose deadline passed."""
+
+    def __init__(self):
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
         self._thread = None
+
+    def add(self, timeout, future):
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic() + timeout, next(self._seq), future, timeout))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="EventRequestTimer", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                deadline, _, future, timeout = self._heap[0]
+                if future.done():
+                    heapq.heappop(self._heap)
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                heapq.heappop(self._heap)
+            resolve_request(future, error=TimeoutError(
+                f"no {future.response_event} within {timeout}s"
+            ))
+
+
+_request_timer = _RequestTimer()
+
+
+_LANE_NAMES = {PRIORITY_HIGH: "high", PRIORITY_NORMAL: "normal", PRIORITY_LOW: "low"}
+LANE_PRIORITIES = {name: p for p, name in _LANE_NAMES.items()}
+
+
+class _Lane:
+    __slots__ = ("priority", "capacity", "policy", "items",
+                 "dropped", "coalesced", "blocked", "overcommitted", "high_water")
+
+    def __init__(self, priority, capacity, policy):
+        if policy not in (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_COALESCE):
+            raise ValueError(f"invalid overflow policy: {policy}")
+        self.priority = priority
+        self.capacity = capacity
+        self.policy = policy
+        self.items = deque()
+        self.dropped = 0
+        self.coalesced = 0
+        self.blocked = 0
+        self.overcommitted = 0
+        self.high_water = 0
+
+    def stats(self):
+        return {
+            "depth": len(self.items),
+            "capacity": self.capacity,
+            "policy": self.policy,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "blocked": self.blocked,
+            "overcommitted": self.overcommitted,
+            "high_water": self.high_water,
+        }
+
+
+class _Partition:
+    __slots__ = ("index", "lanes", "cond", "thread", "busy", "processed")
+
+    def __init__(self, index, lock, capacity, policies):
+        self.index = index
+        self.lanes = tuple(
+            _Lane(p, capacity, policies[p]) for p in (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW)
+        )
+        self.cond = threading.Condition(lock)
+        self.thread = None
+        self.busy = False
+        self.processed = 0
+
+    def next_item(self):
+        for lane in self.lanes:
+            if lane.items:
+                return lane.items.popleft()
+        return None
+
+
+class EventExecutor:
+    """
+    Partitioned executor: `workers` partitions, each one thread draining its
+    own priority lanes (HIGH > NORMAL > LOW).
+
+    Routing:
+    - keyed events (session id) run all their handlers, in order, on the
+      partition owning the key, so one session's events of a given priority are
+      handled in emit order while other sessions run in parallel;
+    - unkeyed events fan out per subscriber, each on the partition of its own
+      key (subscribe(..., key=...) or the handler itself), so every subscriber
+      sees events in order and independent subscribers overlap.
+    Events emitted from inside a handler inherit the handler's key, keeping
+    causal chains (nlu.intent -> jarvis.response) on the same partition.
+
+    Each lane is bounded (capacity is split across partitions) with its own
+    overflow policy:
+    - block: producer waits up to block_timeout for room, then the event is dropped.
+      Producers running inside a handler never wait (that could deadlock the
+      workers); they are admitted over capacity and counted as overcommitted.
+    - drop_oldest: the oldest pending event in the lane is discarded.
+    - coalesce: a pending event of the same type is replaced by the new one
+      (falls back to drop_oldest when there is none).
+    """
+
+    def __init__(self, workers=4, capacity=1000, overflow=None, block_timeout=1.0, subscriber_keys=None):
+        policies = dict(DEFAULT_OVERFLOW)
+        for lane, policy in (overflow or {}).items():
+            # accept lane names ("low") as well as priorities (PRIORITY_LOW)
+            policies[LANE_PRIORITIES.get(lane, lane)] = policy
+        workers = max(1, workers)
+        self._lock = threading.Lock()
+        self.partitions = tuple(
+            _Partition(i, self._lock, max(1, capacity // workers), policies) for i in range(workers)
+        )
+        self.block_timeout = block_timeout
+        self.subscriber_keys = subscriber_keys if subscriber_keys is not None else {}
+        self._local = threading.local()
         self._running = threading.Event()
+        self.pushed = 0
 
     def start(self):
         if self._running.is_set():
             return
         self._running.set()
-        self._thread = threading.Thread(target=self._loop, name="EventExecutor", daemon=True)
-        self._thread.start()
+        for part in self.partitions:
+            part.thread = threading.Thread(
+                target=self._work, args=(part,), name=f"EventWorker-{part.index}", daemon=True
+            )
+            part.thread.start()
 
     def stop(self, wait=True):
         if not self._running.is_set():
             return
         self._running.clear()
-        # push sentinel to unblock queue.get
-        self.queue.put(None)
-        if wait and self._thread:
-            self._thread.join(timeout=2.0)
-        self.pool.shutdown(wait=wait)
-
-    def push(self, event):
-        self.queue.put(event)
-
-    def _loop(self):
-        while self._running.is_set():
-            event = self.queue.get()
-            if event is None:
-                # sentinel to stop
-                continue
-            handlers = event.get("handlers", [])
-            for h in handlers:
-                self.pool.submit(self._safe_run, h, event)
+        with self._lock:
+            for part in self.partitions:
+                part.cond.notify_all()
+        if wait:
+            for part in self.partitions:
+                if part.thread:
+                    part.thread.join(timeout=2.0)
+
+    def current_key(self):
+        """Partition key of the handler running on this thread (None outside handlers)"""
+        return getattr(self._local, "key", None)
+
+    def current_reply(self):
+        """Request future inherited by events emitted from this thread"""
+        return getattr(self._local, "reply", None)
+
+    def partition_for(self, key):
+        return self.partitions[hash(key) % len(self.partitions)]
+
+    def push(self, event, priority=PRIORITY_NORMAL):
+        """Route event to its partition(s). Returns False if it was dropped anywhere."""
+        self.pushed += 1
+        if event.key is not None:
+            return self._push_item(self.partition_for(event.key), priority, event, event.handlers)
+        accepted = True
+        for h in event.handlers:
+            part = self.partition_for(self.subscriber_keys.get(h, h))
+            accepted = self._push_item(part, priority, event, (h,)) and accepted
+        return accepted
+
+    def _push_item(self, part, priority, event, handlers):
+        lane = part.lanes[priority]
+        with self._lock:
+            if len(lane.items) >= lane.capacity:
+                admitted = self._overflow(part, lane, event, handlers)
+                if admitted == "coalesced":
+                    return True
+                if not admitted:
+                    return False
+            lane.items.append((event, handlers))
+            if len(lane.items) > lane.high_water:
+                lane.high_water = len(lane.items)
+            part.cond.notify_all()
+        return True
+
+    def _overflow(self, part, lane, event, handlers):
+        # called with self._lock held
+        if lane.policy == OVERFLOW_COALESCE:
+            for i, (pending, pending_handlers) in enumerate(lane.items):
+                if pending.type == event.type and pending_handlers == handlers:
+                    lane.items[i] = (event, handlers)
+                    lane.coalesced += 1
+                    return "coalesced"
+        if lane.policy in (OVERFLOW_COALESCE, OVERFLOW_DROP_OLDEST):
+            lane.items.popleft()
+            lane.dropped += 1
+            return True
+
+        if getattr(self._local, "in_handler", False):
+            lane.overcommitted += 1
+            return True
+        if not self._running.is_set():
+            lane.dropped += 1
+            return False
+        lane.blocked += 1
+        deadline = time.monotonic() + self.block_timeout
+        while len(lane.items) >= lane.capacity and self._running.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            part.cond.wait(remaining)
+        if len(lane.items) >= lane.capacity:
+            lane.dropped += 1
+            return False
+        return True
+
+    def _work(self, part):
+        local = self._local
+        while True:
+            with self._lock:
+                item = part.next_item()
+                while item is None and self._running.is_set():
+                    part.cond.wait()
+                    item = part.next_item()
+                if item is None:
+                    # stopped and drained
+                    return
+                part.busy = True
+                # wake producers blocked on a full lane
+                part.cond.notify_all()
+
+            event, handlers = item
+            local.in_handler = True
+            local.key = event.key
+            local.reply = event.reply
+            try:
+                for h in handlers:
+                    self._safe_run(h, event)
+            finally:
+                local.in_handler = False
+                local.key = None
+                local.reply = None
+                part.busy = False
+                part.processed += 1
 
     def _safe_run(self, handler, event):
         try:
-            handler(event)
+            result = handler(event)
+            if inspect.iscoroutine(result):
+                # async def handler on the threaded bus: run it to completion here
+                asyncio.run(result)
         except Exception as e:
             print(f"[EventExecutor] handler error: {e}")
+            if event.reply is not None:
+                resolve_request(event.reply, error=e)
+
+    def depth(self):
+        with self._lock:
+            return sum(len(lane.items) for part in self.partitions for lane in part.lanes)
+
+    def get_stats(self):
+        with self._lock:
+            lanes = {}
+            for part in self.partitions:
+                for lane in part.lanes:
+                    agg = lanes.setdefault(_LANE_NAMES[lane.priority], {
+                        "depth": 0, "capacity": 0, "policy": lane.policy, "dropped": 0,
+                        "coalesced": 0, "blocked": 0, "overcommitted": 0, "high_water": 0,
+                    })
+                    for field, value in lane.stats().items():
+                        if field == "high_water":
+                            agg[field] = max(agg[field], value)
+                        elif field != "policy":
+                            agg[field] += value
+            partitions = [
+                {
+                    "depth": sum(len(lane.items) for lane in part.lanes),
+                    "busy": part.busy,
+                    "processed": part.processed,
+                }
+                for part in self.partitions
+            ]
+        return {
+            "queue_depth": sum(p["depth"] for p in partitions),
+            "dropped": sum(lane["dropped"] for lane in lanes.values()),
+            "inflight": sum(int(p["busy"]) for p in partitions),
+            "lanes": lanes,
+            "partitions": partitions,
+        }
 
 
 class EventBus:
-    def __init__(self, workers=4):
+    def __init__(self, workers=4, capacity=1000, priorities=None, overflow=None, block_timeout=1.0):
+        # event_type -> tuple of handlers. Tuples are replaced (never mutated)
+        # under the lock, so emit() can read them without locking.
         self.subscribers = {}
         self.lock = threading.RLock()
-        self.executor = EventExecutor(workers=workers)
+        self.priorities = dict(DEFAULT_PRIORITIES)
+        self.priorities.update(priorities or {})
+        # handler -> partition key for unkeyed events (default: the handler itself)
+        self.subscriber_keys = {}
+        self.executor = EventExecutor(
+            workers=workers, capacity=capacity, overflow=overflow, block_timeout=block_timeout,
+            subscriber_keys=self.subscriber_keys
+        )
         self._started = False
+        self.emitted = 0
+        self.skipped = 0
+        self._open_requests = 0
+        self.requests = 0
+        self.request_timeouts = 0
 
     def start(self):
         with self.lock:
@@ -69,23 +418,119 @@ class EventBus:
             self.executor.stop(wait=True)
             self._started = False
 
-    def subscribe(self, event_type, handler):
+    def subscribe(self, event_type, handler, key=None):
         with self.lock:
-            if event_type not in self.subscribers:
-                self.subscribers[event_type] = []
-            self.subscribers[event_type].append(handler)
+            self.subscribers[event_type] = self.subscribers.get(event_type, ()) + (handler,)
+            if key is not None:
+                self.subscriber_keys[handler] = key
 
     def unsubscribe(self, event_type, handler):
         with self.lock:
-            handlers = self.subscribers.get(event_type, [])
+            handlers = self.subscribers.get(event_type, ())
             if handler in handlers:
-                handlers.remove(handler)
+                idx = handlers.index(handler)
+                remaining = handlers[:idx] + handlers[idx + 1:]
+                if remaining:
+                    self.subscribers[event_type] = remaining
+                else:
+                    del self.subscribers[event_type]
+
+    def has_subscribers(self, event_type):
+        return bool(self.subscribers.get(event_type))
+
+    def emit(self, event_type, data=None, key=None):
+        """
+        Queue event for its subscribers.
+
+        key: ordering/partition key. Defaults to data["session_id"], then to
+        the key of the handler currently emitting (so chains stay ordered).
+        """
+        self.emitted += 1
+        reply = None
+        if self._open_requests:
+            reply = self.executor.current_reply()
+            if reply is not None and event_type == reply.response_event:
+                resolve_request(reply, data)
+                reply = None
+        handlers = self.subscribers.get(event_type)
+        if not handlers:
+            # nobody listening: no allocation, no queue traffic
+            self.skipped += 1
+            return
+        if key is None:
+            if type(data) is dict:
+                key = data.get("session_id")
+            if key is None:
+                key = self.executor.current_key()
+        self.executor.push(
+            Event(event_type, data, handlers, key, reply),
+            self.priorities.get(event_type, PRIORITY_NORMAL)
+        )
+
+    def request(self, event_type, data=None, timeout=None, key=None, response=RESPONSE_EVENT):
+        """
+        Emit an event and return a RequestFuture completed with the data of the
+        first `response` event produced by its handler chain (events emitted
+        from handlers inherit the request). Fails with TimeoutError after
+        `timeout` seconds, with LookupError if nobody handles `event_type`,
+        or with the exception of a handler in the chain.
 
-    def emit(self, event_type, data=None):
+        Don't block on .result() inside a handler: the chain may need the
+        partition that handler is occupying.
+        """
+        with self.replying(timeout, response) as future:
+            self.emit(event_type, data, key)
+        if not future.done() and not self.has_subscribers(event_type):
+            resolve_request(future, error=LookupError(f"no subscribers for {event_type}"))
+        return future
+
+    async def arequest(self, event_type, data=None, timeout=None, key=None, response=RESPONSE_EVENT):
+        """Awaitable request() for callers running on an event loop"""
+        return await asyncio.wrap_future(self.request(event_type, data, timeout, key, response))
+
+    @contextmanager
+    def replying(self, timeout=None, response=RESPONSE_EVENT):
+        """
+        Attach a new RequestFuture to every event emitted by this thread inside
+        the block (e.g. input.text plus the inline NLU emits of one command).
+        """
+        future = self._open_request(timeout, response)
+        local = self.executor._local
+        previous = getattr(local, "reply", None)
+        local.reply = future
+        try:
+            yield future
+        finally:
+            local.reply = previous
+
+    def _open_request(self, timeout, response):
+        future = RequestFuture(response)
         with self.lock:
-            handlers = list(self.subscribers.get(event_type, []))
-        self.executor.push({
-            "type": event_type,
-            "data": data,
-            "handlers": handlers
+            self._open_requests += 1
+            self.requests += 1
+        future.add_done_callback(self._close_request)
+        if timeout is not None:
+            _request_timer.add(timeout, future)
+        return future
+
+    def _close_request(self, future):
+        with self.lock:
+            self._open_requests -= 1
+            if not future.cancelled() and isinstance(future.exception(), TimeoutError):
+                self.request_timeouts += 1
+
+    def set_priority(self, event_type, priority):
+        self.priorities[event_type] = priority
+
+    def get_stats(self):
+        stats = self.executor.get_stats()
+        stats.update({
+            "emitted": self.emitted,
+            "skipped_no_subscribers": self.skipped,
+            "enqueued": self.executor.pushed,
+            "subscribed_types": len(self.subscribers),
+            "requests": self.requests,
+            "open_requests": self._open_requests,
+            "request_timeouts": self.request_timeouts,
         })
+        return stats
@@ -2,54 +2,307 @@
 import threading
 import time
 import heapq
+import itertools
+import random
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+
+# What to do when a job is dispatched later than its misfire grace
+MISFIRE_COALESCE = "coalesce"   # run once now, drop the missed slots
+MISFIRE_SKIP = "skip"           # don't run, wait for the next slot
+MISFIRE_CATCH_UP = "catch_up"   # run every missed slot back to back
+
+_MISFIRE_POLICIES = (MISFIRE_COALESCE, MISFIRE_SKIP, MISFIRE_CATCH_UP)
+
+
+class ScheduledJob:
+    """
+    Handle returned by Scheduler.schedule_every / schedule_at.
+
+    Times are time.monotonic(). `grid` is the ideal fixed-rate slot, `due`
+    the slot plus jitter. Lateness = start - due (scheduler + pool delay),
+    drift = start - grid (includes jitter).
+    """
+
+    def __init__(self, scheduler, fn, args, kwargs, interval, first_due,
+                 jitter, misfire, misfire_grace, name):
+        if misfire not in _MISFIRE_POLICIES:
+            raise ValueError(f"invalid misfire policy: {misfire}")
+        self._scheduler = scheduler
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.interval = interval
+        self.jitter = jitter
+        self.misfire = misfire
+        self.misfire_grace = misfire_grace
+        self.name = name or getattr(fn, "__qualname__", repr(fn))
+        self.grid = first_due
+        self.due = first_due
+        self.cancelled = False
+        self.finished = False  # one-shot job that has already fired
+        self.running = False
+        self._deferred = False  # catch-up slot waiting for the current run
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0       # slots dropped by misfire policy
+        self.overlapped = 0    # slots dropped because the previous run was still going
+        self.last_error = None
+        self.last_lateness = 0.0
+        self.max_lateness = 0.0
+        self.total_lateness = 0.0
+        self.last_drift = 0.0
+        self.max_drift = 0.0
+        self.last_duration = 0.0
+        self.total_duration = 0.0
+
+    def cancel(self):
+        """Stop future runs (a run already in progress finishes). Returns False if already cancelled."""
+        if self.cancelled:
+            return False
+        self.cancelled = True
+        self._scheduler._on_cancel(self)
+        return True
+
+    @property
+    def next_run(self):
+        """Wall-clock time of the next run, or None when cancelled/finished"""
+        if self.cancelled or self.finished:
+            return None
+        return time.time() + (self.due - time.monotonic())
+
+    def _advance(self, now):
+        """Move grid/due to the next slot. Returns False for one-shot jobs."""
+        if not self.interval:
+            return False
+        self.grid += self.interval
+        if self.misfire != MISFIRE_CATCH_UP and self.grid <= now:
+            missed = int((now - self.grid) // self.interval) + 1
+            self.skipped += missed
+            self.grid += missed * self.interval
+        self.due = self.grid + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        return True
+
+    def stats(self):
+        done = self.runs or 1
+        return {
+            "name": self.name,
+            "interval": self.interval,
+            "next_run": self.next_run,
+            "running": self.running,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "overlapped": self.overlapped,
+            "last_error": self.last_error,
+            "lateness_ms": {
+                "last": self.last_lateness * 1000,
+                "avg": self.total_lateness / done * 1000,
+                "max": self.max_lateness * 1000,
+            },
+            "drift_ms": {
+                "last": self.last_drift * 1000,
+                "max": self.max_drift * 1000,
+            },
+            "duration_ms": {
+                "last": self.last_duration * 1000,
+                "avg": self.total_duration / done * 1000,
+            },
+        }
+
+    def __repr__(self):
+        return f"ScheduledJob({self.name!r}, interval={self.interval}, cancelled={self.cancelled})"
 
 
 class Scheduler:
-    def __init__(self):
-        self._tasks = []
+    """
+    Timer thread + bounded worker pool.
+
+    The timer thread waits on a condition until the earliest deadline and is
+    woken when an earlier job is added or a job is cancelled; due jobs are
+    handed to `workers` pool threads so a slow job never delays the others.
+    Periodic jobs run at a fixed rate (next slot = previous slot + interval),
+    never overlap themselves, and follow their misfire policy when late.
+    """
+
+    def __init__(self, workers=4):
+        self._tasks = []  # heap of (due, seq, job)
         self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._seq = itertools.count()
+        self._jobs = set()
         self._thread = None
+        self._pool = None
         self._running = threading.Event()
+        self.workers = max(1, workers)
+        self.dispatched = 0
 
     def start(self):
         if self._running.is_set():
             return
         self._running.set()
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="SchedulerWorker")
         self._thread = threading.Thread(target=self._loop, name="Scheduler", daemon=True)
         self._thread.start()
 
-    def stop(self):
+    def stop(self, wait=True):
         if not self._running.is_set():
             return
         self._running.clear()
+        with self._cond:
+            self._cond.notify_all()
         if self._thread:
             self._thread.join(timeout=2.0)
+        if self._pool:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def schedule_every(self, interval_seconds, fn, *args, jitter=0.0, misfire=MISFIRE_COALESCE,
+                       misfire_grace=None, first_run=None, name=None, **kwargs):
+        """
+        Run fn(*args, **kwargs) every `interval_seconds`.
 
-    def schedule_every(self, interval_seconds, fn, *args, **kwargs):
-        run_at = time.time() + interval_seconds
+        jitter: up to this many seconds added to each slot (spreads load).
+        misfire / misfire_grace: policy applied when a run starts more than
+        `misfire_grace` seconds late (default: one interval).
+        first_run: seconds until the first run (default: one interval).
+        """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        delay = interval_seconds if first_run is None else first_run
+        job = ScheduledJob(
+            self, fn, args, kwargs, interval_seconds, time.monotonic() + delay, jitter, misfire,
+            interval_seconds if misfire_grace is None else misfire_grace, name
+        )
+        if jitter:
+            job.due += random.uniform(0, jitter)
+        self._push(job)
+        return job
+
+    def schedule_at(self, when, fn, *args, misfire=MISFIRE_COALESCE, misfire_grace=None, name=None, **kwargs):
+        """
+        Run fn once at wall-clock time `when` (time.time() seconds).
+        With misfire="skip" and a grace, the run is dropped when it can't start in time.
+        """
+        due = time.monotonic() + (when - time.time())
+        job = ScheduledJob(self, fn, args, kwargs, None, due, 0.0, misfire, misfire_grace, name)
+        self._push(job)
+        return job
+
+    def schedule_after(self, delay_seconds, fn, *args, **kwargs):
+        return self.schedule_at(time.time() + delay_seconds, fn, *args, **kwargs)
+
+    def jobs(self):
         with self._lock:
-            heapq.heappush(self._tasks, (run_at, interval_seconds, fn, args, kwargs))
+            return list(self._jobs)
+
+    def _push(self, job):
+        with self._cond:
+            self._jobs.add(job)
+            heapq.heappush(self._tasks, (job.due, next(self._seq), job))
+            if self._tasks[0][2] is job:
+                # new earliest deadline: wake the timer thread
+                self._cond.notify()
+
+    def _on_cancel(self, job):
+        with self._cond:
+            self._jobs.discard(job)
+            # lazily removed from the heap; drop it now if it's at the top
+            while self._tasks and self._tasks[0][2].cancelled:
+                heapq.heappop(self._tasks)
+            self._cond.notify()
 
     def _loop(self):
         while self._running.is_set():
-            now = time.time()
             to_run = []
-            with self._lock:
+            with self._cond:
+                now = time.monotonic()
                 while self._tasks and self._tasks[0][0] <= now:
-                    run_at, interval, fn, args, kwargs = heapq.heappop(self._tasks)
-                    to_run.append((interval, fn, args, kwargs))
-                # next wait time
-                next_wait = None
-                if self._tasks:
-                    next_wait = max(0.0, self._tasks[0][0] - now)
-            for interval, fn, args, kwargs in to_run:
-                try:
-                    fn(*args, **kwargs)
-                except Exception:
-                    traceback.print_exc()
-                # re-schedule
-                if interval and self._running.is_set():
-                    with self._lock:
-                        heapq.heappush(self._tasks, (time.time() + interval, interval, fn, args, kwargs))
-            time.sleep(next_wait if next_wait is not None else 0.1)
+                    _, _, job = heapq.heappop(self._tasks)
+                    if job.cancelled:
+                        continue
+                    to_run.append(job)
+                if not to_run:
+                    timeout = self._tasks[0][0] - now if self._tasks else None
+                    self._cond.wait(timeout)
+                    continue
+
+            for job in to_run:
+                self._dispatch(job, now)
+
+    def _dispatch(self, job, now):
+        due, grid = job.due, job.grid
+        late = now - due
+        run = True
+        # running/_deferred are shared with _run_job's finally on a worker thread
+        with self._lock:
+            if job.running:
+                if job.misfire == MISFIRE_CATCH_UP:
+                    # requeued by _run_job when the current run finishes
+                    job._deferred = True
+                    return
+                job.overlapped += 1
+                run = False
+            elif job.misfire_grace is not None and late > job.misfire_grace and job.misfire == MISFIRE_SKIP:
+                job.skipped += 1
+                run = False
+            if run:
+                job.running = True
+                self.dispatched += 1
+
+        if run:
+            try:
+                self._pool.submit(self._run_job, job, due, grid)
+            except RuntimeError:
+                # pool shut down by stop()
+                with self._lock:
+                    job.running = False
+                return
+
+        if job._advance(now):
+            with self._cond:
+                if not job.cancelled:
+                    heapq.heappush(self._tasks, (job.due, next(self._seq), job))
+        else:
+            job.finished = True
+            with self._cond:
+                self._jobs.discard(job)
+
+    def _run_job(self, job, due, grid):
+        start = time.monotonic()
+        lateness = max(0.0, start - due)
+        drift = start - grid
+        job.last_lateness = lateness
+        job.total_lateness += lateness
+        job.max_lateness = max(job.max_lateness, lateness)
+        job.last_drift = drift
+        job.max_drift = max(job.max_drift, abs(drift))
+        try:
+            job.fn(*job.args, **job.kwargs)
+        except Exception as e:
+            job.failures += 1
+            job.last_error = str(e)
+            traceback.print_exc()
+        finally:
+            job.last_duration = time.monotonic() - start
+            job.total_duration += job.last_duration
+            job.runs += 1
+            with self._lock:
+                job.running = False
+                requeue, job._deferred = job._deferred, False
+            if requeue and not job.cancelled:
+                self._push(job)
+
+    def get_stats(self):
+        with self._lock:
+            jobs = list(self._jobs)
+            pending = sum(1 for _, _, job in self._tasks if not job.cancelled)
+        return {
+            "running": self._running.is_set(),
+            "workers": self.workers,
+            "jobs": len(jobs),
+            "pending": pending,
+            "dispatched": self.dispatched,
+            "active": sum(1 for job in jobs if job.running),
+            "per_job": [job.stats() for job in jobs],
+        }
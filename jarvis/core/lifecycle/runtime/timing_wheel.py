@@ -0,0 +1,238 @@
+# core/lifecycle/runtime/timing_wheel.py
+import math
+import threading
+import time
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel (Varghese & Lauck, as in the classic Linux timer base).
+
+    Level 0 has 2**8 one-tick slots; each further level has 2**6 slots, each
+    covering a whole revolution of the level below. An entry goes to the
+    lowest level whose range covers its delay; whenever level 0 wraps, the
+    matching slot of the next level is cascaded down. Insert and cancel are
+    O(1) (slots are dicts, plus a key -> slot index). advance() visits
+    occupied level-0 slots and cascade points only, skipping empty stretches,
+    so catching up after a long sleep is cheap. With 1s ticks the default
+    levels span ~2 years; later entries are parked in the last slot and
+    re-placed when it cascades.
+
+    Not thread-safe; WheelTimer wraps it with a lock and a thread.
+    """
+
+    def __init__(self, tick=1.0, now=None, levels=(8, 6, 6, 6)):
+        self.tick = tick
+        self.current = int((time.time() if now is None else now) / tick)
+        self._bits = levels
+        self._masks = tuple((1 << b) - 1 for b in levels)
+        shifts, total = [], 0
+        for bits in levels:
+            shifts.append(total)
+            total += bits
+        self._shifts = tuple(shifts)
+        self._limits = tuple(1 << (s + b) for s, b in zip(shifts, levels))
+        self._span = 1 << total
+        self._wheels = [[{} for _ in range(1 << b)] for b in levels]
+        self._where = {}  # key -> (level, slot dict holding it)
+        self._counts = [0] * len(levels)
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, key):
+        return key in self._where
+
+    def add(self, key, when, payload=None):
+        """
+        Schedule `key` to expire at time `when` (same clock as advance), rounded
+        up to the next tick so it never fires early. Replaces an existing key.
+        """
+        if key in self._where:
+            self.cancel(key)
+        self._place(key, math.ceil(when / self.tick), payload)
+
+    def cancel(self, key):
+        entry = self._where.pop(key, None)
+        if entry is None:
+            return False
+        level, slot = entry
+        del slot[key]
+        self._counts[level] -= 1
+        return True
+
+    def _place(self, key, expires, payload):
+        delta = expires - self.current
+        if delta < 0:
+            # overdue: fire on the next tick
+            level = 0
+            slot = self._wheels[0][self.current & self._masks[0]]
+        else:
+            for level, limit in enumerate(self._limits):
+                if delta < limit:
+                    index = (expires >> self._shifts[level]) & self._masks[level]
+                    slot = self._wheels[level][index]
+                    break
+            else:
+                # beyond the last level: park at its far end, re-placed on cascade
+                level = len(self._bits) - 1
+                parked = self.current + self._span - 1
+                slot = self._wheels[level][(parked >> self._shifts[level]) & self._masks[level]]
+        slot[key] = (expires, payload)
+        self._where[key] = (level, slot)
+        self._counts[level] += 1
+
+    def _cascade(self, level, index):
+        slot = self._wheels[level][index]
+        if slot:
+            self._wheels[level][index] = {}
+            self._counts[level] -= len(slot)
+            for key, (expires, payload) in slot.items():
+                self._place(key, expires, payload)
+
+    def advance(self, now=None):
+        """Process every tick up to `now`; returns [(key, payload)] of expired entries."""
+        target = int((time.time() if now is None else now) / self.tick)
+        expired = []
+        wheel0, mask0 = self._wheels[0], self._masks[0]
+        while self.current <= target:
+            index = self.current & mask0
+            if index == 0:
+                for level in range(1, len(self._bits)):
+                    upper = (self.current >> self._shifts[level]) & self._masks[level]
+                    self._cascade(level, upper)
+                    if upper != 0:
+                        break
+            slot = wheel0[index]
+            if slot:
+                wheel0[index] = {}
+                self._counts[0] -= len(slot)
+                for key, (_, payload) in slot.items():
+                    del self._where[key]
+                    expired.append((key, payload))
+            nxt = self._next_event_tick(self.current + 1)
+            self.current = target + 1 if nxt is None or nxt > target else nxt
+        return expired
+
+    def _next_event_tick(self, start):
+        """First tick >= start with work: an occupied level-0 slot or a cascade of an occupied level."""
+        if not self._where:
+            return None
+        mask0 = self._masks[0]
+        wrap = start if start & mask0 == 0 else (start | mask0) + 1
+        if self._counts[0]:
+            wheel0 = self._wheels[0]
+            index = start & mask0
+            for n in range(mask0 + 1 - index):
+                if wheel0[index + n]:
+                    slot_tick = start + n
+                    # upper levels cascade at the wrap: don't skip past it
+                    if len(self._where) > self._counts[0]:
+                        return min(slot_tick, wrap)
+                    return slot_tick
+            return wrap
+        # level 0 empty: jump to where the lowest occupied level cascades next
+        for level in range(1, len(self._bits)):
+            if self._counts[level]:
+                step = 1 << self._shifts[level]
+                return -(-start // step) * step
+        return start
+
+    def ticks_until_next(self):
+        """
+        Ticks from `current` until advance() has work (an occupied level-0
+        slot or a cascade). None when empty. Lets a driver sleep through idle
+        stretches instead of waking every tick.
+        """
+        nxt = self._next_event_tick(self.current)
+        return None if nxt is None else nxt - self.current
+
+
+class WheelTimer:
+    """
+    Thread driving a TimingWheel. Sleeps until the next occupied slot (or
+    indefinitely when empty), so an idle timer costs nothing no matter how
+    many entries it holds. callback(expired) runs on the timer thread with
+    [(key, payload)] for each batch that expires together.
+    """
+
+    def __init__(self, callback, tick=1.0, name="WheelTimer"):
+        self.callback = callback
+        self.wheel = TimingWheel(tick)
+        self.name = name
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = threading.Event()
+        self._wake_at = None
+        self.fired = 0
+        self.wakeups = 0
+
+    def start(self):
+        if self._running.is_set():
+            return
+        self._running.set()
+        self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self._running.is_set():
+            return
+        self._running.clear()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+    def __len__(self):
+        return len(self.wheel)
+
+    def schedule(self, key, when, payload=None):
+        with self._cond:
+            self.wheel.add(key, when, payload)
+            if self._wake_at is None or when < self._wake_at:
+                self._cond.notify()
+
+    def schedule_many(self, items):
+        """items: iterable of (key, when, payload)"""
+        with self._cond:
+            earliest = None
+            for key, when, payload in items:
+                self.wheel.add(key, when, payload)
+                if earliest is None or when < earliest:
+                    earliest = when
+            if earliest is not None and (self._wake_at is None or earliest < self._wake_at):
+                self._cond.notify()
+
+    def cancel(self, key):
+        with self._cond:
+            return self.wheel.cancel(key)
+
+    def _loop(self):
+        while self._running.is_set():
+            with self._cond:
+                expired = self.wheel.advance(time.time())
+                if not expired:
+                    ticks = self.wheel.ticks_until_next()
+                    if ticks is None:
+                        self._wake_at = None
+                        timeout = None
+                    else:
+                        self._wake_at = (self.wheel.current + ticks) * self.wheel.tick
+                        timeout = max(0.0, self._wake_at - time.time())
+                    self._cond.wait(timeout)
+                    self.wakeups += 1
+                    continue
+            self.fired += len(expired)
+            try:
+                self.callback(expired)
+            except Exception as e:
+                print(f"[{self.name}] callback error: {e}")
+
+    def get_stats(self):
+        return {
+            "pending": len(self.wheel),
+            "fired": self.fired,
+            "wakeups": self.wakeups,
+            "next_wake": self._wake_at,
+            "tick": self.wheel.tick,
+        }
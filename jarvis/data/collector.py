@@ -4,7 +4,34 @@ import platform
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from .journal import JournaledState
+from .timeseries import TimeSeriesStore, tiers_for_interval
+
+# Campos numéricos de cada snapshot del sistema (orden fijo en el archivo anillo)
+SYSTEM_FIELDS = ("cpu_percent", "memory_percent", "disk_percent", "running_apps",
+                 "net_bytes_sent", "net_bytes_recv")
+
+_TIER_NAMES = {"1m": "por minuto", "1h": "por hora", "1d": "por día"}
+
+
+def _duration_text(seconds: float) -> str:
+    days = seconds / 86400
+    if days >= 365:
+        return f"{days / 365:g} años" if days >= 730 else "1 año"
+    if days >= 1:
+        return f"{days:g} días" if days >= 2 else "1 día"
+    return f"{seconds / 3600:g} horas"
+
+
+def _retention_text(tiers, interval: float) -> str:
+    """Historia que guarda cada nivel, p. ej. 'raw 30 días; promedios por hora 2 años, por día 10 años'"""
+    raw = [_duration_text(capacity * interval) for _, resolution, capacity in tiers if resolution == 0]
+    averages = [f"{_TIER_NAMES.get(tier, tier)} {_duration_text(capacity * resolution)}"
+                for tier, resolution, capacity in tiers if resolution > 0]
+    text = f"raw {raw[0]}"
+    return text + f"; promedios {', '.join(averages)}" if averages else text
 
 
 class DataCollector:
@@ -13,8 +40,14 @@ class DataCollector:
     TODO en Desktop/JarvisData con README explicativo.
     """
     
-    def __init__(self, consent: bool = True):
+    def __init__(self, consent: bool = True, snapshot_interval: int = 300):
+        """
+        Args:
+            consent: recolectar o no
+            snapshot_interval: segundos entre snapshots del sistema (define los niveles de historia)
+        """
         self.consent = consent
+        self.snapshot_interval = snapshot_interval
         
         # Carpeta en Desktop
         self.data_dir = Path.home() / "Desktop" / "JarvisData"
@@ -25,15 +58,27 @@ class DataCollector:
         
         # Archivos de datos
         self.app_usage_file = self.data_dir / "app_usage.json"
-        self.system_metrics_file = self.data_dir / "system_metrics.json"
+        self.system_metrics_file = self.data_dir / "system_metrics.json"  # formato viejo (se migra)
         self.patterns_file = self.data_dir / "usage_patterns.json"
         
         # Inicializar estructuras
         self._init_data_structures()
+        
+        # Uso de apps: contadores en memoria + journal; app_usage.json se reescribe solo en flush()
+        self.app_usage = JournaledState.shared(self.app_usage_file, dict, self._apply_app_usage)
+        
+        # Métricas del sistema: anillo raw + promedios más gruesos que el muestreo, en JarvisData/metrics
+        self.system_metrics = TimeSeriesStore(self.data_dir / "metrics", "system", SYSTEM_FIELDS,
+                                              tiers_for_interval(snapshot_interval))
+        self._migrate_system_metrics()
+        
+        # cpu_percent(interval=None) mide desde la llamada anterior: la primera marca el inicio
+        psutil.cpu_percent(interval=None)
     
     def _create_transparency_readme(self):
         """Crea README explicando qué datos se recolectan"""
         readme_path = self.data_dir / "README.txt"
+        tiers = tiers_for_interval(self.snapshot_interval)
         
         readme_content = """
 ═══════════════════════════════════════════════════════════════
@@ -50,11 +95,14 @@ Puedes borrar esta carpeta en cualquier momento sin afectar a Jarvis.
    - Apps que abriste via Jarvis
    - Frecuencia de uso
    - Última vez usada
+   - app_usage.json.journal: cambios recientes que todavía no se volcaron al JSON
    → Para: Sugerencias inteligentes ("¿quieres abrir Chrome otra vez?")
 
-2. system_metrics.json
-   - CPU, RAM, Disco (snapshots cada X minutos)
-   - Apps corriendo en background
+2. metrics/system.<nivel>.ring ({tiers})
+   - CPU, RAM, Disco, red (un snapshot cada {interval} segundos)
+   - Cantidad de procesos corriendo
+   - Archivos binarios de tamaño fijo: los puntos más viejos se pisan solos
+     ({retention})
    → Para: Optimizar rendimiento, avisar cuando algo consume mucho
 
 3. usage_patterns.json
@@ -96,9 +144,14 @@ Si quieres ayudar a mejorar Jarvis para todos:
 
 ═══════════════════════════════════════════════════════════════
 
-Fecha de creación: {}
+Fecha de creación: {created}
 Versión de Jarvis: 1.0
-        """.format(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        """.format(
+            created=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            tiers=", ".join(tier for tier, _, _ in tiers),
+            interval=self.snapshot_interval,
+            retention=_retention_text(tiers, self.snapshot_interval)
+        )
         
         with open(readme_path, "w", encoding='utf-8') as f:
             f.write(readme_content)
@@ -109,65 +162,99 @@ Versión de Jarvis: 1.0
             with open(self.app_usage_file, "w") as f:
                 json.dump({}, f)
         
-        if not self.system_metrics_file.exists():
-            with open(self.system_metrics_file, "w") as f:
-                json.dump({"snapshots": []}, f)
-        
         if not self.patterns_file.exists():
             with open(self.patterns_file, "w") as f:
                 json.dump({"patterns": [], "automations": []}, f)
     
+    @staticmethod
+    def _apply_app_usage(apps: Dict, op: Dict):
+        # Valores absolutos: reaplicar el journal sobre un snapshot que ya los tiene no cambia nada
+        apps[op["app"]] = {"count": op["count"], "first_used": op["first_used"], "last_used": op["last_used"]}
+    
     def track_app_usage(self, app_name: str):
-        """Registra uso de app"""
+        """Registra uso de app (en memoria + una línea de journal; el JSON se escribe en flush())"""
         if not self.consent:
             return
         
-        with open(self.app_usage_file, "r+") as f:
-            data = json.load(f)
-            
-            if app_name not in data:
-                data[app_name] = {
-                    "count": 0,
-                    "first_used": datetime.now().isoformat(),
-                    "last_used": None
-                }
-            
-            data[app_name]["count"] += 1
-            data[app_name]["last_used"] = datetime.now().isoformat()
-            
-            f.seek(0)
-            json.dump(data, f, indent=2)
-            f.truncate()
+        now = datetime.now().isoformat()
+        with self.app_usage.lock:
+            current = self.app_usage.state.get(app_name, {"count": 0, "first_used": now})
+            self.app_usage.record({
+                "app": app_name,
+                "count": current["count"] + 1,
+                "first_used": current["first_used"],
+                "last_used": now
+            })
+    
+    def flush(self) -> bool:
+        """Escribe app_usage.json si hubo cambios (job del scheduler y apagado)"""
+        return self.app_usage.flush()
+    
+    def _migrate_system_metrics(self):
+        """Pasa los snapshots de system_metrics.json (formato viejo) a los anillos, una sola vez"""
+        if not self.system_metrics_file.exists():
+            return
+        try:
+            with open(self.system_metrics_file, "r") as f:
+                snapshots = json.load(f).get("snapshots", [])
+            if not self.system_metrics.latest():
+                for snapshot in snapshots:
+                    self.system_metrics.append(
+                        datetime.fromisoformat(snapshot["timestamp"]).timestamp(),
+                        self._snapshot_values(snapshot)
+                    )
+            self.system_metrics_file.rename(self.system_metrics_file.with_suffix(".json.migrated"))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    
+    @staticmethod
+    def _snapshot_values(snapshot: Dict) -> Dict:
+        network = snapshot.get("network_io") or {}
+        return {
+            "cpu_percent": snapshot.get("cpu_percent", 0.0),
+            "memory_percent": snapshot.get("memory_percent", 0.0),
+            "disk_percent": snapshot.get("disk_percent", 0.0),
+            "running_apps": snapshot.get("running_apps", 0),
+            "net_bytes_sent": network.get("bytes_sent", 0),
+            "net_bytes_recv": network.get("bytes_recv", 0),
+        }
     
     def collect_system_snapshot(self) -> Dict:
-        """Recolecta snapshot del sistema"""
+        """Recolecta snapshot del sistema (un registro fijo en el anillo: O(1) sin importar la historia)"""
         if not self.consent:
             return {}
         
+        now = datetime.now()
         snapshot = {
-            "timestamp": datetime.now().isoformat(),
-            "cpu_percent": psutil.cpu_percent(interval=1),
+            "timestamp": now.isoformat(),
+            "cpu_percent": psutil.cpu_percent(interval=None),  # desde el snapshot anterior, sin bloquear
             "memory_percent": psutil.virtual_memory().percent,
             "disk_percent": psutil.disk_usage('/').percent,
             "running_apps": len(psutil.pids()),
             "network_io": dict(psutil.net_io_counters()._asdict())
         }
         
-        # Guardar snapshot
-        with open(self.system_metrics_file, "r+") as f:
-            data = json.load(f)
-            data["snapshots"].append(snapshot)
-            
-            # Mantener solo últimos 1000 snapshots
-            if len(data["snapshots"]) > 1000:
-                data["snapshots"] = data["snapshots"][-1000:]
-            
-            f.seek(0)
-            json.dump(data, f, indent=2)
-            f.truncate()
-        
+        self.system_metrics.append(now.timestamp(), self._snapshot_values(snapshot))
         return snapshot
     
+    def get_system_history(self, tier: str = "raw", since: Optional[datetime] = None,
+                           until: Optional[datetime] = None, fields: Optional[List[str]] = None) -> Dict:
+        """
+        Historia de métricas del sistema de un nivel ("raw", "1h", "1d"; "1m" si el muestreo es < 60 s).
+        Devuelve {"timestamp": array, campo: array} (arrays de NumPy si está instalado).
+        """
+        return self.system_metrics.read(
+            tier,
+            since=since.timestamp() if since else None,
+            until=until.timestamp() if until else None,
+            fields=fields
+        )
+    
+    def close(self):
+        """Escribe el uso de apps pendiente y cierra journal y anillos"""
+        self.app_usage.release()
+        self.system_metrics.close()
+    
     def detect_pattern(self, commands: List[str]) -> Dict:
         """Detecta patrones de uso"""
         if not self.consent or len(commands) < 2:
@@ -204,14 +291,11 @@ Versión de Jarvis: 1.0
         suggestions = []
         
         # Top apps usadas
-        try:
-            with open(self.app_usage_file, "r") as f:
-                apps = json.load(f)
-                top_apps = sorted(apps.items(), key=lambda x: x[1]["count"], reverse=True)[:3]
-                
-                for app, data in top_apps:
-                    suggestions.append(f"App frecuente: {app} (usado {data['count']} veces)")
-        except:
-            pass
+        with self.app_usage.lock:
+            apps = dict(self.app_usage.state)
+        top_apps = sorted(apps.items(), key=lambda x: x[1]["count"], reverse=True)[:3]
+        
+        for app, data in top_apps:
+            suggestions.append(f"App frecuente: {app} (usado {data['count']} veces)")
         
         return suggestions
\ No newline at end of file
@@ -0,0 +1,162 @@
+# system/data/journal.py
+"""
+Estado JSON en memoria con journal append-only.
+
+Cada cambio se aplica en memoria y se agrega como una línea al journal
+(<archivo>.journal): costo O(1) por operación. flush() escribe el estado
+completo a un temporal y lo renombra sobre el archivo (atómico), y recién
+entonces vacía el journal. Al abrir, el journal se vuelve a aplicar sobre
+el último snapshot, así que un crash entre flushes no pierde cambios.
+
+Como un crash entre el rename y el vaciado del journal hace que las
+operaciones se apliquen dos veces, `apply` debe ser idempotente respecto
+del snapshot (p. ej. guardar valores absolutos, o ignorar operaciones con
+un número de secuencia ya incluido).
+
+Varios dueños del mismo archivo (p. ej. dos ContextAwareness) deben usar
+JournaledState.shared(): comparten estado y journal, así ninguno pisa el
+snapshot con una copia vieja ni vacía un journal en el que otro escribe.
+"""
+
+import atexit
+import json
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+
+_shared: "weakref.WeakValueDictionary[str, JournaledState]" = weakref.WeakValueDictionary()
+_shared_lock = threading.Lock()
+
+
+def _close_at_exit(ref):
+    state = ref()
+    if state is not None:
+        try:
+            state.close()
+        except OSError:
+            pass
+
+
+class JournaledState:
+    """Snapshot JSON + journal de operaciones, con flag de sucio"""
+
+    def __init__(self, path, default: Callable[[], Any], apply: Callable[[Any, Dict], None],
+                 indent: int = 2):
+        """
+        Args:
+            path: archivo JSON del snapshot
+            default: fábrica del estado inicial si no hay snapshot (o está corrupto)
+            apply: apply(state, op) aplica una operación al estado en memoria
+            indent: indentación del snapshot (el archivo queda legible)
+        """
+        self.path = Path(path)
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        self.apply = apply
+        self.indent = indent
+        self.dirty = False
+        self.lock = threading.RLock()
+        self._journal = None  # se abre con la primera operación: solo leer no crea archivos
+        self._closed = False
+        self._users = 0
+        self._stats = {"ops": 0, "flushes": 0, "replayed": 0}
+
+        self.state = self._load_snapshot(default)
+        self._replay()
+        atexit.register(_close_at_exit, weakref.ref(self))
+
+    @classmethod
+    def shared(cls, path, default: Callable[[], Any], apply: Callable[[Any, Dict], None],
+               indent: int = 2) -> "JournaledState":
+        """Instancia única por archivo dentro del proceso; cada dueño la suelta con release()"""
+        key = os.path.abspath(path)
+        with _shared_lock:
+            state = _shared.get(key)
+            if state is None or state._closed:
+                state = _shared[key] = cls(path, default, apply, indent)
+            with state.lock:
+                state._users += 1
+            return state
+
+    def release(self) -> None:
+        """Un dueño menos: flush, y cierre cuando se va el último"""
+        with self.lock:
+            self._users -= 1
+            if self._users > 0:
+                self.flush()
+                return
+        self.close()
+
+    def _load_snapshot(self, default):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return default()
+
+    def _replay(self):
+        """Aplica las operaciones del journal posteriores al último snapshot"""
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                op = json.loads(line)
+            except ValueError:
+                continue  # última línea cortada por un crash
+            self.apply(self.state, op)
+            self._stats["replayed"] += 1
+        self.dirty = self._stats["replayed"] > 0
+
+    def record(self, op: Dict) -> None:
+        """Aplica `op` en memoria y la agrega al journal"""
+        with self.lock:
+            self.apply(self.state, op)
+            if not self._closed:
+                if self._journal is None:
+                    self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._journal = open(self.journal_path, "a", encoding="utf-8")
+                self._journal.write(json.dumps(op, ensure_ascii=False, default=str) + "\n")
+                self._journal.flush()
+            self.dirty = True
+            self._stats["ops"] += 1
+
+    def flush(self) -> bool:
+        """Si hay cambios, escribe el snapshot (temporal + rename) y vacía el journal"""
+        with self.lock:
+            if not self.dirty:
+                return False
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.state, f, indent=self.indent, ensure_ascii=False, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            if self._journal is not None:
+                self._journal.truncate(0)
+                self._journal.seek(0)
+            elif self.journal_path.exists():
+                open(self.journal_path, "w").close()
+            self.dirty = False
+            self._stats["flushes"] += 1
+            return True
+
+    def close(self) -> None:
+        """Flush final y cierre del journal"""
+        with self.lock:
+            try:
+                self.flush()
+            finally:
+                self._closed = True
+                if self._journal is not None:
+                    self._journal.close()
+                    self._journal = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {**self._stats, "dirty": self.dirty}
@@ -0,0 +1,287 @@
+# system/data/timeseries.py
+"""
+Series de tiempo numéricas en archivos anillo de registros fijos (mmap).
+
+Cada nivel (raw y promedios de 1 minuto / 1 hora / 1 día, según el
+intervalo de muestreo: ver tiers_for_interval) es un archivo con una cabecera y
+`capacity` registros de float64: [timestamp, campo1, campo2, ...]. Escribir
+un punto pisa el slot más viejo y actualiza la cabecera: O(1) sin importar
+cuánta historia haya. Los niveles agregados guardan el promedio de cada
+intervalo, acumulado en memoria y escrito al cerrarse el intervalo (al
+reabrir, el intervalo en curso se reconstruye desde raw).
+
+read() devuelve arrays de NumPy (o array('d') si NumPy no está instalado).
+"""
+
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+_MAGIC = b"JRING1\0\0"
+_HEADER = struct.Struct("<8sIIQQd")  # magic, campos, reservado, capacidad, escritos (total), resolución
+_HEADER_SIZE = 4096                  # cabecera + nombres de campos (JSON); los registros empiezan alineados
+
+# Niveles agregados posibles: (nombre, resolución en segundos, retención en segundos)
+AGGREGATE_TIERS: Tuple[Tuple[str, int, int], ...] = (
+    ("1m", 60, 30 * 86400),         # 30 días
+    ("1h", 3600, 2 * 365 * 86400),  # 2 años
+    ("1d", 86400, 10 * 365 * 86400),  # 10 años
+)
+RAW_RETENTION = 30 * 86400
+
+
+def tiers_for_interval(interval: float, raw_retention: int = RAW_RETENTION) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Niveles (nombre, resolución, capacidad) para una serie muestreada cada
+    `interval` segundos: raw con `raw_retention` de historia, más cada nivel
+    agregado más grueso que el muestreo (un nivel de 1 minuto sobre
+    snapshots cada 5 minutos sería una copia de raw).
+    """
+    tiers = [("raw", 0, max(1, math.ceil(raw_retention / interval)))]
+    tiers.extend((name, resolution, retention // resolution)
+                 for name, resolution, retention in AGGREGATE_TIERS if resolution > interval)
+    return tuple(tiers)
+
+
+# Snapshots cada 5 minutos: raw (8640 puntos, 30 días), 1h (2 años), 1d (10 años)
+DEFAULT_TIERS = tiers_for_interval(300)
+
+
+class RingFile:
+    """Un archivo anillo: `capacity` registros de (1 + len(fields)) float64"""
+
+    def __init__(self, path, fields: Sequence[str], capacity: int, resolution: int = 0):
+        self.path = Path(path)
+        self.fields = list(fields)
+        self.width = len(self.fields) + 1
+        self.record_size = self.width * 8
+        self.resolution = resolution
+
+        fresh = not self.path.exists() or self.path.stat().st_size < _HEADER_SIZE
+        if fresh:
+            self._create(capacity)
+        self._file = open(self.path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, n_fields, _, self.capacity, self.written, _ = _HEADER.unpack_from(self._map, 0)
+        names = json.loads(bytes(self._map[_HEADER.size:_HEADER_SIZE]).rstrip(b"\0") or b"[]")
+        if magic != _MAGIC or names != self.fields:
+            raise ValueError(f"{self.path.name}: formato o campos distintos ({names} != {self.fields})")
+
+    def _create(self, capacity: int):
+        names = json.dumps(self.fields).encode("utf-8")
+        if _HEADER.size + len(names) > _HEADER_SIZE:
+            raise ValueError("demasiados campos para la cabecera")
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(self.fields), 0, capacity, 0, float(self.resolution)))
+            f.write(names)
+            f.truncate(_HEADER_SIZE + capacity * self.record_size)  # ralo: no ocupa disco hasta escribirse
+        os.replace(tmp, self.path)
+
+    def __len__(self) -> int:
+        return min(self.written, self.capacity)
+
+    def append(self, ts: float, values: Sequence[float]):
+        """Escribe un registro en el slot siguiente (pisa el más viejo si está lleno)"""
+        slot = self.written % self.capacity
+        struct.pack_into(f"<{self.width}d", self._map, _HEADER_SIZE + slot * self.record_size, ts, *values)
+        self.written += 1
+        # La cabecera se actualiza después del registro: un corte a mitad deja el anillo consistente
+        struct.pack_into("<Q", self._map, 24, self.written)
+
+    def last(self) -> Optional[Tuple[float, ...]]:
+        if not self.written:
+            return None
+        slot = (self.written - 1) % self.capacity
+        return struct.unpack_from(f"<{self.width}d", self._map, _HEADER_SIZE + slot * self.record_size)
+
+    def _slots(self) -> List[Tuple[int, int]]:
+        """Rangos [desde, hasta) de slots en orden cronológico"""
+        count = len(self)
+        if self.written <= self.capacity:
+            return [(0, count)]
+        start = self.written % self.capacity
+        return [(start, self.capacity), (0, start)]
+
+    def raw_bytes(self) -> bytes:
+        """Registros en orden cronológico (copia)"""
+        return b"".join(bytes(self._map[_HEADER_SIZE + a * self.record_size:_HEADER_SIZE + b * self.record_size])
+                        for a, b in self._slots())
+
+    def flush(self):
+        self._map.flush()
+
+    def close(self):
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._file.close()
+            self._map = None
+
+
+class _Bucket:
+    """Promedio en curso de un intervalo de un nivel agregado"""
+    __slots__ = ("start", "count", "sums")
+
+    def __init__(self, start: float, width: int):
+        self.start = start
+        self.count = 0
+        self.sums = [0.0] * width
+
+    def add(self, values: Sequence[float]):
+        self.count += 1
+        for i, value in enumerate(values):
+            self.sums[i] += value
+
+    def mean(self) -> List[float]:
+        return [total / self.count for total in self.sums]
+
+
+class TimeSeriesStore:
+    """
+    Niveles raw + agregados de una serie con campos fijos.
+
+    append() escribe en raw y suma el punto al intervalo en curso de cada
+    nivel agregado; cuando llega un punto de un intervalo nuevo, el
+    promedio del anterior se escribe en su anillo (marcado con el inicio
+    del intervalo).
+    """
+
+    def __init__(self, directory, name: str, fields: Sequence[str],
+                 tiers: Sequence[Tuple[str, int, int]] = DEFAULT_TIERS):
+        """
+        Args:
+            directory: carpeta de los archivos <name>.<nivel>.ring
+            name: nombre de la serie
+            fields: campos numéricos de cada punto (fijos para el archivo)
+            tiers: (nivel, resolución en segundos, capacidad); el de resolución 0 es raw.
+                La capacidad vale al crear el archivo; después manda la de su cabecera
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.name = name
+        self.fields = list(fields)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.rings: Dict[str, RingFile] = {
+            tier: RingFile(self.directory / f"{name}.{tier}.ring", self.fields, capacity, resolution)
+            for tier, resolution, capacity in tiers
+        }
+        self.raw_tier = next(tier for tier, resolution, _ in tiers if resolution == 0)
+        self._buckets: Dict[str, Optional[_Bucket]] = {
+            tier: None for tier, resolution, _ in tiers if resolution > 0
+        }
+        self._recover_buckets()
+
+    def _recover_buckets(self):
+        """Reconstruye el intervalo en curso de cada nivel con los puntos raw posteriores a su último registro"""
+        if not self._buckets or not len(self.rings[self.raw_tier]):
+            return
+        raw = self.rings[self.raw_tier]
+        records = struct.iter_unpack(f"<{raw.width}d", raw.raw_bytes())
+        last = {tier: (self.rings[tier].last() or (float("-inf"),))[0] for tier in self._buckets}
+        for record in records:
+            ts, values = record[0], record[1:]
+            for tier in self._buckets:
+                if ts >= last[tier] + self.rings[tier].resolution:
+                    self._feed(tier, ts, values, write=False)
+
+    def _feed(self, tier: str, ts: float, values: Sequence[float], write: bool = True):
+        resolution = self.rings[tier].resolution
+        start = ts - ts % resolution
+        bucket = self._buckets[tier]
+        if bucket is not None and start != bucket.start:
+            if write:
+                self.rings[tier].append(bucket.start, bucket.mean())
+            bucket = None
+        if bucket is None:
+            bucket = self._buckets[tier] = _Bucket(start, len(self.fields))
+        bucket.add(values)
+
+    def append(self, ts: float, values) -> None:
+        """Agrega un punto (values: secuencia en el orden de `fields`, o dict por campo)"""
+        if isinstance(values, dict):
+            values = [float(values.get(field, 0.0) or 0.0) for field in self.fields]
+        else:
+            values = [float(value) for value in values]
+        with self._lock:
+            if self._closed:  # un job del scheduler que llega tarde al apagado
+                return
+            self.rings[self.raw_tier].append(ts, values)
+            for tier in self._buckets:
+                self._feed(tier, ts, values)
+
+    def read(self, tier: str = "raw", since: Optional[float] = None, until: Optional[float] = None,
+             fields: Optional[Sequence[str]] = None) -> Dict[str, "np.ndarray"]:
+        """
+        {"timestamp": ..., campo: ...} del nivel, en orden cronológico, con since <= ts < until.
+        Arrays de NumPy (copias); array('d') si NumPy no está disponible.
+        """
+        ring = self.rings[tier]
+        with self._lock:
+            data = ring.raw_bytes()
+        fields = list(fields) if fields is not None else self.fields
+        columns = [0] + [self.fields.index(field) + 1 for field in fields]
+
+        if NUMPY_AVAILABLE:
+            table = np.frombuffer(data, dtype="<f8").reshape(-1, ring.width)
+            if since is not None or until is not None:
+                ts = table[:, 0]
+                mask = np.ones(len(ts), dtype=bool)
+                if since is not None:
+                    mask &= ts >= since
+                if until is not None:
+                    mask &= ts < until
+                table = table[mask]
+            out = {"timestamp": table[:, 0].copy()}
+            out.update({field: table[:, column].copy() for field, column in zip(fields, columns[1:])})
+            return out
+
+        out = {name: array("d") for name in ["timestamp"] + fields}
+        for record in struct.iter_unpack(f"<{ring.width}d", data):
+            if (since is not None and record[0] < since) or (until is not None and record[0] >= until):
+                continue
+            out["timestamp"].append(record[0])
+            for field, column in zip(fields, columns[1:]):
+                out[field].append(record[column])
+        return out
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        """Último punto raw como dict"""
+        with self._lock:
+            record = self.rings[self.raw_tier].last()
+        if record is None:
+            return None
+        return {"timestamp": record[0], **dict(zip(self.fields, record[1:]))}
+
+    def get_stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {tier: {"points": len(ring), "capacity": ring.capacity, "written": ring.written,
+                           "resolution_s": ring.resolution}
+                    for tier, ring in self.rings.items()}
+
+    def flush(self):
+        with self._lock:
+            if self._closed:
+                return
+            for ring in self.rings.values():
+                ring.flush()
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            for ring in self.rings.values():
+                ring.close()
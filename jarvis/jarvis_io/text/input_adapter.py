@@ -15,10 +15,19 @@ class CLIInput:
         self._last_command_time = time.time()
         self._command_count = 0
 
-    def process_text(self, text: str):
+    def _session_id(self) -> Optional[str]:
+        """Current session of the core (ordering key for emitted events)"""
+        return getattr(self.core, "current_session_id", None) if self.core else None
+
+    def process_text(self, text: str, session_id: Optional[str] = None):
         """
         Process text input directly
         Required by diagnostics and API
+
+        Args:
+            text: Input text
+            session_id: Session the command belongs to (defaults to the core's
+                current session). Commands of one session are handled in order.
         """
         if not text or not text.strip():
             return
@@ -26,13 +35,26 @@ class CLIInput:
         text = text.strip()
         self._command_count += 1
         self._last_command_time = time.time()
+        session_id = session_id or self._session_id()
         
         # Emit text input event
-        self.bus.emit("input.text", {"text": text})
+        self.bus.emit("input.text", {"text": text, "session_id": session_id})
         
         # Process with NLU
         if self.nlu:
-            self.nlu.process(text, self.bus)
+            self.nlu.process(text, self.bus, session_id=session_id)
+
+    def request_text(self, text: str, session_id: Optional[str] = None, timeout: float = 30.0):
+        """
+        Process text input and return a Future with the jarvis.response data
+        it produces (dict with text/intent/...). Lets API and batch clients
+        pipeline commands instead of polling for the answer.
+        """
+        with self.bus.replying(timeout) as future:
+            self.process_text(text, session_id=session_id)
+        if not text or not text.strip():
+            future.set_result(None)
+        return future
 
     def poll(self):
         if not self._ready():
@@ -61,12 +83,14 @@ class CLIInput:
                     self._running = False
                     return
 
+                session_id = self._session_id()
+
                 # Emitir evento de input
-                self.bus.emit("input.text", {"text": txt})
+                self.bus.emit("input.text", {"text": txt, "session_id": session_id})
 
                 # Procesar con NLU si está disponible
                 if self.nlu:
-                    self.nlu.process(txt, self.bus)
+                    self.nlu.process(txt, self.bus, session_id=session_id)
                 else:
                     if self.logger:
                         self.logger.warning("NLU pipeline no disponible")
@@ -0,0 +1,189 @@
+# monitoring/metrics.py
+"""
+Latency histograms (HDR-style).
+
+Values are bucketed logarithmically with 5 significant bits: exact below
+32µs, then 16 linear sub-buckets per power of two, so every percentile is
+within ~3% of the true value while the whole range 1µs..~12 days fits in
+a few hundred counters. Each recording thread writes its own shard (no
+lock, no contention); readers merge the shards.
+"""
+
+import threading
+from typing import Dict, Iterable, Optional
+
+
+_SUB_BITS = 5
+_SUB_COUNT = 1 << _SUB_BITS          # 32: exact buckets for 0..31µs
+_HALF = _SUB_COUNT >> 1              # 16 sub-buckets per power of two above that
+_MAX_US = (1 << 40) - 1              # ~12.7 days; larger values are clamped
+_BUCKETS = (_MAX_US.bit_length() - _SUB_BITS) * _HALF + _SUB_COUNT
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+
+def bucket_index(us: int) -> int:
+    if us < _SUB_COUNT:
+        return us if us > 0 else 0
+    if us > _MAX_US:
+        us = _MAX_US
+    shift = us.bit_length() - _SUB_BITS
+    return shift * _HALF + (us >> shift)
+
+
+def bucket_bounds(index: int) -> tuple:
+    """[low, high) in microseconds covered by a bucket"""
+    if index < _SUB_COUNT:
+        return index, index + 1
+    shift = index // _HALF - 1
+    low = (index - shift * _HALF) << shift
+    return low, low + (1 << shift)
+
+
+class _Shard:
+    __slots__ = ("counts", "count", "total_us", "max_us")
+
+    def __init__(self):
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram, cheap to record from many threads.
+
+    record() takes milliseconds (the unit used across the dispatcher and
+    the metrics files); snapshot() reports count, mean, p50/p90/p99 and max.
+    """
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()  # only taken when a new thread first records
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def record(self, ms: float):
+        us = int(ms * 1000.0)
+        if us < 0:
+            us = 0
+        shard = self._shard()
+        shard.counts[bucket_index(us)] += 1
+        shard.count += 1
+        shard.total_us += us
+        if us > shard.max_us:
+            shard.max_us = us
+
+    def _merged(self):
+        with self._lock:
+            shards = list(self._shards)
+        counts = [0] * _BUCKETS
+        count = total = peak = 0
+        for shard in shards:
+            for i, c in enumerate(shard.counts):
+                if c:
+                    counts[i] += c
+            count += shard.count
+            total += shard.total_us
+            peak = max(peak, shard.max_us)
+        return counts, count, total, peak
+
+    @property
+    def count(self) -> int:
+        with self._lock:
+            return sum(shard.count for shard in self._shards)
+
+    def percentiles(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[float, float]:
+        """{p: value_ms}, each value the midpoint of the bucket holding the p-th sample"""
+        counts, count, _, peak = self._merged()
+        return self._percentiles(counts, count, peak, percentiles)
+
+    @staticmethod
+    def _percentiles(counts, count, peak_us, percentiles) -> Dict[float, float]:
+        result = {}
+        if count == 0:
+            return {p: 0.0 for p in percentiles}
+        wanted = sorted(percentiles)
+        targets = [(p, max(1, -(-count * p // 100))) for p in wanted]
+        seen = 0
+        t = 0
+        for index, c in enumerate(counts):
+            if not c:
+                continue
+            seen += c
+            while t < len(targets) and seen >= targets[t][1]:
+                low, high = bucket_bounds(index)
+                result[targets[t][0]] = min((low + high - 1) / 2.0, peak_us) / 1000.0
+                t += 1
+            if t == len(targets):
+                break
+        return result
+
+    def snapshot(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        counts, count, total, peak = self._merged()
+        snap = {"count": count, "mean_ms": (total / count / 1000.0) if count else 0.0}
+        for p, value in self._percentiles(counts, count, peak, percentiles).items():
+            snap[f"p{p:g}_ms"] = value
+        snap["max_ms"] = peak / 1000.0
+        return snap
+
+    def reset(self):
+        """Zero all shards (a sample recorded concurrently with reset may survive it)"""
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            shard.counts = [0] * _BUCKETS
+            shard.count = 0
+            shard.total_us = 0
+            shard.max_us = 0
+
+
+class HistogramRegistry:
+    """Named LatencyHistograms, created on first use"""
+
+    def __init__(self):
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> LatencyHistogram:
+        hist = self._histograms.get(name)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(name, LatencyHistogram(name))
+        return hist
+
+    def record(self, name: str, ms: float):
+        self.get(name).record(ms)
+
+    def names(self):
+        return list(self._histograms)
+
+    def snapshot(self, name: Optional[str] = None) -> Dict:
+        """One histogram's snapshot, or {name: snapshot} for all"""
+        if name is not None:
+            hist = self._histograms.get(name)
+            return hist.snapshot() if hist else None
+        return {n: h.snapshot() for n, h in list(self._histograms.items())}
+
+    def worst(self, n: int = 5, key: str = "p99_ms") -> list:
+        """[(name, snapshot)] with the highest `key` (tail-latency offenders first)"""
+        snaps = [(name, snap) for name, snap in self.snapshot().items() if snap["count"]]
+        return sorted(snaps, key=lambda item: item[1][key], reverse=True)[:n]
+
+    def reset(self, name: Optional[str] = None):
+        if name is not None:
+            hist = self._histograms.get(name)
+            if hist:
+                hist.reset()
+            return
+        for hist in list(self._histograms.values()):
+            hist.reset()
@@ -0,0 +1,168 @@
+# scheduler/cron.py
+"""
+Cron expressions for persistent jobs.
+
+Standard 5 fields: minute hour day-of-month month day-of-week, with
+`*`, lists (`1,15`), ranges (`1-5`), steps (`*/10`, `8-18/2`), month and
+weekday names (`jan`, `mon-fri`) and the macros @yearly, @monthly,
+@weekly, @daily and @hourly. When both day-of-month and day-of-week are
+restricted a day matches either of them (classic Vixie cron behaviour).
+Times are evaluated in local time.
+"""
+
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+
+MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+_MONTH_NAMES = {name: i for i, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+_DAY_NAMES = {name: i for i, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+# (name, min, max, names)
+_FIELDS = (
+    ("minute", 0, 59, None),
+    ("hour", 0, 23, None),
+    ("day", 1, 31, None),
+    ("month", 1, 12, _MONTH_NAMES),
+    ("weekday", 0, 7, _DAY_NAMES),
+)
+
+# A valid expression fires at least once every 4 years (Feb 29); give up after that
+_MAX_YEARS = 5
+
+
+def _parse_value(token: str, names, field: str) -> int:
+    token = token.lower()
+    if names and token in names:
+        return names[token]
+    try:
+        return int(token)
+    except ValueError:
+        raise ValueError(f"invalid {field} value: {token!r}")
+
+
+def _parse_field(text: str, field: str, lo: int, hi: int, names) -> List[int]:
+    values = set()
+    for part in text.split(","):
+        if not part:
+            raise ValueError(f"empty item in {field} field")
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = _parse_value(step_text, None, field)
+            if step < 1:
+                raise ValueError(f"invalid {field} step: {step}")
+        if part == "*":
+            start, end = lo, hi
+        elif "-" in part:
+            a, b = part.split("-", 1)
+            start, end = _parse_value(a, names, field), _parse_value(b, names, field)
+        else:
+            start = _parse_value(part, names, field)
+            # "5/15" means 5, 20, 35, 50
+            end = hi if step > 1 else start
+        if not (lo <= start <= hi and lo <= end <= hi) or start > end:
+            raise ValueError(f"{field} out of range {lo}-{hi}: {part!r}")
+        values.update(range(start, end + 1, step))
+    return sorted(values)
+
+
+class CronExpression:
+    """Parsed cron expression; next_fire() jumps field by field instead of scanning minutes."""
+
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        text = MACROS.get(self.expression.lower(), self.expression)
+        parts = text.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron expression needs 5 fields, got {len(parts)}: {expression!r}")
+
+        parsed = [_parse_field(p, name, lo, hi, names) for p, (name, lo, hi, names) in zip(parts, _FIELDS)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # 7 is Sunday too
+        self.weekdays = sorted({d % 7 for d in weekdays})
+        self._day_restricted = parts[2] != "*"
+        self._weekday_restricted = parts[4] != "*"
+        self._day_set = set(self.days)
+        self._weekday_set = set(self.weekdays)
+
+    def __repr__(self):
+        return f"CronExpression({self.expression!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, CronExpression) and self.expression == other.expression
+
+    def __hash__(self):
+        return hash(self.expression)
+
+    def _day_matches(self, dt: datetime) -> bool:
+        cron_weekday = (dt.weekday() + 1) % 7
+        if self._day_restricted and self._weekday_restricted:
+            return dt.day in self._day_set or cron_weekday in self._weekday_set
+        if self._day_restricted:
+            return dt.day in self._day_set
+        if self._weekday_restricted:
+            return cron_weekday in self._weekday_set
+        return True
+
+    def next_after(self, dt: datetime) -> datetime:
+        """First matching minute strictly after `dt` (naive local datetime)."""
+        dt = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt.year + _MAX_YEARS
+
+        while dt.year <= limit:
+            if dt.month not in self.months:
+                i = bisect_left(self.months, dt.month)
+                if i == len(self.months):
+                    dt = datetime(dt.year + 1, self.months[0], 1)
+                else:
+                    dt = datetime(dt.year, self.months[i], 1)
+                continue
+
+            if not self._day_matches(dt):
+                dt = datetime(dt.year, dt.month, dt.day) + timedelta(days=1)
+                continue
+
+            if dt.hour not in self.hours:
+                i = bisect_left(self.hours, dt.hour)
+                if i == len(self.hours):
+                    dt = datetime(dt.year, dt.month, dt.day) + timedelta(days=1)
+                else:
+                    dt = dt.replace(hour=self.hours[i], minute=0)
+                continue
+
+            if dt.minute not in self.minutes:
+                i = bisect_left(self.minutes, dt.minute)
+                if i == len(self.minutes):
+                    dt = dt.replace(minute=0) + timedelta(hours=1)
+                else:
+                    dt = dt.replace(minute=self.minutes[i])
+                continue
+
+            return dt
+
+        raise ValueError(f"cron expression never fires: {self.expression!r}")
+
+    def next_fire(self, after: Optional[float] = None) -> float:
+        """Timestamp of the first fire time strictly after `after` (default: now)."""
+        base = datetime.fromtimestamp(after) if after is not None else datetime.now()
+        return self.next_after(base).timestamp()
+
+
+def is_valid(expression: str) -> bool:
+    try:
+        CronExpression(expression)
+        return True
+    except ValueError:
+        return False
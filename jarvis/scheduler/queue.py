@@ -0,0 +1,216 @@
+# scheduler/queue.py
+"""
+Persistent job store (SQLite).
+
+One row per job with its precomputed `next_run`. The partial index on
+next_run means the worker only ever reads the due head of the table
+(`ORDER BY next_run LIMIT n`), so the cost of a tick does not grow with
+the number of registered jobs.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+TRIGGER_CRON = "cron"
+TRIGGER_INTERVAL = "interval"
+TRIGGER_DATE = "date"
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
+_COLUMNS = ("id", "func", "args", "kwargs", "trigger", "spec", "next_run", "executor",
+            "misfire_grace", "last_run", "runs", "failures", "last_error", "created_at")
+
+
+@dataclass
+class Job:
+    id: str
+    func: str                          # "package.module:function"
+    trigger: str                       # cron | interval | date
+    spec: str                          # cron expression, seconds, or timestamp
+    next_run: Optional[float]          # None once a date job has fired
+    args: List[Any] = field(default_factory=list)
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    executor: str = EXECUTOR_THREAD
+    misfire_grace: Optional[float] = None
+    last_run: Optional[float] = None
+    runs: int = 0
+    failures: int = 0
+    last_error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+
+    def _row(self) -> Tuple:
+        return (self.id, self.func, json.dumps(self.args), json.dumps(self.kwargs), self.trigger,
+                self.spec, self.next_run, self.executor, self.misfire_grace, self.last_run,
+                self.runs, self.failures, self.last_error, self.created_at)
+
+    @classmethod
+    def _from_row(cls, row) -> "Job":
+        data = dict(zip(_COLUMNS, row))
+        data["args"] = json.loads(data["args"])
+        data["kwargs"] = json.loads(data["kwargs"])
+        return cls(**data)
+
+
+class JobStore:
+    """
+    SQLite job table. Thread-safe; one connection guarded by a lock.
+    Use ":memory:" for a throwaway store.
+    """
+
+    def __init__(self, db_path: str = "jarvis_jobs.db"):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    func TEXT NOT NULL,
+                    args TEXT NOT NULL DEFAULT '[]',
+                    kwargs TEXT NOT NULL DEFAULT '{}',
+                    trigger TEXT NOT NULL,
+                    spec TEXT NOT NULL,
+                    next_run REAL,
+                    executor TEXT NOT NULL DEFAULT 'thread',
+                    misfire_grace REAL,
+                    last_run REAL,
+                    runs INTEGER NOT NULL DEFAULT 0,
+                    failures INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    created_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_next_run ON jobs(next_run) WHERE next_run IS NOT NULL"
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def add(self, job: Job, replace: bool = True) -> Job:
+        """
+        Insert a job. An existing job with the same id is updated; its
+        schedule position and counters are kept when trigger and spec are
+        unchanged (so re-registering jobs at boot doesn't reset them).
+        """
+        self.add_many([job], replace=replace)
+        return self.get(job.id)
+
+    def add_many(self, jobs: Iterable[Job], replace: bool = True):
+        """Insert/update many jobs in one transaction."""
+        placeholders = ", ".join("?" * len(_COLUMNS))
+        sql = f"INSERT INTO jobs ({', '.join(_COLUMNS)}) VALUES ({placeholders})"
+        if replace:
+            sql += """
+                ON CONFLICT(id) DO UPDATE SET
+                    func = excluded.func,
+                    args = excluded.args,
+                    kwargs = excluded.kwargs,
+                    executor = excluded.executor,
+                    misfire_grace = excluded.misfire_grace,
+                    next_run = CASE
+                        WHEN jobs.trigger = excluded.trigger AND jobs.spec = excluded.spec
+                             AND jobs.next_run IS NOT NULL
+                        THEN jobs.next_run ELSE excluded.next_run END,
+                    trigger = excluded.trigger,
+                    spec = excluded.spec
+            """
+        with self._lock:
+            with self._transaction():
+                self._conn.executemany(sql, (job._row() for job in jobs))
+
+    def remove(self, job_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            return cursor.rowcount > 0
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return Job._from_row(row) if row else None
+
+    def list_jobs(self, limit: int = 100, offset: int = 0) -> List[Job]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM jobs ORDER BY id LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+        return [Job._from_row(row) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def next_run_time(self) -> Optional[float]:
+        """Earliest pending next_run (index head), or None when nothing is scheduled."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT next_run FROM jobs WHERE next_run IS NOT NULL ORDER BY next_run LIMIT 1"
+            ).fetchone()
+        return row[0] if row else None
+
+    def due(self, now: float, limit: int = 500) -> List[Job]:
+        """Jobs with next_run <= now, earliest first, at most `limit`."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM jobs "
+                "WHERE next_run IS NOT NULL AND next_run <= ? ORDER BY next_run LIMIT ?",
+                (now, limit)
+            ).fetchall()
+        return [Job._from_row(row) for row in rows]
+
+    def reschedule(self, updates: Iterable[Tuple[Optional[float], str]]):
+        """Set next_run for many jobs: iterable of (next_run, job_id)."""
+        with self._lock:
+            with self._transaction():
+                self._conn.executemany("UPDATE jobs SET next_run = ? WHERE id = ?", updates)
+
+    def set_next_run(self, job_id: str, next_run: Optional[float]):
+        self.reschedule([(next_run, job_id)])
+
+    def record_run(self, job_id: str, finished_at: float, error: Optional[str] = None):
+        self.record_runs([(job_id, finished_at, error)])
+
+    def record_runs(self, results: Iterable[Tuple[str, float, Optional[str]]]):
+        """Update run counters for many jobs: iterable of (job_id, finished_at, error)."""
+        rows = [(finished_at, 1 if error else 0, error, job_id) for job_id, finished_at, error in results]
+        if not rows:
+            return
+        with self._lock:
+            with self._transaction():
+                self._conn.executemany(
+                    "UPDATE jobs SET last_run = ?, runs = runs + 1, failures = failures + ?, "
+                    "last_error = ? WHERE id = ?",
+                    rows
+                )
+
+    def _transaction(self):
+        return _Transaction(self._conn)
+
+
+class _Transaction:
+    """BEGIN/COMMIT around a block (the connection runs in autocommit mode)."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __enter__(self):
+        self._conn.execute("BEGIN")
+
+    def __exit__(self, exc_type, exc, tb):
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
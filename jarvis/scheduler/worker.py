@@ -0,0 +1,295 @@
+# scheduler/worker.py
+"""
+Persistent job worker.
+
+Sleeps until the earliest `next_run` in the JobStore (woken early when a
+sooner job is added), reads only the due head of the index in batches,
+writes every due job's next fire time back in one transaction and then
+runs it on a thread pool, or on a process pool for jobs registered with
+executor="process" (CPU-heavy work that shouldn't hold the GIL).
+
+Job functions are stored as "package.module:function" references so they
+survive restarts and can be imported by worker processes.
+"""
+
+import importlib
+import multiprocessing
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Union
+
+from scheduler.cron import CronExpression
+from scheduler.queue import (
+    Job, JobStore,
+    TRIGGER_CRON, TRIGGER_INTERVAL, TRIGGER_DATE,
+    EXECUTOR_THREAD, EXECUTOR_PROCESS,
+)
+
+
+def func_ref(func: Union[str, Callable]) -> str:
+    """'module:qualname' reference for a module-level function (or pass a reference through)."""
+    if isinstance(func, str):
+        if ":" not in func:
+            raise ValueError(f"function reference must look like 'module:function': {func!r}")
+        return func
+    module = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", "")
+    if not module or "<" in qualname or module == "__main__":
+        raise ValueError(f"persistent jobs need an importable module-level function, got {func!r}")
+    return f"{module}:{qualname}"
+
+
+@lru_cache(maxsize=1024)
+def resolve_func(ref: str) -> Callable:
+    module_name, _, qualname = ref.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _call_ref(ref: str, args, kwargs):
+    # entry point in worker processes (must be picklable: module-level)
+    return resolve_func(ref)(*args, **kwargs)
+
+
+@lru_cache(maxsize=4096)
+def _cron(spec: str) -> CronExpression:
+    return CronExpression(spec)
+
+
+def next_run_after(job: Job, now: float) -> Optional[float]:
+    """Next fire time after `now`; missed slots are coalesced into one run."""
+    if job.trigger == TRIGGER_CRON:
+        return _cron(job.spec).next_fire(now)
+    if job.trigger == TRIGGER_INTERVAL:
+        step = float(job.spec)
+        scheduled = job.next_run if job.next_run is not None else now
+        if scheduled > now:
+            return scheduled
+        return scheduled + step * (int((now - scheduled) // step) + 1)
+    return None  # date jobs fire once
+
+
+class JobWorker:
+    def __init__(self, store: JobStore, workers: int = 4, process_workers: Optional[int] = None,
+                 batch_size: int = 500, misfire_grace: Optional[float] = None, poll_interval: float = 60.0):
+        """
+        Args:
+            store: JobStore holding the jobs
+            workers: thread pool size for executor="thread" jobs
+            process_workers: process pool size for executor="process" jobs (default: CPU count)
+            batch_size: due jobs read per tick
+            misfire_grace: default seconds a run may start late before it is skipped (None = never skip)
+            poll_interval: max sleep, so jobs added to the DB by other processes are picked up
+        """
+        self.store = store
+        self.workers = workers
+        self.process_workers = process_workers
+        self.batch_size = batch_size
+        self.misfire_grace = misfire_grace
+        self.poll_interval = poll_interval
+        self._cond = threading.Condition()
+        self._running = threading.Event()
+        self._thread = None
+        self._pool = None
+        self._process_pool = None
+        self._head = None
+        self._inflight = set()
+        self._results = []
+        self._results_lock = threading.Lock()
+        self._listeners: List[Callable] = []
+        self.dispatched = 0
+        self.completed = 0
+        self.failed = 0
+        self.overlapped = 0
+        self.misfired = 0
+        self.ticks = 0
+        self.last_lag = 0.0
+
+    # -- lifecycle -------------------------------------------------------
+
+    def start(self):
+        if self._running.is_set():
+            return
+        self._running.set()
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="JobWorker")
+        self._thread = threading.Thread(target=self._loop, name="JobScheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, wait: bool = True):
+        if not self._running.is_set():
+            return
+        self._running.clear()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        for pool in (self._pool, self._process_pool):
+            if pool:
+                pool.shutdown(wait=wait, cancel_futures=True)
+        self._process_pool = None
+        self._flush_results()
+
+    # -- registration ----------------------------------------------------
+
+    def add_cron(self, job_id: str, expression: str, func, *args, executor: str = EXECUTOR_THREAD,
+                 misfire_grace: Optional[float] = None, **kwargs) -> Job:
+        next_run = _cron(expression).next_fire()
+        return self._add(Job(job_id, func_ref(func), TRIGGER_CRON, expression, next_run,
+                             list(args), kwargs, executor, misfire_grace))
+
+    def add_interval(self, job_id: str, seconds: float, func, *args, first_run: Optional[float] = None,
+                     executor: str = EXECUTOR_THREAD, misfire_grace: Optional[float] = None, **kwargs) -> Job:
+        if seconds <= 0:
+            raise ValueError("seconds must be > 0")
+        next_run = time.time() + (seconds if first_run is None else first_run)
+        return self._add(Job(job_id, func_ref(func), TRIGGER_INTERVAL, repr(float(seconds)), next_run,
+                             list(args), kwargs, executor, misfire_grace))
+
+    def add_date(self, job_id: str, when: float, func, *args, executor: str = EXECUTOR_THREAD,
+                 misfire_grace: Optional[float] = None, **kwargs) -> Job:
+        return self._add(Job(job_id, func_ref(func), TRIGGER_DATE, repr(float(when)), float(when),
+                             list(args), kwargs, executor, misfire_grace))
+
+    def add_jobs(self, jobs: List[Job]):
+        """Bulk registration (one transaction)."""
+        for job in jobs:
+            self._validate(job)
+        self.store.add_many(jobs)
+        self._wake_if_sooner(min((j.next_run for j in jobs if j.next_run is not None), default=None))
+
+    def remove(self, job_id: str) -> bool:
+        return self.store.remove(job_id)
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        return self.store.get(job_id)
+
+    def add_listener(self, listener: Callable[[str, Any, Optional[str]], None]):
+        """listener(job_id, result, error) is called after every run (from a pool thread)."""
+        self._listeners.append(listener)
+
+    def _validate(self, job: Job):
+        if job.executor not in (EXECUTOR_THREAD, EXECUTOR_PROCESS):
+            raise ValueError(f"invalid executor: {job.executor}")
+        if job.trigger == TRIGGER_CRON:
+            _cron(job.spec)
+        elif job.trigger not in (TRIGGER_INTERVAL, TRIGGER_DATE):
+            raise ValueError(f"invalid trigger: {job.trigger}")
+
+    def _add(self, job: Job) -> Job:
+        self._validate(job)
+        stored = self.store.add(job)
+        self._wake_if_sooner(stored.next_run)
+        return stored
+
+    def _wake_if_sooner(self, next_run: Optional[float]):
+        if next_run is None:
+            return
+        with self._cond:
+            if self._head is None or next_run < self._head:
+                self._head = next_run
+                self._cond.notify()
+
+    # -- loop --------------------------------------------------------------
+
+    def _loop(self):
+        while self._running.is_set():
+            try:
+                self._flush_results()
+                with self._cond:
+                    head = self.store.next_run_time()
+                    now = time.time()
+                    if head is None or head > now:
+                        self._head = head
+                        wait = self.poll_interval if head is None else min(head - now, self.poll_interval)
+                        self._cond.wait(wait)
+                        continue
+                self.last_lag = now - head
+                self._tick(now)
+            except Exception:
+                traceback.print_exc()
+                time.sleep(1.0)
+
+    def _tick(self, now: float):
+        self.ticks += 1
+        jobs = self.store.due(now, self.batch_size)
+        # persist the next fire time first: a crash mid-batch re-runs at most this batch
+        self.store.reschedule([(next_run_after(job, now), job.id) for job in jobs])
+
+        for job in jobs:
+            if job.id in self._inflight:
+                self.overlapped += 1
+                continue
+            grace = job.misfire_grace if job.misfire_grace is not None else self.misfire_grace
+            if grace is not None and now - job.next_run > grace:
+                self.misfired += 1
+                continue
+            self._dispatch(job)
+
+    def _dispatch(self, job: Job):
+        try:
+            if job.executor == EXECUTOR_PROCESS:
+                future = self._get_process_pool().submit(_call_ref, job.func, job.args, job.kwargs)
+            else:
+                future = self._pool.submit(resolve_func(job.func), *job.args, **job.kwargs)
+        except Exception as e:
+            # unresolvable function or pool shut down: record as a failed run
+            self._record(job.id, None, f"{type(e).__name__}: {e}")
+            return
+        self._inflight.add(job.id)
+        self.dispatched += 1
+        future.add_done_callback(lambda f, job_id=job.id: self._on_done(job_id, f))
+
+    def _get_process_pool(self):
+        if self._process_pool is None:
+            # spawn: forking a process that runs threads can deadlock the child
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.process_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._process_pool
+
+    def _on_done(self, job_id: str, future):
+        self._inflight.discard(job_id)
+        if future.cancelled():
+            return
+        error = future.exception()
+        result = None if error else future.result()
+        self._record(job_id, result, f"{type(error).__name__}: {error}" if error else None)
+
+    def _record(self, job_id: str, result, error: Optional[str]):
+        if error:
+            self.failed += 1
+        else:
+            self.completed += 1
+        with self._results_lock:
+            self._results.append((job_id, time.time(), error))
+        for listener in self._listeners:
+            try:
+                listener(job_id, result, error)
+            except Exception:
+                traceback.print_exc()
+
+    def _flush_results(self):
+        with self._results_lock:
+            results, self._results = self._results, []
+        self.store.record_runs(results)
+
+    def get_stats(self) -> dict:
+        return {
+            "running": self._running.is_set(),
+            "jobs": self.store.count(),
+            "next_run": self.store.next_run_time(),
+            "inflight": len(self._inflight),
+            "dispatched": self.dispatched,
+            "completed": self.completed,
+            "failed": self.failed,
+            "overlapped": self.overlapped,
+            "misfired": self.misfired,
+            "ticks": self.ticks,
+            "last_lag_ms": self.last_lag * 1000,
+            "process_pool": self._process_pool is not None,
+        }
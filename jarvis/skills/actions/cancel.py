@@ -0,0 +1,83 @@
+# skills/actions/cancel.py
+"""
+Cooperative cancellation tokens for running skills.
+
+Kept free of package-level imports so skills can import
+current_cancel_token at module level: importing it through the dispatcher
+pulls in system.core, whose package init loads the engine, which loads
+the dispatcher again.
+"""
+
+import contextvars
+import threading
+import time
+from typing import Optional
+
+
+# a ContextVar rather than a thread-local: async skills share the loop thread,
+# each task sees its own token
+_current_token: contextvars.ContextVar = contextvars.ContextVar("skill_cancel_token", default=None)
+
+
+class CancelToken:
+    """
+    Cooperative cancellation for a running skill.
+
+    Python threads can't be killed, so when a skill misses its deadline the
+    dispatcher returns a timeout to the caller and cancels the token; skills
+    doing long loops (walking a directory tree, paging an API) should check
+    `token.cancelled` (or call `token.check()`) and bail out early.
+
+    Tokens nest: cancelling a token cancels every child() made from it, while
+    a child timing out leaves its parent and siblings running.
+    """
+
+    __slots__ = ("_event", "reason", "deadline", "_children")
+
+    def __init__(self, deadline: Optional[float] = None):
+        self._event = threading.Event()
+        self.reason = None
+        self.deadline = deadline
+        self._children = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled"):
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+            for child in self._children:
+                child.cancel(reason)
+
+    def child(self, deadline: Optional[float] = None) -> "CancelToken":
+        """Token cancelled along with this one, with the earlier of both deadlines"""
+        if self.deadline is not None:
+            deadline = self.deadline if deadline is None else min(deadline, self.deadline)
+        token = CancelToken(deadline)
+        self._children.append(token)
+        if self._event.is_set():  # cancelled before (or while) the child was attached
+            token.cancel(self.reason)
+        return token
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None = no deadline)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check(self):
+        """Raise SkillTimeoutError if the skill has been cancelled"""
+        if self._event.is_set():
+            from system.core.exceptions import SkillTimeoutError
+            raise SkillTimeoutError(f"Skill cancelled: {self.reason}", {"reason": self.reason})
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to `timeout` seconds; returns True early if cancelled"""
+        return self._event.wait(timeout)
+
+
+def current_cancel_token() -> Optional[CancelToken]:
+    """Cancel token of the skill running on this thread / task (None outside the dispatcher)"""
+    return _current_token.get()
@@ -3,14 +3,33 @@
 Skill Dispatcher v0.0.4+ - Enhanced with parallelization & scalability
 Robust skill execution with validation, timeout handling, and error recovery
 """
+import asyncio
 import inspect
+import itertools
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, Any, Optional, Callable
 from system.core.exceptions import (
     SkillNotFoundError, SkillTimeoutError, SkillError, SkillDependencyError
 )
+from monitoring.metrics import HistogramRegistry
+from skills.actions.result_cache import CachePolicy, ResultCache, freeze
+from skills.actions.manifest import LazySkill
+from skills.actions.cancel import CancelToken, current_cancel_token, _current_token  # noqa: F401 (re-exported)
+
+
+def _accepts_cancel_token(run) -> bool:
+    try:
+        return "cancel_token" in inspect.signature(run).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _has_run_async(skill) -> bool:
+    if isinstance(skill, LazySkill):
+        return skill.is_async  # from the manifest, without importing the skill
+    return inspect.iscoroutinefunction(getattr(skill, "run_async", None))
 
 
 class SkillDispatcher:
@@ -23,16 +42,79 @@ class SkillDispatcher:
     - Thread pool management
     - Proper exception handling
     - Execution metrics
+
+    Skills run on the dispatcher's thread pool under a deadline: the caller
+    gets a SkillTimeoutError when it passes and the skill's CancelToken is
+    cancelled. Each skill also has a concurrency cap (a semaphore held for
+    as long as the skill actually runs), so a skill that hangs can only pin
+    its own slots, never the whole pool. Limits come from register(), then
+    the skill's `timeout_seconds` / `max_concurrency` attributes, then the
+    dispatcher defaults.
+
+    Skills registered as classes (or as manifest LazySkills, whose module
+    is only imported then) are singletons: built on first dispatch
+    (or by warmup_all()), then reused; an optional `warmup()` runs once
+    after construction and `close()` at shutdown. pre_check() outcomes are
+    cached per skill for `pre_check_ttl` seconds (or the skill's own
+    `pre_check_ttl`), so a repeat dispatch pays no construction or
+    validation cost.
+
+    Skills declaring a `cache_policy` (see result_cache.CachePolicy) have
+    their successful results served from an LRU until the TTL expires or an
+    invalidating event fires; attach_eventbus() wires those events up.
+
+    Concurrent identical dispatches of side-effect-free skills (declared
+    with `side_effects = False`, or implied by a cache_policy) are
+    coalesced: the first one runs, the others wait for and share its result.
+
+    I/O-bound skills can implement `async def run_async(entities, core)`
+    (optionally with a `cancel_token` kwarg). The dispatcher prefers it over
+    run() and awaits it on one shared event loop thread under the same
+    deadline, so a hundred concurrent web searches cost a hundred
+    coroutines instead of a hundred pool threads. Their default concurrency
+    cap is `async_max_concurrency`.
     """
     
-    def __init__(self, logger=None, timeout_seconds: float = 30.0, max_workers: int = 4):
+    def __init__(self, logger=None, timeout_seconds: float = 30.0, max_workers: int = 4,
+                 max_concurrency: Optional[int] = None, pre_check_ttl: float = 60.0,
+                 cache_size: int = 256, async_max_concurrency: int = 64):
         self.skills: Dict[str, Any] = {}
         self.logger = logger
         self.timeout_seconds = timeout_seconds
+        self.max_workers = max_workers
+        # default per-skill cap: one worker is always left for other skills
+        self.max_concurrency = max_concurrency or max(1, max_workers - 1)
         self.execution_stats = {}  # Track execution metrics per skill
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.latency = HistogramRegistry()  # per-skill latency distribution
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Skill")
+        self._async_executor = None  # waiters for dispatch_async (created lazily)
         self.async_tasks = {}  # Track async task results
+        self._task_seq = itertools.count(1)  # same-millisecond dispatches get distinct ids
         self.lock = threading.Lock()  # For thread-safe operations
+        self._limits: Dict[str, tuple] = {}  # intent -> (timeout, max_concurrency)
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._takes_token: Dict[str, bool] = {}
+        self.async_max_concurrency = async_max_concurrency
+        self._async_skills: Dict[str, bool] = {}  # intent -> implements run_async
+        self._loop = None  # shared event loop for run_async (started lazily)
+        self._loop_thread = None
+        self._closed = False
+        self._inflight: Dict[int, tuple] = {}  # id(token) -> (intent, token)
+        self.pre_check_ttl = pre_check_ttl
+        self._instances: Dict[str, Any] = {}  # intent -> live (warmed-up) skill instance
+        self._instance_lock = threading.Lock()
+        self._creation_locks: Dict[str, threading.Lock] = {}
+        self._pre_checks: Dict[str, tuple] = {}  # intent -> (expires_at, (ok, error))
+        self.lifecycle_stats = {"created": 0, "warmups": 0, "closed": 0,
+                                "pre_check_runs": 0, "pre_check_hits": 0}
+        self.result_cache = ResultCache(cache_size)
+        self._cache_policies: Dict[str, CachePolicy] = {}
+        self._invalidators: Dict[str, set] = {}  # event type -> intents whose cache it drops
+        self._eventbus = None
+        self._subscribed = set()
+        self._flights: Dict[Any, Future] = {}  # in-flight side-effect-free dispatches
+        self._flight_lock = threading.Lock()
+        self.coalesce_stats = {"leaders": 0, "coalesced": 0, "by_intent": {}}
 
     def _log(self, level: str, msg: str):
         """Log message using logger or print fallback"""
@@ -43,63 +125,235 @@ class SkillDispatcher:
                 return
         print(msg)
     
-    def _record_execution(self, intent: str, success: bool, duration_ms: float, error: str = None):
+    def _record_execution(self, intent: str, success: bool, duration_ms: float, error: str = None,
+                          timeout: bool = False):
         """Record execution statistics"""
-        if intent not in self.execution_stats:
-            self.execution_stats[intent] = {
-                "total": 0,
-                "success": 0,
-                "failures": 0,
-                "avg_time_ms": 0,
-                "last_error": None,
-                "timeouts": 0
-            }
-        
-        stats = self.execution_stats[intent]
-        stats["total"] += 1
-        stats["avg_time_ms"] = (stats["avg_time_ms"] + duration_ms) / 2
-        
-        if success:
-            stats["success"] += 1
-        else:
-            stats["failures"] += 1
-            stats["last_error"] = error
+        with self.lock:
+            if intent not in self.execution_stats:
+                self.execution_stats[intent] = {
+                    "total": 0,
+                    "success": 0,
+                    "failures": 0,
+                    "avg_time_ms": 0,
+                    "total_time_ms": 0.0,
+                    "last_error": None,
+                    "timeouts": 0
+                }
+            
+            stats = self.execution_stats[intent]
+            stats["total"] += 1
+            stats["total_time_ms"] += duration_ms
+            stats["avg_time_ms"] = stats["total_time_ms"] / stats["total"]
+            
+            if success:
+                stats["success"] += 1
+            else:
+                stats["failures"] += 1
+                stats["last_error"] = error
+            if timeout:
+                stats["timeouts"] += 1
+        self.latency.record(intent, duration_ms)
     
     def _validate_skill_requirements(self, intent: str, skill_cls: Any) -> tuple:
         """
-        Validate skill can be executed
+        Validate skill can be executed (pre_check result cached for its TTL)
         Returns: (can_execute: bool, error_message: str or None)
         """
-        # Check if skill has pre_check method
-        if hasattr(skill_cls, "pre_check") and callable(getattr(skill_cls, "pre_check")):
+        registered = skill_cls
+        if isinstance(skill_cls, LazySkill):
             try:
+                skill_cls = skill_cls.load()
+            except ImportError as e:
+                return (False, f"Import error: {e}")
+
+        # Check if skill has pre_check method
+        if not (hasattr(skill_cls, "pre_check") and callable(getattr(skill_cls, "pre_check"))):
+            return (True, None)  # No pre-check, assume OK
+
+        now = time.monotonic()
+        cached = self._pre_checks.get(intent)
+        if cached is not None and cached[0] > now:
+            self.lifecycle_stats["pre_check_hits"] += 1
+            return cached[1]
+
+        try:
+            shared = inspect.isclass(registered) or isinstance(registered, LazySkill)
+            if shared and self.skills.get(intent) is registered:
+                skill_instance = self.get_instance(intent)
+            else:
                 skill_instance = skill_cls() if inspect.isclass(skill_cls) else skill_cls
-                result = skill_instance.pre_check({})
-                
-                if isinstance(result, tuple):
-                    can_execute, message = result
-                    return (can_execute, message if not can_execute else None)
-                elif isinstance(result, bool):
-                    return (result, None if result else "Pre-check failed")
-                else:
-                    return (True, None)  # Assume OK if unknown return
+            result = skill_instance.pre_check({})
+            
+            if isinstance(result, tuple):
+                can_execute, message = result
+                outcome = (can_execute, message if not can_execute else None)
+            elif isinstance(result, bool):
+                outcome = (result, None if result else "Pre-check failed")
+            else:
+                outcome = (True, None)  # Assume OK if unknown return
+        except Exception as e:
+            outcome = (False, f"Pre-check error: {str(e)}")
+
+        self.lifecycle_stats["pre_check_runs"] += 1
+        ttl = getattr(skill_cls, "pre_check_ttl", None)
+        ttl = self.pre_check_ttl if ttl is None else ttl
+        if ttl > 0:
+            self._pre_checks[intent] = (now + ttl, outcome)
+        return outcome
+
+    def invalidate_pre_check(self, intent: Optional[str] = None):
+        """Forget cached pre_check outcomes (one skill or all), e.g. after installing a dependency"""
+        if intent is None:
+            self._pre_checks.clear()
+        else:
+            self._pre_checks.pop(intent, None)
+
+    # ---------- skill lifecycle ----------
+
+    def get_instance(self, intent: str):
+        """
+        Live instance for a skill: created (and warmed up) on first use,
+        then reused. Instances registered directly are warmed up once too.
+        """
+        instance = self._instances.get(intent)
+        if instance is not None:
+            return instance
+        # per-skill lock: a slow warmup doesn't hold up other skills' first dispatch
+        with self._creation_locks.setdefault(intent, threading.Lock()):
+            instance = self._instances.get(intent)
+            if instance is not None:
+                return instance
+            skill = self.skills[intent]
+            if inspect.isclass(skill) or isinstance(skill, LazySkill):
+                try:
+                    instance = skill.create() if isinstance(skill, LazySkill) else skill()
+                except Exception as e:
+                    raise SkillDependencyError(
+                        f"Skill {intent} could not be created: {e}",
+                        {"intent": intent, "error": str(e)}
+                    )
+                self.lifecycle_stats["created"] += 1
+                self._log("debug", f"[DISPATCHER] Instantiated {intent}")
+            else:
+                instance = skill
+            warmup = getattr(instance, "warmup", None)
+            if callable(warmup):
+                try:
+                    warmup()
+                    self.lifecycle_stats["warmups"] += 1
+                except Exception as e:
+                    self._log("warning", f"[DISPATCHER] {intent} warmup failed: {e}")
+            self._instances[intent] = instance
+            return instance
+
+    def warmup_all(self, intents=None) -> int:
+        """Eagerly create/warm up skills (all by default); returns how many are live"""
+        for intent in list(intents if intents is not None else self.skills):
+            try:
+                self.get_instance(intent)
+            except SkillError as e:
+                self._log("warning", f"[DISPATCHER] {e}")
+        return len(self._instances)
+
+    def _close_instance(self, intent: str):
+        instance = self._instances.pop(intent, None)
+        close = getattr(instance, "close", None)
+        if callable(close):
+            try:
+                close()
+                self.lifecycle_stats["closed"] += 1
             except Exception as e:
-                return (False, f"Pre-check error: {str(e)}")
-        
-        return (True, None)  # No pre-check, assume OK
+                self._log("warning", f"[DISPATCHER] {intent} close failed: {e}")
 
-    def register(self, intent_name, skill_cls):
+    def close_skills(self):
+        """Run close() on every live skill instance"""
+        with self._instance_lock:
+            for intent in list(self._instances):
+                self._close_instance(intent)
+
+    def register(self, intent_name, skill_cls, timeout: Optional[float] = None,
+                 max_concurrency: Optional[int] = None, cache_policy=None):
         """
         Registra una skill para un intent específico.
         
         Args:
             intent_name (str): Nombre del intent (ej: "open_app")
             skill_cls (class): Clase de la skill (no instancia)
+            timeout: deadline en segundos (default: skill.timeout_seconds o el del dispatcher)
+            max_concurrency: ejecuciones simultáneas (default: skill.max_concurrency o el del dispatcher)
+            cache_policy: CachePolicy o dict (default: skill.cache_policy; None = sin caché)
         """
+        is_async = _has_run_async(skill_cls)
+        timeout = timeout or getattr(skill_cls, "timeout_seconds", None) or self.timeout_seconds
+        max_concurrency = (max_concurrency or getattr(skill_cls, "max_concurrency", None)
+                           or (self.async_max_concurrency if is_async else self.max_concurrency))
         self.skills[intent_name] = skill_cls
+        self._async_skills[intent_name] = is_async
+        self._limits[intent_name] = (timeout, max_concurrency)
+        self._semaphores[intent_name] = threading.BoundedSemaphore(max_concurrency)
+        self._takes_token.pop(intent_name, None)
+        self._pre_checks.pop(intent_name, None)
+        self._set_cache_policy(intent_name, CachePolicy.coerce(
+            cache_policy if cache_policy is not None else getattr(skill_cls, "cache_policy", None)
+        ))
+        with self._instance_lock:
+            if intent_name in self._instances:
+                self._close_instance(intent_name)  # re-registration replaces the old instance
         self._log("debug", f"[DISPATCHER] Registered skill: {intent_name}")
 
-    def dispatch(self, intent, entities, core):
+    # ---------- result cache ----------
+
+    def _set_cache_policy(self, intent: str, policy: Optional[CachePolicy]):
+        self.result_cache.invalidate(intent)
+        for intents in self._invalidators.values():
+            intents.discard(intent)
+        if policy is None:
+            self._cache_policies.pop(intent, None)
+            return
+        self._cache_policies[intent] = policy
+        for event_type in policy.invalidate_on:
+            self._invalidators.setdefault(event_type, set()).add(intent)
+            self._subscribe_invalidator(event_type)
+
+    def attach_eventbus(self, eventbus):
+        """Subscribe to the events that invalidate cached skill results"""
+        self._eventbus = eventbus
+        for event_type in list(self._invalidators):
+            self._subscribe_invalidator(event_type)
+
+    def _subscribe_invalidator(self, event_type: str):
+        if self._eventbus is None or event_type in self._subscribed or event_type.startswith("skill."):
+            return  # "skill.<intent>" is raised locally after that skill runs
+        self._subscribed.add(event_type)
+        self._eventbus.subscribe(event_type, lambda event, et=event_type: self.invalidate_for_event(et))
+
+    def invalidate_for_event(self, event_type: str):
+        """Drop cached results of every skill whose policy lists `event_type`"""
+        for intent in self._invalidators.get(event_type, ()):
+            self.result_cache.invalidate(intent)
+
+    def invalidate_cache(self, intent: Optional[str] = None):
+        """Drop cached results of one skill (or all)"""
+        self.result_cache.invalidate(intent)
+
+    def cache_key(self, intent: str, entities: dict):
+        """Result-cache key dispatch() would use for this call (None: not cacheable)"""
+        policy = self._cache_policies.get(intent)
+        return policy.make_key(entities or {}) if policy is not None else None
+
+    def is_cached(self, intent: str, entities: dict) -> bool:
+        """Whether dispatch() would be served from the result cache right now"""
+        key = self.cache_key(intent, entities)
+        return key is not None and self.result_cache.peek(intent, key)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return {**self.result_cache.get_stats(), "cached_skills": sorted(self._cache_policies)}
+
+    def get_limits(self, intent_name: str) -> tuple:
+        """(timeout_seconds, max_concurrency) for a skill"""
+        return self._limits.get(intent_name, (self.timeout_seconds, self.max_concurrency))
+
+    def dispatch(self, intent, entities, core, cancel_token: Optional[CancelToken] = None):
         """
         Execute the skill corresponding to intent with robust error handling
         
@@ -107,6 +361,8 @@ class SkillDispatcher:
             intent (str): Intent to execute
             entities (dict): Extracted entities
             core: JarvisCore instance
+            cancel_token: parent token: cancelling it (or its deadline passing)
+                cancels this run too; such runs are never coalesced
             
         Returns:
             dict: Execution result with success/error/result fields
@@ -131,6 +387,104 @@ class SkillDispatcher:
                 }
             )
         
+        # 1b. Cached result (skills with a cache_policy)
+        policy = self._cache_policies.get(intent)
+        cache_key = policy.make_key(entities or {}) if policy is not None else None
+        if cache_key is not None:
+            hit, cached = self.result_cache.get(intent, cache_key)
+            if hit:
+                duration_ms = (time.time() - start_time) * 1000
+                self._log("debug", f"[DISPATCHER] {intent} served from cache ({duration_ms:.2f}ms)")
+                return {
+                    "success": cached.get("success", True),
+                    "intent": intent,
+                    "result": dict(cached),
+                    "execution_time_ms": duration_ms,
+                    "cached": True
+                }
+            # a run that straddles an invalidation must not store its (stale) result
+            cache_generation = self.result_cache.generation(intent)
+        else:
+            cache_generation = None
+        
+        # 1c. Single-flight: identical in-flight dispatches of side-effect-free skills share one run
+        flight_key = self._flight_key(intent, entities, policy, cache_key) if cancel_token is None else None
+        if flight_key is None:
+            return self._execute(intent, entities, core, start_time, policy, cache_key, cache_generation,
+                                 cancel_token)
+
+        with self._flight_lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[flight_key] = Future()
+                self.coalesce_stats["leaders"] += 1
+            else:
+                self.coalesce_stats["coalesced"] += 1
+                self.coalesce_stats["by_intent"][intent] = self.coalesce_stats["by_intent"].get(intent, 0) + 1
+
+        if not leader:
+            timeout = self.get_limits(intent)[0]
+            try:
+                # the leader enforces the deadline; the margin only covers its bookkeeping
+                response = flight.result(timeout=timeout + 1.0)
+            except FutureTimeoutError:
+                raise SkillTimeoutError(
+                    f"Skill {intent} exceeded {timeout}s timeout (coalesced)",
+                    {"intent": intent, "timeout_seconds": timeout}
+                )
+            self._log("debug", f"[DISPATCHER] {intent} coalesced with an in-flight run")
+            return {**response, "result": dict(response["result"]), "coalesced": True,
+                    "execution_time_ms": (time.time() - start_time) * 1000}
+
+        try:
+            response = self._execute(intent, entities, core, start_time, policy, cache_key, cache_generation)
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(response)
+            return response
+        finally:
+            with self._flight_lock:
+                self._flights.pop(flight_key, None)
+
+    def _flight_key(self, intent: str, entities, policy, cache_key):
+        """Coalescing key, or None when the skill may have side effects or the call is nested"""
+        if current_cancel_token() is not None:
+            return None  # nested dispatch: could end up waiting on its own flight
+        if policy is not None:
+            return (intent, cache_key) if cache_key is not None else None
+        if not self.is_read_only(intent):
+            return None
+        try:
+            key = (intent, freeze(entities or {}))
+            hash(key)
+            return key
+        except TypeError:
+            return None
+
+    def is_read_only(self, intent: str) -> bool:
+        """Side-effect-free skill: declares `side_effects = False` or has a cache_policy"""
+        if intent in self._cache_policies:
+            return True
+        return getattr(self.skills.get(intent), "side_effects", True) is False
+
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """Single-flight counters: runs that led a flight vs dispatches that joined one"""
+        with self._flight_lock:
+            total = self.coalesce_stats["leaders"] + self.coalesce_stats["coalesced"]
+            return {
+                "leaders": self.coalesce_stats["leaders"],
+                "coalesced": self.coalesce_stats["coalesced"],
+                "coalesced_rate": (self.coalesce_stats["coalesced"] / total) if total else 0.0,
+                "in_flight": len(self._flights),
+                "by_intent": dict(self.coalesce_stats["by_intent"]),
+            }
+
+    def _execute(self, intent, entities, core, start_time, policy, cache_key, cache_generation,
+                 cancel_token=None):
+        """Validate, run and record one skill execution (dispatch() minus cache/coalescing)"""
         try:
             skill_cls = self.skills[intent]
             
@@ -145,33 +499,22 @@ class SkillDispatcher:
                     {"intent": intent, "validation_error": validation_error}
                 )
             
-            # 3. Instantiate skill
-            if inspect.isclass(skill_cls):
-                skill_instance = skill_cls()
-                self._log("debug", f"[DISPATCHER] Instantiated {intent}")
-            else:
-                skill_instance = skill_cls
-                self._log("debug", f"[DISPATCHER] Using cached instance for {intent}")
+            # 3. Live instance (created and warmed up on first dispatch only)
+            skill_instance = self.get_instance(intent)
             
             # 4. Execute with timeout protection
             self._log("info", f"[DISPATCHER] Executing: {intent} | entities: {list(entities.keys())}")
             
             execution_start = time.time()
-            
-            # Simple timeout using try-except (no threading required for now)
             try:
-                result = skill_instance.run(entities, core)
-            except TimeoutError as e:
+                result = self._run_with_deadline(intent, skill_instance, entities, core, cancel_token)
+            except SkillTimeoutError as e:
                 duration_ms = (time.time() - start_time) * 1000
-                self._record_execution(intent, False, duration_ms, "timeout")
-                
-                raise SkillTimeoutError(
-                    f"Skill {intent} exceeded {self.timeout_seconds}s timeout",
-                    {"intent": intent, "timeout_seconds": self.timeout_seconds}
-                )
+                self._record_execution(intent, False, duration_ms, "timeout", timeout=True)
+                self._log("warning", f"[DISPATCHER] {intent} ⏱ {e}")
+                raise
             
-            execution_time = time.time() - execution_start
-            duration_ms = execution_time * 1000
+            duration_ms = (time.time() - execution_start) * 1000
             
             # 5. Validate result structure
             if not isinstance(result, dict):
@@ -181,6 +524,10 @@ class SkillDispatcher:
             # 6. Record execution
             success = result.get("success", True)
             self._record_execution(intent, success, duration_ms)
+            if cache_key is not None and (success or policy.cache_failures):
+                self.result_cache.put(intent, cache_key, dict(result), policy.ttl, generation=cache_generation)
+            if success and self._invalidators:
+                self.invalidate_for_event(f"skill.{intent}")
             
             # 7. Format response
             response = {
@@ -211,6 +558,204 @@ class SkillDispatcher:
                 {"intent": intent, "error": str(e)}
             )
 
+    def _run_with_deadline(self, intent: str, skill_instance, entities, core, parent_token=None):
+        """
+        Run the skill on the pool (run) or the event loop (run_async) and
+        wait up to the skill's timeout.
+
+        The deadline covers waiting for a concurrency slot, queueing and the
+        run itself. Nested dispatches (a skill dispatching another skill) run
+        inline on the calling worker under the outer deadline, so they can't
+        deadlock the pool waiting on themselves.
+        """
+        timeout, _ = self.get_limits(intent)
+        is_async = self._async_skills.get(intent)
+        if is_async is None:  # instance handed over without register()
+            is_async = self._async_skills[intent] = _has_run_async(skill_instance)
+        takes_token = self._takes_token.get(intent)
+        if takes_token is None:
+            takes_token = self._takes_token[intent] = _accepts_cancel_token(
+                skill_instance.run_async if is_async else skill_instance.run
+            )
+
+        outer = current_cancel_token()
+        if outer is not None:
+            outer.check()
+            if is_async:
+                return self._run_nested_async(intent, skill_instance, entities, core, outer, takes_token)
+            return self._call_skill(skill_instance, entities, core, outer, takes_token)
+
+        deadline = time.monotonic() + timeout
+        reason = f"timeout after {timeout}s"
+        if parent_token is not None:
+            token = parent_token.child(deadline)
+            token.check()
+            if token.deadline < deadline:
+                reason = "deadline"  # the parent's deadline comes first
+            deadline = token.deadline
+        else:
+            token = CancelToken(deadline)
+        semaphore = self._semaphores.get(intent)
+        if semaphore is not None and not semaphore.acquire(timeout=max(0.0, deadline - time.monotonic())):
+            raise SkillTimeoutError(
+                f"Skill {intent} has no free slot after {timeout}s "
+                f"({self.get_limits(intent)[1]} running)",
+                {"intent": intent, "timeout_seconds": timeout, "reason": "concurrency_limit"}
+            )
+        if is_async:
+            return self._run_async_with_deadline(intent, skill_instance, entities, core,
+                                                 token, takes_token, semaphore, timeout, reason)
+
+        def _work():
+            reset = _current_token.set(token)
+            with self.lock:
+                self._inflight[id(token)] = (intent, token)
+            try:
+                token.check()  # deadline passed while queued
+                return self._call_skill(skill_instance, entities, core, token, takes_token)
+            finally:
+                _current_token.reset(reset)
+                with self.lock:
+                    self._inflight.pop(id(token), None)
+                if semaphore is not None:
+                    semaphore.release()
+
+        try:
+            future = self.executor.submit(_work)
+        except RuntimeError:
+            if semaphore is not None:
+                semaphore.release()
+            raise SkillError(f"Dispatcher shut down, cannot run {intent}", {"intent": intent})
+
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            if future.done() and not future.cancelled():
+                # finished at the deadline: its value, or the skill's own TimeoutError (e.g. a socket timeout)
+                return future.result()
+            token.cancel(reason)
+            if future.cancel() and semaphore is not None:
+                semaphore.release()  # never started: _work won't release it
+            raise SkillTimeoutError(
+                f"Skill {intent} exceeded {timeout}s timeout",
+                {"intent": intent, "timeout_seconds": timeout}
+            )
+
+    def _run_async_with_deadline(self, intent, skill_instance, entities, core,
+                                 token, takes_token, semaphore, timeout, reason=None):
+        """Await run_async on the shared loop; the caller blocks, no pool worker is used"""
+        try:
+            loop = self._get_loop()
+        except SkillError:
+            if semaphore is not None:
+                semaphore.release()
+            raise
+
+        async def _guarded():
+            _current_token.set(token)  # the task runs in its own context copy
+            token.check()
+            try:
+                return await asyncio.wait_for(
+                    self._call_skill_async(skill_instance, entities, core, token, takes_token),
+                    token.remaining()
+                )
+            except asyncio.TimeoutError:
+                if token.remaining() > 0:
+                    raise  # the skill's own timeout, not the deadline
+                token.cancel(reason or f"timeout after {timeout}s")
+                raise SkillTimeoutError(
+                    f"Skill {intent} exceeded {timeout}s timeout",
+                    {"intent": intent, "timeout_seconds": timeout}
+                )
+
+        def _done(_future):
+            with self.lock:
+                self._inflight.pop(id(token), None)
+            if semaphore is not None:
+                semaphore.release()
+
+        with self.lock:
+            self._inflight[id(token)] = (intent, token)
+        future = asyncio.run_coroutine_threadsafe(_guarded(), loop)
+        future.add_done_callback(_done)
+
+        try:
+            # wait_for on the loop enforces the deadline; the margin covers the hop back
+            return future.result(timeout=token.remaining() + 1.0)
+        except FutureTimeoutError:
+            if future.done() and not future.cancelled():
+                return future.result()  # finished at the deadline, or the skill's own TimeoutError
+            token.cancel(reason or f"timeout after {timeout}s")
+            future.cancel()
+            raise SkillTimeoutError(
+                f"Skill {intent} exceeded {timeout}s timeout",
+                {"intent": intent, "timeout_seconds": timeout}
+            )
+
+    def _run_nested_async(self, intent, skill_instance, entities, core, outer, takes_token):
+        """Nested dispatch of an async skill: sync run() inline if it has one, else via the loop"""
+        run = getattr(skill_instance, "run", None)
+        if callable(run):
+            return self._call_skill(skill_instance, entities, core, outer, _accepts_cancel_token(run))
+        loop = self._get_loop()
+        if threading.current_thread() is self._loop_thread:
+            raise SkillError(
+                f"Skill {intent} is async-only and can't be dispatched synchronously from the event loop",
+                {"intent": intent}
+            )
+        future = asyncio.run_coroutine_threadsafe(
+            self._call_skill_async(skill_instance, entities, core, outer, takes_token), loop
+        )
+        try:
+            return future.result(timeout=outer.remaining())
+        except FutureTimeoutError:
+            if future.done() and not future.cancelled():
+                raise
+            future.cancel()
+            outer.check()
+            raise SkillTimeoutError(f"Skill {intent} exceeded the outer deadline", {"intent": intent})
+
+    @staticmethod
+    def _call_skill(skill_instance, entities, core, token, takes_token):
+        if takes_token:
+            return skill_instance.run(entities, core, cancel_token=token)
+        return skill_instance.run(entities, core)
+
+    @staticmethod
+    async def _call_skill_async(skill_instance, entities, core, token, takes_token):
+        if takes_token:
+            return await skill_instance.run_async(entities, core, cancel_token=token)
+        return await skill_instance.run_async(entities, core)
+
+    # ---------- shared event loop ----------
+
+    def _get_loop(self):
+        """The loop that runs every run_async, started on first use"""
+        with self.lock:
+            if self._closed:
+                raise SkillError("Dispatcher shut down, event loop closed", {})
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=self._loop_main, args=(loop,),
+                                          name="SkillLoop", daemon=True)
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _loop_main(loop):
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
     def list_skills(self):
         """Return list of available skills"""
         return list(self.skills.keys())
@@ -228,9 +773,26 @@ class SkillDispatcher:
             "class": skill_cls.__name__ if hasattr(skill_cls, "__name__") else "UnknownSkill",
             "doc": skill_cls.__doc__ or "No documentation",
             "has_pre_check": hasattr(skill_cls, "pre_check"),
+            "timeout_seconds": self.get_limits(intent_name)[0],
+            "max_concurrency": self.get_limits(intent_name)[1],
+            "async": self._async_skills.get(intent_name, False),
             "stats": stats
         }
     
+    def get_inflight(self) -> list:
+        """Skills currently running on the pool or the loop (including ones past their deadline)"""
+        now = time.monotonic()
+        with self.lock:
+            running = list(self._inflight.values())
+        return [
+            {
+                "intent": intent,
+                "overdue_s": max(0.0, now - token.deadline) if token.deadline else 0.0,
+                "cancelled": token.cancelled,
+            }
+            for intent, token in running
+        ]
+
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get execution statistics for all skills"""
         return {
@@ -255,12 +817,33 @@ class SkillDispatcher:
         return {
             **stats,
             "success_rate": f"{success_rate:.1f}%",
-            "timeout_rate": f"{timeout_rate:.1f}%"
+            "timeout_rate": f"{timeout_rate:.1f}%",
+            "latency": self.latency.snapshot(intent_name)
         }
+
+    def get_latency_report(self, worst: Optional[int] = None) -> Dict[str, Any]:
+        """{intent: {count, mean_ms, p50_ms, p90_ms, p99_ms, max_ms}}, optionally only the `worst` by p99"""
+        if worst is not None:
+            return dict(self.latency.worst(worst))
+        return self.latency.snapshot()
     
+    def get_lifecycle_stats(self) -> Dict[str, Any]:
+        """Instance / pre_check cache counters"""
+        return {
+            **self.lifecycle_stats,
+            "live_instances": len(self._instances),
+            "registered": len(self.skills),
+            "cached_pre_checks": len(self._pre_checks),
+        }
+
     def reset_stats(self):
         """Reset execution statistics"""
-        self.execution_stats.clear()
+        with self.lock:
+            self.execution_stats.clear()
+        self.latency.reset()
+        self.result_cache.reset_stats()
+        with self._flight_lock:
+            self.coalesce_stats = {"leaders": 0, "coalesced": 0, "by_intent": {}}
     
     def dispatch_async(self, intent: str, entities: dict, core=None) -> str:
         """
@@ -270,7 +853,7 @@ class SkillDispatcher:
         Returns:
             task_id: str for tracking the async task
         """
-        task_id = f"{intent}_{int(time.time() * 1000)}"
+        task_id = f"{intent}_{int(time.time() * 1000)}_{next(self._task_seq)}"
         
         def _async_task():
             try:
@@ -278,7 +861,14 @@ class SkillDispatcher:
             except Exception as e:
                 return {"success": False, "error": str(e)}
         
-        future = self.executor.submit(_async_task)
+        # waits on its own pool: an async dispatch must not occupy the skill
+        # worker that its own skill needs
+        with self.lock:
+            if self._async_executor is None:
+                self._async_executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="SkillAsync"
+                )
+        future = self._async_executor.submit(_async_task)
         
         with self.lock:
             self.async_tasks[task_id] = {
@@ -339,7 +929,21 @@ class SkillDispatcher:
         self._log("debug", f"[DISPATCHER] Cleaned {len(expired)} async tasks")
         return len(expired)
     
-    def shutdown(self):
-        """Graceful shutdown of executor"""
-        self.executor.shutdown(wait=True)
+    def shutdown(self, wait: bool = True):
+        """Graceful shutdown of executor (running skills are asked to cancel)"""
+        with self.lock:
+            running = [token for _, token in self._inflight.values()]
+        for token in running:
+            token.cancel("shutdown")
+        if self._async_executor is not None:
+            self._async_executor.shutdown(wait=wait, cancel_futures=True)
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+        with self.lock:
+            self._closed = True
+            loop, thread = self._loop, self._loop_thread
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)  # pending coroutines are cancelled on the way out
+            if wait:
+                thread.join(timeout=5.0)
+        self.close_skills()
         self._log("info", "[DISPATCHER] Executor shut down")
\ No newline at end of file
@@ -0,0 +1,254 @@
+# skills/actions/manifest.py
+"""
+Skill manifest and lazy skill registry.
+
+skills/manifest.json describes every skill without importing it:
+
+    "search_file": {
+        "module": "skills.research.search_file", "class": "SearchFileSkill",
+        "init": [],                      # constructor args, as attributes of the core
+        "patterns": [...], "entity_hints": {...},
+        "side_effects": false, "cost": "high",
+        "timeout_seconds": 20.0, "max_concurrency": 1, "async": false,
+        "cache_policy": {"ttl": 30.0, "key": ["file", "search_query", "path"], ...}
+    }
+
+lazy_registry() turns it into LazySkill placeholders that carry the same
+class attributes the NLU and SkillDispatcher read (patterns, entity_hints,
+cache_policy, ...), so both work off the manifest at boot and the skill
+module is only imported when the dispatcher first needs an instance.
+
+Regenerate the code-derived fields after editing a skill:
+
+    python -m skills.actions.manifest --write
+"""
+
+import importlib
+import inspect
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "manifest.json")
+
+# Fields maintained by hand; everything else is read from the skill class by build_manifest()
+MANUAL_FIELDS = ("module", "class", "init", "cost", "side_effects")
+COSTS = ("low", "medium", "high")
+
+
+def load_manifest(path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """intent -> manifest entry"""
+    with open(path or MANIFEST_PATH, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    for intent, entry in manifest.items():
+        missing = [field for field in ("module", "class") if not entry.get(field)]
+        if missing:
+            raise ValueError(f"manifest entry {intent!r} lacks {', '.join(missing)}")
+    return manifest
+
+
+class LazySkill:
+    """
+    Registry placeholder for a skill that hasn't been imported yet.
+
+    Exposes the manifest's metadata under the attribute names skill classes
+    use; load() imports the class (once, timing it), create() builds the
+    instance with its `init` args resolved against `context` (the core).
+    """
+
+    def __init__(self, intent: str, entry: Dict[str, Any], context=None):
+        self.intent = intent
+        self.module = entry["module"]
+        self.class_name = entry["class"]
+        self.init = list(entry.get("init") or [])
+        self.patterns = list(entry.get("patterns") or [])
+        self.entity_hints = dict(entry.get("entity_hints") or {})
+        self.side_effects = entry.get("side_effects", True)
+        self.cost = entry.get("cost", "medium")
+        self.timeout_seconds = entry.get("timeout_seconds")
+        self.max_concurrency = entry.get("max_concurrency")
+        self.cache_policy = entry.get("cache_policy")
+        self.is_async = bool(entry.get("async", False))
+        self.__doc__ = entry.get("description") or f"Skill: {intent}"
+        self.context = context
+        self.import_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self._cls = None
+        self._lock = threading.Lock()
+
+    @property
+    def __name__(self):
+        return self.class_name
+
+    @property
+    def loaded(self) -> bool:
+        return self._cls is not None
+
+    def load(self):
+        """Import and return the skill class (an import failure is remembered and re-raised)"""
+        if self._cls is not None:
+            return self._cls
+        with self._lock:
+            if self._cls is None:
+                if self.error is not None:
+                    raise ImportError(self.error)
+                start = time.perf_counter()
+                try:
+                    self._cls = getattr(importlib.import_module(self.module), self.class_name)
+                except Exception as e:
+                    self.error = f"{type(e).__name__}: {e}"
+                    raise ImportError(self.error) from e
+                finally:
+                    self.import_ms = (time.perf_counter() - start) * 1000
+        return self._cls
+
+    def create(self):
+        """New instance of the skill"""
+        cls = self.load()
+        return cls(*(self._resolve(name) for name in self.init))
+
+    def _resolve(self, path: str):
+        value = self.context
+        for attr in path.split("."):
+            value = getattr(value, attr)
+        return value
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else ("failed" if self.error else "lazy")
+        return f"<LazySkill {self.intent} {self.module}:{self.class_name} ({state})>"
+
+
+def lazy_registry(manifest: Optional[Dict[str, Dict[str, Any]]] = None, context=None,
+                  intents=None) -> Dict[str, LazySkill]:
+    """intent -> LazySkill for every manifest entry (or only `intents`)"""
+    manifest = manifest if manifest is not None else load_manifest()
+    return {
+        intent: LazySkill(intent, entry, context)
+        for intent, entry in manifest.items()
+        if intents is None or intent in intents
+    }
+
+
+def preload(registry: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Import every LazySkill's module (no instances); returns import_report()"""
+    for skill in registry.values():
+        if isinstance(skill, LazySkill):
+            try:
+                skill.load()
+            except ImportError:
+                pass
+    return import_report(registry)
+
+
+def import_report(registry: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Per-skill import status and time, slowest first"""
+    rows = []
+    for intent, skill in registry.items():
+        if not isinstance(skill, LazySkill):
+            continue
+        rows.append({
+            "intent": intent,
+            "module": skill.module,
+            "status": "loaded" if skill.loaded else ("failed" if skill.error else "lazy"),
+            "import_ms": skill.import_ms,
+            "error": skill.error,
+        })
+    return sorted(rows, key=lambda row: row["import_ms"] or 0.0, reverse=True)
+
+
+def format_import_report(rows: List[Dict[str, Any]], top: int = 5) -> str:
+    loaded = [row for row in rows if row["status"] == "loaded"]
+    failed = [row for row in rows if row["status"] == "failed"]
+    total = sum(row["import_ms"] or 0.0 for row in rows)
+    lines = [f"{len(loaded)}/{len(rows)} skills imported in {total:.1f}ms"]
+    for row in loaded[:top]:
+        lines.append(f"  {row['intent']}: {row['import_ms']:.1f}ms")
+    for row in failed:
+        lines.append(f"  {row['intent']}: FAILED ({row['error']})")
+    return "\n".join(lines)
+
+
+# ---------- manifest generation ----------
+
+def _policy_to_dict(policy) -> Optional[Dict[str, Any]]:
+    from skills.actions.result_cache import CachePolicy
+
+    policy = CachePolicy.coerce(policy)
+    if policy is None:
+        return None
+    if callable(policy.key):
+        raise ValueError("callable cache keys can't be described in the manifest")
+    return {
+        "ttl": policy.ttl,
+        "key": list(policy.key) if policy.key is not None else None,
+        "invalidate_on": list(policy.invalidate_on),
+        "cache_failures": policy.cache_failures,
+    }
+
+
+def describe(cls) -> Dict[str, Any]:
+    """Code-derived manifest fields of a skill class"""
+    doc = inspect.getdoc(cls) or ""
+    return {
+        "description": doc.splitlines()[0] if doc else "",
+        "patterns": list(getattr(cls, "patterns", None) or []),
+        "entity_hints": dict(getattr(cls, "entity_hints", None) or {}),
+        "timeout_seconds": getattr(cls, "timeout_seconds", None),
+        "max_concurrency": getattr(cls, "max_concurrency", None),
+        "async": inspect.iscoroutinefunction(getattr(cls, "run_async", None)),
+        "cache_policy": _policy_to_dict(getattr(cls, "cache_policy", None)),
+    }
+
+
+def build_manifest(manifest: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Refresh the code-derived fields of every entry, keeping the hand-maintained ones"""
+    built = {}
+    for intent, entry in manifest.items():
+        cls = getattr(importlib.import_module(entry["module"]), entry["class"])
+        declared = getattr(cls, "side_effects", None)
+        built[intent] = {
+            **{field: entry[field] for field in MANUAL_FIELDS if field in entry},
+            **describe(cls),
+        }
+        if declared is not None:
+            built[intent]["side_effects"] = declared
+        if built[intent].get("cost") not in COSTS:
+            raise ValueError(f"{intent}: cost must be one of {COSTS}")
+    return built
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Skill manifest tools")
+    parser.add_argument("--write", action="store_true", help="regenerate code-derived fields in place")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the manifest is out of date")
+    parser.add_argument("--report", action="store_true", help="import every skill and print the timings")
+    args = parser.parse_args(argv)
+
+    import system.core.exceptions  # noqa: F401 - package import order (skills import the dispatcher)
+
+    manifest = load_manifest()
+    if args.report:
+        print(format_import_report(preload(lazy_registry(manifest)), top=len(manifest)))
+    if args.write or args.check:
+        built = json.loads(json.dumps(build_manifest(manifest)))  # tuples -> lists, as stored
+        if args.check:
+            stale = sorted(intent for intent in built if built[intent] != manifest.get(intent))
+            if stale:
+                print(f"Manifest out of date: {', '.join(stale)}")
+                return 1
+            print("Manifest up to date")
+        else:
+            with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+                json.dump(built, f, indent=2, ensure_ascii=False)
+                f.write("\n")
+            print(f"Wrote {len(built)} skills to {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,202 @@
+# skills/actions/result_cache.py
+"""
+Result cache for idempotent skills.
+
+A skill opts in by declaring a policy on its class:
+
+    class SystemStatusSkill:
+        cache_policy = CachePolicy(ttl=5.0, key=())
+
+    class SearchFileSkill:
+        cache_policy = CachePolicy(ttl=30.0, key=("file", "search_query", "path"),
+                                   invalidate_on=("skill.create_note",))
+
+SkillDispatcher serves repeat dispatches with the same key from an LRU
+until the TTL expires or one of the `invalidate_on` events fires.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+
+class CachePolicy:
+    """
+    Args:
+        ttl: seconds a result stays valid
+        key: how entities map to a cache key. A tuple of entity names uses
+            only those entities (() = one shared result for any input), a
+            callable(entities) -> hashable computes it, None uses all entities.
+        invalidate_on: event types that drop every cached result of the
+            skill (EventBus events, or "skill.<intent>" after that skill runs)
+        cache_failures: also cache results with success=False
+    """
+
+    __slots__ = ("ttl", "key", "invalidate_on", "cache_failures")
+
+    def __init__(self, ttl: float, key: Union[None, Tuple[str, ...], Callable[[dict], Any]] = None,
+                 invalidate_on: Iterable[str] = (), cache_failures: bool = False):
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        self.ttl = ttl
+        self.key = tuple(key) if isinstance(key, (list, tuple)) else key
+        self.invalidate_on = tuple(invalidate_on)
+        self.cache_failures = cache_failures
+
+    @classmethod
+    def coerce(cls, policy) -> Optional["CachePolicy"]:
+        """Accept a CachePolicy, a dict of its arguments, or None"""
+        if policy is None or isinstance(policy, cls):
+            return policy
+        if isinstance(policy, dict):
+            return cls(**policy)
+        raise TypeError(f"invalid cache policy: {policy!r}")
+
+    def make_key(self, entities: dict):
+        """Hashable key for `entities` (None if it can't be built: don't cache)"""
+        try:
+            if callable(self.key):
+                key = self.key(entities)
+            elif self.key is None:
+                key = freeze(entities)
+            else:
+                key = tuple(freeze(entities.get(name)) for name in self.key)
+            hash(key)
+            return key
+        except Exception:
+            return None
+
+
+def freeze(value):
+    """Recursively turn dicts/lists/sets into hashable tuples"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(freeze(v) for v in value))
+    return value
+
+
+class ResultCache:
+    """
+    Thread-safe LRU of (intent, key) -> result with per-entry expiry.
+
+    Invalidating an intent bumps its generation instead of scanning the
+    LRU; entries from an older generation count as misses and are dropped
+    when next touched (or evicted by newer ones). Invalidating everything
+    bumps a global epoch that is part of every intent's generation.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # -> (expires_at, generation, result)
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0  # bumped by invalidate(None)
+        self._lock = threading.Lock()
+        self._per_intent: Dict[str, Dict[str, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.stale_puts = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _intent_stats(self, intent: str) -> Dict[str, int]:
+        stats = self._per_intent.get(intent)
+        if stats is None:
+            stats = self._per_intent[intent] = {"hits": 0, "misses": 0}
+        return stats
+
+    def get(self, intent: str, key) -> Tuple[bool, Any]:
+        """(hit, result)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((intent, key))
+            if entry is not None:
+                expires_at, generation, result = entry
+                if expires_at > now and generation == self._generation(intent):
+                    self._entries.move_to_end((intent, key))
+                    self.hits += 1
+                    self._intent_stats(intent)["hits"] += 1
+                    return True, result
+                del self._entries[(intent, key)]
+                self.expired += 1
+            self.misses += 1
+            self._intent_stats(intent)["misses"] += 1
+            return False, None
+
+    def peek(self, intent: str, key) -> bool:
+        """Whether a valid entry exists, without touching LRU order or hit/miss counters"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((intent, key))
+            return entry is not None and entry[0] > now and entry[1] == self._generation(intent)
+
+    def _generation(self, intent: str) -> Tuple[int, int]:
+        return self._epoch, self._generations.get(intent, 0)
+
+    def generation(self, intent: str) -> Tuple[int, int]:
+        """Current generation of `intent` (capture it before running, pass it to put())"""
+        with self._lock:
+            return self._generation(intent)
+
+    def put(self, intent: str, key, result, ttl: float, generation: Optional[Tuple[int, int]] = None):
+        """
+        Store `result`. With `generation` (captured when the run started), the
+        write is dropped if the intent was invalidated meanwhile: the run may
+        have seen the old state.
+        """
+        with self._lock:
+            current = self._generation(intent)
+            if generation is not None and generation != current:
+                self.stale_puts += 1
+                return
+            self._entries[(intent, key)] = (time.monotonic() + ttl, current, result)
+            self._entries.move_to_end((intent, key))
+            self.stores += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, intent: Optional[str] = None):
+        """Drop every cached result of `intent` (or everything)"""
+        with self._lock:
+            self.invalidations += 1
+            if intent is None:
+                self._epoch += 1
+                self._entries.clear()
+                return
+            self._generations[intent] = self._generations.get(intent, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            per_intent = {
+                intent: {**stats, "hit_rate": stats["hits"] / (stats["hits"] + stats["misses"])}
+                for intent, stats in self._per_intent.items() if stats["hits"] + stats["misses"]
+            }
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "stores": self.stores,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "stale_puts": self.stale_puts,
+                "by_intent": per_intent,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = self.stores = 0
+            self.expired = self.evictions = self.invalidations = self.stale_puts = 0
+            self._per_intent.clear()
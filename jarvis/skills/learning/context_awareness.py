@@ -3,12 +3,13 @@ Smart Context Awareness System
 Learns from user interaction patterns to provide more relevant responses and predictions
 """
 
-import json
 import os
 from datetime import datetime, timedelta
 from collections import defaultdict
 from typing import Dict, List, Tuple, Optional
 
+from data.journal import JournaledState
+
 
 class ContextAwareness:
     """
@@ -19,69 +20,92 @@ class ContextAwareness:
     - Personalizes responses
     """
     
-    def __init__(self, data_dir: str = None):
+    def __init__(self, data_dir: str = None, scheduler=None, flush_interval: float = 60):
+        """
+        Args:
+            data_dir: folder of context_awareness.json
+            scheduler: optional Scheduler; if given, pending changes are flushed every `flush_interval` s
+                (otherwise on close() / interpreter exit)
+        """
         self.data_dir = data_dir or os.path.join(os.path.dirname(__file__), "..", "..", "data")
         self.context_file = os.path.join(self.data_dir, "context_awareness.json")
-        self.data = self._load_data()
-        
-    def _load_data(self) -> Dict:
-        """Load context data from disk"""
-        if os.path.exists(self.context_file):
-            try:
-                with open(self.context_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
-        
+        # In-memory state + append-only journal, shared by every instance on the same file;
+        # the JSON is rewritten only on flush()
+        self.store = JournaledState.shared(self.context_file, self._default_data, self._apply_interaction)
+        self.data = self.store.state
+        self._released = False
+        if scheduler is not None:
+            scheduler.schedule_every(flush_interval, self.flush)
+    
+    @staticmethod
+    def _default_data() -> Dict:
         return {
             "user_preferences": {},
             "time_patterns": defaultdict(list),
             "skill_frequency": defaultdict(int),
             "last_interactions": [],
             "context_chain": [],
-            "predictions": []
+            "predictions": [],
+            "journal_seq": 0
         }
     
-    def _save_data(self):
-        """Save context data to disk"""
-        os.makedirs(self.data_dir, exist_ok=True)
-        try:
-            with open(self.context_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, default=str)
-        except:
-            pass
-    
-    def record_interaction(self, skill_name: str, input_text: str, output_text: str, 
-                          timestamp: datetime = None) -> None:
-        """Record an interaction for pattern analysis"""
-        if timestamp is None:
-            timestamp = datetime.now()
+    @staticmethod
+    def _apply_interaction(data: Dict, op: Dict) -> None:
+        """Apply one journaled interaction (skipped if the snapshot already includes its seq)"""
+        if op["seq"] <= data.get("journal_seq", 0):
+            return
+        data["journal_seq"] = op["seq"]
+        skill_name = op["skill"]
         
         # Track skill frequency
-        self.data["skill_frequency"][skill_name] = self.data["skill_frequency"].get(skill_name, 0) + 1
+        data["skill_frequency"][skill_name] = data["skill_frequency"].get(skill_name, 0) + 1
         
         # Track time patterns
-        hour = timestamp.hour
-        time_key = f"hour_{hour:02d}"
-        self.data["time_patterns"][time_key] = self.data["time_patterns"].get(time_key, [])
-        self.data["time_patterns"][time_key].append(skill_name)
+        time_key = f"hour_{op['hour']:02d}"
+        data["time_patterns"][time_key] = data["time_patterns"].get(time_key, [])
+        data["time_patterns"][time_key].append(skill_name)
         
         # Track interaction chain
-        interaction = {
-            "timestamp": timestamp.isoformat(),
+        data["last_interactions"].append({
+            "timestamp": op["timestamp"],
             "skill": skill_name,
-            "input": input_text[:100],  # First 100 chars
-            "hour": hour,
-            "day": timestamp.strftime("%A")
-        }
-        
-        self.data["last_interactions"].append(interaction)
+            "input": op["input"],
+            "hour": op["hour"],
+            "day": op["day"]
+        })
         
         # Keep last 1000 interactions
-        if len(self.data["last_interactions"]) > 1000:
-            self.data["last_interactions"] = self.data["last_interactions"][-1000:]
+        if len(data["last_interactions"]) > 1000:
+            data["last_interactions"] = data["last_interactions"][-1000:]
+    
+    def record_interaction(self, skill_name: str, input_text: str, output_text: str, 
+                          timestamp: datetime = None) -> None:
+        """Record an interaction for pattern analysis (in memory + one journal line)"""
+        if timestamp is None:
+            timestamp = datetime.now()
         
-        self._save_data()
+        with self.store.lock:
+            self.store.record({
+                "seq": self.data.get("journal_seq", 0) + 1,
+                "timestamp": timestamp.isoformat(),
+                "skill": skill_name,
+                "input": input_text[:100],  # First 100 chars
+                "hour": timestamp.hour,
+                "day": timestamp.strftime("%A")
+            })
+    
+    def flush(self) -> bool:
+        """Write context_awareness.json if there are pending changes"""
+        try:
+            return self.store.flush()
+        except OSError:
+            return False
+    
+    def close(self) -> None:
+        """Flush; the journal is closed when the last instance on this file closes"""
+        if not self._released:
+            self._released = True
+            self.store.release()
     
     def get_context_summary(self) -> Dict:
         """Get current context summary"""
@@ -85,13 +85,22 @@ class LearningEngineSkill:
         }
 
     def _analyze_errors(self, core) -> Dict[str, Any]:
-        """Analyze error patterns"""
-        # This would need access to error logs
-        # For now, return basic structure
+        """Analyze error patterns (failed commands of the last week, from the indexed command log)"""
+        index = self._log_index(core, "commands_history")
+        if index is None:
+            return {"total_errors": 0, "error_types": {}, "insights": ["Análisis de errores no disponible"]}
+
+        failures = index.query(success=False, since=datetime.now() - timedelta(days=7))
+        error_types = dict(Counter(row.intent for row in failures).most_common())
+
+        insights = []
+        if error_types:
+            worst, count = next(iter(error_types.items()))
+            insights.append(f"{len(failures)} comandos fallaron esta semana; el que más falla es '{worst}' ({count})")
         return {
-            "total_errors": 0,
-            "error_types": {},
-            "insights": ["Análisis de errores no implementado aún"]
+            "total_errors": len(failures),
+            "error_types": error_types,
+            "insights": insights
         }
 
     def _analyze_unknown_intents(self, core) -> Dict[str, Any]:
@@ -117,23 +126,53 @@ class LearningEngineSkill:
         }
 
     def _analyze_skill_usage(self, core) -> Dict[str, Any]:
-        """Analyze which skills are used most"""
-        # This would need access to usage logs
+        """Analyze which skills are used most (last week, from the indexed skill log)"""
         skills = list(core.skill_dispatcher.skills.keys())
+        index = self._log_index(core, "skills_execution")
+        usage = index.counts(since=datetime.now() - timedelta(days=7)) if index else {}
+        most_used = sorted(usage.items(), key=lambda item: item[1], reverse=True)[:5]
+
+        insights = [f"Tienes {len(skills)} skills disponibles"]
+        if most_used:
+            insights.append("Más usadas esta semana: " + ", ".join(f"{name} ({n})" for name, n in most_used))
         return {
             "total_skills": len(skills),
             "available_skills": skills,
-            "insights": [f"Tienes {len(skills)} skills disponibles"]
+            "usage_last_week": usage,
+            "insights": insights
         }
 
     def _analyze_performance(self, core) -> Dict[str, Any]:
-        """Analyze performance metrics"""
+        """Analyze performance metrics (latency per skill and success rate over the last week)"""
+        index = self._log_index(core, "skills_execution")
+        if index is None:
+            return {"avg_response_time": 0.0, "success_rate": 0.0, "insights": []}
+
+        week_ago = datetime.now() - timedelta(days=7)
+        rows = index.query(since=week_ago)
+        latency = index.latency_distribution(since=week_ago)
+        known = [row.success for row in rows if row.success is not None]
+        avg_ms = sum(row.duration_ms for row in rows) / len(rows) if rows else 0.0
+        success_rate = sum(known) / len(known) if known else 0.0
+
+        insights = []
+        slowest = max(latency.items(), key=lambda item: item[1]["p90_ms"], default=None)
+        if slowest:
+            insights.append(f"La skill más lenta es '{slowest[0]}' (p90 {slowest[1]['p90_ms']:.0f}ms)")
         return {
-            "avg_response_time": 0.5,  # Placeholder
-            "success_rate": 0.85,      # Placeholder
-            "insights": ["Métricas de rendimiento básicas disponibles"]
+            "avg_response_time": avg_ms / 1000.0,
+            "success_rate": success_rate,
+            "latency_by_skill": latency,
+            "insights": insights
         }
 
+    def _log_index(self, core, stream: str):
+        """Indexed audit log of the core's logger (None if unavailable)"""
+        try:
+            return core.logger.log_index(stream)
+        except Exception:
+            return None
+
     def _generate_improvement_opportunities(self, core) -> List[str]:
         """Generate specific improvement suggestions"""
         opportunities = []
@@ -188,6 +227,17 @@ class LearningEngineSkill:
         if unknown['unknown_commands']:
             response_parts.append(f"❓ Comandos desconocidos recientes: {len(unknown['unknown_commands'])}")
 
+        # Errors and performance (last week)
+        errors = insights['error_analysis']
+        if errors['total_errors']:
+            response_parts.append(f"⚠️ Comandos fallidos (7 días): {errors['total_errors']}")
+        performance = insights['performance_metrics']
+        if performance.get('latency_by_skill'):
+            response_parts.append(
+                f"⏱️ Respuesta promedio: {performance['avg_response_time'] * 1000:.0f}ms | "
+                f"éxito {performance['success_rate']:.0%}"
+            )
+
         # Skills
         skills = insights['skill_usage']
         response_parts.append(f"🛠️ Skills disponibles: {skills['total_skills']}")
@@ -16,11 +16,18 @@ class CreateNoteSkill:
     }
     
     def __init__(self):
-        # Crear carpeta de notas si no existe
         self.notes_dir = os.path.join(os.path.expanduser("~"), "jarvis_notes")
+        self._ready = False
+    
+    def warmup(self):
+        # Crear carpeta de notas si no existe (una vez; el dispatcher la llama al crear la skill)
         os.makedirs(self.notes_dir, exist_ok=True)
+        self._ready = True
     
     def run(self, entities, core):
+        if not self._ready:
+            self.warmup()
+        
         # Extraer contenido
         content = entities.get("note_content", "Nota sin contenido")
         if isinstance(content, list):
@@ -7,7 +7,10 @@ Searches: Registry, common paths, PATH env, app shortcuts
 import os
 import subprocess
 import sys
-import winreg  # Windows registry
+try:
+    import winreg  # Windows registry
+except ImportError:  # not on Windows: registry lookup is skipped
+    winreg = None
 from pathlib import Path
 from typing import Optional, Dict, List
 
@@ -93,6 +96,8 @@ class AppFinder:
     
     def _search_registry(self, app_name: str) -> Optional[str]:
         """Search Windows registry for application"""
+        if winreg is None:
+            return None
         try:
             reg_path = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
             
@@ -113,7 +118,7 @@ class AppFinder:
                                     return exe_path
                         
                         i += 1
-                    except WindowsError:
+                    except OSError:
                         break
         except Exception:
             pass
@@ -0,0 +1,213 @@
+# skills/productivity/reminders.py
+"""
+Reminders: "recuérdame en 10 minutos llamar a mamá".
+
+ReminderService keeps pending reminders in a hierarchical timing wheel
+(O(1) add/cancel, the timer thread only wakes when a slot is due), persists
+them in JarvisStorage and reloads them at boot. A fired reminder is emitted
+as a jarvis.response on the EventBus.
+"""
+
+import itertools
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from core.constants import EVENT_JARVIS_RESPONSE
+from core.lifecycle.runtime.timing_wheel import WheelTimer
+
+
+_UNITS = {
+    "s": 1, "seg": 1, "segs": 1, "segundo": 1, "segundos": 1,
+    "m": 60, "min": 60, "mins": 60, "minuto": 60, "minutos": 60,
+    "h": 3600, "hs": 3600, "hora": 3600, "horas": 3600,
+    "d": 86400, "dia": 86400, "dias": 86400,
+}
+
+_DURATION_RE = re.compile(r"\b(?:en|dentro de)\s+(\d{1,3})\s*([a-z]+)\b")
+
+
+def parse_duration(text: str) -> Optional[int]:
+    """'en 10 minutos' / 'dentro de 2 horas' -> seconds (None if no duration)"""
+    if not text:
+        return None
+    m = _DURATION_RE.search(text.lower())
+    if not m:
+        return None
+    seconds = _UNITS.get(m.group(2))
+    return int(m.group(1)) * seconds if seconds else None
+
+
+def format_delay(seconds: float) -> str:
+    seconds = int(round(seconds))
+    if seconds % 86400 == 0 and seconds >= 86400:
+        n, unit = seconds // 86400, "día"
+    elif seconds % 3600 == 0 and seconds >= 3600:
+        n, unit = seconds // 3600, "hora"
+    elif seconds % 60 == 0 and seconds >= 60:
+        n, unit = seconds // 60, "minuto"
+    else:
+        n, unit = seconds, "segundo"
+    return f"{n} {unit}{'s' if n != 1 else ''}"
+
+
+class ReminderService:
+    """
+    Pending reminders on a WheelTimer.
+
+    Args:
+        eventbus: where fired reminders are emitted (jarvis.response)
+        storage: JarvisStorage for persistence (None = memory only)
+        tick: wheel resolution in seconds
+    """
+
+    def __init__(self, eventbus=None, storage=None, tick: float = 1.0):
+        self.bus = eventbus
+        self.storage = storage
+        self.timer = WheelTimer(self._fire, tick=tick, name="Reminders")
+        self._reminders: Dict[int, dict] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._started = False
+        self.fired = 0
+        self.loaded = 0
+
+    def start(self):
+        """Reload pending reminders from storage and start the timer."""
+        if self._started:
+            return
+        if self.storage:
+            pending = self.storage.get_pending_reminders()
+            with self._lock:
+                for r in pending:
+                    self._reminders[r["id"]] = r
+            self.timer.schedule_many((r["id"], r["due"], None) for r in pending)
+            self.loaded = len(pending)
+        self.timer.start()
+        self._started = True
+
+    def stop(self):
+        self.timer.stop()
+        self._started = False
+
+    def add(self, text: str, delay: Optional[float] = None, due: Optional[float] = None,
+            session_id: Optional[str] = None) -> dict:
+        """Schedule a reminder `delay` seconds from now (or at epoch `due`)."""
+        if due is None:
+            due = time.time() + (delay or 0)
+        return self.add_many([(due, text, session_id)])[0]
+
+    def add_many(self, items: List[tuple]) -> List[dict]:
+        """Bulk add (due, text, session_id) tuples; persisted in one transaction."""
+        if self.storage:
+            ids = self.storage.save_reminders(items)
+        else:
+            ids = [next(self._ids) for _ in items]
+        reminders = [
+            {"id": rid, "due": due, "text": text, "session_id": session_id}
+            for rid, (due, text, session_id) in zip(ids, items)
+        ]
+        with self._lock:
+            for r in reminders:
+                self._reminders[r["id"]] = r
+        self.timer.schedule_many((r["id"], r["due"], None) for r in reminders)
+        return reminders
+
+    def cancel(self, reminder_id: int) -> bool:
+        with self._lock:
+            if self._reminders.pop(reminder_id, None) is None:
+                return False
+        self.timer.cancel(reminder_id)
+        if self.storage:
+            self.storage.delete_reminder(reminder_id)
+        return True
+
+    def pending(self, limit: int = 20) -> List[dict]:
+        with self._lock:
+            reminders = list(self._reminders.values())
+        return sorted(reminders, key=lambda r: r["due"])[:limit]
+
+    def __len__(self):
+        return len(self._reminders)
+
+    def _fire(self, expired):
+        fired = []
+        with self._lock:
+            for rid, _ in expired:
+                r = self._reminders.pop(rid, None)
+                if r is not None:
+                    fired.append(r)
+        if not fired:
+            return
+        now = time.time()
+        if self.storage:
+            try:
+                self.storage.mark_reminders_fired([r["id"] for r in fired], now)
+            except Exception as e:
+                print(f"[REMINDERS] Could not persist fired reminders: {e}")
+        self.fired += len(fired)
+        if not self.bus:
+            return
+        for r in fired:
+            late = now - r["due"]
+            text = f"⏰ Recordatorio: {r['text']}"
+            if late > 60:
+                text += f" (atrasado {format_delay(late)})"
+            self.bus.emit(EVENT_JARVIS_RESPONSE, {
+                "text": text,
+                "intent": "reminder",
+                "entities": {"reminder_id": r["id"]},
+                "confidence": 1.0,
+                "session_id": r["session_id"],
+            })
+
+    def get_stats(self) -> dict:
+        stats = self.timer.get_stats()
+        stats.update({"fired_total": self.fired, "loaded_at_boot": self.loaded})
+        return stats
+
+
+class ReminderSkill:
+    """Crea recordatorios: 'recuérdame en 10 minutos llamar a mamá'"""
+
+    patterns = [
+        r"\b(recuerdame|recordame|recordarme|recordatorio|avisame|remind me)\b"
+    ]
+
+    entity_hints = {
+        "reminder_text": {"pattern": r"(?:recuerdame|recordame|recordarme|recordatorio|avisame|remind me)\s+(.+)"}
+    }
+
+    def run(self, entities, core):
+        service = getattr(core, "reminders", None)
+        if service is None:
+            return {"success": False, "error": "el servicio de recordatorios no está activo"}
+
+        text = entities.get("reminder_text") or ""
+        if isinstance(text, list):
+            text = " ".join(text)
+        duration = entities.get("duration") or []
+        if isinstance(duration, str):
+            duration = [duration]
+
+        delay = None
+        for candidate in list(duration) + [text]:
+            delay = parse_duration(candidate)
+            if delay:
+                break
+        if not delay:
+            return {"success": False, "error": "no entendí cuándo (probá 'en 10 minutos')"}
+
+        message = re.sub(r"\s+", " ", _DURATION_RE.sub("", text))
+        message = re.sub(r"^\s*(que|de|a)\s+", "", message).strip(" ,.") or "recordatorio"
+
+        reminder = service.add(message, delay=delay, session_id=getattr(core, "current_session_id", None))
+        return {
+            "success": True,
+            "id": reminder["id"],
+            "text": message,
+            "due": datetime.fromtimestamp(reminder["due"]).isoformat(timespec="seconds"),
+            "in": format_delay(delay),
+        }
@@ -0,0 +1,177 @@
+# skills/research/async_http.py
+"""
+Minimal asyncio HTTP client for the research skills' async path.
+
+Only what the web search skills need: GET with query params and headers,
+HTTPS, redirects, Content-Length / chunked / read-to-EOF bodies,
+gzip/deflate and the HTTP(S)_PROXY / NO_PROXY settings requests honours
+(HTTPS through a CONNECT tunnel). Built on asyncio streams, so a request
+in flight costs a coroutine rather than a thread and needs no extra
+dependency.
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import ssl
+import urllib.request
+import zlib
+from typing import Dict, Optional, Tuple
+from urllib.parse import unquote, urlencode, urljoin, urlsplit
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+_ssl_context = None
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, reason: str, url: str):
+        super().__init__(f"HTTP {status} {reason}: {url}")
+        self.status = status
+        self.reason = reason
+        self.url = url
+
+
+def _get_ssl_context():
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+async def _read_body(reader, headers: Dict[str, str]) -> bytes:
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                await reader.readline()  # trailer / final CRLF
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+
+    encoding = headers.get("content-encoding", "").lower()
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    elif encoding == "deflate":
+        body = zlib.decompress(body)
+    return body
+
+
+def _proxy_for(parts):
+    """Proxy URL parts for this request (None: connect directly), like requests does"""
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if not proxy or urllib.request.proxy_bypass(parts.hostname or ""):
+        return None
+    return urlsplit(proxy if "://" in proxy else "http://" + proxy)
+
+
+def _proxy_auth(proxy) -> Dict[str, str]:
+    if proxy.username is None:
+        return {}
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")}
+
+
+async def _read_head(reader) -> Tuple[int, str, Dict[str, str]]:
+    status_line = (await reader.readline()).decode("latin-1").strip()
+    _, status, reason = (status_line.split(" ", 2) + [""])[:3]
+    response_headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1")
+        if line in ("\r\n", "\n", ""):
+            break
+        name, _, value = line.partition(":")
+        response_headers[name.strip().lower()] = value.strip()
+    return int(status), reason, response_headers
+
+
+async def _connect(url: str, parts, secure: bool, port: int):
+    """(reader, writer, request target, extra headers), through the configured proxy if any"""
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    proxy = _proxy_for(parts)
+    if proxy is None:
+        reader, writer = await asyncio.open_connection(
+            parts.hostname, port, ssl=_get_ssl_context() if secure else None
+        )
+        return reader, writer, path, {}
+
+    reader, writer = await asyncio.open_connection(proxy.hostname, proxy.port or 8080)
+    if not secure:
+        # plain HTTP: the proxy takes the absolute URL
+        return reader, writer, url.split("#", 1)[0], _proxy_auth(proxy)
+    try:
+        authority = f"{parts.hostname}:{port}"
+        lines = [f"CONNECT {authority} HTTP/1.1", f"Host: {authority}"]
+        lines += [f"{k}: {v}" for k, v in _proxy_auth(proxy).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+        status, reason, _ = await _read_head(reader)
+        if status != 200:
+            raise HTTPError(status, f"proxy CONNECT failed: {reason}", url)
+        await writer.start_tls(_get_ssl_context(), server_hostname=parts.hostname)
+    except BaseException:
+        writer.close()
+        raise
+    return reader, writer, path, {}
+
+
+async def _request_once(url: str, headers: Dict[str, str]) -> Tuple[int, str, Dict[str, str], bytes]:
+    parts = urlsplit(url)
+    secure = parts.scheme == "https"
+    port = parts.port or (443 if secure else 80)
+
+    reader, writer, target, proxy_headers = await _connect(url, parts, secure, port)
+    try:
+        lines = [f"GET {target} HTTP/1.1", f"Host: {parts.netloc}", "Connection: close"]
+        lines += [f"{k}: {v}" for k, v in {**headers, **proxy_headers}.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+        status, reason, response_headers = await _read_head(reader)
+        body = await _read_body(reader, response_headers)
+        return status, reason, response_headers, body
+    finally:
+        writer.close()
+
+
+async def fetch(url: str, params: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None,
+                timeout: float = 5.0, max_redirects: int = 3) -> Tuple[int, Dict[str, str], bytes]:
+    """GET `url` (+ params); returns (status, headers, body). Raises asyncio.TimeoutError on timeout."""
+    if params:
+        url += ("&" if "?" in url else "?") + urlencode(params)
+    merged = {**DEFAULT_HEADERS, **(headers or {})}
+
+    async def _follow():
+        nonlocal url
+        for _ in range(max_redirects + 1):
+            status, reason, response_headers, body = await _request_once(url, merged)
+            if status in (301, 302, 303, 307, 308) and "location" in response_headers:
+                url = urljoin(url, response_headers["location"])
+                continue
+            return status, reason, response_headers, body
+        raise HTTPError(status, "too many redirects", url)
+
+    status, reason, response_headers, body = await asyncio.wait_for(_follow(), timeout)
+    return status, response_headers, body
+
+
+async def get_json(url: str, params: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None,
+                   timeout: float = 5.0):
+    """GET and decode a JSON body; raises HTTPError on non-2xx"""
+    status, response_headers, body = await fetch(url, params, headers, timeout)
+    if not 200 <= status < 300:
+        raise HTTPError(status, "", url)
+    return json.loads(body.decode("utf-8") if body else "null")
@@ -2,12 +2,51 @@
 """
 Internet Search Skill - Search Google and retrieve results
 Provides web context for answering questions
+
+Each skill has a blocking run() (requests) and a run_async() (asyncio
+streams) that the dispatcher prefers, so concurrent searches don't each
+hold a thread while waiting on the network.
 """
 
+import json
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote
 
+from skills.actions.result_cache import CachePolicy
+from skills.research import async_http
+
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+def _get_json(url: str, params: Optional[Dict] = None):
+    """GET a JSON API; None unless the status is 200"""
+    response = requests.get(url, params=params, headers=HEADERS, timeout=5)
+    return response.json() if response.status_code == 200 else None
+
+
+async def _get_json_async(url: str, params: Optional[Dict] = None):
+    """Async twin of _get_json"""
+    status, _, body = await async_http.fetch(url, params, HEADERS, timeout=5)
+    return json.loads(body) if status == 200 else None
+
+
+def _outcome(results: List[Dict]) -> Dict:
+    """success=False when every result is an error entry, so the failure isn't cached"""
+    errors = [r["error"] for r in results if "error" in r]
+    if results and len(errors) == len(results):
+        return {"success": False, "error": errors[0]}
+    return {"success": True}
+
+
+def _query_of(entities) -> Optional[str]:
+    if not entities.get("query"):
+        return None
+    return " ".join(entities["query"]) if isinstance(entities["query"], list) else entities["query"]
+
 
 class InternetSearchSkill:
     """Search the internet for information"""
@@ -20,6 +59,8 @@ class InternetSearchSkill:
         r".*web.*",
     ]
     
+    cache_policy = CachePolicy(ttl=300.0, key=("query",))
+    
     def __init__(self):
         self.name = "internet_search"
         self.description = "Search the internet for information"
@@ -27,15 +68,25 @@ class InternetSearchSkill:
     def run(self, entities, core=None):
         """Execute internet search"""
         
-        if not entities.get("query"):
+        query = _query_of(entities)
+        if not query:
             return {"success": False, "error": "No search query provided"}
         
-        query = " ".join(entities["query"]) if isinstance(entities["query"], list) else entities["query"]
+        return self._respond(query, self.search(query))
+    
+    async def run_async(self, entities, core=None):
+        """Execute internet search without blocking a thread"""
         
-        results = self.search(query)
+        query = _query_of(entities)
+        if not query:
+            return {"success": False, "error": "No search query provided"}
         
+        return self._respond(query, await self.search_async(query))
+    
+    @staticmethod
+    def _respond(query: str, results: List[Dict]) -> Dict:
         return {
-            "success": True,
+            **_outcome(results),
             "query": query,
             "results": results,
             "count": len(results)
@@ -46,32 +97,37 @@ class InternetSearchSkill:
         Search Google for query (using DuckDuckGo or similar)
         Returns list of results with title, snippet, URL
         """
-        results = []
-        
         try:
-            # Using DuckDuckGo API (no authentication needed)
-            url = f"https://duckduckgo.com/?q={quote(query)}&format=json"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Extract results from DuckDuckGo API
-                for result in data.get("Results", [])[:num_results]:
-                    results.append({
-                        "title": result.get("Text", ""),
-                        "snippet": result.get("Result", ""),
-                        "url": result.get("FirstURL", ""),
-                        "source": "DuckDuckGo"
-                    })
-        
+            data = _get_json(self._url(query))
         except Exception as e:
             return [{"error": str(e), "source": "Search API"}]
+        return self._parse(data, query, num_results)
+    
+    async def search_async(self, query: str, num_results: int = 5) -> List[Dict]:
+        """Async version of search()"""
+        try:
+            data = await _get_json_async(self._url(query))
+        except Exception as e:
+            return [{"error": str(e) or type(e).__name__, "source": "Search API"}]
+        return self._parse(data, query, num_results)
+    
+    @staticmethod
+    def _url(query: str) -> str:
+        # Using DuckDuckGo API (no authentication needed)
+        return f"https://duckduckgo.com/?q={quote(query)}&format=json"
+    
+    @staticmethod
+    def _parse(data, query: str, num_results: int) -> List[Dict]:
+        results = []
+        
+        # Extract results from DuckDuckGo API
+        for result in (data or {}).get("Results", [])[:num_results]:
+            results.append({
+                "title": result.get("Text", ""),
+                "snippet": result.get("Result", ""),
+                "url": result.get("FirstURL", ""),
+                "source": "DuckDuckGo"
+            })
         
         if not results:
             results.append({
@@ -93,6 +149,8 @@ class StackOverflowSearchSkill:
         r".*coding.*",
     ]
     
+    cache_policy = CachePolicy(ttl=300.0, key=("query",))
+    
     def __init__(self):
         self.name = "stackoverflow_search"
         self.description = "Search Stack Overflow for programming help"
@@ -100,15 +158,25 @@ class StackOverflowSearchSkill:
     def run(self, entities, core=None):
         """Search Stack Overflow"""
         
-        if not entities.get("query"):
+        query = _query_of(entities)
+        if not query:
             return {"success": False, "error": "No query provided"}
         
-        query = " ".join(entities["query"]) if isinstance(entities["query"], list) else entities["query"]
+        return self._respond(query, self.search(query))
+    
+    async def run_async(self, entities, core=None):
+        """Search Stack Overflow without blocking a thread"""
         
-        results = self.search(query)
+        query = _query_of(entities)
+        if not query:
+            return {"success": False, "error": "No query provided"}
         
+        return self._respond(query, await self.search_async(query))
+    
+    @staticmethod
+    def _respond(query: str, results: List[Dict]) -> Dict:
         return {
-            "success": True,
+            **_outcome(results),
             "query": query,
             "results": results,
             "platform": "Stack Overflow"
@@ -116,42 +184,44 @@ class StackOverflowSearchSkill:
     
     def search(self, query: str, num_results: int = 3) -> List[Dict]:
         """Search Stack Overflow API"""
-        results = []
-        
         try:
-            # Stack Overflow API
-            url = "https://api.stackexchange.com/2.3/search/advanced"
-            params = {
-                "q": query,
-                "order": "desc",
-                "sort": "relevance",
-                "site": "stackoverflow",
-                "pagesize": num_results
-            }
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                for item in data.get("items", [])[:num_results]:
-                    results.append({
-                        "title": item.get("title", ""),
-                        "score": item.get("score", 0),
-                        "answers": item.get("answer_count", 0),
-                        "url": item.get("link", ""),
-                        "tags": item.get("tags", []),
-                        "views": item.get("view_count", 0)
-                    })
-        
+            data = _get_json(*self._request(query, num_results))
         except Exception as e:
             return [{"error": str(e), "source": "Stack Overflow API"}]
-        
-        return results
+        return self._parse(data, num_results)
+    
+    async def search_async(self, query: str, num_results: int = 3) -> List[Dict]:
+        """Async version of search()"""
+        try:
+            data = await _get_json_async(*self._request(query, num_results))
+        except Exception as e:
+            return [{"error": str(e) or type(e).__name__, "source": "Stack Overflow API"}]
+        return self._parse(data, num_results)
+    
+    @staticmethod
+    def _request(query: str, num_results: int) -> Tuple[str, Dict]:
+        # Stack Overflow API
+        return "https://api.stackexchange.com/2.3/search/advanced", {
+            "q": query,
+            "order": "desc",
+            "sort": "relevance",
+            "site": "stackoverflow",
+            "pagesize": num_results
+        }
+    
+    @staticmethod
+    def _parse(data, num_results: int) -> List[Dict]:
+        return [
+            {
+                "title": item.get("title", ""),
+                "score": item.get("score", 0),
+                "answers": item.get("answer_count", 0),
+                "url": item.get("link", ""),
+                "tags": item.get("tags", []),
+                "views": item.get("view_count", 0)
+            }
+            for item in (data or {}).get("items", [])[:num_results]
+        ]
 
 
 class GitHubSearchSkill:
@@ -164,6 +234,8 @@ class GitHubSearchSkill:
         r".*library.*",
     ]
     
+    cache_policy = CachePolicy(ttl=300.0, key=("query",))
+    
     def __init__(self):
         self.name = "github_search"
         self.description = "Search GitHub for repositories and code"
@@ -171,15 +243,25 @@ class GitHubSearchSkill:
     def run(self, entities, core=None):
         """Search GitHub"""
         
-        if not entities.get("query"):
+        query = _query_of(entities)
+        if not query:
             return {"success": False, "error": "No query provided"}
         
-        query = " ".join(entities["query"]) if isinstance(entities["query"], list) else entities["query"]
+        return self._respond(query, self.search(query))
+    
+    async def run_async(self, entities, core=None):
+        """Search GitHub without blocking a thread"""
         
-        results = self.search(query)
+        query = _query_of(entities)
+        if not query:
+            return {"success": False, "error": "No query provided"}
         
+        return self._respond(query, await self.search_async(query))
+    
+    @staticmethod
+    def _respond(query: str, results: List[Dict]) -> Dict:
         return {
-            "success": True,
+            **_outcome(results),
             "query": query,
             "results": results,
             "platform": "GitHub"
@@ -187,37 +269,39 @@ class GitHubSearchSkill:
     
     def search(self, query: str, num_results: int = 5) -> List[Dict]:
         """Search GitHub API"""
-        results = []
-        
         try:
-            url = "https://api.github.com/search/repositories"
-            params = {
-                "q": query,
-                "sort": "stars",
-                "order": "desc",
-                "per_page": num_results
-            }
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                for repo in data.get("items", [])[:num_results]:
-                    results.append({
-                        "name": repo.get("name", ""),
-                        "description": repo.get("description", ""),
-                        "stars": repo.get("stargazers_count", 0),
-                        "language": repo.get("language", ""),
-                        "url": repo.get("html_url", ""),
-                        "forks": repo.get("forks_count", 0)
-                    })
-        
+            data = _get_json(*self._request(query, num_results))
         except Exception as e:
             return [{"error": str(e), "source": "GitHub API"}]
-        
-        return results
+        return self._parse(data, num_results)
+    
+    async def search_async(self, query: str, num_results: int = 5) -> List[Dict]:
+        """Async version of search()"""
+        try:
+            data = await _get_json_async(*self._request(query, num_results))
+        except Exception as e:
+            return [{"error": str(e) or type(e).__name__, "source": "GitHub API"}]
+        return self._parse(data, num_results)
+    
+    @staticmethod
+    def _request(query: str, num_results: int) -> Tuple[str, Dict]:
+        return "https://api.github.com/search/repositories", {
+            "q": query,
+            "sort": "stars",
+            "order": "desc",
+            "per_page": num_results
+        }
+    
+    @staticmethod
+    def _parse(data, num_results: int) -> List[Dict]:
+        return [
+            {
+                "name": repo.get("name", ""),
+                "description": repo.get("description", ""),
+                "stars": repo.get("stargazers_count", 0),
+                "language": repo.get("language", ""),
+                "url": repo.get("html_url", ""),
+                "forks": repo.get("forks_count", 0)
+            }
+            for repo in (data or {}).get("items", [])[:num_results]
+        ]
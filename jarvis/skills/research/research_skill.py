@@ -6,11 +6,14 @@ Searches local data first, then web data with safe parsing
 
 import os
 import json
+import asyncio
 import requests
 from typing import Dict, List, Any, Optional
 from urllib.parse import quote
 import time
 
+from skills.research import async_http
+
 
 class ResearchSkill:
     """
@@ -29,6 +32,9 @@ class ResearchSkill:
         "topic": {"pattern": r"(?:acerca de|about|sobre|sobre)\s+(.+)"}
     }
 
+    # only reads: identical concurrent queries can share one run
+    side_effects = False
+
     def run(self, entities, core):
         """Perform research based on user query"""
 
@@ -42,10 +48,26 @@ class ResearchSkill:
             }
 
         # Research pipeline: local first, then web
+        return self._complete(query, self._search_local(query, core), self._search_web_safe(query), core)
+
+    async def run_async(self, entities, core):
+        """Same research pipeline; the web lookup awaits instead of blocking a thread"""
+        query = self._extract_query(entities)
+
+        if not query:
+            return {
+                "success": False,
+                "error": "No pude identificar qué investigar. Especifica mejor tu consulta."
+            }
+
+        local_results = self._search_local(query, core)
+        return self._complete(query, local_results, await self._search_web_async(query), core)
+
+    def _complete(self, query: str, local_results, web_results, core) -> Dict[str, Any]:
         results = {
             "query": query,
-            "local_results": self._search_local(query, core),
-            "web_results": self._search_web_safe(query),
+            "local_results": local_results,
+            "web_results": web_results,
             "sources": [],
             "confidence": 0.0
         }
@@ -130,67 +152,78 @@ class ResearchSkill:
 
     def _search_web_safe(self, query: str) -> List[Dict[str, Any]]:
         """Safe web search using requests (no external commands)"""
-        results = []
-
         try:
-            # Use DuckDuckGo instant answers API (safe, no API key needed)
-            url = f"https://api.duckduckgo.com/?q={quote(query)}&format=json&no_html=1"
-
-            response = requests.get(url, timeout=5)
+            response = requests.get(self._web_url(query), timeout=5)
             response.raise_for_status()
+            return self._parse_web(response.json(), query)
+        except requests.exceptions.RequestException as e:
+            return [self._web_error("Error de conexión web", f"No pude acceder a información web: {str(e)}")]
+        except Exception as e:
+            return [self._web_error("Error en búsqueda web", f"Error inesperado: {str(e)}")]
 
-            data = response.json()
+    async def _search_web_async(self, query: str) -> List[Dict[str, Any]]:
+        """Async twin of _search_web_safe (asyncio streams, no thread held while waiting)"""
+        try:
+            return self._parse_web(await async_http.get_json(self._web_url(query), timeout=5), query)
+        except (OSError, asyncio.TimeoutError, async_http.HTTPError) as e:
+            return [self._web_error("Error de conexión web",
+                                    f"No pude acceder a información web: {str(e) or type(e).__name__}")]
+        except Exception as e:
+            return [self._web_error("Error en búsqueda web", f"Error inesperado: {str(e)}")]
 
-            # Extract instant answer if available
-            if data.get('Answer'):
-                results.append({
-                    "type": "instant_answer",
-                    "title": data.get('Answer'),
-                    "content": data.get('Answer'),
-                    "source": "duckduckgo_instant",
-                    "confidence": 0.9
-                })
+    @staticmethod
+    def _web_url(query: str) -> str:
+        # Use DuckDuckGo instant answers API (safe, no API key needed)
+        return f"https://api.duckduckgo.com/?q={quote(query)}&format=json&no_html=1"
 
-            # Extract abstract if available
-            elif data.get('AbstractText'):
-                results.append({
-                    "type": "web_abstract",
-                    "title": data.get('Heading', query),
-                    "content": data.get('AbstractText')[:500] + "..." if len(data.get('AbstractText', '')) > 500 else data.get('AbstractText', ''),
-                    "source": "duckduckgo_abstract",
-                    "confidence": 0.8
-                })
+    @staticmethod
+    def _web_error(title: str, content: str) -> Dict[str, Any]:
+        return {
+            "type": "error",
+            "title": title,
+            "content": content,
+            "source": "web_error",
+            "confidence": 0.0
+        }
 
-            # Extract related topics
-            if data.get('RelatedTopics'):
-                topics = data['RelatedTopics'][:3]  # First 3 topics
-                for topic in topics:
-                    if topic.get('Text'):
-                        results.append({
-                            "type": "related_topic",
-                            "title": topic.get('Text', '')[:100],
-                            "content": topic.get('Text', ''),
-                            "source": "duckduckgo_related",
-                            "confidence": 0.6
-                        })
+    @staticmethod
+    def _parse_web(data, query: str) -> List[Dict[str, Any]]:
+        results = []
+        data = data or {}
 
-        except requests.exceptions.RequestException as e:
+        # Extract instant answer if available
+        if data.get('Answer'):
             results.append({
-                "type": "error",
-                "title": "Error de conexión web",
-                "content": f"No pude acceder a información web: {str(e)}",
-                "source": "web_error",
-                "confidence": 0.0
+                "type": "instant_answer",
+                "title": data.get('Answer'),
+                "content": data.get('Answer'),
+                "source": "duckduckgo_instant",
+                "confidence": 0.9
             })
-        except Exception as e:
+
+        # Extract abstract if available
+        elif data.get('AbstractText'):
             results.append({
-                "type": "error",
-                "title": "Error en búsqueda web",
-                "content": f"Error inesperado: {str(e)}",
-                "source": "web_error",
-                "confidence": 0.0
+                "type": "web_abstract",
+                "title": data.get('Heading', query),
+                "content": data.get('AbstractText')[:500] + "..." if len(data.get('AbstractText', '')) > 500 else data.get('AbstractText', ''),
+                "source": "duckduckgo_abstract",
+                "confidence": 0.8
             })
 
+        # Extract related topics
+        if data.get('RelatedTopics'):
+            topics = data['RelatedTopics'][:3]  # First 3 topics
+            for topic in topics:
+                if topic.get('Text'):
+                    results.append({
+                        "type": "related_topic",
+                        "title": topic.get('Text', '')[:100],
+                        "content": topic.get('Text', ''),
+                        "source": "duckduckgo_related",
+                        "confidence": 0.6
+                    })
+
         return results
 
     def _calculate_confidence(self, results: Dict[str, Any]) -> float:
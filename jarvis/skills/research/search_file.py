@@ -2,6 +2,9 @@
 import os
 import fnmatch
 
+from skills.actions.cancel import current_cancel_token
+from skills.actions.result_cache import CachePolicy
+
 
 class SearchFileSkill:
     """Busca archivos en el sistema"""
@@ -14,6 +17,13 @@ class SearchFileSkill:
     entity_hints = {
         "search_query": {"pattern": r"busca\s+(.+)"}
     }
+
+    # recorrer un home grande puede tardar: deadline propio y una búsqueda a la vez
+    timeout_seconds = 20.0
+    max_concurrency = 1
+    # misma búsqueda en la misma carpeta: reutilizar; una nota nueva puede cambiar el resultado
+    cache_policy = CachePolicy(ttl=30.0, key=("file", "search_query", "path"),
+                               invalidate_on=("skill.create_note",))
     
     def run(self, entities, core):
         # Extraer parámetros
@@ -32,8 +42,11 @@ class SearchFileSkill:
         print(f"📂 En: {search_path}")
         
         results = []
+        token = current_cancel_token()
         try:
             for root, dirs, files in os.walk(search_path):
+                if token is not None and token.cancelled:
+                    break
                 # Limitar profundidad para no tardar mucho
                 if root.count(os.sep) - search_path.count(os.sep) > 3:
                     continue
@@ -10,6 +10,8 @@ import time
 from typing import Dict, Any, List
 import os
 
+from skills.actions.result_cache import CachePolicy
+
 
 class AnalyzeSystemHealthSkill:
     """
@@ -17,6 +19,8 @@ class AnalyzeSystemHealthSkill:
     Never executes changes automatically - only provides analysis and suggestions.
     """
 
+    cache_policy = CachePolicy(ttl=30.0, key=())
+
     def __init__(self, logger=None):
         self.logger = logger
 
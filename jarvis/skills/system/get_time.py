@@ -17,6 +17,9 @@ class GetTimeSkill:
         "time_query": {"pattern": r"\b(hora|time)\b"}
     }
     
+    # Solo lectura: dispatches idénticos simultáneos comparten una ejecución
+    side_effects = False
+    
     def run(self, entities, core):
         now = datetime.now()
         time_str = now.strftime("%H:%M:%S")
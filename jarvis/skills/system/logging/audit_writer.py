@@ -0,0 +1,245 @@
+# system/logging/audit_writer.py
+"""
+Escritor asíncrono de los registros JSONL de auditoría
+(commands_history.jsonl, skills_execution.jsonl).
+
+El hot path solo encola el dict; un hilo escritor lo serializa, agrupa las
+líneas en lotes (por tamaño o por tiempo) y las agrega al archivo activo.
+Al cambiar el día el archivo activo se cierra como segmento
+`<stream>.<YYYY-MM-DD>.jsonl` (comprimido a .jsonl.gz si compress=True).
+"""
+
+import atexit
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+_FLUSH = object()
+_STOP = object()
+
+
+def segment_paths(logs_dir, stream: str) -> List[Path]:
+    """Segmentos cerrados de <stream> (más viejo primero) + el archivo activo <stream>.jsonl"""
+    logs_dir = Path(logs_dir)
+    closed = sorted(p for p in logs_dir.glob(f"{stream}.*.jsonl*") if p.name.endswith((".jsonl", ".jsonl.gz")))
+    active = logs_dir / f"{stream}.jsonl"
+    return closed + ([active] if active.exists() else [])
+
+
+class AuditWriter:
+    """
+    Cola acotada + hilo escritor con lotes y rotación diaria.
+
+    Si la cola está llena la entrada se descarta (y se cuenta en `dropped`)
+    en vez de bloquear el comando. close() (también registrado en atexit)
+    vacía la cola y escribe todo lo pendiente antes de volver.
+    Las entradas se serializan en el hilo escritor: no modificar los valores
+    anidados después de write().
+    """
+
+    def __init__(self, logs_dir, max_queue: int = 10000, batch_size: int = 256,
+                 flush_interval: float = 1.0, compress: bool = True,
+                 today: Callable[[], date] = date.today, logger=None):
+        """
+        Args:
+            logs_dir: carpeta de los archivos <stream>.jsonl
+            max_queue: entradas en espera como máximo
+            batch_size: líneas que fuerzan una escritura
+            flush_interval: segundos máximos que una línea espera en memoria
+            compress: gzip de los segmentos cerrados
+            today: fecha actual (inyectable para pruebas)
+            logger: logging.Logger para errores del escritor
+        """
+        self.logs_dir = Path(logs_dir)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.compress = compress
+        self.today = today
+        self.logger = logger
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._files: Dict[str, Any] = {}           # stream -> archivo abierto
+        self._segment_day: Dict[str, date] = {}    # stream -> día del archivo activo
+        self._lock = threading.Lock()              # serializa escrituras (hilo o cierre)
+        self._closed = False
+        self.stats = {
+            "enqueued": 0, "written": 0, "batches": 0, "dropped": 0,
+            "rotations": 0, "compressed": 0, "errors": 0, "max_batch": 0,
+        }
+
+        self._thread = threading.Thread(target=self._loop, name="AuditWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _log_error(self, msg: str):
+        self.stats["errors"] += 1
+        if self.logger:
+            self.logger.error(f"[AUDIT] {msg}")
+
+    # ---------- hot path ----------
+
+    def write(self, stream: str, entry: Dict) -> bool:
+        """Encola una línea para <stream>.jsonl (False si se descartó)"""
+        if self._closed:
+            # Después del cierre no hay hilo: escribir directo para no perder la línea
+            self._write_batch({stream: [self._dumps(entry)]})
+            return True
+        try:
+            self._queue.put_nowait((stream, entry))
+        except queue.Full:
+            self.stats["dropped"] += 1
+            return False
+        self.stats["enqueued"] += 1
+        return True
+
+    # ---------- hilo escritor ----------
+
+    def _loop(self):
+        pending: Dict[str, List[str]] = {}
+        count = 0
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if count else None
+            try:
+                stream, entry = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                stream = None
+
+            if stream is None or stream is _FLUSH or stream is _STOP:
+                if count:
+                    self._write_batch(pending)
+                    pending, count = {}, 0
+                if stream is not None:
+                    entry.set()  # entry es el Event de flush()/close()
+                    if stream is _STOP:
+                        return
+                continue
+
+            line = self._dumps(entry)
+            if line is None:
+                continue
+            pending.setdefault(stream, []).append(line)
+            count += 1
+            if count == 1:
+                deadline = time.monotonic() + self.flush_interval
+            if count >= self.batch_size:
+                self._write_batch(pending)
+                pending, count = {}, 0
+
+    def _dumps(self, entry: Dict) -> Optional[str]:
+        try:
+            return json.dumps(entry, ensure_ascii=False, default=str)
+        except Exception as e:
+            self._log_error(f"entrada no serializable: {e}")
+            return None
+
+    def _write_batch(self, pending: Dict[str, List[str]]):
+        with self._lock:
+            lines = 0
+            for stream, batch in pending.items():
+                batch = [line for line in batch if line is not None]
+                if not batch:
+                    continue
+                try:
+                    handle = self._open(stream)
+                    handle.write("\n".join(batch) + "\n")
+                    handle.flush()
+                    lines += len(batch)
+                except Exception as e:
+                    self._log_error(f"no se pudo escribir {stream}: {e}")
+            self.stats["written"] += lines
+            self.stats["batches"] += 1
+            self.stats["max_batch"] = max(self.stats["max_batch"], lines)
+            if self._closed:
+                self._close_files()
+
+    def _close_files(self):
+        for handle in self._files.values():
+            handle.close()
+        self._files.clear()
+
+    # ---------- segmentos ----------
+
+    def path(self, stream: str) -> Path:
+        """Archivo activo del stream"""
+        return self.logs_dir / f"{stream}.jsonl"
+
+    def _open(self, stream: str):
+        """Archivo activo, rotando antes si es de otro día"""
+        today = self.today()
+        path = self.path(stream)
+        day = self._segment_day.get(stream)
+        if day is None and path.exists():
+            day = datetime.fromtimestamp(path.stat().st_mtime).date()
+        if day is not None and day != today and path.exists() and path.stat().st_size > 0:
+            self._rotate(stream, day)
+        self._segment_day[stream] = today
+
+        handle = self._files.get(stream)
+        if handle is None:
+            handle = self._files[stream] = open(path, "a", encoding="utf-8")
+        return handle
+
+    def _rotate(self, stream: str, day: date):
+        """Cierra el archivo activo como segmento del día `day`"""
+        handle = self._files.pop(stream, None)
+        if handle is not None:
+            handle.close()
+        segment = self.logs_dir / f"{stream}.{day.isoformat()}.jsonl"
+        n = 1
+        while segment.exists() or segment.with_suffix(".jsonl.gz").exists():
+            segment = self.logs_dir / f"{stream}.{day.isoformat()}.{n}.jsonl"
+            n += 1
+        os.replace(self.path(stream), segment)
+        self.stats["rotations"] += 1
+        if self.compress:
+            try:
+                with open(segment, "rb") as src, gzip.open(f"{segment}.gz", "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                segment.unlink()
+                self.stats["compressed"] += 1
+            except Exception as e:
+                self._log_error(f"no se pudo comprimir {segment.name}: {e}")
+
+    def segments(self, stream: str) -> List[Path]:
+        """Segmentos cerrados del stream (más viejo primero) + el archivo activo"""
+        return segment_paths(self.logs_dir, stream)
+
+    # ---------- flush / cierre ----------
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Espera a que todo lo encolado hasta ahora esté en disco"""
+        if self._closed:
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put((_FLUSH, done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """Escribe lo pendiente y cierra los archivos (idempotente)"""
+        if self._closed:
+            return
+        done = threading.Event()
+        try:
+            self._queue.put((_STOP, done), timeout=timeout)
+            done.wait(timeout)
+        except queue.Full:
+            pass
+        self._closed = True
+        self._thread.join(timeout=timeout)
+        with self._lock:
+            self._close_files()
+        atexit.unregister(self.close)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "queued": self._queue.qsize(), "closed": self._closed}
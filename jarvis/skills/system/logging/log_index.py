@@ -0,0 +1,360 @@
+# system/logging/log_index.py
+"""
+Índice de offsets sobre los JSONL de auditoría (commands_history,
+skills_execution) para consultarlos sin releerlos de punta a punta.
+
+Por cada segmento (<stream>.jsonl activo y los cerrados .jsonl / .jsonl.gz)
+se guarda en logs/.index/ un sidecar binario con un registro fijo por línea:
+offset, largo, timestamp, intent, éxito y duración. Se construye una vez y
+después solo se agregan las líneas nuevas. Las consultas filtran sobre esas
+columnas en memoria (búsqueda binaria por tiempo) y solo se parsean las
+líneas pedidas, leídas con mmap (o con gzip, avanzando, en los .gz).
+"""
+
+import bisect
+import gzip
+import json
+import mmap
+import os
+import struct
+import threading
+from array import array
+from collections import namedtuple
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from monitoring.metrics import LatencyHistogram
+from .audit_writer import segment_paths
+
+INDEX_DIR = ".index"
+_VERSION = 1
+_RECORD = struct.Struct("<QIdibf")  # offset, largo, ts, intent id, éxito (-1 = sin dato), duración ms
+_HEAD_BYTES = 64
+
+Row = namedtuple("Row", "ts intent success duration_ms segment offset length")
+
+
+def _timestamp(value) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _fields(stream: str, entry: Dict) -> tuple:
+    """(ts, intent, success, duration_ms) de una línea del stream"""
+    if stream == "skills_execution":
+        result = entry.get("result")
+        success = result.get("success") if isinstance(result, dict) else None
+        return (_timestamp(entry.get("timestamp")), str(entry.get("skill", "")),
+                success, float(entry.get("duration_ms") or 0.0))
+    return (_timestamp(entry.get("timestamp")), str(entry.get("intent", "")),
+            entry.get("success"), float(entry.get("duration_ms") or 0.0))
+
+
+class _Segment:
+    """Columnas de un segmento + su sidecar (<logs>/.index/<segmento>.idx y .idx.json)"""
+
+    def __init__(self, path: Path, stream: str, index_dir: Path):
+        self.path = path
+        self.stream = stream
+        self.compressed = path.name.endswith(".gz")
+        self.idx_path = index_dir / f"{path.name}.idx"
+        self.meta_path = index_dir / f"{path.name}.idx.json"
+        self._reset()
+        self._load()
+
+    def _reset(self):
+        self.offsets = array("Q")
+        self.lengths = array("I")
+        self.ts = array("d")
+        self.intent_ids = array("i")
+        self.success = array("b")
+        self.durations = array("f")
+        self.intents: List[str] = []
+        self._intent_ids: Dict[str, int] = {}
+        self.indexed_bytes = 0
+        self.sorted = True
+        self.head = b""
+        self._key = None     # identidad del archivo indexado (ver _stat_key)
+        self._synced = False  # el .idx en disco corresponde a estas columnas
+
+    # ---------- sidecar ----------
+
+    def _stat_key(self) -> list:
+        """Inodo del archivo plano (sobrevive al crecer); tamaño+mtime de un .gz cerrado"""
+        stat = self.path.stat()
+        return [stat.st_size, int(stat.st_mtime)] if self.compressed else [stat.st_ino]
+
+    def _read_head(self) -> bytes:
+        opener = gzip.open if self.compressed else open
+        with opener(self.path, "rb") as f:
+            return f.read(_HEAD_BYTES)
+
+    def _load(self):
+        """Carga el sidecar si sigue describiendo este archivo"""
+        try:
+            with open(self.meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            head = bytes.fromhex(meta.get("head", ""))
+            if meta.get("version") != _VERSION or meta.get("stat") != self._stat_key():
+                return
+            if self._read_head()[:len(head)] != head:
+                return
+            with open(self.idx_path, "rb") as f:
+                data = f.read()
+        except (OSError, ValueError):
+            return
+        count = meta.get("count", 0)
+        if len(data) < count * _RECORD.size:
+            return
+        for record in _RECORD.iter_unpack(data[:count * _RECORD.size]):
+            self._append(*record)
+        self.intents = list(meta.get("intents", []))
+        self._intent_ids = {name: i for i, name in enumerate(self.intents)}
+        self.indexed_bytes = meta.get("indexed_bytes", 0)
+        self.head = head
+        self._key = meta["stat"]
+        self._synced = len(data) == count * _RECORD.size
+
+    def _save(self, new_records: bytes):
+        os.makedirs(self.idx_path.parent, exist_ok=True)
+        if self._synced:
+            with open(self.idx_path, "ab") as f:
+                f.write(new_records)
+        else:  # sin sidecar válido: reescribir todo
+            with open(self.idx_path, "wb") as f:
+                f.write(b"".join(_RECORD.pack(*fields) for fields in zip(
+                    self.offsets, self.lengths, self.ts, self.intent_ids, self.success, self.durations)))
+            self._synced = True
+        meta = {
+            "version": _VERSION,
+            "stream": self.stream,
+            "stat": self._key,
+            "head": self.head.hex(),
+            "count": len(self.offsets),
+            "indexed_bytes": self.indexed_bytes,
+            "intents": self.intents,
+        }
+        tmp = self.meta_path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, self.meta_path)
+
+    # ---------- construcción incremental ----------
+
+    def _append(self, offset, length, ts, intent_id, success, duration):
+        if self.ts and ts < self.ts[-1]:
+            self.sorted = False
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.ts.append(ts)
+        self.intent_ids.append(intent_id)
+        self.success.append(success)
+        self.durations.append(duration)
+
+    def _intent_id(self, intent: str) -> int:
+        intent_id = self._intent_ids.get(intent)
+        if intent_id is None:
+            intent_id = self._intent_ids[intent] = len(self.intents)
+            self.intents.append(intent)
+        return intent_id
+
+    def refresh(self) -> int:
+        """Indexa las líneas completas agregadas desde la última vez; devuelve cuántas"""
+        try:
+            key = self._stat_key()
+            size = self.path.stat().st_size
+            head = self._read_head()
+        except OSError:
+            return 0
+        if self._key is not None and (key != self._key or head[:len(self.head)] != self.head
+                                      or (not self.compressed and size < self.indexed_bytes)):
+            self._reset()  # el archivo fue reemplazado (rotación) o truncado
+        if self._key is not None and (self.compressed or size == self.indexed_bytes):
+            return 0  # nada nuevo (un .gz cerrado no crece)
+        self._key = key
+        head_changed = len(head) > len(self.head)
+        self.head = head
+
+        opener = gzip.open if self.compressed else open
+        with opener(self.path, "rb") as f:
+            f.seek(self.indexed_bytes)
+            data = f.read()
+        end = data.rfind(b"\n") + 1  # solo líneas completas (el escritor puede estar a mitad)
+        packed = bytearray()
+        position = self.indexed_bytes
+        for line in data[:end].split(b"\n")[:-1]:
+            if line.strip():
+                try:
+                    ts, intent, success, duration = _fields(self.stream, json.loads(line))
+                except (ValueError, AttributeError):
+                    ts, intent, success, duration = 0.0, "", None, 0.0
+                record = (position, len(line), ts, self._intent_id(intent),
+                          -1 if success is None else int(bool(success)), duration)
+                self._append(*record)
+                packed += _RECORD.pack(*record)
+            position += len(line) + 1
+        self.indexed_bytes = position
+        added = len(packed) // _RECORD.size
+        if added or head_changed or not self._synced:
+            self._save(bytes(packed))
+        return added
+
+    # ---------- consulta ----------
+
+    def positions(self, since: Optional[float], until: Optional[float]) -> Iterable[int]:
+        """Posiciones de las filas con since <= ts < until"""
+        n = len(self.ts)
+        if not n:
+            return range(0)
+        if not self.sorted:
+            return (i for i in range(n)
+                    if (since is None or self.ts[i] >= since) and (until is None or self.ts[i] < until))
+        lo = bisect.bisect_left(self.ts, since) if since is not None else 0
+        hi = bisect.bisect_left(self.ts, until) if until is not None else n
+        return range(lo, hi)
+
+    def overlaps(self, since: Optional[float], until: Optional[float]) -> bool:
+        if not self.ts:
+            return False
+        if not self.sorted:
+            return True
+        return (since is None or self.ts[-1] >= since) and (until is None or self.ts[0] < until)
+
+    def read(self, rows: List[Row]) -> List[Dict]:
+        """Parsea solo las líneas de `rows` (del mismo segmento, en orden de offset)"""
+        if self.compressed:
+            out = []
+            with gzip.open(self.path, "rb") as f:
+                for row in rows:
+                    f.seek(row.offset)  # hacia adelante: descomprime solo hasta ahí
+                    out.append(json.loads(f.read(row.length)))
+            return out
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                return [json.loads(view[row.offset:row.offset + row.length]) for row in rows]
+
+
+class LogIndex:
+    """
+    Consultas sobre un stream de auditoría (todos sus segmentos).
+
+    query() responde desde el índice (sin parsear JSON); read() trae las
+    líneas completas de las filas elegidas. refresh() se llama solo antes
+    de cada consulta y solo lee los bytes nuevos.
+    """
+
+    def __init__(self, logs_dir, stream: str):
+        self.logs_dir = Path(logs_dir)
+        self.stream = stream
+        self.index_dir = self.logs_dir / INDEX_DIR
+        self._segments: Dict[str, _Segment] = {}
+        self._lock = threading.Lock()
+
+    def refresh(self) -> int:
+        """Indexa segmentos nuevos y líneas nuevas; borra sidecars de segmentos que ya no están"""
+        with self._lock:
+            paths = segment_paths(self.logs_dir, self.stream)
+            names = {p.name for p in paths}
+            for name in [n for n in self._segments if n not in names]:
+                del self._segments[name]
+            added = 0
+            for path in paths:
+                segment = self._segments.get(path.name)
+                if segment is None:
+                    segment = self._segments[path.name] = _Segment(path, self.stream, self.index_dir)
+                added += segment.refresh()
+            self._prune(names)
+            return added
+
+    def _prune(self, names):
+        if not self.index_dir.is_dir():
+            return
+        prefix = f"{self.stream}."
+        for sidecar in self.index_dir.iterdir():
+            source = sidecar.name.split(".idx", 1)[0]
+            if source.startswith(prefix) and source not in names:
+                try:
+                    sidecar.unlink()
+                except OSError:
+                    pass
+
+    def query(self, intent: Optional[str] = None, success: Optional[bool] = None,
+              since=None, until=None, limit: Optional[int] = None) -> List[Row]:
+        """
+        Filas (más viejas primero) que cumplen todos los filtros dados.
+
+        Args:
+            intent: intent (o skill, en skills_execution) exacto
+            success: True / False (las líneas sin dato de éxito no entran)
+            since / until: datetime, ISO string o epoch; since <= ts < until
+            limit: máximo de filas (las más recientes)
+        """
+        self.refresh()
+        since, until = (None if since is None else _timestamp(since)), (None if until is None else _timestamp(until))
+        wanted = None if success is None else int(bool(success))
+        rows: List[Row] = []
+        with self._lock:
+            for segment in self._segments.values():
+                if not segment.overlaps(since, until):
+                    continue
+                intent_id = segment._intent_ids.get(intent) if intent is not None else None
+                if intent is not None and intent_id is None:
+                    continue
+                for i in segment.positions(since, until):
+                    if intent_id is not None and segment.intent_ids[i] != intent_id:
+                        continue
+                    if wanted is not None and segment.success[i] != wanted:
+                        continue
+                    rows.append(Row(segment.ts[i], segment.intents[segment.intent_ids[i]],
+                                    None if segment.success[i] < 0 else bool(segment.success[i]),
+                                    segment.durations[i], segment.path.name, segment.offsets[i],
+                                    segment.lengths[i]))
+        rows.sort(key=lambda row: row.ts)
+        return rows[-limit:] if limit else rows
+
+    def read(self, rows: List[Row]) -> List[Dict]:
+        """Entradas JSON completas de `rows`, en el mismo orden"""
+        by_segment: Dict[str, List[int]] = {}
+        for position, row in enumerate(rows):
+            by_segment.setdefault(row.segment, []).append(position)
+        out: List[Any] = [None] * len(rows)
+        for name, positions in by_segment.items():
+            segment = self._segments.get(name)
+            if segment is None:
+                continue
+            positions.sort(key=lambda p: rows[p].offset)
+            for position, entry in zip(positions, segment.read([rows[p] for p in positions])):
+                out[position] = entry
+        return out
+
+    def counts(self, since=None, until=None, success: Optional[bool] = None) -> Dict[str, int]:
+        """Líneas por intent/skill"""
+        totals: Dict[str, int] = {}
+        for row in self.query(success=success, since=since, until=until):
+            totals[row.intent] = totals.get(row.intent, 0) + 1
+        return totals
+
+    def latency_distribution(self, since=None, until=None) -> Dict[str, Dict[str, Any]]:
+        """Percentiles de duración por intent/skill (snapshot de LatencyHistogram)"""
+        histograms: Dict[str, LatencyHistogram] = {}
+        for row in self.query(since=since, until=until):
+            histogram = histograms.get(row.intent)
+            if histogram is None:
+                histogram = histograms[row.intent] = LatencyHistogram(row.intent)
+            histogram.record(row.duration_ms)
+        return {name: histogram.snapshot() for name, histogram in sorted(histograms.items())}
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "segments": len(self._segments),
+                "rows": sum(len(segment.ts) for segment in self._segments.values()),
+                "indexed_bytes": sum(segment.indexed_bytes for segment in self._segments.values()),
+            }
@@ -6,6 +6,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
 
+from .audit_writer import AuditWriter
+from .log_index import LogIndex
+from .queue_logging import (
+    DebugSampler, NonBlockingQueueHandler, attach_queue_logging, build_file_handlers, detach_queue_logging,
+)
+
 
 class JarvisLogger:
     """
@@ -26,6 +32,15 @@ class JarvisLogger:
         # Configurar logging
         self._setup_logging()
         
+        # JSONL de auditoría: el comando solo encola, un hilo escribe por lotes
+        self.audit = AuditWriter(
+            self.logs_dir,
+            max_queue=config.get("audit_queue_size", 10000),
+            flush_interval=config.get("audit_flush_ms", 1000) / 1000.0,
+            compress=config.get("audit_compress", True),
+            logger=self.logger,
+        )
+        
         # Métricas en memoria
         self.metrics = {
             "commands_processed": 0,
@@ -33,50 +48,49 @@ class JarvisLogger:
             "errors": [],
             "session_start": datetime.now().isoformat()
         }
+        # Secciones extra de métricas (ej: histogramas de latencia) por nombre
+        self._metrics_providers = {"audit": self.audit.get_stats, "logging": self.get_logging_stats}
+        self._indexes: Dict[str, LogIndex] = {}
         
         self.logger.info("JarvisLogger initialized")
         self.logger.info(f"Logs guardados en: {self.logs_dir}")
     
     def _setup_logging(self):
-        """Configura el sistema de logging con múltiples handlers"""
+        """Configura el logging: QueueHandler en el logger, handlers reales en un QueueListener"""
         
         # Logger principal
         self.logger = logging.getLogger("Jarvis")
         self.logger.setLevel(logging.DEBUG if self.config.get("debug") else logging.INFO)
+        self.debug_sampler = DebugSampler(rate=self.config.get("log_debug_rate", 30))
+        self._queue_handler = None
 
         # Evitar duplicar handlers si se reinicializa en el mismo proceso
         if getattr(self.logger, "handlers", None):
             if len(self.logger.handlers) > 0:
+                self._queue_handler = next(
+                    (h for h in self.logger.handlers if isinstance(h, NonBlockingQueueHandler)), None)
                 return
         
-        # Formato detallado
-        formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+        # Handlers 1 y 2: archivo general (rota a medianoche) y de errores (rota por tamaño)
+        file_handler, error_handler = build_file_handlers(
+            self.logs_dir,
+            max_bytes=self.config.get("log_max_bytes", 5 * 1024 * 1024),
+            backup_count=self.config.get("log_backup_count", 7),
         )
         
-        # Handler 1: Archivo general
-        log_file = self.logs_dir / f"jarvis_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        
-        # Handler 2: Archivo de errores
-        error_file = self.logs_dir / f"errors_{datetime.now().strftime('%Y%m%d')}.log"
-        error_handler = logging.FileHandler(error_file, encoding='utf-8')
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(formatter)
-        
         # Handler 3: Console (solo INFO+)
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_formatter = logging.Formatter('%(levelname)s | %(message)s')
         console_handler.setFormatter(console_formatter)
         
-        # Agregar handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(error_handler)
-        self.logger.addHandler(console_handler)
+        # El logger solo encola; el listener escribe en su hilo
+        self._queue_handler = attach_queue_logging(
+            self.logger,
+            (file_handler, error_handler, console_handler),
+            max_queue=self.config.get("log_queue_size", 10000),
+            sampler=self.debug_sampler,
+        )
     
     def log_command(self, command: str, intent: str, entities: Dict, success: bool):
         """Log de comandos ejecutados"""
@@ -92,10 +106,8 @@ class JarvisLogger:
         
         self.logger.info(f"Command: {command} → {intent} (success: {success})")
         
-        # Guardar en archivo JSON para análisis
-        commands_file = self.logs_dir / "commands_history.jsonl"
-        with open(commands_file, "a", encoding='utf-8') as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
+        # Guardar en archivo JSON para análisis (lo escribe el hilo de auditoría)
+        self.audit.write("commands_history", log_entry)
     
     def log_skill_execution(self, skill_name: str, result: Dict, duration: float):
         """Log de ejecución de skills"""
@@ -105,15 +117,13 @@ class JarvisLogger:
         
         self.logger.info(f"Skill executed: {skill_name} ({duration:.3f}s)")
         
-        # Guardar detalles
-        skills_file = self.logs_dir / "skills_execution.jsonl"
-        with open(skills_file, "a", encoding='utf-8') as f:
-            f.write(json.dumps({
-                "timestamp": datetime.now().isoformat(),
-                "skill": skill_name,
-                "duration_ms": duration * 1000,
-                "result": result
-            }, ensure_ascii=False) + "\n")
+        # Guardar detalles (serializados fuera del hot path)
+        self.audit.write("skills_execution", {
+            "timestamp": datetime.now().isoformat(),
+            "skill": skill_name,
+            "duration_ms": duration * 1000,
+            "result": result
+        })
     
     def log_error(self, error_type: str, error_msg: str, context: Dict = None):
         """Log de errores"""
@@ -131,15 +141,25 @@ class JarvisLogger:
         if len(self.metrics["errors"]) > 100:
             self.metrics["errors"].pop(0)
     
+    def add_metrics_provider(self, name: str, provider):
+        """Registra provider() -> dict, incluido como métricas[name] en get_metrics/save_metrics"""
+        self._metrics_providers[name] = provider
+    
     def get_metrics(self) -> Dict:
         """Retorna métricas actuales"""
-        return {
+        metrics = {
             **self.metrics,
             "session_duration": (
                 datetime.now() - 
                 datetime.fromisoformat(self.metrics["session_start"])
             ).total_seconds()
         }
+        for name, provider in self._metrics_providers.items():
+            try:
+                metrics[name] = provider()
+            except Exception as e:
+                metrics[name] = {"error": str(e)}
+        return metrics
     
     def save_metrics(self):
         """Guarda métricas a disco"""
@@ -148,3 +168,30 @@ class JarvisLogger:
             json.dump(self.get_metrics(), f, indent=2, ensure_ascii=False)
         
         self.logger.info(f"Metrics saved to {metrics_file}")
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Espera a que los JSONL de auditoría encolados estén en disco"""
+        return self.audit.flush(timeout)
+    
+    def log_index(self, stream: str = "commands_history") -> LogIndex:
+        """Índice consultable de un JSONL de auditoría (incluye lo que aún estaba encolado)"""
+        self.audit.flush(timeout=1.0)
+        if stream not in self._indexes:
+            self._indexes[stream] = LogIndex(self.logs_dir, stream)
+        return self._indexes[stream]
+    
+    def get_logging_stats(self) -> Dict:
+        """Cola de logging: records en espera, descartados y DEBUG muestreados"""
+        handler = self._queue_handler
+        return {
+            "queued": handler.queue.qsize() if handler else 0,
+            "dropped": handler.dropped if handler else 0,
+            "debug_suppressed": self.debug_sampler.suppressed_total,
+        }
+    
+    def close(self):
+        """Vacía y cierra los JSONL de auditoría y la cola de logging (al apagar)"""
+        self.audit.close()
+        if self._queue_handler is not None:
+            detach_queue_logging(self.logger)
+            self._queue_handler = None
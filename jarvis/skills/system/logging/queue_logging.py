@@ -0,0 +1,133 @@
+# system/logging/queue_logging.py
+"""
+Logging no bloqueante para el logger "Jarvis".
+
+Los records pasan por un QueueHandler (el hot path solo hace un put en una
+cola acotada) y un QueueListener los entrega en su propio hilo a los
+handlers reales: archivo general con rotación diaria, archivo de errores
+con rotación por tamaño y consola. Las líneas DEBUG de alta frecuencia se
+muestrean por punto de llamada antes de entrar a la cola.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+class DebugSampler(logging.Filter):
+    """
+    Deja pasar como máximo `rate` records DEBUG por punto de llamada
+    (archivo:línea) cada `window` segundos; el primero que pasa después de
+    un corte lleva "(+N suprimidos)". INFO y superiores pasan siempre.
+    """
+
+    def __init__(self, rate: int = 30, window: float = 60.0):
+        super().__init__()
+        self.rate = rate
+        self.window = window
+        self.suppressed_total = 0
+        self._sites: Dict[Tuple[str, int], list] = {}  # sitio -> [inicio ventana, pasados, suprimidos]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate <= 0:
+            return True
+        now = time.monotonic()
+        site = (record.pathname, record.lineno)
+        with self._lock:
+            state = self._sites.get(site)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                state = self._sites[site] = [now, 0, 0]
+            else:
+                suppressed = 0
+            if state[1] >= self.rate:
+                state[2] += 1
+                self.suppressed_total += 1
+                return False
+            state[1] += 1
+        if suppressed:
+            record.msg = f"{record.msg} (+{suppressed} suprimidos)"
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler que descarta (y cuenta) en vez de fallar si la cola está llena"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.listener = None
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def build_file_handlers(logs_dir: Path, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 7):
+    """Handlers de destino: general (rotación a medianoche) y errores (rotación por tamaño)"""
+    formatter = logging.Formatter(
+        '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    # Archivo general: jarvis.log, rota a medianoche (jarvis.log.YYYY-MM-DD)
+    file_handler = TimedRotatingFileHandler(
+        logs_dir / "jarvis.log", when="midnight", backupCount=backup_count, encoding='utf-8', delay=True)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+
+    # Archivo de errores: errors.log, rota al superar max_bytes (errors.log.1 ...)
+    error_handler = RotatingFileHandler(
+        logs_dir / "errors.log", maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+    error_handler.setLevel(logging.ERROR)
+    error_handler.setFormatter(formatter)
+
+    return file_handler, error_handler
+
+
+def attach_queue_logging(logger: logging.Logger, handlers, max_queue: int = 10000,
+                         sampler: DebugSampler = None) -> NonBlockingQueueHandler:
+    """Pone un NonBlockingQueueHandler en `logger` y arranca el listener con `handlers`"""
+    queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=max_queue))
+    if sampler is not None:
+        queue_handler.addFilter(sampler)
+    listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    listener.start()
+    queue_handler.listener = listener
+    logger.addHandler(queue_handler)
+    atexit.register(detach_queue_logging, logger)  # lo encolado llega a disco al salir
+    return queue_handler
+
+
+def detach_queue_logging(logger: logging.Logger):
+    """Saca los QueueHandler del logger y para sus listeners (escriben lo pendiente)"""
+    for handler in list(logger.handlers):
+        if isinstance(handler, NonBlockingQueueHandler):
+            logger.removeHandler(handler)
+            if handler.listener is not None:
+                _stop_listener(handler.listener)
+                for target in handler.listener.handlers:
+                    target.close()
+                handler.listener = None
+            handler.close()
+
+
+def _stop_listener(listener: QueueListener, timeout: float = 5.0):
+    """listener.stop(), reintentando si la cola está llena justo al poner el centinela"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            listener.stop()
+            return
+        except queue.Full:
+            if time.monotonic() >= deadline:
+                return
+            time.sleep(0.01)
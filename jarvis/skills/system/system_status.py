@@ -2,6 +2,8 @@
 import psutil
 import platform
 
+from skills.actions.result_cache import CachePolicy
+
 
 class SystemStatusSkill:
     """Muestra información del sistema"""
@@ -11,6 +13,9 @@ class SystemStatusSkill:
         r"\b(cpu|memoria|ram|disco)\b"
     ]
     
+    # cpu_percent(interval=1) bloquea 1s: se reutiliza la misma lectura por unos segundos
+    cache_policy = CachePolicy(ttl=5.0, key=())
+    
     def run(self, entities, core):
         try:
             # CPU
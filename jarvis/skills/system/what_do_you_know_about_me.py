@@ -8,6 +8,8 @@ import time
 from typing import Dict, Any, List
 from collections import Counter
 
+from skills.actions.result_cache import CachePolicy
+
 
 class WhatDoYouKnowAboutMeSkill:
     """
@@ -15,6 +17,10 @@ class WhatDoYouKnowAboutMeSkill:
     Covers habits, technical level, preferences, and behavioral patterns.
     """
 
+    # the profile only moves with new sessions: one analysis per minute is plenty
+    cache_policy = CachePolicy(ttl=60.0, key=())
+
+
     def __init__(self, storage=None, active_learning=None):
         self.storage = storage
         self.active_learning = active_learning
@@ -2,18 +2,27 @@
 """
 Background Task Manager - Execute tasks asynchronously
 For internet searches, parallel skill attempts, etc.
+
+Tasks run on the shared TaskEngine (priority order, equal priorities FIFO);
+each task carries a Future that completes when it finishes, which is what
+waiting and completion callbacks hang off.
 """
 
+import itertools
 import threading
 import time
-from typing import Callable, Dict, List, Optional
+from collections import deque
+from concurrent.futures import Future, wait
 from datetime import datetime
-import queue
+from typing import Any, Callable, Dict, List, Optional
+
+from monitoring.metrics import LatencyHistogram
+from system.core.task_engine import TaskEngine
 
 
 class BackgroundTask:
     """Represents a background task"""
-    
+
     def __init__(self, task_id: str, name: str, function: Callable, args=None, kwargs=None, priority=0):
         self.task_id = task_id
         self.name = name
@@ -21,32 +30,71 @@ class BackgroundTask:
         self.args = args or []
         self.kwargs = kwargs or {}
         self.priority = priority  # Higher = more important
-        
-        self.status = 'pending'  # pending, running, completed, failed
+
+        self.status = 'pending'  # pending, running, completed, failed, cancelled
         self.result = None
         self.error = None
         self.created_at = datetime.now()
         self.started_at = None
         self.completed_at = None
         self.duration_ms = 0
-    
-    def execute(self):
-        """Execute the task"""
-        try:
+        self.queue_wait_ms = 0.0
+        self.run_ms = 0.0
+        self.future: Future = Future()
+        self._state_lock = threading.Lock()
+        self._queued_at = time.perf_counter()
+
+    def execute(self) -> bool:
+        """Execute the task (False if it was cancelled while queued)"""
+        with self._state_lock:
+            if self.status != 'pending':
+                return False
             self.status = 'running'
+        self.future.set_running_or_notify_cancel()
+        start = time.perf_counter()
+        self.queue_wait_ms = (start - self._queued_at) * 1000
+        try:
             self.started_at = datetime.now()
-            
+
             self.result = self.function(*self.args, **self.kwargs)
             self.status = 'completed'
-            
+
         except Exception as e:
             self.error = str(e)
             self.status = 'failed'
-        
+            failure = e
+        else:
+            failure = None
+
         finally:
             self.completed_at = datetime.now()
-            self.duration_ms = int((self.completed_at - self.started_at).total_seconds() * 1000)
-    
+            self.run_ms = (time.perf_counter() - start) * 1000
+            self.duration_ms = int(self.run_ms)
+
+        # Complete the future last: waiters and callbacks see the final state
+        if failure is None:
+            self.future.set_result(self.result)
+        else:
+            self.future.set_exception(failure)
+        return True
+
+    def cancel(self) -> bool:
+        """Cancel the task if it hasn't started yet (False if it has, or already was)"""
+        with self._state_lock:
+            if self.status != 'pending':
+                return False
+            self.status = 'cancelled'
+            self.completed_at = datetime.now()
+        self.future.cancel()
+        return True
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def add_done_callback(self, callback: Callable[["BackgroundTask"], Any]):
+        """Call callback(task) when the task finishes (at once if it already has)"""
+        self.future.add_done_callback(lambda _future: callback(self))
+
     def to_dict(self) -> Dict:
         """Convert to dict"""
         return {
@@ -56,6 +104,7 @@ class BackgroundTask:
             'result': str(self.result)[:100] if self.result else None,
             'error': self.error,
             'duration_ms': self.duration_ms,
+            'queue_wait_ms': round(self.queue_wait_ms, 1),
             'priority': self.priority
         }
 
@@ -67,115 +116,178 @@ class BackgroundTaskManager:
     - Internet searches
     - Parallel skill attempts
     - Slow operations
+
+    Tasks run on a TaskEngine (its own, or the core's shared one); every
+    task is indexed by id until it falls out of the `history` most recently
+    finished ones, and queue-wait and run times go to two histograms.
     """
-    
-    def __init__(self, max_workers: int = 4, logger=None):
-        self.max_workers = max_workers
+
+    def __init__(self, max_workers: int = 4, logger=None, history: int = 200, engine: TaskEngine = None):
+        self.max_workers = engine.workers if engine is not None else max_workers
         self.logger = logger
-        self.task_queue = queue.PriorityQueue()
+        self.engine = engine or TaskEngine(workers=max_workers, logger=logger)
+        self._owns_engine = engine is None
         self.active_tasks: Dict[str, BackgroundTask] = {}
-        self.completed_tasks: List[BackgroundTask] = []
-        self.workers = []
+        self.completed_tasks: deque = deque(maxlen=history)
         self.running = False
-    
+
+        self._tasks: Dict[str, BackgroundTask] = {}  # id -> task (queued, running or in history)
+        self._engine_ids: Dict[str, str] = {}  # task id -> engine task id, while pending
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self.queue_wait = LatencyHistogram("queue_wait")
+        self.run_time = LatencyHistogram("run")
+        self.counters = {'submitted': 0, 'completed': 0, 'failed': 0, 'cancelled': 0, 'callback_errors': 0}
+
     def _log(self, msg: str):
         """Log message using logger or print"""
         if self.logger:
             self.logger.info(msg)
         else:
             print(f"[BACKGROUND] {msg}")
-    
+
     def start(self):
-        """Start worker threads"""
+        """Start the engine's workers"""
         if self.running:
             return
-        
+
         self.running = True
-        for i in range(self.max_workers):
-            worker = threading.Thread(target=self._worker_loop, daemon=True)
-            worker.start()
-            self.workers.append(worker)
-        
-        self._log(f"Started {self.max_workers} workers")
-    
-    def stop(self):
-        """Stop all workers"""
+        self.engine.start()
+        self._log(f"Started ({self.max_workers} engine workers)")
+
+    def stop(self, timeout: float = 1.0):
+        """Stop taking work; tasks still queued are cancelled (the engine stops too if it's ours)"""
+        if not self.running:
+            return
         self.running = False
-        # Wait for workers to finish
-        for worker in self.workers:
-            worker.join(timeout=1.0)
-        self._log("All workers stopped")
-    
-    def _worker_loop(self):
-        """Worker thread main loop"""
-        while self.running:
-            try:
-                # Get task from queue (blocking with timeout)
-                priority, task = self.task_queue.get(timeout=1.0)
-                
-                if task is None:  # Shutdown signal
-                    break
-                
-                self.active_tasks[task.task_id] = task
-                task.execute()
-                self.completed_tasks.append(task)
-                del self.active_tasks[task.task_id]
-                
-            except queue.Empty:
-                continue
-            except Exception as e:
-                self._log(f"Worker error: {e}")
-    
-    def submit(self, name: str, function: Callable, args=None, 
-               kwargs=None, priority: int = 0, task_id: str = None) -> str:
+        with self._lock:
+            pending = [task_id for task_id, task in self._tasks.items() if task.status == 'pending']
+        cancelled = sum(1 for task_id in pending if self.cancel(task_id))
+        if self._owns_engine:
+            self.engine.stop(timeout=timeout)
+        self._log(f"All workers stopped ({cancelled} queued tasks cancelled)")
+
+    def _run(self, task: BackgroundTask):
+        """Engine-side body of a task"""
+        with self._lock:
+            self._engine_ids.pop(task.task_id, None)
+            self.active_tasks[task.task_id] = task
+        if task.execute():
+            self.queue_wait.record(task.queue_wait_ms)
+            self.run_time.record(task.run_ms)
+            self._finish(task)
+        else:  # cancelled while queued: cancel() already moved it to the history
+            with self._lock:
+                self.active_tasks.pop(task.task_id, None)
+
+    def _finish(self, task: BackgroundTask):
+        """Move a finished task from active to the bounded history"""
+        with self._lock:
+            self.active_tasks.pop(task.task_id, None)
+            self._engine_ids.pop(task.task_id, None)
+            if len(self.completed_tasks) == self.completed_tasks.maxlen:
+                evicted = self.completed_tasks[0]
+                if self._tasks.get(evicted.task_id) is evicted:
+                    del self._tasks[evicted.task_id]
+            self.completed_tasks.append(task)
+            self.counters[task.status] = self.counters.get(task.status, 0) + 1
+
+    def submit(self, name: str, function: Callable, args=None,
+               kwargs=None, priority: int = 0, task_id: str = None,
+               callback: Optional[Callable[[BackgroundTask], Any]] = None) -> str:
         """
         Submit a task for background execution
+        callback(task) runs on the worker thread once the task finishes
         Returns: task_id (str)
         """
-        task_id = task_id or f"task_{int(time.time() * 1000)}"
+        seq = next(self._seq)
+        task_id = task_id or f"task_{int(time.time() * 1000)}_{seq}"
         task = BackgroundTask(task_id, name, function, args, kwargs, priority)
-        
-        # Add to queue (negative priority so higher = executed sooner)
-        self.task_queue.put((-priority, task))
+        if callback is not None:
+            task.add_done_callback(lambda t: self._run_callback(callback, t))
+
+        with self._lock:
+            current = self._tasks.get(task_id)
+            if current is not None and not current.done():
+                raise ValueError(f"Task id already in use: {task_id}")
+            self._tasks[task_id] = task
+            self.counters['submitted'] += 1
+
+        # Higher priority runs sooner; the engine keeps equal priorities FIFO
+        handle = self.engine.submit(self._run, args=(task,), name=name, priority=priority)
+        with self._lock:
+            if task.status == 'pending':
+                self._engine_ids[task_id] = handle.task_id
         self._log(f"Task queued: {name} (id={task_id})")
-        
+
         return task_id
-    
+
+    def _run_callback(self, callback, task: BackgroundTask):
+        try:
+            callback(task)
+        except Exception as e:
+            with self._lock:
+                self.counters['callback_errors'] += 1
+            self._log(f"Callback error for {task.task_id}: {e}")
+
     def get_task(self, task_id: str) -> Optional[BackgroundTask]:
-        """Get task by ID"""
-        # Check active tasks
-        if task_id in self.active_tasks:
-            return self.active_tasks[task_id]
-        
-        # Check completed tasks
-        for task in self.completed_tasks:
-            if task.task_id == task_id:
-                return task
-        
-        return None
-    
+        """Get task by ID (queued, running or still in the completed history)"""
+        return self._tasks.get(task_id)
+
+    def cancel(self, task_id: str) -> bool:
+        """Cancel a task that hasn't started yet"""
+        task = self.get_task(task_id)
+        if task is None or not task.cancel():
+            return False
+        with self._lock:
+            engine_id = self._engine_ids.pop(task_id, None)
+        if engine_id is not None:
+            self.engine.cancel(engine_id)
+        self._finish(task)
+        return True
+
     def wait_for_task(self, task_id: str, timeout_ms: int = 5000) -> Optional[BackgroundTask]:
         """
-        Wait for task to complete
+        Wait for task to complete (wakes as soon as it does)
         Returns: task or None if timeout
         """
-        start = time.time()
-        timeout_s = timeout_ms / 1000.0
-        
-        while time.time() - start < timeout_s:
-            task = self.get_task(task_id)
-            
-            if task and task.status in ['completed', 'failed']:
-                return task
-            
-            time.sleep(0.1)
-        
-        return None
-    
+        task = self.get_task(task_id)
+        if task is None:
+            return None
+        done, _ = wait([task.future], timeout=timeout_ms / 1000.0)
+        return task if done else None
+
+    def result(self, task_id: str, timeout: Optional[float] = None):
+        """Task's return value; re-raises its exception, CancelledError or TimeoutError (KeyError for unknown ids)"""
+        task = self.get_task(task_id)
+        if task is None:
+            raise KeyError(task_id)
+        return task.future.result(timeout=timeout)
+
     def get_active_tasks(self) -> List[Dict]:
         """Get all active tasks"""
-        return [task.to_dict() for task in self.active_tasks.values()]
-    
+        with self._lock:
+            return [task.to_dict() for task in self.active_tasks.values()]
+
     def get_completed_tasks(self, limit: int = 10) -> List[Dict]:
         """Get recently completed tasks"""
-        return [task.to_dict() for task in self.completed_tasks[-limit:]]
+        with self._lock:
+            recent = list(self.completed_tasks)[-limit:]
+        return [task.to_dict() for task in recent]
+
+    def get_stats(self) -> Dict:
+        """Counters, queue depth and queue-wait vs run-time distributions"""
+        with self._lock:
+            counters = dict(self.counters)
+            active = len(self.active_tasks)
+            history = len(self.completed_tasks)
+            queued = sum(1 for task in self._tasks.values() if task.status == 'pending')
+        return {
+            **counters,
+            'queued': queued,
+            'active': active,
+            'history': history,
+            'workers': self.engine.workers if self.running and self.engine.running else 0,
+            'queue_wait': self.queue_wait.snapshot(),
+            'run': self.run_time.snapshot(),
+        }
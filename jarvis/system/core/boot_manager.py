@@ -69,10 +69,16 @@ class BootManager:
 
             self.core.logger.logger.info("Starting Scheduler...")
             self.core.scheduler.start()
+            if getattr(self.core, "jobs", None):
+                self.core.jobs.start()
+            if getattr(self.core, "reminders", None):
+                self.core.reminders.start()
 
-            # Scheduler: Collect metrics every 5 minutes
+            # Scheduler: Collect metrics (every 5 minutes by default) and flush app usage
             if self.core.config.get("data_collection", False):
-                self.core.scheduler.schedule_every(300, self.core.data_collector.collect_system_snapshot)
+                self.core.scheduler.schedule_every(self.core.data_collector.snapshot_interval,
+                                                   self.core.data_collector.collect_system_snapshot)
+                self.core.scheduler.schedule_every(self.core.config.get("data_flush_interval", 60), self.core.data_collector.flush)
 
             self.core.logger.logger.info("Running initializers...")
             self.core._initializer.run()
@@ -1,8 +1,9 @@
 # system/core/engine.py
+import threading
 import time
 from typing import Optional
 
-from core.lifecycle.runtime import RuntimeState, EventBus, Scheduler
+from core.lifecycle.runtime import RuntimeState, EventBus, AsyncEventBus, Scheduler
 from core.lifecycle.boot import Initializer, Diagnostics, ModuleLoader
 
 from jarvis_io.text.input_adapter import CLIInput
@@ -21,18 +22,7 @@ from skills.actions.dispatcher import SkillDispatcher
 from .exceptions import BootError, JarvisException, ConfigError
 from .decorators import handle_errors, validate_input, log_execution
 from .validators import ConfigValidator, StateValidator
-from skills.system.get_time import GetTimeSkill
-from skills.system.system_status import SystemStatusSkill
-from skills.productivity.create_note import CreateNoteSkill
-from skills.research.search_file import SearchFileSkill
-from skills.research.summarize_recent_activity import SummarizeRecentActivitySkill
-from skills.analysis.analyze_session_value import AnalyzeSessionValueSkill
-from skills.analysis.research_and_contextualize import ResearchAndContextualizeSkill
-from skills.system.analyze_system_health import AnalyzeSystemHealthSkill
-from skills.system.what_do_you_know_about_me import WhatDoYouKnowAboutMeSkill
-from skills.analysis.evaluate_user_session import EvaluateUserSessionSkill
-from skills.system.system_auto_optimization import SystemAutoOptimizationSkill
-from skills.automation.auto_programming import AutoProgrammingSkill
+from skills.actions.manifest import lazy_registry, preload, import_report, format_import_report
 
 # Web Dashboard (opcional)
 try:
@@ -101,7 +91,8 @@ class JarvisCore:
         # Data collector (con consent del config)
         try:
             self.data_collector = DataCollector(
-                consent=self.config.get("data_collection", False)
+                consent=self.config.get("data_collection", False),
+                snapshot_interval=self.config.get("metrics_interval", 300)
             )
             self._components_initialized.append("data_collector")
         except Exception as e:
@@ -110,8 +101,30 @@ class JarvisCore:
         
         # Runtime components
         try:
-            self.events = EventBus(workers=self.config.get("workers", 4))
-            self.scheduler = Scheduler()
+            if self.config.get("event_bus") == "asyncio":
+                # asyncio loop for async handlers, `workers` threads for sync ones
+                self.events = AsyncEventBus(
+                    workers=self.config.get("workers", 4),
+                    capacity=self.config.get("event_queue_capacity", 1000),
+                    max_concurrency=self.config.get("event_max_concurrency", 256)
+                )
+            else:
+                self.events = EventBus(
+                    workers=self.config.get("workers", 4),
+                    capacity=self.config.get("event_queue_capacity", 1000),
+                    overflow=self.config.get("event_overflow"),
+                    block_timeout=self.config.get("event_block_timeout", 1.0)
+                )
+            self.scheduler = Scheduler(workers=self.config.get("scheduler_workers", 4))
+            # Persistent cron/interval jobs (SQLite), only when a job store is configured
+            self.jobs = None
+            if self.config.get("job_store"):
+                from scheduler.queue import JobStore
+                from scheduler.worker import JobWorker
+                self.jobs = JobWorker(
+                    JobStore(self.config["job_store"]),
+                    workers=self.config.get("scheduler_workers", 4)
+                )
             self.modules_loader = ModuleLoader(self)
             self._components_initialized.append("runtime")
         except Exception as e:
@@ -162,6 +175,16 @@ class JarvisCore:
             self.logger.logger.warning(f"Memory/LLM components failed: {e}")
             self._components_failed.append(("memory_llm", str(e)))
 
+        # Reminders (timing wheel, persisted in storage, fire as jarvis.response)
+        try:
+            from skills.productivity.reminders import ReminderService
+            self.reminders = ReminderService(self.events, getattr(self, "storage", None))
+            self._components_initialized.append("reminders")
+        except Exception as e:
+            self.reminders = None
+            self.logger.logger.warning(f"Reminder service failed: {e}")
+            self._components_failed.append(("reminders", str(e)))
+
         # NLU Pipeline (temporal - será inicializado después)
         self.nlu = None
 
@@ -179,8 +202,13 @@ class JarvisCore:
 
         # Dispatcher de skills
         try:
-            self.skill_dispatcher = SkillDispatcher(logger=self.logger.logger)
+            self.skill_dispatcher = SkillDispatcher(
+                logger=self.logger.logger,
+                timeout_seconds=self.config.get("skill_timeout", 30),
+                max_workers=self.config.get("skill_workers", 4),
+            )
             self._register_skills()
+            self.skill_dispatcher.attach_eventbus(self.events)
             self._components_initialized.append("skill_dispatcher")
         except Exception as e:
             raise BootError(f"Failed to initialize skill dispatcher: {e}", {"component": "skill_dispatcher"})
@@ -209,6 +237,9 @@ class JarvisCore:
         # Actualizar active_learning con NLU
         self.active_learning.nlu_parser = self.nlu
         
+        # Histogramas de latencia (skills + etapas NLU) en el archivo de métricas
+        self.logger.add_metrics_provider("latency", self.get_latency_report)
+        
         # Formateador de respuestas
         self.response_formatter = ResponseFormatter()
         
@@ -217,11 +248,21 @@ class JarvisCore:
         from system.core.intent_validator import IntentValidator
         from system.core.background_tasks import BackgroundTaskManager
         from system.core.parallel_executor import ParallelExecutor
+        from system.core.task_engine import TaskEngine
+        from system.pc_authority.background_task_manager import BackgroundTaskManager as PCTaskManager
         
         self.reflection_observer = SkillReflectionObserver(self.storage, self.logger.logger)
         self.intent_validator = IntentValidator(self.cli, self.reflection_observer)
-        self.background_tasks = BackgroundTaskManager(max_workers=4, logger=self.logger.logger)
+        # Un solo motor de tareas (hilos fijos + pool de procesos) detrás de ambos gestores
+        self.task_engine = TaskEngine(
+            workers=self.config.get("task_workers", 4),
+            process_workers=self.config.get("task_process_workers", 2),
+            logger=self.logger.logger,
+        )
+        self.background_tasks = BackgroundTaskManager(logger=self.logger.logger, engine=self.task_engine)
+        self.task_manager = PCTaskManager(engine=self.task_engine)
         self.parallel_executor = ParallelExecutor(self.skill_dispatcher, self.logger.logger, timeout_seconds=3.0)
+        self.prefetcher = self._create_prefetcher() if self.config.get("prefetch", False) else None
         
         # Handlers
         self.handlers = EventHandlers(self)
@@ -257,69 +298,31 @@ class JarvisCore:
             print(f"[{tag}] {msg}")
 
     def _register_skills(self):
-        """Registra todas las skills disponibles"""
-        from skills.productivity.open_app import OpenAppSkill
-        from skills.system.get_time import GetTimeSkill
-        from skills.system.system_status import SystemStatusSkill
-        from skills.productivity.create_note import CreateNoteSkill
-        from skills.research.search_file import SearchFileSkill
-        from skills.research.summarize_recent_activity import SummarizeRecentActivitySkill
-        from skills.research.summarize_last_session import SummarizeLastSessionSkill
-        from skills.analysis.analyze_session_value import AnalyzeSessionValueSkill
-        from skills.analysis.research_and_contextualize import ResearchAndContextualizeSkill
-        from skills.system.analyze_system_health import AnalyzeSystemHealthSkill
-        from skills.system.what_do_you_know_about_me import WhatDoYouKnowAboutMeSkill
-        from skills.analysis.evaluate_user_session import EvaluateUserSessionSkill
-        from skills.learning.learning_engine import LearningEngineSkill
-        from skills.research.research_skill import ResearchSkill
-        from skills.learning.context_awareness import ContextAwarenessSkill
-        from skills.system.manage_resources import ManageResourcesSkill
-        # NEW v0.0.6: Advanced features
-        from skills.productivity.open_app_advanced import OpenAppAdvancedSkill
-        from skills.research.internet_search import InternetSearchSkill, StackOverflowSearchSkill, GitHubSearchSkill
-        from skills.system.skill_testing import SkillTestingSkill
-        
-        skills = {
-            "open_app": OpenAppSkill,
-            "get_time": GetTimeSkill,
-            "system_status": SystemStatusSkill,
-            "create_note": CreateNoteSkill,
-            "search_file": SearchFileSkill,
-            "summarize_recent_activity": SummarizeRecentActivitySkill,
-            "summarize_last_session": SummarizeLastSessionSkill,
-            "analyze_session_value": AnalyzeSessionValueSkill,
-            "research_and_contextualize": ResearchAndContextualizeSkill(self.storage, self.llm_manager),
-            "analyze_system_health": AnalyzeSystemHealthSkill(self.logger.logger),
-            "what_do_you_know_about_me": WhatDoYouKnowAboutMeSkill(self.storage, self.active_learning),
-            "evaluate_user_session": EvaluateUserSessionSkill(self.storage, self.active_learning),
-            "auto_programming": AutoProgrammingSkill(self.storage, self.active_learning, self.logger.logger),
-            "system_auto_optimization": SystemAutoOptimizationSkill(self.logger.logger),
-            "learning_engine": LearningEngineSkill(),
-            "research_skill": ResearchSkill(),
-            "context_awareness": ContextAwarenessSkill(),
-            "manage_resources": ManageResourcesSkill(),
-            # NEW v0.0.6: Advanced skills
-            "open_app_advanced": OpenAppAdvancedSkill(),
-            "internet_search": InternetSearchSkill(),
-            "stackoverflow_search": StackOverflowSearchSkill(),
-            "github_search": GitHubSearchSkill(),
-            "skill_testing": SkillTestingSkill()
-        }
+        """
+        Registra todas las skills del manifiesto (skills/manifest.json).
+
+        Ningún módulo de skill se importa aquí: el NLU lee patrones y
+        entity_hints del manifiesto, y cada skill se importa e instancia en
+        su primer dispatch (o en la precarga en segundo plano tras el boot).
+        """
+        start = time.perf_counter()
+        skills = lazy_registry(context=self)
         
-        for name, skill_cls in skills.items():
-            # Check if it's a class (type) or already an instance
-            if isinstance(skill_cls, type):
-                # It's a class, needs instantiation
-                try:
-                    skill_instance = skill_cls()
-                    self.skill_dispatcher.register(name, skill_instance)
-                except Exception as e:
-                    self.logger.logger.error(f"Failed to instantiate {name}: {e}")
-            else:
-                # Already an instance
-                self.skill_dispatcher.register(name, skill_cls)
+        for name, skill in skills.items():
+            self.skill_dispatcher.register(name, skill)
         
-        self.logger.logger.info(f"Registered {len(skills)} skills")
+        self.logger.logger.info(
+            f"Registered {len(skills)} skills from manifest in {(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+
+    def _preload_skills(self):
+        """Importa los módulos de skills fuera del camino crítico y registra el tiempo de cada uno"""
+        report = preload(self.skill_dispatcher.skills)
+        self.logger.logger.info(f"[SKILLS] Import report: {format_import_report(report)}")
+
+    def get_skill_import_report(self) -> list:
+        """Estado e import time por skill (las más lentas primero)"""
+        return import_report(self.skill_dispatcher.skills)
 
     def boot(self):
         """Secuencia de arranque del sistema"""
@@ -333,14 +336,20 @@ class JarvisCore:
             
             self.logger.logger.info("Starting Scheduler...")
             self.scheduler.start()
+            if self.jobs:
+                self.jobs.start()
+            if self.reminders:
+                self.reminders.start()
             
             # NEW: Start Background Task Manager
             self.logger.logger.info("Starting Background Task Manager...")
             self.background_tasks.start()
             
-            # Scheduler: Recolectar métricas cada 5 minutos
+            # Scheduler: Recolectar métricas (cada 5 minutos por defecto) y volcar el uso de apps
             if self.config.get("data_collection", False):
-                self.scheduler.schedule_every(300, self.data_collector.collect_system_snapshot)
+                self.scheduler.schedule_every(self.data_collector.snapshot_interval,
+                                              self.data_collector.collect_system_snapshot)
+                self.scheduler.schedule_every(self.config.get("data_flush_interval", 60), self.data_collector.flush)
             
             self.logger.logger.info("Running initializers...")
             self._initializer.run()
@@ -372,6 +381,10 @@ class JarvisCore:
             self.state.set("READY")
             self.logger.logger.info("[BOOT] Boot completed - READY")
             
+            # Importar skills en segundo plano (el primer dispatch ya no paga el import)
+            if self.config.get("skill_preload", True):
+                threading.Thread(target=self._preload_skills, name="SkillPreload", daemon=True).start()
+            
             # Legacy STT (deprecated - will be removed)
             if self.stt.is_available():
                 self.stt.start()
@@ -453,9 +466,20 @@ class JarvisCore:
             except Exception as e:
                 self.logger.log_error("STT_STOP_ERR", str(e))
             
+            # Skills en curso: pedir cancelación sin esperar a las colgadas
+            try:
+                if hasattr(self, 'parallel_executor'):
+                    self.parallel_executor.shutdown(wait=False)
+                if getattr(self, 'prefetcher', None):
+                    self.prefetcher.shutdown()
+                self.skill_dispatcher.shutdown(wait=False)
+            except Exception as e:
+                self.logger.log_error("DISPATCHER_STOP_ERR", str(e))
+            
             # Stop background tasks
             try:
                 self.background_tasks.stop()
+                self.task_engine.stop()
             except Exception as e:
                 self.logger.log_error("BACKGROUND_STOP_ERR", str(e))
             
@@ -472,6 +496,10 @@ class JarvisCore:
             
             try: 
                 self.scheduler.stop()
+                if self.jobs:
+                    self.jobs.stop()
+                if self.reminders:
+                    self.reminders.stop()
             except Exception as e: 
                 self.logger.log_error("SCHED_STOP_ERR", str(e))
             
@@ -479,10 +507,17 @@ class JarvisCore:
                 self.events.stop()
             except Exception as e: 
                 self.logger.log_error("EVENTS_STOP_ERR", str(e))
+            
+            try:
+                if getattr(self, 'data_collector', None):
+                    self.data_collector.close()
+            except Exception as e:
+                self.logger.log_error("DATA_COLLECTOR_STOP_ERR", str(e))
         
         finally:
             self.state.set("DEAD")
             self.logger.logger.info("[SYSTEM] Shutdown complete")
+            self.logger.close()  # último: vacía los JSONL de auditoría
             print("\n[GOODBYE] Hasta luego!")
     
     def get_session_insights(self) -> dict:
@@ -523,9 +558,13 @@ class JarvisCore:
             if hasattr(self, 'skill_dispatcher') and hasattr(self.skill_dispatcher, 'skills'):
                 for skill_name, skill_instance in self.skill_dispatcher.skills.items():
                     skill_doc = skill_instance.__doc__ if hasattr(skill_instance, '__doc__') else f"Skill: {skill_name}"
+                    if isinstance(skill_instance, type):
+                        class_name = skill_instance.__name__
+                    else:
+                        class_name = getattr(skill_instance, 'class_name', skill_instance.__class__.__name__)
                     skills_list.append({
                         'name': skill_name,
-                        'class': skill_instance.__class__.__name__,
+                        'class': class_name,
                         'description': skill_doc
                     })
             
@@ -587,6 +626,17 @@ class JarvisCore:
                     'disk_percent': disk_percent,
                     'processes': processes
                 },
+                'eventbus': self.events.get_stats() if hasattr(self, 'events') else {},
+                'scheduler': self.scheduler.get_stats() if hasattr(self, 'scheduler') else {},
+                'jobs': self.jobs.get_stats() if getattr(self, 'jobs', None) else {},
+                'latency': self.get_latency_report(),
+                'result_cache': self.skill_dispatcher.get_cache_stats() if hasattr(self, 'skill_dispatcher') else {},
+                'coalescing': self.skill_dispatcher.get_coalescing_stats() if hasattr(self, 'skill_dispatcher') else {},
+                'skill_imports': self.get_skill_import_report() if hasattr(self, 'skill_dispatcher') else [],
+                'speculation': self.parallel_executor.get_stats() if hasattr(self, 'parallel_executor') else {},
+                'prefetch': self.prefetcher.get_stats() if getattr(self, 'prefetcher', None) else {},
+                'background_tasks': self.background_tasks.get_stats() if hasattr(self, 'background_tasks') else {},
+                'task_engine': self.task_engine.get_stats() if hasattr(self, 'task_engine') else {},
                 'debug_mode': getattr(self, '_debug_mode', False)
             }
             return status
@@ -594,6 +644,47 @@ class JarvisCore:
             self.logger.logger.error(f"Error getting system status: {e}")
             return {'error': str(e)}
     
+    def _create_prefetcher(self):
+        """Prefetcher seeded with (and falling back to) ContextAwareness' interaction history"""
+        from system.core.prefetcher import NextActionModel, Prefetcher
+        from skills.learning.context_awareness import ContextAwareness
+
+        skills = self.skill_dispatcher.skills
+        try:
+            awareness = ContextAwareness()
+            history = [i.get("skill") for i in awareness.data.get("last_interactions", [])]
+            predict = awareness.predict_next_action
+        except Exception as e:
+            self.logger.logger.debug(f"[PREFETCH] No context history: {e}")
+            history, predict = [], None
+
+        def fallback(recent):
+            guess = predict(recent) if predict else None
+            return guess if guess in skills else None
+
+        model = NextActionModel(fallback=fallback)
+        model.seed(skill for skill in history if skill in skills)
+        return Prefetcher(
+            self.skill_dispatcher, core=self, logger=self.logger.logger, model=model,
+            budget_ms=self.config.get("prefetch_budget_ms", 250),
+        )
+
+    def get_latency_report(self) -> dict:
+        """Latency histograms: {'skills': {intent: snapshot}, 'nlu': {stage: snapshot}}"""
+        dispatcher = getattr(self, 'skill_dispatcher', None)
+        nlu = getattr(self, 'nlu', None)
+        return {
+            'skills': dispatcher.get_latency_report() if dispatcher else {},
+            'nlu': nlu.latency.snapshot() if hasattr(nlu, 'latency') else {},
+        }
+    
+    def reset_latency(self):
+        """Reset skill and NLU latency histograms"""
+        if getattr(self, 'skill_dispatcher', None):
+            self.skill_dispatcher.latency.reset()
+        if hasattr(getattr(self, 'nlu', None), 'latency'):
+            self.nlu.latency.reset()
+    
     def toggle_debug_mode(self) -> bool:
         """Toggle debug mode ON/OFF and return new state
         
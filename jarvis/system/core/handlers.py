@@ -4,6 +4,7 @@ Event Handlers for JarvisAI Core
 Handles various system events and user interactions with enhanced error handling and confidence tracking
 """
 
+import threading
 import time
 import traceback
 from typing import TYPE_CHECKING, Dict, Any, Optional
@@ -16,9 +17,16 @@ from system.exceptions import (
     SkillTimeoutError, PreCheckError, DegradedError
 )
 from system.core.special_commands import SpecialCommandsHandler
+from core.constants import EVENT_JARVIS_RESPONSE, EVENT_MEMORY_SHORT_TERM_UPDATED
 from system.core.error_presenter import ErrorPresenter
 
 
+# Replies that confirm / decline a deferred alternative (see _deferred_hint)
+_AFFIRMATIVE = {"si", "sí", "dale", "ok", "okay", "confirmo", "hacelo", "yes"}
+_NEGATIVE = {"no", "cancelar", "cancelá", "dejalo", "dejá", "nope"}
+CONFIRMATION_TTL = 60.0
+
+
 class EventHandlers:
     """
     Collection of event handlers for JarvisAI core events
@@ -27,6 +35,9 @@ class EventHandlers:
     def __init__(self, core: 'JarvisCore'):
         self.core = core
         self.special_commands = SpecialCommandsHandler(core)
+        # Side-effecting alternative waiting for a "sí" on the session's next command
+        self._pending_confirmations: Dict[Any, Dict[str, Any]] = {}
+        self._confirmations_lock = threading.Lock()
 
     def _handle_error_gracefully(self, error_type: str, error: Exception, 
                                  intent: str = "", entities: Dict = None, 
@@ -59,7 +70,10 @@ class EventHandlers:
             if text:
                 self.core.logger.logger.info(f"[VOICE] {text}")
                 # Reuse NLU pipeline as if it were text
-                self.core.nlu.process(text, self.core.events)
+                self.core.nlu.process(
+                    text, self.core.events,
+                    session_id=event.get("data", {}).get("session_id") or getattr(self.core, "current_session_id", None)
+                )
         except SkillExecutionError as e:
             self.core.logger.logger.error(f"[VOICE] {e.user_message()}")
         except JarvisException as e:
@@ -106,7 +120,7 @@ class EventHandlers:
                 # Check for special commands first
                 if self.special_commands.is_special_command(text):
                     response = self.special_commands.handle_command(text)
-                    self.core.events.emit("jarvis_response", {
+                    self.core.events.emit(EVENT_JARVIS_RESPONSE, {
                         "text": response,
                         "intent": "system_command",
                         "entities": {},
@@ -144,6 +158,21 @@ class EventHandlers:
             confidence = payload.get("confidence", 0.0)
             alternatives = payload.get("alternatives", [])
             trace = payload.get("trace")
+            session_id = payload.get("session_id") or self.core.current_session_id
+
+            # A "sí" right after a deferred alternative runs it; any other command of the session drops it
+            confirmed = self._take_confirmation(raw_text, session_id)
+            if confirmed == "declined":
+                self.core.events.emit(EVENT_JARVIS_RESPONSE, {
+                    "text": "Listo, no lo ejecuto.",
+                    "intent": "confirmation",
+                    "entities": {},
+                    "confidence": 1.0
+                })
+                return
+            if confirmed:
+                intent, entities = confirmed["intent"], confirmed["entities"]
+                confidence, alternatives = 1.0, []
 
             # Log NLU result with confidence
             self.core.logger.logger.debug(
@@ -167,7 +196,7 @@ class EventHandlers:
                     )
                 except IntentNotRecognizedError as e:
                     response_text = self._handle_error_gracefully("UNKNOWN_INTENT", e, intent, entities)
-                    self.core.events.emit("jarvis_response", {
+                    self.core.events.emit(EVENT_JARVIS_RESPONSE, {
                         "text": response_text,
                         "intent": intent,
                         "entities": entities,
@@ -183,7 +212,7 @@ class EventHandlers:
                     return
 
             # Check operational mode permissions
-            current_mode = self.core.session_manager.get_session_mode(self.core.current_session_id)
+            current_mode = self.core.session_manager.get_session_mode(session_id)
             if not self.core.mode_controller.can_execute_action(current_mode, intent):
                 try:
                     raise PreCheckError(
@@ -193,7 +222,7 @@ class EventHandlers:
                     )
                 except PreCheckError as e:
                     response_text = self._handle_error_gracefully("MODE_RESTRICTION", e, intent, entities)
-                    self.core.events.emit("jarvis_response", {
+                    self.core.events.emit(EVENT_JARVIS_RESPONSE, {
                         "text": response_text,
                         "intent": intent,
                         "entities": entities,
@@ -219,6 +248,10 @@ class EventHandlers:
                 else:
                     result = self.core.skill_dispatcher.dispatch(intent, entities, self.core)
                 
+                # Warm the cache for the likely next command (opt-in)
+                if getattr(self.core, 'prefetcher', None) and isinstance(result, dict):
+                    self.core.prefetcher.after_command(result.get("intent", intent), entities, result)
+                
                 # Record execution result
                 duration = time.time() - start_time
                 self.core.reflection_observer.record_execution(
@@ -237,7 +270,7 @@ class EventHandlers:
                 )
                 
                 response_text = self._handle_error_gracefully("SKILL_TIMEOUT", e, intent, entities)
-                self.core.events.emit("jarvis_response", {
+                self.core.events.emit(EVENT_JARVIS_RESPONSE, {
                     "text": response_text,
                     "intent": intent,
                     "entities": entities,
@@ -259,7 +292,7 @@ class EventHandlers:
                 )
                 
                 response_text = self._handle_error_gracefully("SKILL_EXECUTION", e, intent, entities)
-                self.core.events.emit("jarvis_response", {
+                self.core.events.emit(EVENT_JARVIS_RESPONSE, {
                     "text": response_text,
                     "intent": intent,
                     "entities": entities,
@@ -281,7 +314,7 @@ class EventHandlers:
                 )
                 
                 response_text = self._handle_error_gracefully("UNEXPECTED_ERROR", e, intent, entities)
-                self.core.events.emit("jarvis_response", {
+                self.core.events.emit(EVENT_JARVIS_RESPONSE, {
                     "text": response_text,
                     "intent": intent,
                     "entities": entities,
@@ -290,6 +323,7 @@ class EventHandlers:
                 return
             
             response_text = self._format_response(intent, result, confidence)
+            self._remember_deferred(result, entities, session_id)
             
             # Log the decision made: WHY did we execute this skill?
             decision_log = {
@@ -298,7 +332,7 @@ class EventHandlers:
                 "recognized_intent": intent,
                 "confidence": confidence,
                 "alternatives": alternatives,
-                "mode": self.core.session_manager.get_session_mode(self.core.current_session_id),
+                "mode": self.core.session_manager.get_session_mode(session_id),
                 "reason": f"NLU confidence {confidence:.2f} met threshold ({self.core.nlu.confidence_threshold})"
             }
             self.core.logger.logger.debug(f"[DECISION] {decision_log}")
@@ -319,7 +353,7 @@ class EventHandlers:
                     self.core.logger.logger.debug(f"[REFLECTION ERROR] {str(e)}")
             
             # Emit response with full metadata
-            self.core.events.emit("jarvis_response", {
+            self.core.events.emit(EVENT_JARVIS_RESPONSE, {
                 "text": response_text,
                 "intent": intent,
                 "entities": entities,
@@ -340,7 +374,7 @@ class EventHandlers:
             if len(self.core.short_term_memory) > self.core.short_term_memory_max:
                 self.core.short_term_memory = self.core.short_term_memory[-self.core.short_term_memory_max:]
 
-            self.core.events.emit("memory_short_term_updated", {
+            self.core.events.emit(EVENT_MEMORY_SHORT_TERM_UPDATED, {
                 "size": len(self.core.short_term_memory),
                 "last": self.core.short_term_memory[-1] if self.core.short_term_memory else None
             })
@@ -382,7 +416,7 @@ class EventHandlers:
                 entities,
                 fallback_response=e.user_message()
             )
-            self.core.events.emit("jarvis_response", {
+            self.core.events.emit(EVENT_JARVIS_RESPONSE, {
                 "text": response_text,
                 "intent": intent,
                 "entities": entities,
@@ -399,7 +433,7 @@ class EventHandlers:
             if self.core.config.get("debug_errors", True):
                 self.core.logger.logger.error(f"Error in skill execution:\n{traceback.format_exc()}")
             
-            self.core.events.emit("jarvis_response", {
+            self.core.events.emit(EVENT_JARVIS_RESPONSE, {
                 "text": response_text,
                 "intent": intent,
                 "entities": entities,
@@ -439,7 +473,7 @@ class EventHandlers:
     def handle_response(self, event):
         """Handler for Jarvis responses with graceful degradation for TTS"""
         try:
-            data = event.get("data", {}) if isinstance(event, dict) else {}
+            data = (event.get("data") if hasattr(event, "get") else None) or {}
             text = data.get("text")
             if not text:
                 return
@@ -466,6 +500,48 @@ class EventHandlers:
         except Exception as e:
             self.core.logger.log_error("RESPONSE_HANDLER_ERROR", str(e), {"event": event})
 
+    @staticmethod
+    def _deferred_hint(dispatch_result: dict) -> str:
+        """Side-effecting alternatives the parallel executor did not run on a guess"""
+        deferred = dispatch_result.get("deferred_alternatives") or []
+        if not deferred:
+            return ""
+        options = " o ".join(f"'{d['intent']}'" for d in deferred)
+        return f" ¿Quisiste decir {options}? Respondé 'sí' para ejecutar '{deferred[0]['intent']}'."
+
+    def _remember_deferred(self, dispatch_result, entities: dict, session_id):
+        """Keep the top deferred alternative of a failed dispatch until the session's next command"""
+        if not isinstance(dispatch_result, dict) or dispatch_result.get("success", True):
+            return
+        deferred = dispatch_result.get("deferred_alternatives") or []
+        if deferred:
+            now = time.time()
+            with self._confirmations_lock:
+                for stale in [sid for sid, p in self._pending_confirmations.items() if now > p["expires"]]:
+                    del self._pending_confirmations[stale]
+                self._pending_confirmations[session_id] = {
+                    "intent": deferred[0]["intent"],
+                    "entities": entities,
+                    "expires": now + CONFIRMATION_TTL
+                }
+
+    def _take_confirmation(self, raw_text: str, session_id):
+        """
+        The session's pending alternative if `raw_text` confirms it, "declined"
+        if it declines it, else None. The pending alternative of `session_id`
+        is consumed either way; other sessions' are left alone.
+        """
+        with self._confirmations_lock:
+            pending = self._pending_confirmations.pop(session_id, None)
+        if not pending or time.time() > pending["expires"]:
+            return None
+        answer = (raw_text or "").strip().lower().strip(" .,!¡?¿")
+        if answer in _AFFIRMATIVE:
+            return pending
+        if answer in _NEGATIVE:
+            return "declined"
+        return None
+
     def _format_response(self, intent: str, dispatch_result: dict, confidence: float = 1.0) -> str:
         """Format skill execution result into response text"""
         if not intent:
@@ -477,7 +553,7 @@ class EventHandlers:
 
         if not dispatch_result.get("success", True):
             err = dispatch_result.get("error") or "error"
-            return f"No pude ejecutar '{intent}': {err}"
+            return f"No pude ejecutar '{intent}': {err}" + self._deferred_hint(dispatch_result)
 
         payload = dispatch_result.get("result")
         if isinstance(payload, dict) and payload.get("success") is False:
@@ -499,5 +575,7 @@ class EventHandlers:
             return f"Nota creada: {payload.get('filename', 'ok')}."
         elif intent == "search_file" and isinstance(payload, dict):
             return f"Búsqueda completada. Encontré {payload.get('count', 0)} resultados."
+        elif intent == "reminder" and isinstance(payload, dict):
+            return f"Te lo recuerdo en {payload.get('in')}: {payload.get('text')}."
 
         return f"Listo: {intent}."
@@ -4,28 +4,47 @@ Parallel Executor v0.0.4
 Attempts multiple skills in parallel when intent confidence is low
 """
 
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import Dict, List, Optional, Any
 import time
 import threading
 
+from skills.actions.dispatcher import CancelToken
+
 
 class ParallelExecutor:
     """
     Execute multiple skill alternatives in parallel
     Used when intent confidence is low (< 0.7)
-    Returns first successful result or most promising failure
+    Returns the highest-ranked successful result (primary first)
+
+    Only the primary intent and alternatives whose skills are read-only
+    (dispatcher.is_read_only) run speculatively; side-effecting alternatives
+    (open_app, create_note, ...) are never run on a guess; they come back in
+    'deferred_alternatives' for the user to confirm. Attempts share one
+    bounded pool and one CancelToken: as soon as the winner is known the
+    token is cancelled so the losers stop, and nothing outlives the overall
+    deadline.
     """
     
-    def __init__(self, dispatcher, logger=None, timeout_seconds=5.0):
+    def __init__(self, dispatcher, logger=None, timeout_seconds=5.0, max_workers: int = 4,
+                 max_alternatives: int = 2):
         """
         Args:
             dispatcher: SkillDispatcher instance
             logger: logging.Logger instance
-            timeout_seconds: Max time to wait for parallel attempts
+            timeout_seconds: Deadline for the whole speculative attempt
+            max_workers: Threads shared by all speculative attempts
+            max_alternatives: Alternatives considered besides the primary intent
         """
         self.dispatcher = dispatcher
         self.logger = logger
         self.timeout = timeout_seconds
+        self.max_alternatives = max_alternatives
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Speculative")
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "speculative_runs": 0, "alternative_wins": 0,
+                      "cancelled": 0, "deferred": 0, "deadline_hits": 0}
     
     def _log(self, msg: str):
         """Log message"""
@@ -33,11 +52,19 @@ class ParallelExecutor:
             self.logger.info(msg)
         else:
             print(f"[PARALLEL] {msg}")
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self.stats[key] += n
+
+    def _is_read_only(self, intent: str) -> bool:
+        is_read_only = getattr(self.dispatcher, "is_read_only", None)
+        return bool(is_read_only and is_read_only(intent))
     
     def attempt_alternatives(self, primary_intent: str, alternatives: List[tuple],
                             entities: Dict[str, Any], core) -> Dict[str, Any]:
         """
-        Attempt primary intent and alternatives in parallel
+        Attempt primary intent and read-only alternatives in parallel
         
         Args:
             primary_intent: Main recognized intent
@@ -48,91 +75,137 @@ class ParallelExecutor:
         Returns:
             Dict with best result from any attempt
         """
-        # Build list of intents to try
-        intents_to_try = [(primary_intent, 1.0)]  # Primary first
-        intents_to_try.extend(alternatives[:2])  # Top 2 alternatives
+        self._count("requests")
         
-        results = {}
-        threads = []
-        results_lock = threading.Lock()
+        # Primary first, then the top alternatives that are safe to run on a guess
+        intents_to_try = [(primary_intent, 1.0)]
+        deferred = []
+        for intent, conf in alternatives[:self.max_alternatives]:
+            if intent == primary_intent:
+                continue
+            if self._is_read_only(intent):
+                intents_to_try.append((intent, conf))
+            else:
+                deferred.append({'intent': intent, 'confidence': conf})
+        if deferred:
+            self._count("deferred", len(deferred))
+            self._log(f"Deferred (side effects, need confirmation): {[d['intent'] for d in deferred]}")
         
-        def attempt_skill(intent_name: str, confidence: float):
-            """Try executing a single skill"""
-            try:
-                self._log(f"Attempting: {intent_name} ({confidence:.2%})")
-                start = time.time()
-                
-                result = self.dispatcher.dispatch(intent_name, entities, core)
-                duration = time.time() - start
-                
-                with results_lock:
-                    results[intent_name] = {
-                        'intent': intent_name,
-                        'confidence': confidence,
-                        'result': result,
-                        'duration_ms': int(duration * 1000),
-                        'success': result.get('success', False) if isinstance(result, dict) else True
-                    }
-                
-                if results[intent_name]['success']:
-                    self._log(f"✅ Success: {intent_name}")
-                else:
-                    self._log(f"❌ Failed: {intent_name}")
-            
-            except Exception as e:
-                with results_lock:
-                    results[intent_name] = {
-                        'intent': intent_name,
-                        'confidence': confidence,
-                        'error': str(e),
-                        'success': False
-                    }
-                self._log(f"❌ Error in {intent_name}: {str(e)[:50]}")
+        token = CancelToken(time.monotonic() + self.timeout)
+        outcomes: List[Optional[Dict[str, Any]]] = [None] * len(intents_to_try)
+        futures = {}
+        for rank, (intent, conf) in enumerate(intents_to_try):
+            futures[self.pool.submit(self._attempt, intent, conf, entities, core, token)] = rank
+        if len(intents_to_try) > 1:
+            self._count("speculative_runs", len(intents_to_try) - 1)
         
-        # Start all attempts in parallel
-        for intent, conf in intents_to_try:
-            thread = threading.Thread(
-                target=attempt_skill,
-                args=(intent, conf),
-                daemon=True
-            )
-            thread.start()
-            threads.append(thread)
+        # Wait until the winner is decided: the first success in rank order
+        winner = None
+        pending = set(futures)
+        while pending and winner is None:
+            done, pending = wait(pending, timeout=token.remaining(), return_when=FIRST_COMPLETED)
+            for future in done:
+                outcomes[futures[future]] = future.result()
+            winner = self._decide(outcomes)
+            if not done:
+                break
+        # the attempts' own (child) deadlines may fire just before wait() gives up
+        if winner is None and token.remaining() == 0:
+            self._count("deadline_hits")
+            self._log(f"⏱ Deadline ({self.timeout}s) reached with {len(pending)} attempts running")
         
-        # Wait for all attempts (with timeout)
-        for thread in threads:
-            thread.join(timeout=self.timeout / len(threads))
+        # Stop the losers (and anything past the deadline)
+        if pending:
+            token.cancel("speculation decided" if winner else "deadline")
+            for future in pending:
+                future.cancel()
+            self._count("cancelled", len(pending))
         
-        # Find best result: prefer success, then confidence, then duration
-        if not results:
+        if winner is None:
+            # Deadline: settle for the best success that did finish
+            winner = next((o for o in outcomes if o and o.get('success')), None)
+        
+        if winner is not None:
+            if winner['intent'] != primary_intent:
+                self._count("alternative_wins")
+            self._log(f"🎯 Using result from: {winner['intent']}")
+            if deferred:
+                winner['deferred_alternatives'] = deferred
+            return winner
+        
+        finished = [o for o in outcomes if o is not None]
+        if not finished:
             return {
                 'success': False,
                 'error': 'No results from parallel execution',
-                'attempted_intents': len(intents_to_try)
+                'attempted_intents': len(intents_to_try),
+                'deferred_alternatives': deferred
             }
         
-        # Find successful result
-        successful = [r for r in results.values() if r.get('success')]
-        if successful:
-            # Return highest confidence successful result
-            best = max(successful, key=lambda x: x.get('confidence', 0))
-            self._log(f"🎯 Using result from: {best['intent']}")
-            return best
-        
         # All failed - return primary with alternatives info
-        primary_result = results.get(primary_intent, {})
+        primary_result = outcomes[0] or {'intent': primary_intent, 'confidence': 1.0,
+                                         'error': 'timeout', 'success': False}
         primary_result['alternatives_attempted'] = [
             {
                 'intent': r['intent'],
                 'confidence': r['confidence'],
                 'success': r.get('success', False)
             }
-            for r in results.values()
+            for r in finished
             if r['intent'] != primary_intent
         ]
+        primary_result['deferred_alternatives'] = deferred
         
         self._log(f"⚠️ All attempts failed, returning primary: {primary_intent}")
         return primary_result
+
+    @staticmethod
+    def _decide(outcomes: List[Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        """First success in rank order, once every higher-ranked attempt has failed"""
+        for outcome in outcomes:
+            if outcome is None:
+                return None  # a better-ranked attempt is still running
+            if outcome.get('success'):
+                return outcome
+        return None
+
+    def _attempt(self, intent_name: str, confidence: float, entities, core, token: CancelToken):
+        """Try executing a single skill"""
+        if token.cancelled:
+            return None
+        try:
+            self._log(f"Attempting: {intent_name} ({confidence:.2%})")
+            start = time.time()
+            
+            result = self.dispatcher.dispatch(intent_name, entities, core, cancel_token=token)
+            duration = time.time() - start
+            
+            outcome = {
+                'intent': intent_name,
+                'confidence': confidence,
+                'result': result,
+                'duration_ms': int(duration * 1000),
+                'success': result.get('success', False) if isinstance(result, dict) else True
+            }
+            self._log(f"{'✅ Success' if outcome['success'] else '❌ Failed'}: {intent_name}")
+            return outcome
+        
+        except Exception as e:
+            self._log(f"❌ Error in {intent_name}: {str(e)[:50]}")
+            return {
+                'intent': intent_name,
+                'confidence': confidence,
+                'error': str(e),
+                'success': False
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Speculation counters (runs on a guess, cancelled losers, deferred side-effecting alternatives)"""
+        with self._lock:
+            return dict(self.stats)
+
+    def shutdown(self, wait: bool = False):
+        self.pool.shutdown(wait=wait, cancel_futures=True)
     
     def get_best_result(self, results: Dict) -> Dict[str, Any]:
         """Get best result from parallel execution results"""
@@ -0,0 +1,272 @@
+# system/core/prefetcher.py
+"""
+Predictive prefetch of the likely next skill.
+
+After each command the Prefetcher asks a next-action model which intent
+usually follows; if that skill is read-only and has a cache_policy, it runs
+it once in the background so the result is already in the dispatcher's
+result cache when the user asks for it. Opt-in ("prefetch": true).
+"""
+
+from collections import Counter, deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import threading
+import time
+
+
+class NextActionModel:
+    """
+    Intent -> next-intent transition counts (the command-pair counting of
+    DataCollector.detect_pattern, over intents instead of raw text).
+
+    predict() only answers when a transition has at least `min_support`
+    occurrences and `min_share` of the transitions out of that intent;
+    otherwise the optional `fallback` (e.g. ContextAwareness.predict_next_action)
+    is asked.
+    """
+
+    def __init__(self, min_support: int = 3, min_share: float = 0.5,
+                 fallback: Optional[Callable[[List[str]], Optional[str]]] = None, history: int = 20):
+        self.min_support = min_support
+        self.min_share = min_share
+        self.fallback = fallback
+        self._transitions: Dict[str, Counter] = {}
+        self._recent = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def seed(self, sequence: Iterable[str]):
+        """Learn transitions from a past sequence of intents (oldest first)"""
+        previous = None
+        for intent in sequence:
+            if previous is not None:
+                self._count(previous, intent)
+            previous = intent
+
+    def observe(self, intent: str):
+        with self._lock:
+            if self._recent:
+                self._count(self._recent[-1], intent)
+            self._recent.append(intent)
+
+    def _count(self, previous: str, intent: str):
+        self._transitions.setdefault(previous, Counter())[intent] += 1
+
+    def predict(self, intent: str) -> Tuple[Optional[str], str]:
+        """(next intent or None, source: 'transitions' | 'fallback' | 'none')"""
+        with self._lock:
+            counts = self._transitions.get(intent)
+            recent = list(self._recent)
+        if counts:
+            best, support = counts.most_common(1)[0]
+            if support >= self.min_support and support / sum(counts.values()) >= self.min_share:
+                return best, "transitions"
+        if self.fallback is not None:
+            try:
+                guess = self.fallback(recent)
+            except Exception:
+                guess = None
+            if guess:
+                return guess, "fallback"
+        return None, "none"
+
+    def top_transitions(self, n: int = 5) -> List[Tuple[str, str, int]]:
+        with self._lock:
+            pairs = [(a, b, c) for a, counts in self._transitions.items() for b, c in counts.items()]
+        return sorted(pairs, key=lambda p: p[2], reverse=True)[:n]
+
+
+class Prefetcher:
+    """
+    Warms the result cache with the predicted next skill.
+
+    Only skills the dispatcher considers read-only *and* cacheable are
+    prefetched (with the entities they were last called with), never while
+    a prefetch is still running, and only while less than `budget_ms` of
+    skill execution time has been spent in the current `window_seconds`.
+    A warmed entry is a hit when the next real dispatch is served from it,
+    and waste when it expires or is invalidated first.
+    """
+
+    def __init__(self, dispatcher, core=None, logger=None, model: Optional[NextActionModel] = None,
+                 budget_ms: float = 250.0, window_seconds: float = 60.0):
+        """
+        Args:
+            dispatcher: SkillDispatcher whose result cache gets warmed
+            core: passed to the prefetched skills like a real dispatch
+            logger: logging.Logger instance
+            model: next-action model (a NextActionModel by default)
+            budget_ms: skill execution time prefetching may spend per window
+            window_seconds: budget window
+        """
+        self.dispatcher = dispatcher
+        self.core = core
+        self.logger = logger
+        self.model = model or NextActionModel()
+        self.budget_ms = budget_ms
+        self.window_seconds = window_seconds
+
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._spent_ms = 0.0
+        self._last_entities: Dict[str, dict] = {}
+        self._warm: Dict[Tuple[str, Any], float] = {}  # (intent, cache key) -> skill time it saves (ms)
+        self._pending: Optional[Tuple[str, dict]] = None
+        self._busy = False
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._worker = threading.Thread(target=self._loop, name="Prefetch", daemon=True)
+        self._worker.start()
+
+        self.stats = {
+            "predictions": 0,
+            "prefetches": 0,
+            "hits": 0,
+            "wasted": 0,
+            "saved_ms": 0.0,
+            "spent_ms": 0.0,
+            "errors": 0,
+            "skipped": Counter(),
+        }
+
+    def _log(self, level: str, msg: str):
+        if self.logger:
+            getattr(self.logger, level)(msg)
+
+    # ---------- called after every command ----------
+
+    def after_command(self, intent: str, entities: dict, response: Optional[dict] = None):
+        """Record a real dispatch (hit bookkeeping + model) and queue the next prefetch"""
+        if not intent or intent == "unknown":
+            return
+        entities = entities or {}
+        self._settle(intent, entities, response)
+        self._last_entities[intent] = entities
+        self.model.observe(intent)
+
+        predicted, _source = self.model.predict(intent)
+        if predicted is None:
+            return
+        with self._lock:
+            self.stats["predictions"] += 1
+        reason = self._skip_reason(predicted)
+        if reason:
+            self._skip(reason)
+            return
+
+        with self._lock:
+            if self._busy or self._pending is not None:
+                self.stats["skipped"]["busy"] += 1
+                return
+            self._pending = (predicted, self._last_entities.get(predicted, {}))
+        self._wakeup.set()
+
+    def _settle(self, intent: str, entities: dict, response: Optional[dict]):
+        """Count the hit if this dispatch used a warmed entry; expire the stale ones as waste"""
+        key = self.dispatcher.cache_key(intent, entities)
+        with self._lock:
+            if key is not None and (intent, key) in self._warm and (response or {}).get("cached"):
+                self.stats["hits"] += 1
+                self.stats["saved_ms"] += self._warm.pop((intent, key))
+            for warm_intent, warm_key in list(self._warm):
+                if not self.dispatcher.result_cache.peek(warm_intent, warm_key):
+                    del self._warm[(warm_intent, warm_key)]
+                    self.stats["wasted"] += 1
+
+    def _skip_reason(self, intent: str) -> Optional[str]:
+        if intent not in self.dispatcher.skills:
+            return "unknown_skill"
+        if not self.dispatcher.is_read_only(intent):
+            return "side_effects"
+        entities = self._last_entities.get(intent, {})
+        if self.dispatcher.cache_key(intent, entities) is None:
+            return "not_cacheable"
+        if self.dispatcher.is_cached(intent, entities):
+            return "already_cached"
+        if not self._has_budget():
+            return "budget"
+        return None
+
+    def _skip(self, reason: str):
+        with self._lock:
+            self.stats["skipped"][reason] += 1
+
+    def _has_budget(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= self.window_seconds:
+                self._window_start = now
+                self._spent_ms = 0.0
+            return self._spent_ms < self.budget_ms
+
+    # ---------- background worker ----------
+
+    def _loop(self):
+        while True:
+            self._wakeup.wait()
+            with self._lock:
+                self._wakeup.clear()
+                if self._closed:
+                    return
+                job, self._pending = self._pending, None
+                self._busy = job is not None
+            if job is None:
+                continue
+            try:
+                self._prefetch(*job)
+            finally:
+                with self._lock:
+                    self._busy = False
+
+    def _prefetch(self, intent: str, entities: dict):
+        key = self.dispatcher.cache_key(intent, entities)
+        if key is None or self.dispatcher.result_cache.peek(intent, key):
+            self._skip("already_cached")
+            return
+        start = time.perf_counter()
+        try:
+            response = self.dispatcher.dispatch(intent, entities, self.core)
+        except Exception as e:
+            with self._lock:
+                self.stats["errors"] += 1
+                self._spent_ms += (time.perf_counter() - start) * 1000
+            self._log("debug", f"[PREFETCH] {intent} failed: {e}")
+            return
+        spent_ms = (time.perf_counter() - start) * 1000
+        cost_ms = response.get("execution_time_ms", spent_ms)
+        with self._lock:
+            self._spent_ms += spent_ms
+            self.stats["spent_ms"] += spent_ms
+            if response.get("cached"):
+                self.stats["skipped"]["already_cached"] += 1
+            elif self.dispatcher.result_cache.peek(intent, key):
+                self.stats["prefetches"] += 1
+                self._warm[(intent, key)] = cost_ms
+        self._log("debug", f"[PREFETCH] {intent} warmed ({spent_ms:.1f}ms)")
+
+    # ---------- reporting ----------
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            prefetches = self.stats["prefetches"]
+            return {
+                "enabled": True,
+                "predictions": self.stats["predictions"],
+                "prefetches": prefetches,
+                "hits": self.stats["hits"],
+                "wasted": self.stats["wasted"],
+                "outstanding": len(self._warm),
+                "hit_rate": (self.stats["hits"] / prefetches) if prefetches else 0.0,
+                "waste_rate": (self.stats["wasted"] / prefetches) if prefetches else 0.0,
+                "saved_ms": self.stats["saved_ms"],
+                "spent_ms": self.stats["spent_ms"],
+                "budget_ms": self.budget_ms,
+                "errors": self.stats["errors"],
+                "skipped": dict(self.stats["skipped"]),
+                "top_transitions": self.model.top_transitions(3),
+            }
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            self._pending = None
+        self._wakeup.set()
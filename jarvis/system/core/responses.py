@@ -36,5 +36,7 @@ class ResponseFormatter:
             return f"Nota creada: {payload.get('filename', 'ok')}."
         if intent == "search_file" and isinstance(payload, dict):
             return f"Búsqueda completada. Encontré {payload.get('count', 0)} resultados."
+        if intent == "reminder" and isinstance(payload, dict):
+            return f"Te lo recuerdo en {payload.get('in')}: {payload.get('text')}."
 
         return f"Listo: {intent}."
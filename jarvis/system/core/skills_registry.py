@@ -4,56 +4,46 @@ Skills Registry for JarvisAI Core
 Manages skill registration and initialization
 """
 
-from typing import Dict, Type, TYPE_CHECKING
+from typing import Dict, TYPE_CHECKING
 if TYPE_CHECKING:
     from .core import JarvisCore
 
-# Import all available skills
-from skills.productivity.open_app import OpenAppSkill
-from skills.system.get_time import GetTimeSkill
-from skills.system.system_status import SystemStatusSkill
-from skills.productivity.create_note import CreateNoteSkill
-from skills.research.search_file import SearchFileSkill
-from skills.research.summarize_recent_activity import SummarizeRecentActivitySkill
-from skills.research.summarize_last_session import SummarizeLastSessionSkill
-from skills.analysis.analyze_session_value import AnalyzeSessionValueSkill
-from skills.analysis.research_and_contextualize import ResearchAndContextualizeSkill
-from skills.system.analyze_system_health import AnalyzeSystemHealthSkill
-from skills.system.what_do_you_know_about_me import WhatDoYouKnowAboutMeSkill
-from skills.analysis.evaluate_user_session import EvaluateUserSessionSkill
-from skills.system.system_auto_optimization import SystemAutoOptimizationSkill
-from skills.automation.auto_programming import AutoProgrammingSkill
+from skills.actions.manifest import LazySkill, load_manifest
 
 
 class SkillsRegistry:
     """
     Registry for all available skills in JarvisAI
+
+    Skills come from skills/manifest.json as LazySkills: nothing is imported
+    until the dispatcher first runs a skill.
     """
 
-    # Base skills registry - always available
-    BASE_SKILLS: Dict[str, Type] = {
-        "open_app": OpenAppSkill,
-        "get_time": GetTimeSkill,
-        "system_status": SystemStatusSkill,
-        "create_note": CreateNoteSkill,
-        "search_file": SearchFileSkill,
-        "summarize_recent_activity": SummarizeRecentActivitySkill,
-    }
-
-    # Advanced skills registry - may require additional dependencies
-    ADVANCED_SKILLS: Dict[str, Type] = {
-        "summarize_last_session": SummarizeLastSessionSkill,
-        "analyze_session_value": AnalyzeSessionValueSkill,
-        "research_and_contextualize": ResearchAndContextualizeSkill,
-        "analyze_system_health": AnalyzeSystemHealthSkill,
-        "what_do_you_know_about_me": WhatDoYouKnowAboutMeSkill,
-        "evaluate_user_session": EvaluateUserSessionSkill,
-        "system_auto_optimization": SystemAutoOptimizationSkill,
-        "auto_programming": AutoProgrammingSkill,
-    }
+    # Base skills - always available
+    BASE_SKILLS = (
+        "open_app",
+        "get_time",
+        "system_status",
+        "create_note",
+        "search_file",
+        "summarize_recent_activity",
+    )
+
+    # Advanced skills - may require additional dependencies
+    ADVANCED_SKILLS = (
+        "summarize_last_session",
+        "analyze_session_value",
+        "research_and_contextualize",
+        "analyze_system_health",
+        "what_do_you_know_about_me",
+        "evaluate_user_session",
+        "system_auto_optimization",
+        "auto_programming",
+    )
 
     def __init__(self, core: 'JarvisCore'):
         self.core = core
+        self._manifest = load_manifest()
         self._registered_skills: Dict[str, object] = {}
 
     def register_all_skills(self):
@@ -61,42 +51,31 @@ class SkillsRegistry:
         Register all available skills based on configuration
         """
         # Always register base skills
-        for name, skill_cls in self.BASE_SKILLS.items():
-            self._register_skill(name, skill_cls)
+        for name in self.BASE_SKILLS:
+            self._register_skill(name)
 
         # Register advanced skills if enabled
         if self.core.config.get("advanced_skills", True):
-            for name, skill_cls in self.ADVANCED_SKILLS.items():
+            for name in self.ADVANCED_SKILLS:
                 try:
-                    self._register_skill(name, skill_cls)
+                    self._register_skill(name)
                 except Exception as e:
                     self.core.logger.logger.warning(f"Failed to register advanced skill '{name}': {e}")
 
         self.core.logger.logger.info(f"Registered {len(self._registered_skills)} skills")
 
-    def _register_skill(self, name: str, skill_cls: Type):
+    def _register_skill(self, name: str):
         """
-        Register a single skill with proper instantiation
+        Register a single skill from its manifest entry (imported on first dispatch)
         """
         try:
-            # Handle skills that need special initialization
-            if name == "research_and_contextualize":
-                skill_instance = skill_cls(self.core.storage, self.core.llm_manager)
-            elif name in ["analyze_system_health", "system_auto_optimization"]:
-                skill_instance = skill_cls(self.core.logger.logger)
-            elif name in ["what_do_you_know_about_me", "evaluate_user_session", "auto_programming"]:
-                skill_instance = skill_cls(self.core.storage, self.core.active_learning, self.core.logger.logger)
-            else:
-                # Check if it's already instantiated (has run method)
-                if hasattr(skill_cls, 'run'):
-                    skill_instance = skill_cls
-                else:
-                    # Instantiate the class
-                    skill_instance = skill_cls()
+            if name not in self._manifest:
+                raise ValueError(f"Unknown skill: {name}")
+            skill = LazySkill(name, self._manifest[name], context=self.core)
 
             # Register with dispatcher
-            self.core.skill_dispatcher.register(name, skill_instance)
-            self._registered_skills[name] = skill_instance
+            self.core.skill_dispatcher.register(name, skill)
+            self._registered_skills[name] = skill
 
             self.core.logger.logger.debug(f"[SKILLS] Registered skill: {name}")
 
@@ -105,7 +84,7 @@ class SkillsRegistry:
             raise
 
     def get_registered_skills(self) -> Dict[str, object]:
-        """Get all registered skill instances"""
+        """Get all registered skills"""
         return self._registered_skills.copy()
 
     def get_skill_names(self) -> list:
@@ -116,17 +95,14 @@ class SkillsRegistry:
         """
         Reload a specific skill (useful for development)
         """
-        if name in self.BASE_SKILLS:
-            skill_cls = self.BASE_SKILLS[name]
-        elif name in self.ADVANCED_SKILLS:
-            skill_cls = self.ADVANCED_SKILLS[name]
-        else:
+        if name not in self.BASE_SKILLS and name not in self.ADVANCED_SKILLS:
             raise ValueError(f"Unknown skill: {name}")
 
         # Remove old registration
         if name in self._registered_skills:
             del self._registered_skills[name]
 
-        # Re-register
-        self._register_skill(name, skill_cls)
-        self.core.logger.logger.info(f"Reloaded skill: {name}")
\ No newline at end of file
+        # Re-register (re-reads the manifest entry)
+        self._manifest = load_manifest()
+        self._register_skill(name)
+        self.core.logger.logger.info(f"Reloaded skill: {name}")
@@ -21,6 +21,8 @@ class SpecialCommandsHandler:
             '--skills': self._handle_skills,
             '--pc': self._handle_pc_status,
             '--tasks': self._handle_tasks,
+            '--latency': self._handle_latency,
+            '--latency reset': self._handle_latency_reset,
             'skills': self._handle_skills,
             'status': self._handle_status,
             'debug': self._handle_debug,
@@ -93,11 +95,93 @@ class SpecialCommandsHandler:
             response += f"  • Memoria: {sys_info.get('memory_percent', 0):.1f}%\n"
             response += f"  • Disco: {sys_info.get('disk_percent', 0):.1f}%\n"
             response += f"  • Procesos: {sys_info.get('processes', 0)}"
+
+            bus = status.get('eventbus') or {}
+            if bus:
+                response += (
+                    f"\n  • EventBus: cola {bus.get('queue_depth', 0)} | "
+                    f"en curso {bus.get('inflight', 0)} | descartados {bus.get('dropped', 0)}"
+                )
+
+            cache = status.get('result_cache') or {}
+            if cache.get('hits') or cache.get('misses'):
+                response += (
+                    f"\n  • Caché de skills: {cache['hit_rate'] * 100:.0f}% aciertos "
+                    f"({cache['hits']}/{cache['hits'] + cache['misses']}) | {cache['entries']} entradas"
+                )
+
+            coalescing = status.get('coalescing') or {}
+            if coalescing.get('coalesced'):
+                response += f"\n  • Dispatches coalescidos: {coalescing['coalesced']} (de {coalescing['leaders'] + coalescing['coalesced']})"
+
+            prefetch = status.get('prefetch') or {}
+            if prefetch.get('prefetches'):
+                response += (
+                    f"\n  • Prefetch: {prefetch['hit_rate'] * 100:.0f}% usados | "
+                    f"{prefetch['waste_rate'] * 100:.0f}% desperdiciados ({prefetch['prefetches']} precargas, "
+                    f"{prefetch['saved_ms']:.0f}ms ahorrados)"
+                )
+
+            imports = status.get('skill_imports') or []
+            if imports:
+                loaded = [row for row in imports if row['status'] == 'loaded']
+                failed = [row['intent'] for row in imports if row['status'] == 'failed']
+                response += (
+                    f"\n  • Skills importadas: {len(loaded)}/{len(imports)} "
+                    f"({sum(row['import_ms'] or 0 for row in loaded):.0f}ms)"
+                )
+                if failed:
+                    response += f" | con error: {', '.join(failed)}"
+
+            latency = status.get('latency') or {}
+            nlu_total = (latency.get('nlu') or {}).get('total')
+            if nlu_total and nlu_total.get('count'):
+                response += f"\n  • NLU: {self._format_latency(nlu_total)}"
+            worst = sorted(
+                ((name, snap) for name, snap in (latency.get('skills') or {}).items() if snap.get('count')),
+                key=lambda item: item[1]['p99_ms'], reverse=True
+            )[:3]
+            if worst:
+                response += "\n  • Skills más lentas (p99):"
+                for name, snap in worst:
+                    response += f"\n      {name}: {self._format_latency(snap)}"
             
             return response
         except Exception as e:
             return f"Error obteniendo status: {e}"
     
+    @staticmethod
+    def _format_latency(snap: dict) -> str:
+        return (f"p50 {snap['p50_ms']:.1f}ms | p90 {snap['p90_ms']:.1f}ms | "
+                f"p99 {snap['p99_ms']:.1f}ms | max {snap['max_ms']:.1f}ms (n={snap['count']})")
+
+    def _handle_latency(self):
+        """Latency percentiles per skill and per NLU stage"""
+        try:
+            latency = self.core.get_latency_report()
+            skills = [(n, s) for n, s in latency.get('skills', {}).items() if s.get('count')]
+            stages = [(n, s) for n, s in latency.get('nlu', {}).items() if s.get('count')]
+            if not skills and not stages:
+                return "Sin mediciones de latencia todavía"
+
+            response = "⏱️ Latencia:"
+            if stages:
+                response += "\n  NLU:"
+                for name, snap in stages:
+                    response += f"\n    {name:<13} {self._format_latency(snap)}"
+            if skills:
+                response += "\n  Skills (peor p99 primero):"
+                for name, snap in sorted(skills, key=lambda item: item[1]['p99_ms'], reverse=True):
+                    response += f"\n    {name:<28} {self._format_latency(snap)}"
+            return response
+        except Exception as e:
+            return f"Error obteniendo latencias: {e}"
+
+    def _handle_latency_reset(self):
+        """Reset latency histograms"""
+        self.core.reset_latency()
+        return "Histogramas de latencia reiniciados"
+    
     def _handle_skills(self):
         """List all available skills"""
         try:
@@ -131,7 +215,7 @@ class SpecialCommandsHandler:
             
             response = f"📋 Background Tasks ({len(tasks)}):\n"
             for task in tasks[:10]:
-                task_id = task.get('id', 'unknown')
+                task_id = task.get('task_id', 'unknown')
                 task_name = task.get('name', 'unknown')
                 status = task.get('status', 'unknown')
                 response += f"  • {task_id}: {task_name} ({status})\n"
@@ -0,0 +1,468 @@
+# system/core/task_engine.py
+"""
+Task execution engine shared by every background-task API.
+
+A fixed set of worker threads (and, for CPU-heavy work, a process pool)
+pull tasks from priority queues ordered by (priority, submission order).
+Retries and per-task timeouts are timers on a Scheduler, so no worker ever
+sleeps through a backoff and thread counts stay capped no matter how many
+tasks are submitted.
+
+    engine = TaskEngine(workers=4)
+    engine.start()
+    task = engine.submit(fetch, args=(url,), priority=5, timeout=10, max_retries=2)
+    engine.wait(task.task_id, timeout=15)
+
+core/background_tasks.BackgroundTaskManager and
+pc_authority/background_task_manager.BackgroundTaskManager are adapters
+over it.
+"""
+
+import itertools
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from core.lifecycle.runtime.scheduler import Scheduler
+from monitoring.metrics import LatencyHistogram
+
+
+BACKEND_THREAD = "thread"
+BACKEND_PROCESS = "process"  # fn, args and result must be picklable
+
+QUEUED = "queued"
+RUNNING = "running"
+RETRYING = "retrying"  # waiting for its backoff timer
+COMPLETED = "completed"
+FAILED = "failed"
+TIMEOUT = "timeout"
+CANCELLED = "cancelled"
+FINAL_STATES = (COMPLETED, FAILED, TIMEOUT, CANCELLED)
+
+_SHUTDOWN = float("-inf")  # sorts ahead of every task
+
+
+class EngineTask:
+    """
+    One submitted task. `future` completes once, with the final outcome
+    (after the last retry); statuses move queued -> running -> (retrying ->
+    queued -> running ...) -> completed | failed | timeout | cancelled.
+    """
+
+    def __init__(self, task_id: str, name: str, fn: Callable, args, kwargs, priority: int,
+                 backend: str, timeout: Optional[float], max_retries: int, backoff: float,
+                 backoff_factor: float, max_backoff: float, metadata: Optional[Dict] = None):
+        self.task_id = task_id
+        self.name = name
+        self.fn = fn
+        self.args = tuple(args or ())
+        self.kwargs = dict(kwargs or {})
+        self.priority = priority
+        self.backend = backend
+        self.timeout = timeout
+        self.max_retries = max_retries  # retries after the first attempt
+        self.backoff = backoff
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.metadata = metadata if metadata is not None else {}
+
+        self.status = QUEUED
+        self.attempts = 0
+        self.result = None
+        self.error: Optional[str] = None
+        self.future: Future = Future()
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.queue_wait_ms = 0.0  # summed over attempts
+        self.run_ms = 0.0         # last attempt
+
+        self._lock = threading.Lock()
+        self._enqueued = time.perf_counter()
+        self._attempt_start = 0.0
+        self._timer_job = None  # pending timeout or retry
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINAL_STATES
+
+    def retry_delay(self) -> float:
+        """Backoff before the next attempt (after `attempts` failures)"""
+        return min(self.max_backoff, self.backoff * self.backoff_factor ** (self.attempts - 1))
+
+    def to_dict(self) -> Dict:
+        return {
+            'task_id': self.task_id,
+            'name': self.name,
+            'status': self.status,
+            'priority': self.priority,
+            'backend': self.backend,
+            'attempts': self.attempts,
+            'error': self.error,
+            'queue_wait_ms': round(self.queue_wait_ms, 1),
+            'run_ms': round(self.run_ms, 1),
+        }
+
+    def __repr__(self):
+        return f"<EngineTask {self.task_id} {self.name!r} {self.status}>"
+
+
+def _describe(error: BaseException) -> str:
+    return str(error) or type(error).__name__
+
+
+class TaskEngine:
+    """
+    Priority queues + fixed thread workers + optional process pool.
+
+    Timeouts: Python threads can't be killed, so when an attempt overruns
+    its timeout the task fails (or retries) right away and whatever the
+    function returns later is discarded; its worker is busy until then.
+    Process-backend attempts behave the same (the pool can't kill one job).
+    """
+
+    def __init__(self, workers: int = 4, process_workers: int = 2, logger=None, history: int = 500):
+        self.workers = max(1, workers)
+        self.process_workers = max(1, process_workers)
+        self.logger = logger
+        self.running = False
+
+        self._queue = queue.PriorityQueue()          # (-priority, seq, task) for the threads
+        self._process_queue = queue.PriorityQueue()  # same, fed to the process pool
+        self._process_slots = threading.Semaphore(self.process_workers)
+        self._process_pool = None
+        self._threads: List[threading.Thread] = []
+        self._timer = Scheduler(workers=1)
+
+        self._tasks: Dict[str, EngineTask] = {}  # id -> task (live or in history)
+        self._finished: deque = deque(maxlen=history)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._running_count = 0
+        self._started_at: Optional[float] = None
+
+        self.queue_wait = LatencyHistogram("queue_wait")
+        self.run_time = LatencyHistogram("run")
+        self.counters = {
+            'submitted': 0, 'completed': 0, 'failed': 0, 'timeouts': 0,
+            'retries': 0, 'cancelled': 0, 'callback_errors': 0,
+        }
+
+    def _log(self, level: str, msg: str):
+        if self.logger:
+            getattr(self.logger, level)(f"[TASKS] {msg}")
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self.counters[key] += n
+
+    # ---------- lifecycle ----------
+
+    def start(self):
+        """Start the worker threads and the timer (idempotent)"""
+        with self._lock:
+            if self.running:
+                return
+            self.running = True
+            self._started_at = time.monotonic()
+        self._timer.start()
+        self._threads = [
+            threading.Thread(target=self._thread_worker, name=f"TaskEngine-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        self._threads.append(threading.Thread(target=self._process_feeder, name="TaskEngine-process", daemon=True))
+        for thread in self._threads:
+            thread.start()
+        self._log("info", f"Started {self.workers} workers")
+
+    def stop(self, timeout: float = 1.0):
+        """Stop the workers; queued and retrying tasks are cancelled"""
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+        for _ in range(self.workers):
+            self._queue.put((_SHUTDOWN, next(self._seq), None))
+        self._process_queue.put((_SHUTDOWN, next(self._seq), None))
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._timer.stop(wait=False)
+
+        cancelled = 0
+        for task in self.tasks():
+            if task.status in (QUEUED, RETRYING) and self._cancel(task):
+                cancelled += 1
+        for q in (self._queue, self._process_queue):
+            while True:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    break
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        self._log("info", f"Stopped ({cancelled} pending tasks cancelled)")
+
+    # ---------- submission ----------
+
+    def submit(self, fn: Callable, args=(), kwargs=None, name: Optional[str] = None, priority: int = 0,
+               backend: str = BACKEND_THREAD, timeout: Optional[float] = None, max_retries: int = 0,
+               backoff: float = 1.0, backoff_factor: float = 2.0, max_backoff: float = 60.0,
+               task_id: Optional[str] = None, callback: Optional[Callable[[EngineTask], Any]] = None,
+               metadata: Optional[Dict] = None) -> EngineTask:
+        """
+        Queue fn(*args, **kwargs).
+
+        Args:
+            priority: higher runs sooner; equal priorities run in submission order
+            backend: "thread" or "process" (CPU-bound work; must be picklable)
+            timeout: seconds per attempt (None = no limit)
+            max_retries: extra attempts after a failure or timeout, each
+                `backoff * backoff_factor ** n` seconds later (capped at max_backoff)
+            callback: callback(task) once the task reaches a final state
+        """
+        if backend not in (BACKEND_THREAD, BACKEND_PROCESS):
+            raise ValueError(f"unknown backend: {backend!r}")
+        seq = next(self._seq)
+        task_id = task_id or f"task_{int(time.time() * 1000)}_{seq}"
+        task = EngineTask(task_id, name or getattr(fn, "__name__", "task"), fn, args, kwargs, priority,
+                          backend, timeout, max(0, max_retries), backoff, backoff_factor, max_backoff, metadata)
+        if callback is not None:
+            task.future.add_done_callback(lambda _future: self._run_callback(callback, task))
+
+        with self._lock:
+            current = self._tasks.get(task_id)
+            if current is not None and not current.done:
+                raise ValueError(f"Task id already in use: {task_id}")
+            self._tasks[task_id] = task
+            self.counters['submitted'] += 1
+        self._put(task, seq)
+        return task
+
+    def _put(self, task: EngineTask, seq: Optional[int] = None):
+        target = self._process_queue if task.backend == BACKEND_PROCESS else self._queue
+        target.put((-task.priority, next(self._seq) if seq is None else seq, task))
+
+    def _requeue(self, task: EngineTask):
+        """Retry timer fired: back into the queue behind tasks of the same priority"""
+        with task._lock:
+            if task.status != RETRYING:
+                return
+            task.status = QUEUED
+            task._timer_job = None
+            task._enqueued = time.perf_counter()
+        self._put(task)
+
+    def _run_callback(self, callback, task: EngineTask):
+        try:
+            callback(task)
+        except Exception as e:
+            self._count('callback_errors')
+            self._log("warning", f"Callback error for {task.task_id}: {e}")
+
+    # ---------- execution ----------
+
+    def _thread_worker(self):
+        while True:
+            _, _, task = self._queue.get()
+            if task is None:
+                break
+            token = self._begin(task)
+            if token is None:
+                continue
+            try:
+                result = task.fn(*task.args, **task.kwargs)
+            except Exception as e:
+                self._end(task, token, error=e)
+            else:
+                self._end(task, token, result=result)
+
+    def _process_feeder(self):
+        """Hands queued process tasks to the pool as slots free up, highest priority first"""
+        while True:
+            _, _, task = self._process_queue.get()
+            if task is None:
+                break
+            self._process_slots.acquire()
+            token = self._begin(task)
+            if token is None:
+                self._process_slots.release()
+                continue
+            try:
+                future = self._get_process_pool().submit(task.fn, *task.args, **task.kwargs)
+            except Exception as e:
+                self._process_slots.release()
+                self._end(task, token, error=e)
+                continue
+            future.add_done_callback(lambda f, task=task, token=token: self._process_done(task, token, f))
+
+    def _process_done(self, task: EngineTask, token: int, future):
+        self._process_slots.release()
+        if future.cancelled():
+            self._end(task, token, error=CancelledError("process pool shut down"))
+            return
+        error = future.exception()
+        if error is not None:
+            self._end(task, token, error=error)
+        else:
+            self._end(task, token, result=future.result())
+
+    def _get_process_pool(self):
+        if self._process_pool is None:
+            # spawn: forking a process that runs threads can deadlock the child
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.process_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._process_pool
+
+    def _begin(self, task: EngineTask) -> Optional[int]:
+        """Mark an attempt as started; None if the task was cancelled while queued"""
+        with task._lock:
+            if task.status != QUEUED:
+                return None
+            if task.attempts == 0 and not task.future.set_running_or_notify_cancel():
+                task.status = CANCELLED  # its future was cancelled directly
+                return None
+            task.status = RUNNING
+            task.attempts += 1
+            token = task.attempts
+            now = time.perf_counter()
+            waited = (now - task._enqueued) * 1000
+            task.queue_wait_ms += waited
+            task._attempt_start = now
+            if task.started_at is None:
+                task.started_at = time.time()
+            if task.timeout:
+                task._timer_job = self._timer.schedule_after(task.timeout, self._on_timeout, task, token)
+        with self._lock:
+            self._running_count += 1
+        self.queue_wait.record(waited)
+        return token
+
+    def _on_timeout(self, task: EngineTask, token: int):
+        self._end(task, token, error=TimeoutError(f"Task timeout after {task.timeout}s"), timed_out=True)
+
+    def _end(self, task: EngineTask, token: int, result=None, error: Optional[BaseException] = None,
+             timed_out: bool = False):
+        """Record an attempt's outcome: retry, fail or complete (stale outcomes are dropped)"""
+        with task._lock:
+            if task.status != RUNNING or task.attempts != token:
+                return  # already timed out or cancelled: the late outcome is discarded
+            task.run_ms = (time.perf_counter() - task._attempt_start) * 1000
+            if task._timer_job is not None:
+                task._timer_job.cancel()
+                task._timer_job = None
+            retry = error is not None and task.attempts <= task.max_retries
+            if retry:
+                task.status = RETRYING
+                task.error = _describe(error)
+                delay = task.retry_delay()
+                task._timer_job = self._timer.schedule_after(delay, self._requeue, task)
+            elif error is not None:
+                task.status = TIMEOUT if timed_out else FAILED
+                task.error = _describe(error)
+                task.finished_at = time.time()
+            else:
+                task.status = COMPLETED
+                task.result = result
+                task.finished_at = time.time()
+            status = task.status
+        with self._lock:
+            self._running_count -= 1
+            if timed_out:
+                self.counters['timeouts'] += 1
+            if retry:
+                self.counters['retries'] += 1
+            elif status == COMPLETED:
+                self.counters['completed'] += 1
+            else:
+                self.counters['failed'] += 1
+        self.run_time.record(task.run_ms)
+
+        if retry:
+            self._log("info", f"Retrying {task.name} ({task.task_id}) in {delay:.1f}s "
+                              f"- attempt {task.attempts + 1}/{task.max_retries + 1}: {task.error}")
+            return
+        self._retire(task)
+        if status == COMPLETED:
+            task.future.set_result(result)
+        else:
+            task.future.set_exception(error)
+
+    def _retire(self, task: EngineTask):
+        """Into the bounded history; the oldest finished task leaves the index"""
+        with self._lock:
+            if len(self._finished) == self._finished.maxlen:
+                evicted = self._finished[0]
+                if self._tasks.get(evicted.task_id) is evicted:
+                    del self._tasks[evicted.task_id]
+            self._finished.append(task)
+
+    # ---------- control / lookup ----------
+
+    def cancel(self, task_id: str) -> bool:
+        """
+        Cancel a task that hasn't finished. A running attempt keeps going
+        (threads can't be killed) but its outcome is discarded.
+        """
+        task = self.get(task_id)
+        return task is not None and self._cancel(task)
+
+    def _cancel(self, task: EngineTask) -> bool:
+        with task._lock:
+            if task.status in FINAL_STATES:
+                return False
+            was_running = task.status == RUNNING
+            task.status = CANCELLED
+            task.finished_at = time.time()
+            if task._timer_job is not None:
+                task._timer_job.cancel()
+                task._timer_job = None
+        with self._lock:
+            self.counters['cancelled'] += 1
+            if was_running:
+                self._running_count -= 1
+        self._retire(task)
+        if not task.future.cancel():  # already running: complete it as cancelled
+            task.future.set_exception(CancelledError(f"task {task.task_id} cancelled"))
+        return True
+
+    def get(self, task_id: str) -> Optional[EngineTask]:
+        return self._tasks.get(task_id)
+
+    def wait(self, task_id: str, timeout: Optional[float] = None) -> Optional[EngineTask]:
+        """The task once final (wakes on completion), or None on timeout / unknown id"""
+        task = self.get(task_id)
+        if task is None:
+            return None
+        done, _ = wait([task.future], timeout=timeout)
+        return task if done else None
+
+    def tasks(self, status: Optional[str] = None) -> List[EngineTask]:
+        with self._lock:
+            tasks = list(self._tasks.values())
+        return [task for task in tasks if status is None or task.status == status]
+
+    def get_stats(self) -> Dict:
+        """Counters, queue depth, throughput and queue-wait vs run-time distributions"""
+        tasks = self.tasks()
+        with self._lock:
+            counters = dict(self.counters)
+            running = self._running_count
+            uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+        finished = counters['completed'] + counters['failed']
+        return {
+            **counters,
+            'queued': sum(1 for task in tasks if task.status == QUEUED),
+            'retrying': sum(1 for task in tasks if task.status == RETRYING),
+            'running': running,
+            'workers': self.workers if self.running else 0,
+            'process_workers': self.process_workers if self._process_pool is not None else 0,
+            'throughput_per_s': (finished / uptime) if uptime else 0.0,
+            'queue_wait': self.queue_wait.snapshot(),
+            'run': self.run_time.snapshot(),
+        }
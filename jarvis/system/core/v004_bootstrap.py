@@ -40,8 +40,10 @@ def bootstrap_v004_features(jarvis_core) -> bool:
         logger.info("[2/4] Initializing background task manager...")
         try:
             from system.pc_authority.background_task_manager import BackgroundTaskManager
-            jarvis_core.task_manager = BackgroundTaskManager(max_workers=4)
-            logger.info("✓ Background task manager ready (4 workers)")
+            # Reuse the core's manager (shared TaskEngine) instead of a second pool
+            jarvis_core.task_manager = getattr(jarvis_core, 'task_manager', None) or BackgroundTaskManager(
+                max_workers=4, engine=getattr(jarvis_core, 'task_engine', None))
+            logger.info(f"✓ Background task manager ready ({jarvis_core.task_manager.max_workers} workers)")
         except Exception as e:
             logger.warning(f"⚠ Background task manager failed: {e}")
             jarvis_core.task_manager = None
@@ -138,6 +140,8 @@ def setup_debug_commands(jarvis_core):
             '--skills': 'List all available skills',
             '--trace': 'Show NLU trace for next command',
             '--pc': 'Show PC statistics',
+            '--latency': 'Show latency percentiles per skill and NLU stage',
+            '--latency reset': 'Reset latency histograms',
         }
         
         jarvis_core._debug_commands = debug_commands
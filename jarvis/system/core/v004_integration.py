@@ -52,7 +52,9 @@ class V004IntegrationLayer:
             # 3. Import BackgroundTaskManager
             try:
                 from system.pc_authority.background_task_manager import BackgroundTaskManager
-                self.jarvis.task_manager = BackgroundTaskManager(max_workers=4)
+                # Reuse the core's manager (shared TaskEngine) instead of a second pool
+                self.jarvis.task_manager = getattr(self.jarvis, 'task_manager', None) or BackgroundTaskManager(
+                    max_workers=4, engine=getattr(self.jarvis, 'task_engine', None))
                 logger.info("✓ BackgroundTaskManager initialized")
             except Exception as e:
                 logger.warning(f"Could not import BackgroundTaskManager: {e}")
@@ -24,6 +24,31 @@ class ConfigValidator:
         "use_colors": {"type": bool, "required": False, "default": True},
         "short_term_memory_max": {"type": int, "required": False, "default": 20, "min": 5, "max": 100},
         "workers": {"type": int, "required": False, "default": 4, "min": 1, "max": 16},
+        "event_queue_capacity": {"type": int, "required": False, "default": 1000, "min": 10, "max": 1000000},
+        "event_overflow": {"type": dict, "required": False, "default": None,
+                           "keys": ["high", "normal", "low", 0, 1, 2],
+                           "values": ["block", "drop_oldest", "coalesce"]},
+        "event_block_timeout": {"type": float, "required": False, "default": 1.0, "min": 0.0, "max": 60.0},
+        "event_bus": {"type": str, "required": False, "default": "thread", "values": ["thread", "asyncio"]},
+        "event_max_concurrency": {"type": int, "required": False, "default": 256, "min": 1, "max": 100000},
+        "scheduler_workers": {"type": int, "required": False, "default": 4, "min": 1, "max": 64},
+        "job_store": {"type": str, "required": False, "default": None},
+        "skill_timeout": {"type": int, "required": False, "default": 30, "min": 1, "max": 3600},
+        "skill_workers": {"type": int, "required": False, "default": 4, "min": 1, "max": 64},
+        "skill_preload": {"type": bool, "required": False, "default": True},
+        "prefetch": {"type": bool, "required": False, "default": False},
+        "prefetch_budget_ms": {"type": int, "required": False, "default": 250, "min": 1, "max": 60000},
+        "task_workers": {"type": int, "required": False, "default": 4, "min": 1, "max": 64},
+        "task_process_workers": {"type": int, "required": False, "default": 2, "min": 1, "max": 32},
+        "audit_queue_size": {"type": int, "required": False, "default": 10000, "min": 100, "max": 1000000},
+        "audit_flush_ms": {"type": int, "required": False, "default": 1000, "min": 10, "max": 60000},
+        "audit_compress": {"type": bool, "required": False, "default": True},
+        "log_queue_size": {"type": int, "required": False, "default": 10000, "min": 100, "max": 1000000},
+        "log_max_bytes": {"type": int, "required": False, "default": 5242880, "min": 1024, "max": 1073741824},
+        "log_backup_count": {"type": int, "required": False, "default": 7, "min": 0, "max": 365},
+        "log_debug_rate": {"type": int, "required": False, "default": 30, "min": 0, "max": 100000},
+        "metrics_interval": {"type": int, "required": False, "default": 300, "min": 10, "max": 86400},
+        "data_flush_interval": {"type": int, "required": False, "default": 60, "min": 1, "max": 86400},
         "crash_on_error": {"type": bool, "required": False, "default": False},
         "mode": {"type": str, "required": False, "default": "PASSIVE", "values": ["SAFE", "PASSIVE", "ACTIVE", "ANALYSIS"]},
         "wake_word": {"type": str, "required": False, "default": "jarvis", "min_length": 3, "max_length": 50},
@@ -60,8 +85,10 @@ class ConfigValidator:
                 validated[key] = schema_def.get("default")
                 continue
             
-            # Check type
+            # Check type (ints are accepted for float fields)
             expected_type = schema_def.get("type")
+            if expected_type == float and isinstance(value, int) and not isinstance(value, bool):
+                value = float(value)
             if not isinstance(value, expected_type):
                 errors.append(
                     f"Invalid type for '{key}': expected {expected_type.__name__}, "
@@ -70,7 +97,7 @@ class ConfigValidator:
                 continue
             
             # Check numeric constraints
-            if expected_type == int:
+            if expected_type in (int, float):
                 if "min" in schema_def and value < schema_def["min"]:
                     errors.append(f"Value for '{key}' too small: {value} < {schema_def['min']}")
                     continue
@@ -92,6 +119,17 @@ class ConfigValidator:
                     )
                     continue
             
+            # Check dict constraints (allowed keys / values)
+            if expected_type == dict:
+                unknown = [k for k in value if "keys" in schema_def and k not in schema_def["keys"]]
+                if unknown:
+                    errors.append(f"Invalid keys for '{key}': {unknown} not in {schema_def['keys']}")
+                    continue
+                invalid = [v for v in value.values() if "values" in schema_def and v not in schema_def["values"]]
+                if invalid:
+                    errors.append(f"Invalid values for '{key}': {invalid} not in {schema_def['values']}")
+                    continue
+            
             validated[key] = value
         
         # Check for unknown fields
@@ -6,11 +6,15 @@ Manages background tasks, prevents them from dying, monitors their state
 import threading
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable
 from enum import Enum
 from datetime import datetime
 
+from system.core import task_engine as engine_states
+from system.core.task_engine import BACKEND_THREAD, TaskEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,35 +57,60 @@ class BackgroundTask:
     created_at: float = field(default_factory=time.time)
     started_at: Optional[float] = None
     completed_at: Optional[float] = None
-    thread: Optional[threading.Thread] = None
+    handle: Optional[Any] = None  # EngineTask running it
     memory_data: Dict = field(default_factory=dict)  # Store context/memory
 
 
+# Engine status -> TaskStatus (a task waiting for its retry timer counts as queued)
+_STATUS = {
+    engine_states.QUEUED: TaskStatus.QUEUED,
+    engine_states.RETRYING: TaskStatus.QUEUED,
+    engine_states.RUNNING: TaskStatus.RUNNING,
+    engine_states.COMPLETED: TaskStatus.COMPLETED,
+    engine_states.FAILED: TaskStatus.FAILED,
+    engine_states.TIMEOUT: TaskStatus.FAILED,
+    engine_states.CANCELLED: TaskStatus.CANCELLED,
+}
+_FAILED_ATTEMPT = (engine_states.RETRYING, engine_states.FAILED, engine_states.TIMEOUT)
+
+
 class BackgroundTaskManager:
-    """Manage background tasks"""
+    """
+    Manage background tasks
+
+    Adapter over system.core.task_engine.TaskEngine: tasks run on the
+    engine's fixed workers (the core's shared engine, or one of its own with
+    `max_workers` threads), retries wait on timers instead of sleeping
+    threads, and timeouts are enforced by the engine.
+    """
 
-    def __init__(self, max_workers: int = 5, keep_results_count: int = 100):
+    def __init__(self, max_workers: int = 5, keep_results_count: int = 100, engine: TaskEngine = None):
         self.tasks: Dict[str, BackgroundTask] = {}
-        self.results_history: List[TaskResult] = []
-        self.max_workers = max_workers
+        self.results_history: deque = deque(maxlen=keep_results_count)
+        self.engine = engine or TaskEngine(workers=max_workers)
+        self.max_workers = self.engine.workers
         self.keep_results_count = keep_results_count
         self.lock = threading.Lock()
-        self.semaphore = threading.Semaphore(max_workers)
         self.enabled = True
-        self.active_threads = 0
         self.completed_tasks = 0
+        if engine is None:
+            self.engine.start()  # a shared engine is started by its owner
+
+    @property
+    def active_threads(self) -> int:
+        return self.engine.get_stats()['running']
 
     def submit_task(self, task_id: str, name: str, function: Callable,
                    args: tuple = (), kwargs: dict = None, priority: int = 0,
                    max_retries: int = 3, timeout: Optional[float] = None,
-                   memory_data: Dict = None) -> str:
-        """Submit a background task"""
+                   memory_data: Dict = None, backend: str = BACKEND_THREAD) -> str:
+        """Submit a background task (max_retries counts attempts, as before; backend: thread|process)"""
 
         with self.lock:
             # Check if task already exists
-            if task_id in self.tasks:
+            previous = self.tasks.pop(task_id, None)
+            if previous is not None:
                 logger.warning(f"Task {task_id} already exists, updating...")
-                del self.tasks[task_id]
 
             task = BackgroundTask(
                 task_id=task_id,
@@ -95,100 +124,64 @@ class BackgroundTaskManager:
                 timeout=timeout,
                 memory_data=memory_data or {}
             )
-
             self.tasks[task_id] = task
-            logger.info(f"Task submitted: {name} ({task_id}) - Priority: {priority}")
-
-            # Execute in background
-            self._execute_task_async(task_id)
-
-            return task_id
 
-    def _execute_task_async(self, task_id: str):
-        """Execute task in background thread"""
-        task = self.tasks.get(task_id)
-        if not task:
+        if previous is not None and previous.handle is not None:
+            self.engine.cancel(previous.handle.task_id)
+
+        task.handle = self.engine.submit(
+            function, args=task.args, kwargs=task.kwargs, name=name, priority=priority,
+            backend=backend, timeout=timeout, max_retries=max(0, max_retries - 1),
+            callback=lambda handle, task=task: self._on_done(task, handle),
+        )
+        logger.info(f"Task submitted: {name} ({task_id}) - Priority: {priority}")
+        return task_id
+
+    def _sync(self, task: BackgroundTask) -> BackgroundTask:
+        """Refresh the task's fields from its engine task"""
+        handle = task.handle
+        if handle is None:
+            return task
+        if task.status == TaskStatus.PAUSED and handle.status == engine_states.RUNNING:
+            return task
+        task.status = _STATUS[handle.status]
+        failures = handle.attempts - (0 if handle.status in _FAILED_ATTEMPT else 1)
+        task.retry_count = max(0, failures)
+        task.started_at = handle.started_at
+        task.completed_at = handle.finished_at
+        return task
+
+    def _on_done(self, task: BackgroundTask, handle):
+        """Engine callback: the task reached a final state (maybe before submit_task returned)"""
+        task.handle = task.handle or handle
+        result = self._result_of(task)
+        if result is None:
             return
-
-        def run():
-            try:
-                self.semaphore.acquire()
-                self.active_threads += 1
-
-                task.status = TaskStatus.RUNNING
-                task.started_at = time.time()
-                logger.info(f"Task executing: {task.name} ({task_id})")
-
-                start_time = time.time()
-
-                # Execute with timeout
-                if task.timeout:
-                    import signal
-
-                    def timeout_handler(signum, frame):
-                        raise TimeoutError(f"Task timeout after {task.timeout}s")
-
-                    signal.signal(signal.SIGALRM, timeout_handler)
-                    signal.alarm(int(task.timeout))
-
-                    try:
-                        result = task.function(*task.args, **task.kwargs)
-                        signal.alarm(0)  # Cancel alarm
-                    except TimeoutError as e:
-                        raise e
-                else:
-                    result = task.function(*task.args, **task.kwargs)
-
-                execution_time = time.time() - start_time
-
-                task.status = TaskStatus.COMPLETED
-                task.completed_at = time.time()
+        if result.success:
+            logger.info(f"Task completed: {task.name} ({task.task_id}) in {result.execution_time:.2f}s")
+        elif task.handle.status != engine_states.CANCELLED:
+            logger.error(f"Task permanently failed: {task.name} ({task.task_id}): {result.error}")
+
+    def _result_of(self, task: BackgroundTask) -> Optional[TaskResult]:
+        """TaskResult of a finished task, recorded in the history once"""
+        handle = task.handle
+        if handle is None or not handle.done:
+            return task.result
+        with self.lock:
+            if task.result is None:
+                success = handle.status == engine_states.COMPLETED
                 task.result = TaskResult(
-                    task_id=task_id,
-                    success=True,
-                    output=str(result),
-                    execution_time=execution_time
+                    task_id=task.task_id,
+                    success=success,
+                    output=str(handle.result) if success else None,
+                    error=None if success else handle.error,
+                    execution_time=handle.run_ms / 1000.0
                 )
-
-                logger.info(f"Task completed: {task.name} ({task_id}) in {execution_time:.2f}s")
-                self.completed_tasks += 1
-
-                # Store in history
-                with self.lock:
-                    self.results_history.append(task.result)
-                    if len(self.results_history) > self.keep_results_count:
-                        self.results_history.pop(0)
-
-            except Exception as e:
-                execution_time = time.time() - (task.started_at or time.time())
-                logger.error(f"Task failed: {task.name} ({task_id}): {e}")
-
-                task.retry_count += 1
-
-                if task.retry_count < task.max_retries:
-                    task.status = TaskStatus.QUEUED
-                    logger.info(f"Retrying task: {task.name} ({task_id}) - Attempt {task.retry_count + 1}/{task.max_retries}")
-                    # Retry after delay
-                    time.sleep(1 * task.retry_count)
-                    self._execute_task_async(task_id)
-                else:
-                    task.status = TaskStatus.FAILED
-                    task.completed_at = time.time()
-                    task.result = TaskResult(
-                        task_id=task_id,
-                        success=False,
-                        error=str(e),
-                        execution_time=execution_time
-                    )
-                    logger.error(f"Task permanently failed: {task.name} ({task_id})")
-
-            finally:
-                self.active_threads -= 1
-                self.semaphore.release()
-
-        thread = threading.Thread(target=run, daemon=False)
-        task.thread = thread
-        thread.start()
+                if success:
+                    self.completed_tasks += 1
+                self.results_history.append(task.result)
+            self._sync(task)
+            return task.result
 
     def get_task_status(self, task_id: str) -> Optional[Dict]:
         """Get task status"""
@@ -196,6 +189,7 @@ class BackgroundTaskManager:
             task = self.tasks.get(task_id)
             if not task:
                 return None
+            self._sync(task)
 
             return {
                 'task_id': task_id,
@@ -230,42 +224,33 @@ class BackgroundTaskManager:
             return 0.0
 
     def wait_for_task(self, task_id: str, timeout: Optional[float] = None) -> Optional[TaskResult]:
-        """Wait for task to complete"""
-        start_time = time.time()
-
-        while True:
-            with self.lock:
-                task = self.tasks.get(task_id)
-                if task and task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
-                    return task.result
-
-            if timeout:
-                elapsed = time.time() - start_time
-                if elapsed > timeout:
-                    logger.warning(f"Timeout waiting for task {task_id}")
-                    return None
-
-            time.sleep(0.1)
+        """Wait for task to complete (wakes as soon as it does)"""
+        with self.lock:
+            task = self.tasks.get(task_id)
+        if not task or task.handle is None:
+            return None
+        if self.engine.wait(task.handle.task_id, timeout) is None:
+            logger.warning(f"Timeout waiting for task {task_id}")
+            return None
+        return self._result_of(task)
 
     def cancel_task(self, task_id: str) -> bool:
-        """Cancel a task"""
+        """Cancel a task (a running attempt finishes, but its outcome is discarded)"""
         with self.lock:
             task = self.tasks.get(task_id)
-            if not task:
-                return False
-
-            if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
+            if not task or task.handle is None:
                 return False
-
-            task.status = TaskStatus.CANCELLED
-            logger.info(f"Task cancelled: {task.name} ({task_id})")
-            return True
+        if not self.engine.cancel(task.handle.task_id):
+            return False
+        self._result_of(task)
+        logger.info(f"Task cancelled: {task.name} ({task_id})")
+        return True
 
     def pause_task(self, task_id: str) -> bool:
         """Pause a task"""
         with self.lock:
             task = self.tasks.get(task_id)
-            if not task or task.status != TaskStatus.RUNNING:
+            if not task or self._sync(task).status != TaskStatus.RUNNING:
                 return False
 
             task.status = TaskStatus.PAUSED
@@ -280,6 +265,7 @@ class BackgroundTaskManager:
                 return False
 
             task.status = TaskStatus.RUNNING
+            self._sync(task)
             logger.info(f"Task resumed: {task.name} ({task_id})")
             return True
 
@@ -288,6 +274,7 @@ class BackgroundTaskManager:
         with self.lock:
             tasks = []
             for task_id, task in self.tasks.items():
+                self._sync(task)
                 if status_filter and task.status != status_filter:
                     continue
 
@@ -329,6 +316,8 @@ class BackgroundTaskManager:
         """Get task manager statistics"""
         with self.lock:
             total_tasks = len(self.tasks)
+            for task in self.tasks.values():
+                self._sync(task)
             running_tasks = sum(1 for t in self.tasks.values() if t.status == TaskStatus.RUNNING)
             queued_tasks = sum(1 for t in self.tasks.values() if t.status == TaskStatus.QUEUED)
             completed_tasks = sum(1 for t in self.tasks.values() if t.status == TaskStatus.COMPLETED)
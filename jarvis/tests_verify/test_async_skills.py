@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Async skill protocol tests
+run_async on the dispatcher's shared event loop (concurrency without pool
+threads, deadlines, nested dispatch), the asyncio HTTP client (direct and
+through a proxy) and the research skills' async path
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _dispatcher(**kwargs):
+    from system.core.exceptions import SkillError  # noqa: F401 (package import order)
+    from skills.actions.dispatcher import SkillDispatcher
+    return SkillDispatcher(**kwargs)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/redirect"):
+            self.send_response(302)
+            self.send_header("Location", "/json?q=redirected")
+            self.end_headers()
+            return
+        if self.path.startswith("/missing"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path, "proxy_auth": self.headers.get("Proxy-Authorization"), "items": [
+            {"title": "t1", "link": "u1", "score": 3}, {"title": "t2", "link": "u2"}
+        ]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_async_http_client():
+    """GET with params, redirects, non-2xx errors and timeouts"""
+    print("🧪 Testing asyncio HTTP client...")
+    server, base = _serve()
+    try:
+        from skills.research import async_http
+
+        async def scenario():
+            data = await async_http.get_json(base + "/json", {"q": "hola mundo", "n": 2})
+            assert data["path"] == "/json?q=hola+mundo&n=2", data
+            redirected = await async_http.get_json(base + "/redirect")
+            assert redirected["path"] == "/json?q=redirected", redirected
+            try:
+                await async_http.get_json(base + "/missing")
+                raise AssertionError("404 should raise")
+            except async_http.HTTPError as e:
+                assert e.status == 404
+            many = await asyncio.gather(*(async_http.get_json(base + f"/json?i={i}") for i in range(20)))
+            assert [m["path"] for m in many] == [f"/json?i={i}" for i in range(20)]
+
+        asyncio.run(scenario())
+
+        async def silent(reader, writer):
+            await asyncio.sleep(5)
+
+        async def timeout_scenario():
+            stalled = await asyncio.start_server(silent, "127.0.0.1", 0)
+            port = stalled.sockets[0].getsockname()[1]
+            start = time.perf_counter()
+            try:
+                await async_http.fetch(f"http://127.0.0.1:{port}/", timeout=0.2)
+                raise AssertionError("should time out")
+            except asyncio.TimeoutError:
+                pass
+            stalled.close()
+            return time.perf_counter() - start
+
+        elapsed = asyncio.run(timeout_scenario())
+        assert elapsed < 1.0, elapsed
+
+        print("  ✅ HTTP client OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ HTTP client failed: {e}")
+        return False
+    finally:
+        server.shutdown()
+
+
+def test_async_http_proxy():
+    """HTTP(S)_PROXY and NO_PROXY are honoured like requests does; HTTPS goes through CONNECT"""
+    print("🧪 Testing asyncio HTTP client behind a proxy...")
+    server, base = _serve()
+    saved = {name: os.environ.pop(name, None)
+             for name in ("http_proxy", "https_proxy", "no_proxy", "HTTP_PROXY", "HTTPS_PROXY", "NO_PROXY")}
+    try:
+        from skills.research import async_http
+
+        # plain HTTP: the proxy (here, the test server) gets the absolute URL and the credentials
+        os.environ["http_proxy"] = base.replace("http://", "http://jarvis:s%40cret@")
+        data = asyncio.run(async_http.get_json("http://search.invalid/json", {"q": "x"}))
+        assert data["path"] == "http://search.invalid/json?q=x", data
+        assert data["proxy_auth"] == "Basic amFydmlzOnNAY3JldA==", data  # jarvis:s@cret
+
+        # NO_PROXY: straight to the server even though the proxy is unreachable
+        os.environ["http_proxy"] = "http://127.0.0.1:9"
+        os.environ["no_proxy"] = "127.0.0.1"
+        assert asyncio.run(async_http.get_json(base + "/json"))["path"] == "/json"
+
+        # HTTPS: a CONNECT tunnel to host:443; a refused tunnel is an HTTPError from the proxy
+        seen = []
+
+        async def refusing_proxy(reader, writer):
+            while True:
+                line = (await reader.readline()).decode("latin-1")
+                if line in ("\r\n", ""):
+                    break
+                seen.append(line.strip())
+            writer.write(b"HTTP/1.1 407 Proxy Authentication Required\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            writer.close()
+
+        async def connect_scenario():
+            proxy = await asyncio.start_server(refusing_proxy, "127.0.0.1", 0)
+            os.environ["https_proxy"] = f"http://127.0.0.1:{proxy.sockets[0].getsockname()[1]}"
+            try:
+                await async_http.get_json("https://api.invalid/search?q=x")
+                raise AssertionError("refused CONNECT should raise")
+            except async_http.HTTPError as e:
+                assert e.status == 407, e
+            finally:
+                proxy.close()
+
+        asyncio.run(connect_scenario())
+        assert seen[:2] == ["CONNECT api.invalid:443 HTTP/1.1", "Host: api.invalid:443"], seen
+
+        print("  ✅ HTTP client behind a proxy OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ HTTP client behind a proxy failed: {e}")
+        return False
+    finally:
+        for name, value in saved.items():
+            os.environ.pop(name, None)
+            if value is not None:
+                os.environ[name] = value
+        server.shutdown()
+
+
+def test_concurrency_without_pool_threads():
+    """40 concurrent async dispatches with 2 pool workers finish in ~one call's time"""
+    print("🧪 Testing async concurrency...")
+    try:
+        seen_threads = set()
+
+        class Slow:
+            async def run_async(self, entities, core):
+                seen_threads.add(threading.current_thread().name)
+                await asyncio.sleep(0.3)
+                return {"success": True, "i": entities["i"]}
+
+        class Blocking:
+            def run(self, entities, core):
+                time.sleep(0.3)
+                return {"success": True}
+
+        dispatcher = _dispatcher(max_workers=2)
+        dispatcher.register("slow", Slow)
+        dispatcher.register("blocking", Blocking)
+        assert dispatcher.get_limits("slow")[1] == dispatcher.async_max_concurrency
+        assert dispatcher.get_skill_info("slow")["async"] and not dispatcher.get_skill_info("blocking")["async"]
+
+        results = [None] * 40
+
+        def call(i):
+            results[i] = dispatcher.dispatch("slow", {"i": i}, None)
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(40)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        assert all(r["success"] for r in results)
+        assert sorted(r["result"]["i"] for r in results) == list(range(40))
+        assert elapsed < 1.2, elapsed  # the 2-worker pool would need ~6s
+        assert seen_threads == {"SkillLoop"}, seen_threads
+
+        # sync skills keep running on the pool meanwhile
+        assert dispatcher.dispatch("blocking", {}, None)["success"]
+        assert dispatcher.get_execution_stats()["slow"]["success"] == 40
+        dispatcher.shutdown()
+
+        print(f"  ✅ Async concurrency OK (40 calls in {elapsed * 1000:.0f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Async concurrency failed: {e}")
+        return False
+
+
+def test_async_deadline_and_nesting():
+    """Deadlines cancel the coroutine; tokens and nested dispatch work inside run_async"""
+    print("🧪 Testing async deadlines and nesting...")
+    try:
+        from system.core.exceptions import SkillTimeoutError
+        from skills.actions.dispatcher import current_cancel_token
+
+        state = {"cancelled": False}
+
+        class Hang:
+            timeout_seconds = 0.2
+
+            async def run_async(self, entities, core, cancel_token=None):
+                assert current_cancel_token() is cancel_token
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    state["cancelled"] = True
+                    raise
+                return {"success": True}
+
+        class Inner:
+            def run(self, entities, core):
+                return {"success": True, "token": current_cancel_token() is not None}
+
+        dispatcher = _dispatcher()
+
+        class Outer:
+            async def run_async(self, entities, core):
+                inner = dispatcher.dispatch("inner", {}, core)
+                return {"success": True, "inner": inner["result"]["token"]}
+
+        dispatcher.register("hang", Hang)
+        dispatcher.register("inner", Inner)
+        dispatcher.register("outer", Outer)
+
+        start = time.perf_counter()
+        try:
+            dispatcher.dispatch("hang", {}, None)
+            raise AssertionError("should time out")
+        except SkillTimeoutError:
+            pass
+        assert time.perf_counter() - start < 1.0
+        time.sleep(0.05)
+        assert state["cancelled"], "coroutine should be cancelled at the deadline"
+        assert dispatcher.get_execution_stats()["hang"]["timeouts"] == 1
+        assert dispatcher.get_inflight() == []
+
+        assert dispatcher.dispatch("outer", {}, None)["result"]["inner"] is True
+
+        dispatcher.shutdown()
+        try:
+            dispatcher.dispatch("outer", {}, None)
+            raise AssertionError("dispatch after shutdown should fail")
+        except Exception as e:
+            assert "shut down" in str(e), e
+
+        print("  ✅ Async deadlines/nesting OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Async deadlines/nesting failed: {e}")
+        return False
+
+
+def test_research_skills_async_path():
+    """Search skills parse the same results through run_async as through run"""
+    print("🧪 Testing research skills' async path...")
+    server, base = _serve()
+    try:
+        from skills.research import internet_search
+        from skills.research.internet_search import StackOverflowSearchSkill, GitHubSearchSkill
+        from skills.research.research_skill import ResearchSkill
+
+        skill = StackOverflowSearchSkill()
+        skill._request = lambda query, n: (base + "/json", {"q": query})
+        sync_result = skill.run({"query": ["python", "asyncio"]})
+        async_result = asyncio.run(skill.run_async({"query": ["python", "asyncio"]}))
+        assert sync_result == async_result, (sync_result, async_result)
+        assert [r["title"] for r in async_result["results"]] == ["t1", "t2"]
+        assert asyncio.run(skill.run_async({}))["success"] is False
+
+        github = GitHubSearchSkill()
+        github._request = lambda query, n: (base + "/missing", {})
+        assert asyncio.run(github.run_async({"query": "x"}))["results"] == []
+
+        research = ResearchSkill()
+        research._web_url = lambda query: base + "/missing"
+        research._save_research = lambda core, results: None
+        web = asyncio.run(research._search_web_async("x"))
+        assert web[0]["type"] == "error" and web[0]["source"] == "web_error", web
+
+        assert internet_search.InternetSearchSkill._parse({}, "q", 5)[0]["message"].startswith("No results")
+
+        print("  ✅ Research async path OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Research async path failed: {e}")
+        return False
+    finally:
+        server.shutdown()
+
+
+def test_failed_search_not_cached():
+    """A search whose every result is a network error fails and isn't served from the result cache"""
+    print("🧪 Testing failed searches aren't cached...")
+    from skills.research import internet_search
+    original = internet_search._get_json_async
+    try:
+        from skills.research.internet_search import InternetSearchSkill, GitHubSearchSkill
+
+        calls = []
+
+        async def unreachable(url, params=None):
+            calls.append(url)
+            raise OSError("network is unreachable")
+
+        internet_search._get_json_async = unreachable
+        dispatcher = _dispatcher()
+        dispatcher.register("internet_search", InternetSearchSkill())
+        dispatcher.register("github_search", GitHubSearchSkill())
+        for _ in range(2):
+            response = dispatcher.dispatch("internet_search", {"query": "python"}, None)
+            assert response["success"] is False and not response.get("cached"), response
+        assert len(calls) == 2, calls
+        assert dispatcher.get_cache_stats()["stores"] == 0
+
+        async def empty(url, params=None):
+            calls.append(url)
+            return {"items": []}
+
+        internet_search._get_json_async = empty  # no results is an answer, not an error
+        dispatcher.dispatch("github_search", {"query": "x"}, None)
+        assert dispatcher.dispatch("github_search", {"query": "x"}, None)["cached"]
+        dispatcher.shutdown()
+
+        print("  ✅ Failed searches not cached OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Failed searches not cached failed: {e}")
+        return False
+    finally:
+        internet_search._get_json_async = original
+
+
+if __name__ == "__main__":
+    results = [
+        test_async_http_client(),
+        test_async_http_proxy(),
+        test_concurrency_without_pool_threads(),
+        test_async_deadline_and_nesting(),
+        test_research_skills_async_path(),
+        test_failed_search_not_cached(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Audit writer tests
+JarvisLogger's JSONL audit files are written by a background thread:
+commands only enqueue, lines are batched by size/time, the bounded queue
+drops instead of blocking, segments rotate daily (gzip) and close() flushes
+"""
+
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _lines(path):
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_logger_hot_path_enqueues():
+    """log_command / log_skill_execution don't touch the files; flush() puts everything on disk in order"""
+    print("🧪 Testing JarvisLogger hot path...")
+    home = os.environ.get("HOME")
+    try:
+        from skills.system.logging.manager import JarvisLogger
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ["HOME"] = tmp
+            os.makedirs(os.path.join(tmp, "Desktop"))
+            jl = JarvisLogger({"audit_flush_ms": 60000})
+            jl.logger.disabled = True  # only the audit files are under test here
+
+            start = time.perf_counter()
+            for i in range(500):
+                jl.log_command(f"cmd {i}", "get_time", {}, True)
+                jl.log_skill_execution("get_time", {"success": True, "obj": object()}, 0.001)
+            per_command_us = (time.perf_counter() - start) / 500 * 1e6
+
+            assert jl.flush()
+            commands = _lines(jl.logs_dir / "commands_history.jsonl")
+            skills = _lines(jl.logs_dir / "skills_execution.jsonl")
+            assert [c["command"] for c in commands] == [f"cmd {i}" for i in range(500)]
+            assert len(skills) == 500 and skills[0]["result"]["obj"].startswith("<object")
+            assert jl.get_metrics()["audit"]["written"] == 1000
+
+            jl.close()
+            jl.logger.disabled = False
+            for handler in list(jl.logger.handlers):
+                jl.logger.removeHandler(handler)
+                handler.close()
+
+        print(f"  ✅ Hot path OK ({per_command_us:.0f}µs per command, both lines)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Hot path failed: {e}")
+        return False
+    finally:
+        if home is not None:
+            os.environ["HOME"] = home
+
+
+def test_batches_by_size_and_time():
+    """A full batch is written at once; a lone line waits at most flush_interval"""
+    print("🧪 Testing batching...")
+    try:
+        from skills.system.logging.audit_writer import AuditWriter
+
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = AuditWriter(tmp, batch_size=10, flush_interval=0.1)
+            for i in range(25):
+                writer.write("events", {"i": i})
+            time.sleep(0.05)
+            assert len(_lines(writer.path("events"))) == 20  # two full batches, 5 still buffered
+            time.sleep(0.15)
+            assert len(_lines(writer.path("events"))) == 25
+            assert writer.get_stats()["max_batch"] == 10 and writer.get_stats()["batches"] == 3
+
+            writer.write("events", {"i": "late"})
+            time.sleep(0.2)
+            assert _lines(writer.path("events"))[-1] == {"i": "late"}
+            writer.close()
+
+        print("  ✅ Batching OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Batching failed: {e}")
+        return False
+
+
+def test_daily_rotation_and_gzip():
+    """A new day closes the active file as a dated (gzipped) segment"""
+    print("🧪 Testing daily rotation...")
+    try:
+        from skills.system.logging.audit_writer import AuditWriter
+
+        with tempfile.TemporaryDirectory() as tmp:
+            day = [date(2026, 10, 18)]
+            writer = AuditWriter(tmp, today=lambda: day[0])
+            writer.write("commands_history", {"n": 1})
+            writer.write("commands_history", {"n": 2})
+            assert writer.flush()
+            day[0] = date(2026, 10, 19)
+            writer.write("commands_history", {"n": 3})
+            assert writer.flush()
+
+            segments = writer.segments("commands_history")
+            assert [p.name for p in segments] == [
+                "commands_history.2026-10-18.jsonl.gz", "commands_history.jsonl"], segments
+            assert _lines(segments[0]) == [{"n": 1}, {"n": 2}]
+            assert _lines(segments[1]) == [{"n": 3}]
+            assert writer.get_stats()["rotations"] == 1 and writer.get_stats()["compressed"] == 1
+            writer.close()
+
+            # A restart on a later day rotates the leftover file too (day from its mtime)
+            plain = AuditWriter(tmp, compress=False, today=lambda: date(2099, 1, 1))
+            plain.write("commands_history", {"n": 4})
+            plain.close()
+            names = [p.name for p in plain.segments("commands_history")]
+            assert len(names) == 3 and names[1].endswith(".jsonl") and names[2] == "commands_history.jsonl", names
+
+        print("  ✅ Rotation OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Rotation failed: {e}")
+        return False
+
+
+def test_bounded_queue_and_close():
+    """A stalled writer makes write() drop (never block); close() writes everything queued"""
+    print("🧪 Testing bounded queue and shutdown flush...")
+    try:
+        from skills.system.logging.audit_writer import AuditWriter
+
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = AuditWriter(tmp, max_queue=5, batch_size=1, flush_interval=60)
+            with writer._lock:  # stall the writer thread mid-batch
+                writer.write("events", {"i": 0})
+                time.sleep(0.05)
+                start = time.perf_counter()
+                accepted = [writer.write("events", {"i": i}) for i in range(1, 20)]
+                elapsed = (time.perf_counter() - start) * 1000
+            assert accepted.count(True) == 5 and writer.get_stats()["dropped"] == 14, accepted
+            assert elapsed < 50, elapsed
+
+            writer.close()
+            assert [e["i"] for e in _lines(writer.path("events"))] == [0, 1, 2, 3, 4, 5]
+
+            slow = AuditWriter(tmp, flush_interval=60)
+            slow.write("slow", {"pending": True})
+            slow.close()  # the 60s flush interval doesn't delay shutdown
+            assert _lines(slow.path("slow")) == [{"pending": True}]
+            slow.write("slow", {"after_close": True})  # written directly
+            assert _lines(slow.path("slow"))[-1] == {"after_close": True}
+
+        print(f"  ✅ Bounded queue/close OK (19 writes in {elapsed:.1f}ms while stalled)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Bounded queue/close failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [
+        test_logger_hot_path_enqueues(),
+        test_batches_by_size_and_time(),
+        test_daily_rotation_and_gzip(),
+        test_bounded_queue_and_close(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
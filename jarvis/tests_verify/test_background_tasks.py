@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Background task manager tests
+Equal priorities queue FIFO (no TypeError), waiting wakes on completion,
+O(1) lookup with a bounded history, callbacks, cancellation and the
+queue-wait vs run-time metrics
+"""
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _Quiet:
+    def info(self, msg):
+        pass
+
+
+def _manager(**kwargs):
+    from system.core.background_tasks import BackgroundTaskManager
+    return BackgroundTaskManager(logger=_Quiet(), **kwargs)
+
+
+def test_priority_order_and_ties():
+    """Higher priority first, equal priorities in submission order"""
+    print("🧪 Testing priority ordering...")
+    try:
+        manager = _manager(max_workers=1)
+        order = []
+        for i in range(5):
+            manager.submit(f"low{i}", order.append, args=(f"low{i}",), priority=0)
+        manager.submit("high", order.append, args=("high",), priority=9)
+        manager.submit("mid", order.append, args=("mid",), priority=5)
+        manager.start()
+        last = manager.submit("last", order.append, args=("last",), priority=-1)
+        assert manager.wait_for_task(last, 2000) is not None
+        assert order == ["high", "mid", "low0", "low1", "low2", "low3", "low4", "last"], order
+        manager.stop()
+
+        print("  ✅ Priority ordering OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Priority ordering failed: {e}")
+        return False
+
+
+def test_wait_wakes_on_completion():
+    """wait_for_task returns right after the task finishes, not on a polling tick"""
+    print("🧪 Testing wait wake-up...")
+    try:
+        manager = _manager(max_workers=2)
+        manager.start()
+        task_id = manager.submit("short", time.sleep, args=(0.02,))
+        start = time.perf_counter()
+        task = manager.wait_for_task(task_id, timeout_ms=2000)
+        elapsed = (time.perf_counter() - start) * 1000
+        assert task is not None and task.status == "completed"
+        assert elapsed < 60, elapsed  # the old loop slept in 100ms steps
+
+        slow = manager.submit("slow", time.sleep, args=(0.5,))
+        assert manager.wait_for_task(slow, timeout_ms=50) is None
+
+        def boom():
+            raise ValueError("boom")
+
+        failed = manager.submit("boom", boom)
+        task = manager.wait_for_task(failed, 2000)
+        assert task.status == "failed" and task.error == "boom"
+        try:
+            manager.result(failed)
+            raise AssertionError("result() should re-raise")
+        except ValueError:
+            pass
+        assert manager.result(manager.submit("answer", lambda: 42), timeout=2) == 42
+        manager.stop()
+
+        print(f"  ✅ Wait wake-up OK ({elapsed:.1f}ms for a 20ms task)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Wait wake-up failed: {e}")
+        return False
+
+
+def test_bounded_history_and_index():
+    """Completed tasks stay findable until they fall out of the history ring"""
+    print("🧪 Testing bounded history...")
+    try:
+        manager = _manager(max_workers=4, history=50)
+        manager.start()
+        ids = [manager.submit("n", lambda i=i: i) for i in range(500)]
+        deadline = time.time() + 5
+        while manager.get_stats()["completed"] < 500 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert len(manager.completed_tasks) == 50
+        assert len(manager._tasks) == 50, len(manager._tasks)
+        kept = [task_id for task_id in ids if manager.get_task(task_id)]
+        assert len(kept) == 50 and manager.get_task(kept[-1]).result is not None
+        assert len(set(ids)) == 500  # generated ids never collide
+        assert len(manager.get_completed_tasks(limit=10)) == 10
+
+        try:
+            manager.submit("dup", time.sleep, args=(0.3,), task_id="fixed")
+            manager.submit("dup", time.sleep, args=(0.3,), task_id="fixed")
+            raise AssertionError("duplicate live id should be rejected")
+        except ValueError:
+            pass
+        manager.stop()
+
+        print("  ✅ Bounded history OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Bounded history failed: {e}")
+        return False
+
+
+def test_callbacks_cancel_and_metrics():
+    """Callbacks run once per task; queued tasks can be cancelled; wait vs run are measured apart"""
+    print("🧪 Testing callbacks, cancellation and metrics...")
+    try:
+        manager = _manager(max_workers=1)
+        seen = []
+        done = threading.Event()
+
+        def callback(task):
+            seen.append((task.name, task.status))
+            if task.name == "third":
+                done.set()
+
+        manager.start()
+        manager.submit("first", time.sleep, args=(0.1,), callback=callback)
+        second = manager.submit("second", time.sleep, args=(0.1,), callback=callback)
+        manager.submit("third", time.sleep, args=(0.01,), callback=callback)
+        manager.submit("bad_callback", lambda: None, callback=lambda task: 1 / 0)
+        assert manager.cancel(second) and not manager.cancel(second)
+        assert done.wait(2)
+        time.sleep(0.05)
+
+        assert seen == [("second", "cancelled"), ("first", "completed"), ("third", "completed")], seen
+        stats = manager.get_stats()
+        assert stats["cancelled"] == 1 and stats["completed"] == 3 and stats["callback_errors"] == 1, stats
+        assert stats["run"]["count"] == 3 and stats["queue_wait"]["max_ms"] >= 90, stats
+        assert stats["run"]["max_ms"] >= 90 and stats["workers"] == 1
+
+        manager.submit("blocker", time.sleep, args=(0.3,))
+        pending = manager.submit("never", lambda: None)
+        time.sleep(0.05)
+        manager.stop(timeout=1.0)
+        assert manager.get_task(pending).status == "cancelled"
+        assert manager.get_stats()["workers"] == 0
+
+        print("  ✅ Callbacks/cancel/metrics OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Callbacks/cancel/metrics failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [
+        test_priority_order_and_ties(),
+        test_wait_wakes_on_completion(),
+        test_bounded_history_and_index(),
+        test_callbacks_cancel_and_metrics(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+EventBus tests
+Fast path, Event compatibility and subscription semantics
+"""
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _wait(predicate, timeout=2.0):
+    end = time.time() + timeout
+    while time.time() < end:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_zero_subscriber_fast_path():
+    """Emits without subscribers never reach the queue"""
+    print("🧪 Testing zero-subscriber fast path...")
+    try:
+        from core.lifecycle.runtime import EventBus
+
+        bus = EventBus(workers=2)
+        bus.start()
+        for _ in range(100):
+            bus.emit("nlu.entities.detected", {"entities": {}})
+        stats = bus.get_stats()
+        bus.stop()
+
+        assert stats["emitted"] == 100
+        assert stats["skipped_no_subscribers"] == 100
+        assert stats["enqueued"] == 0
+
+        print("  ✅ Fast path OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Fast path failed: {e}")
+        return False
+
+
+def test_event_dict_compat():
+    """Handlers written for dict events keep working"""
+    print("🧪 Testing Event dict compatibility...")
+    try:
+        from core.lifecycle.runtime import EventBus
+
+        received = []
+        bus = EventBus(workers=2)
+        bus.subscribe("input.text", lambda e: received.append(
+            (e.get("type"), e.get("data", {}).get("text"), e["data"], e.get("missing", "x"))
+        ))
+        bus.start()
+        bus.emit("input.text", {"text": "hola"})
+        assert _wait(lambda: received)
+        bus.stop()
+
+        assert received[0] == ("input.text", "hola", {"text": "hola"}, "x")
+
+        print("  ✅ Event compat OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Event compat failed: {e}")
+        return False
+
+
+def test_copy_on_write_subscriptions():
+    """Subscribing while emitting is safe; unsubscribe removes one bound method"""
+    print("🧪 Testing copy-on-write subscriptions...")
+    try:
+        from core.lifecycle.runtime import EventBus
+
+        class Sink:
+            def __init__(self):
+                self.count = 0
+                self.lock = threading.Lock()
+
+            def handle(self, event):
+                with self.lock:
+                    self.count += 1
+
+        bus = EventBus(workers=4)
+        sink = Sink()
+        bus.start()
+
+        stop = threading.Event()
+
+        def churn():
+            while not stop.is_set():
+                bus.subscribe("tick", sink.handle)
+                bus.unsubscribe("tick", sink.handle)
+
+        t = threading.Thread(target=churn)
+        t.start()
+        for _ in range(2000):
+            bus.emit("tick")
+        stop.set()
+        t.join()
+
+        assert not bus.has_subscribers("tick")
+        bus.subscribe("tick", sink.handle)
+        bus.subscribe("tick", sink.handle)
+        bus.unsubscribe("tick", sink.handle)
+        assert len(bus.subscribers["tick"]) == 1
+        bus.stop()
+
+        print("  ✅ Copy-on-write OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Copy-on-write failed: {e}")
+        return False
+
+
+def test_priority_lanes():
+    """Queued jarvis.response is delivered before earlier telemetry/normal events"""
+    print("🧪 Testing priority lanes...")
+    try:
+        from core.lifecycle.runtime import EventBus
+
+        order = []
+        bus = EventBus(workers=1)
+        for event_type in ("nlu.entities.detected", "nlu.intent", "jarvis.response"):
+            bus.subscribe(event_type, lambda e: order.append(e.type))
+
+        # queued before start so the loop sees all three at once
+        bus.emit("nlu.entities.detected", {})
+        bus.emit("nlu.intent", {})
+        bus.emit("jarvis.response", {"text": "ok"})
+        bus.start()
+        assert _wait(lambda: len(order) == 3)
+        bus.stop()
+
+        assert order == ["jarvis.response", "nlu.intent", "nlu.entities.detected"], order
+
+        print("  ✅ Priority lanes OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Priority lanes failed: {e}")
+        return False
+
+
+def test_overflow_policies():
+    """coalesce, drop_oldest and block keep lanes bounded and count drops"""
+    print("🧪 Testing overflow policies...")
+    try:
+        from core.lifecycle.runtime import EventBus
+        from core.lifecycle.runtime.events import Event
+
+        # coalesce (LOW default): same-type pending event is replaced by the newest
+        seen = []
+        bus = EventBus(workers=1, capacity=3)
+        bus.subscribe("nlu.entities.detected", lambda e: seen.append(e.data))
+        for i in range(10):
+            bus.emit("nlu.entities.detected", i)
+        low = bus.get_stats()["lanes"]["low"]
+        assert low["depth"] == 3 and low["coalesced"] == 7, low
+        bus.start()
+        assert _wait(lambda: len(seen) == 3)
+        bus.stop()
+        assert seen == [9, 1, 2], seen
+
+        # drop_oldest
+        bus = EventBus(workers=1, capacity=3, overflow={"normal": "drop_oldest"})
+        bus.subscribe("tick", lambda e: None)
+        for i in range(10):
+            bus.emit("tick", i)
+        normal = bus.get_stats()["lanes"]["normal"]
+        assert normal["depth"] == 3 and normal["dropped"] == 7, normal
+        assert [e.data for e, _ in bus.executor.partitions[0].lanes[1].items] == [7, 8, 9]
+
+        # block: slow handler, producer waits then drops after block_timeout
+        gate = threading.Event()
+        bus = EventBus(workers=1, capacity=2, block_timeout=0.05)
+        bus.subscribe("tick", lambda e: gate.wait(2))
+        bus.start()
+        handlers = bus.subscribers["tick"]
+        accepted = sum(1 for i in range(10) if bus.executor.push(Event("tick", i, handlers)))
+        stats = bus.get_stats()
+        gate.set()
+        bus.stop()
+        normal = stats["lanes"]["normal"]
+        assert normal["blocked"] > 0 and normal["dropped"] > 0, normal
+        assert normal["high_water"] <= 2
+        assert accepted == 10 - normal["dropped"]
+
+        # the block timeout is a validated config key (seconds, ints accepted)
+        from system.core.validators import ConfigValidationError, ConfigValidator
+        base = {"name": "Jarvis", "version": "0.0.4"}
+        assert ConfigValidator.validate(base)["event_block_timeout"] == 1.0
+        assert ConfigValidator.validate({**base, "event_block_timeout": 2})["event_block_timeout"] == 2.0
+        for bad in (-0.5, 120, "1"):
+            try:
+                ConfigValidator.validate({**base, "event_block_timeout": bad})
+                assert False, f"{bad!r} must be rejected"
+            except ConfigValidationError:
+                pass
+
+        # overflow policies are checked per lane when the config loads, not when a lane fills up
+        overflow = {"low": "coalesce", "normal": "drop_oldest"}
+        assert ConfigValidator.validate({**base, "event_overflow": overflow})["event_overflow"] == overflow
+        for bad in ({"low": "coalese"}, {"lwo": "block"}):
+            try:
+                ConfigValidator.validate({**base, "event_overflow": bad})
+                assert False, f"{bad!r} must be rejected"
+            except ConfigValidationError:
+                pass
+
+        print("  ✅ Overflow policies OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Overflow policies failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_response_latency_under_telemetry_flood():
+    """jarvis.response is handled promptly while telemetry floods a slow handler"""
+    print("🧪 Testing response latency under load...")
+    try:
+        from core.lifecycle.runtime import EventBus
+
+        handled = threading.Event()
+        bus = EventBus(workers=2, capacity=100)
+        bus.subscribe("nlu.entities.detected", lambda e: time.sleep(0.01))
+        bus.subscribe("jarvis.response", lambda e: handled.set())
+        bus.start()
+        for i in range(5000):
+            bus.emit("nlu.entities.detected", i)
+        t0 = time.perf_counter()
+        bus.emit("jarvis.response", {"text": "ok"})
+        assert handled.wait(1.0)
+        latency_ms = (time.perf_counter() - t0) * 1000
+        stats = bus.get_stats()
+        bus.stop()
+
+        assert stats["lanes"]["low"]["high_water"] <= 100
+        assert latency_ms < 200, latency_ms
+
+        print(f"  ✅ Response latency OK ({latency_ms:.1f}ms, low lane depth {stats['lanes']['low']['depth']})")
+        return True
+    except Exception as e:
+        print(f"  ❌ Response latency failed: {e}")
+        return False
+
+
+def test_session_ordering_and_throughput():
+    """Per-session order holds at 1, 4 and 16 sessions; sessions run in parallel"""
+    print("🧪 Testing per-session ordered delivery...")
+    try:
+        from core.lifecycle.runtime.benchmark import run_session_throughput
+
+        results = {n: run_session_throughput(n, commands_per_session=20) for n in (1, 4, 16)}
+        for n, r in results.items():
+            print(f"     {n:>2} sessions: {r['commands_per_sec']:.0f} commands/s")
+            assert r["commands"] == n * 20, r
+            assert r["order_violations"] == 0, r
+        assert results[16]["commands_per_sec"] > 2 * results[1]["commands_per_sec"]
+
+        print("  ✅ Ordered delivery OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Ordered delivery failed: {e}")
+        return False
+
+
+def test_key_inheritance():
+    """Events emitted inside a handler inherit its session key"""
+    print("🧪 Testing key inheritance...")
+    try:
+        from core.lifecycle.runtime import EventBus
+
+        keys = []
+        bus = EventBus(workers=4)
+        bus.subscribe("nlu.intent", lambda e: bus.emit("jarvis.response", {"text": "ok"}))
+        bus.subscribe("jarvis.response", lambda e: keys.append(e.key))
+        bus.start()
+        bus.emit("nlu.intent", {"session_id": "abc"})
+        bus.emit("nlu.intent", {}, key="xyz")
+        assert _wait(lambda: len(keys) == 2)
+        bus.stop()
+
+        assert sorted(keys) == ["abc", "xyz"], keys
+
+        print("  ✅ Key inheritance OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Key inheritance failed: {e}")
+        return False
+
+
+def test_async_bus_handlers():
+    """AsyncEventBus runs async handlers on its loop and offloads sync ones"""
+    print("🧪 Testing AsyncEventBus handlers...")
+    try:
+        from core.lifecycle.runtime import AsyncEventBus
+
+        seen = []
+        loop_threads, sync_threads = set(), set()
+
+        async def async_handler(event):
+            loop_threads.add(threading.current_thread().name)
+            seen.append(("async", event.data["n"]))
+
+        def sync_handler(event):
+            sync_threads.add(threading.current_thread().name)
+            seen.append(("sync", event.data["n"]))
+
+        bus = AsyncEventBus(workers=2)
+        bus.subscribe("nlu.intent", async_handler)
+        bus.subscribe("nlu.intent", sync_handler)
+        bus.emit("nlu.intent", {"n": 0})  # buffered until start()
+        bus.start()
+        bus.emit("nlu.intent", {"n": 1})
+        assert _wait(lambda: len(seen) == 4), seen
+        bus.stop()
+
+        assert loop_threads == {"AsyncEventBus"}, loop_threads
+        assert all(name.startswith("AsyncEventSync") for name in sync_threads), sync_threads
+        stats = bus.get_stats()
+        assert stats["backend"] == "asyncio" and stats["completed"] == 2, stats
+
+        print("  ✅ AsyncEventBus handlers OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ AsyncEventBus handlers failed: {e}")
+        return False
+
+
+def test_async_bus_ordering_and_inheritance():
+    """Per-session order and key inheritance hold on the asyncio backend"""
+    print("🧪 Testing AsyncEventBus ordering...")
+    try:
+        import asyncio
+        import random
+        from core.lifecycle.runtime import AsyncEventBus
+
+        bus = AsyncEventBus(workers=4)
+        last_seen, violations, keys = {}, [0], []
+
+        async def handle_intent(event):
+            await asyncio.sleep(random.random() * 0.005)
+            bus.emit("jarvis.response", {"seq": event.data["seq"]})
+
+        def handle_response(event):
+            if event.data["seq"] <= last_seen.get(event.key, -1):
+                violations[0] += 1
+            last_seen[event.key] = event.data["seq"]
+            keys.append(event.key)
+
+        bus.subscribe("nlu.intent", handle_intent)
+        bus.subscribe("jarvis.response", handle_response)
+        bus.start()
+        for seq in range(30):
+            for s in range(4):
+                bus.emit("nlu.intent", {"seq": seq, "session_id": f"s{s}"})
+        assert _wait(lambda: len(keys) == 120, timeout=5.0), len(keys)
+        bus.stop()
+
+        assert violations[0] == 0, violations
+        assert set(keys) == {"s0", "s1", "s2", "s3"}, set(keys)
+
+        print("  ✅ AsyncEventBus ordering OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ AsyncEventBus ordering failed: {e}")
+        return False
+
+
+def test_async_bus_concurrency():
+    """Hundreds of concurrent I/O-bound handlers with a handful of threads"""
+    print("🧪 Testing AsyncEventBus concurrency...")
+    try:
+        import asyncio
+        from core.lifecycle.runtime import AsyncEventBus
+
+        done = []
+        peak_threads = [0]
+
+        async def io_handler(event):
+            await asyncio.sleep(0.2)
+            peak_threads[0] = max(peak_threads[0], threading.active_count())
+            done.append(event.data["i"])
+
+        bus = AsyncEventBus(workers=4, max_concurrency=512)
+        bus.subscribe("skill.request", io_handler)
+        bus.start()
+        start = time.perf_counter()
+        for i in range(300):
+            bus.emit("skill.request", {"i": i, "session_id": f"client-{i}"})
+        assert _wait(lambda: len(done) == 300, timeout=5.0), len(done)
+        elapsed = time.perf_counter() - start
+        bus.stop()
+
+        print(f"     300 requests x 200ms in {elapsed:.2f}s, peak threads {peak_threads[0]}")
+        assert elapsed < 1.5, elapsed
+        assert peak_threads[0] <= 10, peak_threads
+
+        print("  ✅ AsyncEventBus concurrency OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ AsyncEventBus concurrency failed: {e}")
+        return False
+
+
+def test_threaded_bus_runs_coroutine_handlers():
+    """The threaded EventBus still completes `async def` handlers"""
+    print("🧪 Testing coroutine handlers on the threaded bus...")
+    try:
+        import asyncio
+        from core.lifecycle.runtime import EventBus
+
+        seen = []
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            seen.append(event.data)
+
+        bus = EventBus(workers=2)
+        bus.subscribe("nlu.intent", handler)
+        bus.start()
+        bus.emit("nlu.intent", {"x": 1})
+        assert _wait(lambda: seen == [{"x": 1}]), seen
+        bus.stop()
+
+        print("  ✅ Coroutine handlers OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Coroutine handlers failed: {e}")
+        return False
+
+
+def test_request_futures():
+    """request() resolves with the chain's jarvis.response, times out, fails fast"""
+    print("🧪 Testing request/response futures...")
+    try:
+        import asyncio
+        from core.lifecycle.runtime import EventBus, AsyncEventBus
+
+        for factory in (EventBus, AsyncEventBus):
+            bus = factory(workers=4)
+            bus.subscribe("input.text", lambda e: bus.emit("nlu.intent", {"text": e.data["text"]}))
+            bus.subscribe("nlu.intent", lambda e: bus.emit("jarvis.response", {"text": e.data["text"].upper()}))
+            bus.subscribe("nlu.silent", lambda e: None)
+            bus.start()
+
+            # pipelined: many requests in flight, each gets its own answer
+            futures = [bus.request("input.text", {"text": f"cmd{i}", "session_id": f"s{i % 4}"}, timeout=2.0)
+                       for i in range(200)]
+            answers = [f.result(timeout=3.0)["text"] for f in futures]
+            assert answers == [f"CMD{i}" for i in range(200)], answers[:5]
+
+            answer = asyncio.run(bus.arequest("input.text", {"text": "async"}, timeout=2.0))
+            assert answer == {"text": "ASYNC"}, answer
+
+            start = time.perf_counter()
+            try:
+                bus.request("nlu.silent", {}, timeout=0.1).result(timeout=2.0)
+                raise AssertionError("expected TimeoutError")
+            except TimeoutError:
+                pass
+            assert time.perf_counter() - start < 1.0
+
+            try:
+                bus.request("nobody.listens", {}).result(timeout=0.5)
+                raise AssertionError("expected LookupError")
+            except LookupError:
+                pass
+
+            assert _wait(lambda: bus.get_stats()["open_requests"] == 0)
+            stats = bus.get_stats()
+            bus.stop()
+            assert stats["requests"] == 203 and stats["request_timeouts"] == 1, stats
+
+        print("  ✅ Request futures OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Request futures failed: {e!r}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [
+        test_zero_subscriber_fast_path(),
+        test_event_dict_compat(),
+        test_copy_on_write_subscriptions(),
+        test_priority_lanes(),
+        test_overflow_policies(),
+        test_response_latency_under_telemetry_flood(),
+        test_session_ordering_and_throughput(),
+        test_key_inheritance(),
+        test_async_bus_handlers(),
+        test_async_bus_ordering_and_inheritance(),
+        test_async_bus_concurrency(),
+        test_threaded_bus_runs_coroutine_handlers(),
+        test_request_futures(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Persistent job scheduler tests
+Cron expressions, SQLite job store, restart persistence, scale and process mode
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _wait(predicate, timeout=2.0):
+    end = time.time() + timeout
+    while time.time() < end:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_cron_expressions():
+    """next_after() matches cron semantics"""
+    print("🧪 Testing cron expressions...")
+    try:
+        from scheduler.cron import CronExpression, is_valid
+
+        base = datetime(2026, 1, 30, 10, 17)  # Friday
+        cases = {
+            "*/15 * * * *": datetime(2026, 1, 30, 10, 30),
+            "0 9 * * mon-fri": datetime(2026, 2, 2, 9, 0),
+            "30 8 1 * *": datetime(2026, 2, 1, 8, 30),
+            "0 0 29 2 *": datetime(2028, 2, 29, 0, 0),
+            "@hourly": datetime(2026, 1, 30, 11, 0),
+            "0 12 13 * 5": datetime(2026, 1, 30, 12, 0),  # dom OR dow
+            "5/20 10 * * *": datetime(2026, 1, 30, 10, 25),
+            "0 0 * * 7": datetime(2026, 2, 1, 0, 0),
+        }
+        for expr, expected in cases.items():
+            got = CronExpression(expr).next_after(base)
+            assert got == expected, (expr, got, expected)
+
+        for bad in ("* * * *", "60 * * * *", "* * * foo *", "*/0 * * * *"):
+            assert not is_valid(bad), bad
+
+        print("  ✅ Cron expressions OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Cron expressions failed: {e}")
+        return False
+
+
+def test_store_uses_next_run_index():
+    """Due queries read the next_run index head, not the whole table"""
+    print("🧪 Testing job store index...")
+    try:
+        from scheduler.queue import Job, JobStore, TRIGGER_INTERVAL
+
+        store = JobStore(":memory:")
+        now = time.time()
+        store.add_many(
+            Job(f"job-{i}", "time:time", TRIGGER_INTERVAL, "60.0", now + 10 + i % 3600)
+            for i in range(50_000)
+        )
+        store.add(Job("due-1", "time:time", TRIGGER_INTERVAL, "60.0", now - 1))
+
+        plan = " ".join(str(row) for row in store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM jobs "
+            "WHERE next_run IS NOT NULL AND next_run <= ? ORDER BY next_run LIMIT 500", (now,)
+        ))
+        assert "idx_jobs_next_run" in plan, plan
+
+        start = time.perf_counter()
+        for _ in range(100):
+            due = store.due(now, 500)
+            head = store.next_run_time()
+        per_tick_ms = (time.perf_counter() - start) * 10
+        assert [j.id for j in due] == ["due-1"] and head == now - 1
+        assert per_tick_ms < 5, per_tick_ms
+        assert store.count() == 50_001
+
+        print(f"  ✅ Job store index OK (50k jobs, {per_tick_ms:.3f}ms per tick)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Job store index failed: {e}")
+        return False
+
+
+def test_jobs_survive_restart():
+    """Jobs and their schedule position persist across worker restarts"""
+    print("🧪 Testing persistence across restarts...")
+    try:
+        from scheduler.queue import JobStore
+        from scheduler.worker import JobWorker
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "jobs.db")
+
+            worker = JobWorker(JobStore(path))
+            worker.add_cron("nightly", "0 3 * * *", "time:time")
+            job = worker.add_interval("tick", 0.05, "time:time", first_run=0)
+            worker.start()
+            assert _wait(lambda: worker.completed >= 3)
+            worker.stop()
+            worker.store.close()
+
+            store = JobStore(path)
+            assert store.count() == 2
+            tick = store.get("tick")
+            assert tick.runs >= 3, tick
+            nightly = store.get("nightly")
+            assert datetime.fromtimestamp(nightly.next_run).hour == 3, nightly
+
+            # re-registering at boot keeps position and counters
+            worker = JobWorker(store)
+            again = worker.add_interval("tick", 0.05, "time:time", first_run=0)
+            assert again.runs == tick.runs and again.next_run == tick.next_run, (again, tick)
+            store.close()
+
+        print("  ✅ Persistence OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Persistence failed: {e}")
+        return False
+
+
+def test_wakes_for_sooner_job_and_misfire():
+    """Adding a sooner job wakes the loop; runs later than the grace are skipped"""
+    print("🧪 Testing wake-up and misfire grace...")
+    try:
+        from scheduler.queue import Job, JobStore, TRIGGER_DATE
+        from scheduler.worker import JobWorker
+
+        worker = JobWorker(JobStore(":memory:"), poll_interval=30)
+        worker.add_cron("hourly", "@hourly", "time:time")
+        worker.start()
+        time.sleep(0.05)
+
+        fired = []
+        worker.add_listener(lambda job_id, result, error: fired.append((job_id, time.time())))
+        start = time.time()
+        worker.add_date("soon", start + 0.05, "time:time")
+        stale = time.time() - 120
+        worker.add_jobs([Job("stale", "time:time", TRIGGER_DATE, repr(stale), stale, misfire_grace=60)])
+        assert _wait(lambda: any(j == "soon" for j, _ in fired))
+        time.sleep(0.05)
+        worker.stop()
+
+        fired_at = dict(fired)
+        assert fired_at["soon"] - start < 0.2, fired_at["soon"] - start
+        assert "stale" not in fired_at and worker.misfired == 1, worker.get_stats()
+        assert worker.store.get("soon").next_run is None
+
+        print(f"  ✅ Wake-up OK ({(fired_at['soon'] - start) * 1000:.0f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Wake-up/misfire failed: {e}")
+        return False
+
+
+def test_process_executor():
+    """executor='process' runs the job in a worker process"""
+    print("🧪 Testing process executor...")
+    try:
+        from scheduler.queue import JobStore
+        from scheduler.worker import JobWorker
+
+        results = {}
+        done = threading.Event()
+
+        def listener(job_id, result, error):
+            results[job_id] = (result, error)
+            if len(results) == 2:
+                done.set()
+
+        worker = JobWorker(JobStore(":memory:"), process_workers=1)
+        worker.add_listener(listener)
+        worker.add_date("in-process", time.time(), "os:getpid", executor="process")
+        worker.add_date("in-thread", time.time(), "os:getpid")
+        worker.start()
+        assert done.wait(20), results
+        worker.stop()
+
+        assert results["in-thread"] == (os.getpid(), None), results
+        assert results["in-process"][1] is None and results["in-process"][0] != os.getpid(), results
+
+        print("  ✅ Process executor OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Process executor failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [
+        test_cron_expressions(),
+        test_store_uses_next_run_index(),
+        test_jobs_survive_restart(),
+        test_wakes_for_sooner_job_and_misfire(),
+        test_process_executor(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Latency histogram tests
+Percentile accuracy, concurrent recording, dispatcher/NLU integration,
+--status / --latency output and the saved metrics file
+"""
+
+import os
+import sys
+import json
+import random
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _exact(values, p):
+    values = sorted(values)
+    return values[max(0, -(-len(values) * p // 100) - 1)]
+
+
+def test_percentile_accuracy():
+    """p50/p90/p99/max stay within the bucket error of the exact values"""
+    print("🧪 Testing histogram accuracy...")
+    try:
+        from monitoring.metrics import LatencyHistogram
+
+        rng = random.Random(3)
+        hist = LatencyHistogram("test")
+        values = [rng.lognormvariate(1.5, 1.2) for _ in range(50_000)] + [4_000.0]
+        for v in values:
+            hist.record(v)
+
+        snap = hist.snapshot()
+        assert snap["count"] == len(values)
+        assert abs(snap["mean_ms"] - sum(values) / len(values)) < 0.01
+        for p in (50, 90, 99):
+            exact = _exact(values, p)
+            assert abs(snap[f"p{p}_ms"] - exact) / exact < 0.035, (p, snap[f"p{p}_ms"], exact)
+        assert abs(snap["max_ms"] - 4_000.0) < 0.001, snap
+
+        hist.reset()
+        assert hist.snapshot() == {"count": 0, "mean_ms": 0.0, "p50_ms": 0.0,
+                                   "p90_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+
+        print(f"  ✅ Accuracy OK (p99 {snap['p99_ms']:.2f}ms vs {_exact(values, 99):.2f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Accuracy failed: {e}")
+        return False
+
+
+def test_concurrent_recording():
+    """Per-thread shards lose no samples under contention"""
+    print("🧪 Testing concurrent recording...")
+    try:
+        from monitoring.metrics import HistogramRegistry
+
+        registry = HistogramRegistry()
+        start = threading.Barrier(8)
+
+        def worker(i):
+            start.wait()
+            for n in range(20_000):
+                registry.record("shared", (n % 100) / 10)
+                registry.record(f"own-{i}", 1.0)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        snap = registry.snapshot()
+        assert snap["shared"]["count"] == 160_000, snap["shared"]
+        assert all(snap[f"own-{i}"]["count"] == 20_000 for i in range(8))
+        assert abs(snap["shared"]["max_ms"] - 9.9) < 0.001
+
+        print("  ✅ Concurrent recording OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Concurrent recording failed: {e}")
+        return False
+
+
+def test_dispatcher_and_nlu_integration():
+    """Dispatcher and NLU stages feed histograms; --status and --latency show them"""
+    print("🧪 Testing dispatcher / NLU / commands integration...")
+    try:
+        from system.core.exceptions import SkillError  # noqa: F401 (package import order)
+        from skills.actions.dispatcher import SkillDispatcher
+        from brain.nlu.benchmark import build_pipeline
+        from system.core.special_commands import SpecialCommandsHandler
+        from skills.system.get_time import GetTimeSkill
+
+        class Sleepy:
+            def run(self, entities, core):
+                import time
+                time.sleep(entities.get("ms", 0) / 1000)
+                return {"success": True}
+
+        dispatcher = SkillDispatcher()
+        dispatcher.register("sleepy", Sleepy())
+        for ms in (1, 1, 1, 30):
+            dispatcher.dispatch("sleepy", {"ms": ms}, None)
+
+        perf = dispatcher.get_skill_performance("sleepy")
+        latency = perf["latency"]
+        assert latency["count"] == 4 and latency["max_ms"] >= 30, latency
+        assert 8 < perf["avg_time_ms"] < 20, perf  # true mean of ~1,1,1,30
+        assert latency["p50_ms"] < 10 <= latency["p99_ms"], latency
+
+        class Bus:
+            def emit(self, *args, **kwargs):
+                pass
+
+        nlu = build_pipeline({"get_time": GetTimeSkill})
+        for text in ("que hora es", "hora", "dime la hora por favor"):
+            nlu.process(text, Bus())
+        stages = nlu.latency.snapshot()
+        assert {"normalize", "entities", "intent", "total"} <= set(stages), stages
+        assert stages["total"]["count"] == 3
+
+        class Core:
+            def get_latency_report(self):
+                return {"skills": dispatcher.get_latency_report(), "nlu": nlu.latency.snapshot()}
+
+            def get_system_status(self):
+                return {"system": {}, "latency": self.get_latency_report()}
+
+            def reset_latency(self):
+                dispatcher.latency.reset()
+                nlu.latency.reset()
+
+        handler = SpecialCommandsHandler(Core())
+        status = handler.handle_command("--status")
+        assert "sleepy" in status and "p99" in status and "NLU" in status, status
+        report = handler.handle_command("--latency")
+        assert "total" in report and "sleepy" in report, report
+        handler.handle_command("--latency reset")
+        assert dispatcher.get_latency_report()["sleepy"]["count"] == 0
+        assert handler.handle_command("--latency") == "Sin mediciones de latencia todavía"
+        dispatcher.shutdown()
+
+        print("  ✅ Integration OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Integration failed: {e}")
+        return False
+
+
+def test_metrics_file_includes_latency():
+    """JarvisLogger.save_metrics writes registered providers (latency) to the metrics file"""
+    print("🧪 Testing metrics file...")
+    home = os.environ.get("HOME")
+    try:
+        from monitoring.metrics import HistogramRegistry
+        from skills.system.logging.manager import JarvisLogger
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ["HOME"] = tmp
+            os.makedirs(os.path.join(tmp, "Desktop"))
+            registry = HistogramRegistry()
+            registry.record("get_time", 2.5)
+
+            jl = JarvisLogger({})
+            jl.add_metrics_provider("latency", lambda: {"skills": registry.snapshot()})
+            jl.save_metrics()
+            files = [f for f in os.listdir(jl.logs_dir) if f.startswith("metrics_")]
+            with open(os.path.join(jl.logs_dir, files[0]), encoding="utf-8") as f:
+                saved = json.load(f)
+            assert saved["latency"]["skills"]["get_time"]["count"] == 1, saved
+            for handler in list(jl.logger.handlers):
+                jl.logger.removeHandler(handler)
+                handler.close()
+
+        print("  ✅ Metrics file OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Metrics file failed: {e}")
+        return False
+    finally:
+        if home is not None:
+            os.environ["HOME"] = home
+
+
+if __name__ == "__main__":
+    results = [
+        test_percentile_accuracy(),
+        test_concurrent_recording(),
+        test_dispatcher_and_nlu_integration(),
+        test_metrics_file_includes_latency(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Log index tests
+Sidecar offset index over the JSONL audit logs: built incrementally, reused
+across restarts, follows rotation/gzip, and answers queries (failures of an
+intent in a time range, latency per skill) parsing only the matching lines
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _CountingLoads:
+    """Counts JSON log lines parsed (bytes passed to json.loads; the sidecar metadata is str)"""
+
+    def __init__(self, module):
+        self.module = module
+        self.calls = 0
+
+    def __enter__(self):
+        self.original = self.module.json.loads
+
+        def loads(data, *args, **kwargs):
+            if isinstance(data, (bytes, bytearray)):
+                self.calls += 1
+            return self.original(data, *args, **kwargs)
+
+        self.module.json.loads = loads
+        return self
+
+    def __exit__(self, *exc):
+        self.module.json.loads = self.original
+
+
+def _command(ts, intent, success, i=0):
+    return {"timestamp": ts.isoformat(), "command": f"cmd {i}", "intent": intent,
+            "entities": {}, "success": success}
+
+
+def _write(path, entries, mode="a"):
+    with open(path, mode, encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def test_query_parses_only_matches():
+    """Queries answer from the index; read() parses only the selected lines (via mmap)"""
+    print("🧪 Testing indexed queries...")
+    try:
+        from skills.system.logging import log_index
+        from skills.system.logging.log_index import LogIndex
+
+        with tempfile.TemporaryDirectory() as tmp:
+            now = datetime.now()
+            entries = [_command(now - timedelta(days=10 - i / 100), "open_app" if i % 3 else "get_time",
+                                i % 7 != 0, i) for i in range(1000)]
+            _write(os.path.join(tmp, "commands_history.jsonl"), entries)
+
+            index = LogIndex(tmp, "commands_history")
+            assert index.refresh() == 1000
+            with _CountingLoads(log_index) as loads:
+                rows = index.query(intent="open_app", success=False, since=now - timedelta(days=7))
+                assert loads.calls == 0  # the index answers without touching the JSON
+                records = index.read(rows)
+                assert loads.calls == len(rows)
+
+            expected = [e for e in entries if e["intent"] == "open_app" and not e["success"]
+                        and datetime.fromisoformat(e["timestamp"]) >= now - timedelta(days=7)]
+            assert records == expected and len(rows) > 10, (len(rows), len(expected))
+            assert all(row.intent == "open_app" and row.success is False for row in rows)
+            assert index.query(intent="missing") == []
+            assert [row.ts for row in index.query(limit=5)] == [row.ts for row in index.query()[-5:]]
+            assert sum(index.counts().values()) == 1000
+
+        print(f"  ✅ Indexed queries OK ({len(rows)} rows, parsed only those)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Indexed queries failed: {e}")
+        return False
+
+
+def test_incremental_and_sidecar_reuse():
+    """New lines are indexed incrementally, partial lines wait, and a restart reuses the sidecar"""
+    print("🧪 Testing incremental index...")
+    try:
+        from skills.system.logging import log_index
+        from skills.system.logging.log_index import LogIndex
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "commands_history.jsonl")
+            now = datetime.now()
+            _write(path, [_command(now, "a", True, i) for i in range(100)])
+            index = LogIndex(tmp, "commands_history")
+            assert index.refresh() == 100
+
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(_command(now, "b", False)) + "\n")
+                f.write('{"timestamp": "%s", "intent": "part' % now.isoformat())  # writer mid-line
+            with _CountingLoads(log_index) as loads:
+                assert index.refresh() == 1 and loads.calls == 1  # only the new complete line
+            with open(path, "a", encoding="utf-8") as f:
+                f.write('ial", "success": true}\n')
+            assert index.refresh() == 1
+            assert [row.intent for row in index.query()[-2:]] == ["b", "partial"]
+
+            with _CountingLoads(log_index) as loads:
+                reopened = LogIndex(tmp, "commands_history")
+                assert reopened.refresh() == 0 and loads.calls == 0  # sidecar loaded, nothing re-parsed
+            assert reopened.get_stats()["rows"] == 102
+            assert os.path.isdir(os.path.join(tmp, ".index"))
+
+        print("  ✅ Incremental index OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Incremental index failed: {e}")
+        return False
+
+
+def test_rotation_and_gzip_segments():
+    """Rotated (gzipped) segments stay queryable; the new active file is indexed from scratch"""
+    print("🧪 Testing rotated segments...")
+    try:
+        from skills.system.logging.audit_writer import AuditWriter
+        from skills.system.logging.log_index import LogIndex
+
+        with tempfile.TemporaryDirectory() as tmp:
+            day = [date(2026, 10, 17)]
+            writer = AuditWriter(tmp, today=lambda: day[0])
+            index = LogIndex(tmp, "skills_execution")
+            for d in range(3):
+                day[0] = date(2026, 10, 17 + d)
+                for i in range(50):
+                    writer.write("skills_execution", {
+                        "timestamp": datetime(2026, 10, 17 + d, 12, 0, i).isoformat(),
+                        "skill": "get_time" if i % 2 else "search_web",
+                        "duration_ms": 10.0 * (d + 1) if i % 2 else 500.0,
+                        "result": {"success": i % 10 != 0},
+                    })
+                writer.flush()
+                index.refresh()
+            writer.close()
+
+            assert index.get_stats()["segments"] == 3 and index.get_stats()["rows"] == 150, index.get_stats()
+            old = index.query(intent="search_web", success=False, until=datetime(2026, 10, 18))
+            assert [entry["result"]["success"] for entry in index.read(old)] == [False] * 5
+            assert old[0].segment == "skills_execution.2026-10-17.jsonl.gz"
+
+            latency = index.latency_distribution()
+            assert latency["get_time"]["count"] == 75 and latency["search_web"]["p50_ms"] > 400, latency
+            last_day = index.latency_distribution(since=datetime(2026, 10, 19))
+            assert 29 < last_day["get_time"]["p50_ms"] < 31, last_day
+            sidecars = os.listdir(os.path.join(tmp, ".index"))
+            assert len([n for n in sidecars if n.endswith(".idx")]) == 3, sidecars
+
+        print("  ✅ Rotated segments OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Rotated segments failed: {e}")
+        return False
+
+
+def test_months_of_logs_in_milliseconds():
+    """Over ~90 daily segments (270k lines), a week's failures of one intent come back in milliseconds"""
+    print("🧪 Testing query speed over months of logs...")
+    try:
+        from skills.system.logging.log_index import LogIndex
+
+        with tempfile.TemporaryDirectory() as tmp:
+            start_day = datetime(2026, 7, 1)
+            intents = ["open_app", "get_time", "search_web", "system_status", "reminder"]
+            for d in range(90):
+                day = start_day + timedelta(days=d)
+                name = f"commands_history.{day.date().isoformat()}.jsonl" if d < 89 else "commands_history.jsonl"
+                _write(os.path.join(tmp, name), [
+                    _command(day + timedelta(seconds=i * 28), intents[i % 5], i % 11 != 0, i)
+                    for i in range(3000)], mode="w")
+
+            build = time.perf_counter()
+            LogIndex(tmp, "commands_history").refresh()
+            build_s = time.perf_counter() - build
+
+            index = LogIndex(tmp, "commands_history")  # a restart: loads the sidecars
+            load = time.perf_counter()
+            index.refresh()
+            load_ms = (time.perf_counter() - load) * 1000
+
+            week = (start_day + timedelta(days=82), start_day + timedelta(days=89))
+            query = time.perf_counter()
+            rows = index.query(intent="search_web", success=False, since=week[0], until=week[1])
+            entries = index.read(rows)
+            query_ms = (time.perf_counter() - query) * 1000
+            assert len(entries) == 7 * 55 and all(e["intent"] == "search_web" for e in entries), len(entries)
+            assert query_ms < 50, query_ms
+
+        print(f"  ✅ Query speed OK (index built in {build_s:.1f}s, reloaded in {load_ms:.0f}ms, "
+              f"week query {query_ms:.1f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Query speed failed: {e}")
+        return False
+
+
+def test_learning_engine_uses_index():
+    """LearningEngineSkill's error and performance analysis read the indexed logs"""
+    print("🧪 Testing LearningEngineSkill analysis...")
+    home = os.environ.get("HOME")
+    try:
+        import logging
+        from skills.learning.learning_engine import LearningEngineSkill
+        from skills.system.logging.manager import JarvisLogger
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ["HOME"] = tmp
+            os.makedirs(os.path.join(tmp, "Desktop"))
+            jl = JarvisLogger({})
+            jl.logger.disabled = True
+            for i in range(20):
+                jl.log_command(f"abrí {i}", "open_app", {}, i % 4 != 0)
+                jl.log_skill_execution("open_app", {"success": i % 4 != 0}, 0.05)
+            jl.log_command("hora", "get_time", {}, True)
+            jl.log_skill_execution("get_time", {"success": True}, 0.001)
+
+            class Core:
+                logger = jl
+                skill_dispatcher = type("D", (), {"skills": {"open_app": 1, "get_time": 2}})()
+
+            skill = LearningEngineSkill()
+            errors = skill._analyze_errors(Core())
+            performance = skill._analyze_performance(Core())
+            usage = skill._analyze_skill_usage(Core())
+            assert errors["total_errors"] == 5 and errors["error_types"] == {"open_app": 5}, errors
+            assert abs(performance["success_rate"] - 16 / 21) < 1e-9, performance
+            assert performance["latency_by_skill"]["open_app"]["count"] == 20
+            assert usage["usage_last_week"] == {"open_app": 20, "get_time": 1}, usage
+            jl.close()
+            jl.logger.disabled = False
+            logging.getLogger("Jarvis").handlers.clear()
+
+        print("  ✅ LearningEngineSkill OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ LearningEngineSkill failed: {e}")
+        return False
+    finally:
+        if home is not None:
+            os.environ["HOME"] = home
+
+
+if __name__ == "__main__":
+    results = [
+        test_query_parses_only_matches(),
+        test_incremental_and_sidecar_reuse(),
+        test_rotation_and_gzip_segments(),
+        test_months_of_logs_in_milliseconds(),
+        test_learning_engine_uses_index(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+NLU benchmark harness test
+Checks corpus loading, per-stage report and the accuracy regression gate
+"""
+
+import os
+import sys
+import json
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_corpus_and_report():
+    """Corpus is seeded from soft phrases, patterns and history; report has all stages"""
+    print("🧪 Testing NLU benchmark report...")
+    try:
+        from brain.nlu.benchmark import build_pipeline, load_corpus, NLUBenchmark, STAGES
+
+        pipeline = build_pipeline()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            history = os.path.join(tmp, "commands_history.jsonl")
+            with open(history, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"command": "abre spotify", "intent": "open_app"}) + "\n")
+                f.write(json.dumps({"command": "xyz", "intent": "unknown"}) + "\n")
+                f.write("not json\n")
+            corpus = load_corpus(pipeline.skills_registry, history)
+
+        sources = {source for _, _, source in corpus}
+        assert {"soft_phrases", "patterns", "history"} <= sources, sources
+        assert not any(text == "xyz" for text, _, _ in corpus)
+
+        report = NLUBenchmark(pipeline, corpus[:40]).run(repeat=1, warmup=0)
+        assert report["corpus_size"] == 40
+        for stage in STAGES:
+            s = report["stages"][stage]
+            assert s["count"] == 40
+            assert s["p50_ms"] <= s["p95_ms"] <= s["p99_ms"] <= s["max_ms"]
+        assert 0.0 <= report["accuracy"] <= 1.0
+
+        print(f"  ✅ Report OK (accuracy {report['accuracy']:.1%})")
+        return True
+    except Exception as e:
+        print(f"  ❌ Report failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_regression_gate():
+    """check_regression flags accuracy drops, overall and per intent"""
+    print("🧪 Testing accuracy regression gate...")
+    try:
+        from brain.nlu.benchmark import check_regression
+
+        baseline = {"accuracy": 0.9, "accuracy_by_intent": {"get_time": {"accuracy": 1.0}}}
+        same = {"accuracy": 0.9, "accuracy_by_intent": {"get_time": {"accuracy": 1.0}}}
+        worse = {"accuracy": 0.8, "accuracy_by_intent": {"get_time": {"accuracy": 0.5}}}
+
+        assert check_regression(baseline, same) == []
+        assert len(check_regression(baseline, worse)) == 2
+        assert check_regression(baseline, worse, tolerance=0.6) == []
+
+        print("  ✅ Regression gate OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Regression gate failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [test_corpus_and_report(), test_regression_gate()]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Speculative execution tests
+ParallelExecutor runs only read-only alternatives, cancels losers once the
+winner is known, honours one overall deadline and defers side-effecting
+alternatives to the user
+"""
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _setup(timeout=2.0, **skills):
+    from system.core.exceptions import SkillError  # noqa: F401 (package import order)
+    from skills.actions.dispatcher import SkillDispatcher
+    from system.core.parallel_executor import ParallelExecutor
+
+    dispatcher = SkillDispatcher(max_workers=8)
+    for intent, skill in skills.items():
+        dispatcher.register(intent, skill)
+    return dispatcher, ParallelExecutor(dispatcher, timeout_seconds=timeout, max_workers=3)
+
+
+class _Quiet:
+    def info(self, msg):
+        pass
+
+    debug = warning = error = info
+
+
+def _skill(success=True, delay=0.0, side_effects=True, calls=None, cancelled=None):
+    class Skill:
+        def run(self, entities, core, cancel_token=None):
+            if calls is not None:
+                calls.append(type(self).__name__)
+            if cancel_token is not None and cancel_token.wait(delay):
+                if cancelled is not None:
+                    cancelled.append(cancel_token.reason)
+                return {"success": False, "error": "cancelled"}
+            return {"success": success}
+
+    Skill.side_effects = side_effects
+    return Skill
+
+
+def test_side_effects_deferred():
+    """Side-effecting alternatives never run on a guess; they come back for confirmation"""
+    print("🧪 Testing deferred side-effecting alternatives...")
+    try:
+        calls = []
+        dispatcher, executor = _setup(
+            search=_skill(success=False, side_effects=False, calls=calls),
+            open_app=_skill(calls=calls),
+            create_note=_skill(calls=calls),
+        )
+        dispatcher.logger = executor.logger = _Quiet()
+        result = executor.attempt_alternatives("search", [("open_app", 0.5), ("create_note", 0.4)], {}, None)
+
+        assert calls == ["Skill"], calls  # only the (read-only) primary ran
+        assert not result["success"]
+        assert [d["intent"] for d in result["deferred_alternatives"]] == ["open_app", "create_note"]
+        assert executor.get_stats()["deferred"] == 2 and executor.get_stats()["speculative_runs"] == 0
+
+        from system.core.handlers import EventHandlers
+        hint = EventHandlers._deferred_hint(result)
+        assert "'open_app' o 'create_note'" in hint and "'sí' para ejecutar 'open_app'" in hint, hint
+
+        # the top deferred alternative waits for a "sí" on the session's next command only
+        handlers = EventHandlers(None)
+        handlers._remember_deferred(result, {"app": ["chrome"]}, "s1")
+        confirmed = handlers._take_confirmation("¡Sí!", "s1")
+        assert confirmed["intent"] == "open_app" and confirmed["entities"] == {"app": ["chrome"]}
+        assert handlers._take_confirmation("sí", "s1") is None  # consumed
+        handlers._remember_deferred(result, {}, "s1")
+        assert handlers._take_confirmation("no", "s1") == "declined"
+        handlers._remember_deferred(result, {}, "s1")
+        assert handlers._take_confirmation("qué hora es", "s1") is None
+        assert handlers._take_confirmation("sí", "s1") is None  # another command dropped it
+        handlers._remember_deferred(result, {}, "s1")
+        assert handlers._take_confirmation("sí", "s2") is None  # other session: s1's stays pending
+        assert handlers._take_confirmation("sí", "s1")["intent"] == "open_app"
+
+        # concurrent sessions keep their own pending alternative
+        handlers._remember_deferred(result, {"app": ["chrome"]}, "s1")
+        handlers._remember_deferred(dict(result, deferred_alternatives=[{"intent": "create_note"}]), {}, "s2")
+        assert handlers._take_confirmation("qué hora es", "s3") is None
+        assert handlers._take_confirmation("dale", "s2")["intent"] == "create_note"
+        assert handlers._take_confirmation("sí", "s1")["entities"] == {"app": ["chrome"]}
+        handlers._remember_deferred({"success": True, "deferred_alternatives": [{"intent": "x"}]}, {}, "s1")
+        assert handlers._pending_confirmations == {}  # only failed dispatches offer alternatives
+        executor.shutdown()
+        dispatcher.shutdown()
+
+        print("  ✅ Deferred alternatives OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Deferred alternatives failed: {e}")
+        return False
+
+
+def test_winner_cancels_losers():
+    """A successful primary returns at once; the slow read-only alternative is cancelled"""
+    print("🧪 Testing first-success cancellation...")
+    try:
+        cancelled = []
+        dispatcher, executor = _setup(
+            primary=_skill(delay=0.05),
+            slow_alt=_skill(delay=1.5, side_effects=False, cancelled=cancelled),
+            good_alt=_skill(delay=0.01, side_effects=False),
+        )
+        dispatcher.logger = executor.logger = _Quiet()
+
+        start = time.perf_counter()
+        result = executor.attempt_alternatives("primary", [("slow_alt", 0.6), ("good_alt", 0.5)], {}, None)
+        elapsed = time.perf_counter() - start
+        assert result["intent"] == "primary" and result["success"], result  # rank beats speed
+        assert elapsed < 0.5, elapsed
+        time.sleep(0.1)
+        assert cancelled == ["speculation decided"], cancelled
+        assert executor.get_stats()["cancelled"] == 1
+
+        # primary fails -> the best-ranked read-only alternative that succeeds wins
+        dispatcher.register("primary", _skill(success=False, delay=0.02))
+        dispatcher.register("slow_alt", _skill(success=False, delay=0.05, side_effects=False))
+        result = executor.attempt_alternatives("primary", [("slow_alt", 0.6), ("good_alt", 0.5)], {}, None)
+        assert result["intent"] == "good_alt" and result["success"], result
+        assert executor.get_stats()["alternative_wins"] >= 1
+        executor.shutdown()
+        dispatcher.shutdown()
+
+        print(f"  ✅ First-success cancellation OK ({elapsed * 1000:.0f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ First-success cancellation failed: {e}")
+        return False
+
+
+def test_overall_deadline_and_child_tokens():
+    """One deadline bounds the whole attempt; a sibling's own timeout doesn't cancel the others"""
+    print("🧪 Testing overall deadline...")
+    try:
+        from skills.actions.dispatcher import CancelToken
+
+        cancelled = []
+        dispatcher, executor = _setup(
+            timeout=0.3,
+            hang=_skill(delay=5, side_effects=False, cancelled=cancelled),
+            hang_alt=_skill(delay=5, side_effects=False, cancelled=cancelled),
+        )
+        dispatcher.logger = executor.logger = _Quiet()
+
+        start = time.perf_counter()
+        result = executor.attempt_alternatives("hang", [("hang_alt", 0.5)], {}, None)
+        elapsed = time.perf_counter() - start
+        assert not result["success"] and 0.25 < elapsed < 0.8, (elapsed, result)
+        time.sleep(0.1)
+        assert sorted(cancelled) == ["deadline", "deadline"], cancelled
+        assert executor.get_stats()["deadline_hits"] == 1
+
+        parent = CancelToken(time.monotonic() + 10)
+        first, second = parent.child(time.monotonic() + 1), parent.child()
+        first.cancel("own timeout")
+        assert not parent.cancelled and not second.cancelled
+        assert second.deadline == parent.deadline and first.deadline < parent.deadline
+        parent.cancel("done")
+        assert second.cancelled and second.reason == "done"
+        assert parent.child().cancelled  # late children start cancelled
+        executor.shutdown()
+        dispatcher.shutdown()
+
+        print(f"  ✅ Overall deadline OK ({elapsed * 1000:.0f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Overall deadline failed: {e}")
+        return False
+
+
+def test_shared_bounded_pool():
+    """Concurrent low-confidence requests share max_workers speculative threads"""
+    print("🧪 Testing shared bounded pool...")
+    try:
+        dispatcher, executor = _setup(
+            a=_skill(delay=0.05, side_effects=False),
+            b=_skill(success=False, side_effects=False),
+        )
+        dispatcher.logger = executor.logger = _Quiet()
+        results = []
+
+        def request():
+            results.append(executor.attempt_alternatives("a", [("b", 0.5)], {}, None))
+
+        threads = [threading.Thread(target=request) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        speculative = [t for t in threading.enumerate() if t.name.startswith("Speculative")]
+        assert len(speculative) <= 3, len(speculative)
+        assert len(results) == 10 and all(r["success"] for r in results)
+        executor.shutdown()
+        dispatcher.shutdown()
+
+        print(f"  ✅ Shared pool OK ({len(speculative)} threads for 10 requests)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Shared pool failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [
+        test_side_effects_deferred(),
+        test_winner_cancels_losers(),
+        test_overall_deadline_and_child_tokens(),
+        test_shared_bounded_pool(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Predictive prefetch tests
+Next-action model (transition counts + fallback), warming only read-only
+cacheable skills within the budget, hit/waste accounting and --status
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _setup(budget_ms=250.0, **skills):
+    from system.core.exceptions import SkillError  # noqa: F401 (package import order)
+    from skills.actions.dispatcher import SkillDispatcher
+    from system.core.prefetcher import Prefetcher
+
+    dispatcher = SkillDispatcher(max_workers=4)
+    for intent, skill in skills.items():
+        dispatcher.register(intent, skill)
+    return dispatcher, Prefetcher(dispatcher, budget_ms=budget_ms)
+
+
+def _skill(delay=0.0, ttl=None, side_effects=True, calls=None, key=()):
+    class Skill:
+        def run(self, entities, core):
+            if calls is not None:
+                calls.append(entities)
+            time.sleep(delay)
+            return {"success": True, "at": time.monotonic()}
+
+    Skill.side_effects = side_effects
+    if ttl is not None:
+        Skill.cache_policy = {"ttl": ttl, "key": key}
+    return Skill
+
+
+def _run(dispatcher, prefetcher, intent, entities=None):
+    response = dispatcher.dispatch(intent, entities or {}, None)
+    prefetcher.after_command(intent, entities or {}, response)
+    time.sleep(0.05)  # let the worker warm the cache
+    return response
+
+
+def test_next_action_model():
+    """Transitions need min_support and a majority; otherwise the fallback answers"""
+    print("🧪 Testing next-action model...")
+    try:
+        from system.core.prefetcher import NextActionModel
+
+        model = NextActionModel(min_support=3, fallback=lambda recent: "from_fallback")
+        for intent in ["a", "b"] * 2:
+            model.observe(intent)
+        assert model.predict("a") == ("from_fallback", "fallback")  # a->b seen twice
+        model.observe("a")
+        model.observe("b")
+        assert model.predict("a") == ("b", "transitions")
+
+        seeded = NextActionModel(min_support=2)
+        seeded.seed(["x", "y", "x", "y", "x", "z"])
+        assert seeded.predict("x") == ("y", "transitions")
+        assert seeded.predict("y") == ("x", "transitions")
+        assert seeded.predict("z") == (None, "none")
+        assert seeded.top_transitions(1) == [("x", "y", 2)]
+
+        print("  ✅ Next-action model OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Next-action model failed: {e}")
+        return False
+
+
+def test_prefetch_hit_near_zero_latency():
+    """After a learned status -> report sequence, the second command is served from the warmed cache"""
+    print("🧪 Testing prefetch hits...")
+    try:
+        calls = []
+        dispatcher, prefetcher = _setup(
+            status=_skill(),
+            report=_skill(delay=0.1, ttl=30.0, side_effects=False, calls=calls),
+        )
+        for _ in range(3):
+            _run(dispatcher, prefetcher, "status")
+            dispatcher.invalidate_cache("report")
+            _run(dispatcher, prefetcher, "report")
+            dispatcher.invalidate_cache("report")
+
+        _run(dispatcher, prefetcher, "status")  # model now predicts report -> warmed
+        time.sleep(0.15)
+        assert prefetcher.get_stats()["prefetches"] == 1, prefetcher.get_stats()
+        assert len(calls) == 4
+
+        start = time.perf_counter()
+        response = _run(dispatcher, prefetcher, "report")
+        elapsed = (time.perf_counter() - start - 0.05) * 1000
+        assert response.get("cached") and elapsed < 20, (response, elapsed)
+
+        stats = prefetcher.get_stats()
+        assert stats["hits"] == 1 and stats["hit_rate"] == 1.0 and stats["saved_ms"] >= 90, stats
+        assert len(calls) == 4  # the real command didn't run the skill again
+        prefetcher.shutdown()
+        dispatcher.shutdown()
+
+        print(f"  ✅ Prefetch hit OK ({elapsed:.1f}ms for a 100ms skill)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Prefetch hits failed: {e}")
+        return False
+
+
+def test_only_read_only_cacheable_within_budget():
+    """Side-effecting, uncacheable and over-budget predictions are skipped"""
+    print("🧪 Testing prefetch eligibility and budget...")
+    try:
+        calls = {"effect": [], "plain": [], "cheap": []}
+        dispatcher, prefetcher = _setup(
+            budget_ms=30.0,
+            a=_skill(), b=_skill(), c=_skill(),
+            effect=_skill(calls=calls["effect"]),
+            plain=_skill(side_effects=False, calls=calls["plain"]),
+            cheap=_skill(delay=0.05, ttl=0.2, side_effects=False, calls=calls["cheap"]),
+        )
+        for before, target in (("a", "effect"), ("b", "plain")):
+            for _ in range(3):
+                _run(dispatcher, prefetcher, before)
+                _run(dispatcher, prefetcher, target)
+            _run(dispatcher, prefetcher, before)
+        skipped = prefetcher.get_stats()["skipped"]
+        assert skipped.get("side_effects") == 1 and skipped.get("not_cacheable") == 1, skipped
+        assert len(calls["effect"]) == 3 and len(calls["plain"]) == 3, calls
+
+        for _ in range(3):
+            _run(dispatcher, prefetcher, "c")
+            _run(dispatcher, prefetcher, "cheap")
+            time.sleep(0.25)
+        _run(dispatcher, prefetcher, "c")  # warms cheap (50ms > the 30ms budget)
+        time.sleep(0.3)
+        _run(dispatcher, prefetcher, "c")  # the warmed entry expired unused; budget spent
+        stats = prefetcher.get_stats()
+        assert stats["prefetches"] == 1 and stats["wasted"] == 1 and stats["waste_rate"] == 1.0, stats
+        assert stats["skipped"].get("budget") == 1 and len(calls["cheap"]) == 4, stats
+        prefetcher.shutdown()
+        dispatcher.shutdown()
+
+        print(f"  ✅ Eligibility/budget OK (skipped: {stats['skipped']})")
+        return True
+    except Exception as e:
+        print(f"  ❌ Eligibility/budget failed: {e}")
+        return False
+
+
+def test_opt_in_and_status():
+    """Prefetch is opt-in; --status reports its hit/waste rates"""
+    print("🧪 Testing opt-in and status...")
+    try:
+        from system.core.special_commands import SpecialCommandsHandler
+        from system.core.validators import ConfigValidator
+
+        assert ConfigValidator.SCHEMA["prefetch"]["default"] is False
+
+        class Core:
+            def get_system_status(self):
+                return {"system": {}, "prefetch": {
+                    "prefetches": 4, "hits": 3, "wasted": 1, "hit_rate": 0.75,
+                    "waste_rate": 0.25, "saved_ms": 420.0}}
+
+        text = SpecialCommandsHandler(Core()).handle_command("--status")
+        assert "Prefetch: 75% usados | 25% desperdiciados (4 precargas, 420ms ahorrados)" in text, text
+
+        print("  ✅ Opt-in/status OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Opt-in/status failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [
+        test_next_action_model(),
+        test_prefetch_hit_near_zero_latency(),
+        test_only_read_only_cacheable_within_budget(),
+        test_opt_in_and_status(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
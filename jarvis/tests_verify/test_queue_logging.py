@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Queue logging tests
+Records go through a bounded QueueHandler (a put on the hot path) to a
+QueueListener; rotating file handlers (midnight / size), drop-instead-of-block
+when the queue is full, and per-call-site sampling of DEBUG lines
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _file_logger(name, tmp, **kwargs):
+    from skills.system.logging.queue_logging import attach_queue_logging, build_file_handlers
+
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    file_handler, error_handler = build_file_handlers(Path(tmp), **kwargs.pop("files", {}))
+    handler = attach_queue_logging(logger, (file_handler, error_handler), **kwargs)
+    return logger, handler, file_handler, error_handler
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def test_hot_path_is_a_queue_put():
+    """While the file handler is stalled, logging calls return at once; stop() writes everything in order"""
+    print("🧪 Testing hot path...")
+    try:
+        from skills.system.logging.queue_logging import detach_queue_logging
+
+        with tempfile.TemporaryDirectory() as tmp:
+            logger, handler, file_handler, _ = _file_logger("test.queue.hot", tmp)
+            with file_handler.lock:  # the listener blocks inside the file handler
+                start = time.perf_counter()
+                for i in range(1000):
+                    logger.info("line %d", i)
+                per_call_us = (time.perf_counter() - start) / 1000 * 1e6
+            assert per_call_us < 200, per_call_us
+
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("failed")
+            detach_queue_logging(logger)
+            assert not logger.handlers
+
+            lines = _read(Path(tmp) / "jarvis.log")
+            messages = [line.split(" | ")[-1] for line in lines if " | " in line]
+            assert messages[:1000] == [f"line {i}" for i in range(1000)], messages[:3]
+            assert "ValueError: boom" in "\n".join(lines)  # traceback formatted before queuing
+            assert "failed" in "\n".join(_read(Path(tmp) / "errors.log"))
+
+        print(f"  ✅ Hot path OK ({per_call_us:.1f}µs per logger.info with a stalled writer)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Hot path failed: {e}")
+        return False
+
+
+def test_full_queue_drops():
+    """A full queue drops (and counts) records instead of blocking or raising"""
+    print("🧪 Testing full queue...")
+    try:
+        from skills.system.logging.queue_logging import detach_queue_logging
+
+        with tempfile.TemporaryDirectory() as tmp:
+            logger, handler, file_handler, _ = _file_logger("test.queue.full", tmp, max_queue=10)
+            with file_handler.lock:
+                logger.info("first")
+                time.sleep(0.05)  # the listener took it and is now stuck on the lock
+                start = time.perf_counter()
+                for i in range(50):
+                    logger.info("burst %d", i)
+                elapsed = (time.perf_counter() - start) * 1000
+            assert handler.dropped == 40 and elapsed < 50, (handler.dropped, elapsed)
+            detach_queue_logging(logger)
+            assert len(_read(Path(tmp) / "jarvis.log")) == 11
+
+        print(f"  ✅ Full queue OK ({handler.dropped} dropped in {elapsed:.1f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Full queue failed: {e}")
+        return False
+
+
+def test_rotation():
+    """errors.log rotates by size, jarvis.log at midnight"""
+    print("🧪 Testing rotation...")
+    try:
+        from skills.system.logging.queue_logging import detach_queue_logging
+
+        with tempfile.TemporaryDirectory() as tmp:
+            logger, handler, file_handler, _ = _file_logger(
+                "test.queue.rotate", tmp, files={"max_bytes": 2048, "backup_count": 2})
+            for i in range(100):
+                logger.error("error number %d %s", i, "x" * 40)
+            while not handler.queue.empty():  # let the listener write them first
+                time.sleep(0.01)
+            time.sleep(0.05)
+            file_handler.rolloverAt = int(time.time()) - 1  # as if midnight had passed
+            logger.info("after midnight")
+            detach_queue_logging(logger)
+
+            names = sorted(os.listdir(tmp))
+            assert "errors.log.1" in names and "errors.log.2" in names and "errors.log.3" not in names, names
+            assert all(os.path.getsize(os.path.join(tmp, n)) <= 2048 for n in names if n.startswith("errors")), names
+            dated = [n for n in names if n.startswith("jarvis.log.")]
+            assert len(dated) == 1, names
+            assert _read(Path(tmp) / "jarvis.log")[-1].endswith("after midnight")
+
+        print(f"  ✅ Rotation OK ({', '.join(names)})")
+        return True
+    except Exception as e:
+        print(f"  ❌ Rotation failed: {e}")
+        return False
+
+
+def test_debug_sampling():
+    """A DEBUG call site logs at most `rate` lines per window; INFO is never sampled"""
+    print("🧪 Testing debug sampling...")
+    try:
+        from skills.system.logging.queue_logging import DebugSampler, detach_queue_logging
+
+        with tempfile.TemporaryDirectory() as tmp:
+            sampler = DebugSampler(rate=5, window=0.2)
+            logger, _, _, _ = _file_logger("test.queue.sample", tmp, sampler=sampler)
+
+            def hot(i):
+                logger.debug("hot %d", i)  # one call site
+
+            for i in range(100):
+                hot(i)
+                logger.info("info %d", i)
+            assert sampler.suppressed_total == 95
+            time.sleep(0.25)
+            hot(100)
+            detach_queue_logging(logger)
+
+            lines = _read(Path(tmp) / "jarvis.log")
+            hot_lines = [line for line in lines if "hot" in line]
+            assert len(hot_lines) == 6 and hot_lines[-1].endswith("hot 100 (+95 suprimidos)"), hot_lines
+            assert sum(1 for line in lines if "| info" in line) == 100
+
+        print("  ✅ Debug sampling OK (95 of 100 suppressed)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Debug sampling failed: {e}")
+        return False
+
+
+def test_jarvis_logger_wiring():
+    """JarvisLogger logs through the queue, reports its stats and flushes on close()"""
+    print("🧪 Testing JarvisLogger wiring...")
+    home = os.environ.get("HOME")
+    try:
+        from skills.system.logging.manager import JarvisLogger
+        from skills.system.logging.queue_logging import NonBlockingQueueHandler
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ["HOME"] = tmp
+            os.makedirs(os.path.join(tmp, "Desktop"))
+            for handler in list(logging.getLogger("Jarvis").handlers):
+                logging.getLogger("Jarvis").removeHandler(handler)
+
+            jl = JarvisLogger({"debug": True, "log_debug_rate": 3})
+            assert [type(h) for h in jl.logger.handlers] == [NonBlockingQueueHandler]
+            for i in range(10):
+                jl.logger.debug("[SKILLS] Registered skill: %d", i)
+            jl.log_error("TEST_ERR", "algo falló")
+            stats = jl.get_metrics()["logging"]
+            assert stats["debug_suppressed"] == 7 and stats["dropped"] == 0, stats
+            jl.close()
+            assert not jl.logger.handlers
+
+            general = "\n".join(_read(jl.logs_dir / "jarvis.log"))
+            assert general.count("Registered skill") == 3 and "JarvisLogger initialized" in general
+            assert "TEST_ERR: algo falló" in "\n".join(_read(jl.logs_dir / "errors.log"))
+            jl.logger.setLevel(logging.INFO)
+
+        print("  ✅ JarvisLogger wiring OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ JarvisLogger wiring failed: {e}")
+        return False
+    finally:
+        if home is not None:
+            os.environ["HOME"] = home
+
+
+if __name__ == "__main__":
+    results = [
+        test_hot_path_is_a_queue_put(),
+        test_full_queue_drops(),
+        test_rotation(),
+        test_debug_sampling(),
+        test_jarvis_logger_wiring(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
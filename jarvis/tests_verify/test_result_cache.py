@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Skill result cache tests
+Declarative policies (TTL, key, invalidating events), LRU bounds,
+hit-rate metrics and the system_status best case
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _dispatcher(**kwargs):
+    from system.core.exceptions import SkillError  # noqa: F401 (package import order)
+    from skills.actions.dispatcher import SkillDispatcher
+    return SkillDispatcher(**kwargs)
+
+
+def test_ttl_key_and_lru():
+    """Same key is served from cache until the TTL; LRU keeps at most max_entries"""
+    print("🧪 Testing TTL, keys and LRU...")
+    try:
+        from skills.actions.result_cache import CachePolicy
+
+        runs = []
+
+        class Lookup:
+            cache_policy = CachePolicy(ttl=0.2, key=("query",))
+
+            def run(self, entities, core):
+                runs.append(entities["query"])
+                return {"success": entities["query"] != "bad", "query": entities["query"], "n": len(runs)}
+
+        dispatcher = _dispatcher(cache_size=3)
+        dispatcher.register("lookup", Lookup())
+
+        first = dispatcher.dispatch("lookup", {"query": "a", "noise": 1}, None)
+        second = dispatcher.dispatch("lookup", {"query": "a", "noise": 2}, None)
+        assert not first.get("cached") and second["cached"], (first, second)
+        assert second["result"]["n"] == 1 and runs == ["a"]
+
+        second["result"]["n"] = 99  # callers can't corrupt the cached copy
+        assert dispatcher.dispatch("lookup", {"query": "a"}, None)["result"]["n"] == 1
+
+        dispatcher.dispatch("lookup", {"query": "bad"}, None)
+        dispatcher.dispatch("lookup", {"query": "bad"}, None)
+        assert runs.count("bad") == 2  # failures are not cached by default
+
+        for q in ("b", "c", "d"):
+            dispatcher.dispatch("lookup", {"query": q}, None)
+        stats = dispatcher.get_cache_stats()
+        assert stats["entries"] == 3 and stats["evictions"] == 1, stats
+        dispatcher.dispatch("lookup", {"query": "a"}, None)  # evicted -> runs again
+        assert runs.count("a") == 2
+
+        time.sleep(0.25)
+        dispatcher.dispatch("lookup", {"query": "d"}, None)
+        assert runs.count("d") == 2
+
+        stats = dispatcher.get_cache_stats()
+        assert stats["hits"] == 2 and stats["by_intent"]["lookup"]["hits"] == 2, stats
+        assert 0 < stats["hit_rate"] < 1 and stats["cached_skills"] == ["lookup"]
+        assert dispatcher.get_execution_stats()["lookup"]["total"] == len(runs)
+        dispatcher.shutdown()
+
+        print(f"  ✅ TTL/keys/LRU OK (hit rate {stats['hit_rate']:.0%})")
+        return True
+    except Exception as e:
+        print(f"  ❌ TTL/keys/LRU failed: {e}")
+        return False
+
+
+def test_invalidating_events():
+    """EventBus events and 'skill.<intent>' completions drop cached results"""
+    print("🧪 Testing invalidating events...")
+    try:
+        from core.lifecycle.runtime import EventBus
+        from skills.actions.result_cache import CachePolicy
+
+        runs = {"profile": 0, "search": 0}
+
+        class Profile:
+            cache_policy = {"ttl": 60, "key": (), "invalidate_on": ["profile.updated"]}
+
+            def run(self, entities, core):
+                runs["profile"] += 1
+                return {"success": True}
+
+        class Search:
+            cache_policy = CachePolicy(ttl=60, invalidate_on=("skill.note",))
+
+            def run(self, entities, core):
+                runs["search"] += 1
+                return {"success": True}
+
+        class Note:
+            def run(self, entities, core):
+                return {"success": True}
+
+        bus = EventBus(workers=1)
+        bus.start()
+        dispatcher = _dispatcher()
+        dispatcher.register("profile", Profile())
+        dispatcher.register("search", Search())
+        dispatcher.register("note", Note())
+        dispatcher.attach_eventbus(bus)
+
+        for _ in range(3):
+            dispatcher.dispatch("profile", {"aspect": "x"}, None)
+            dispatcher.dispatch("search", {"q": "x"}, None)
+        assert runs == {"profile": 1, "search": 1}, runs
+
+        bus.emit("profile.updated", {})
+        deadline = time.time() + 2
+        while time.time() < deadline:
+            dispatcher.dispatch("profile", {}, None)
+            if runs["profile"] == 2:
+                break
+            time.sleep(0.01)
+        assert runs["profile"] == 2, runs
+
+        dispatcher.dispatch("note", {}, None)
+        dispatcher.dispatch("search", {"q": "x"}, None)
+        assert runs["search"] == 2, runs
+        bus.stop()
+        dispatcher.shutdown()
+
+        print("  ✅ Invalidating events OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Invalidating events failed: {e}")
+        return False
+
+
+def test_invalidation_during_run():
+    """A run in flight when its skill (or the whole cache) is invalidated doesn't cache its (stale) result"""
+    print("🧪 Testing invalidation during a run...")
+    try:
+        import threading
+        from skills.actions.result_cache import CachePolicy
+
+        started, release = threading.Event(), threading.Event()
+        files = ["a.txt"]
+
+        class Search:
+            cache_policy = CachePolicy(ttl=60, key=(), invalidate_on=("skill.create_note",))
+
+            def run(self, entities, core):
+                listing = list(files)
+                started.set()
+                release.wait(2)
+                return {"success": True, "files": listing}
+
+        class CreateNote:
+            def run(self, entities, core):
+                files.append("note.txt")
+                return {"success": True}
+
+        dispatcher = _dispatcher()
+        dispatcher.register("search_file", Search())
+        dispatcher.register("create_note", CreateNote())
+
+        results = []
+        worker = threading.Thread(target=lambda: results.append(dispatcher.dispatch("search_file", {}, None)))
+        worker.start()
+        assert started.wait(2)
+        dispatcher.dispatch("create_note", {}, None)
+        release.set()
+        worker.join(2)
+        assert results[0]["result"]["files"] == ["a.txt"]
+
+        fresh = dispatcher.dispatch("search_file", {}, None)
+        assert not fresh.get("cached") and fresh["result"]["files"] == ["a.txt", "note.txt"], fresh
+        assert dispatcher.dispatch("search_file", {}, None)["cached"]
+        assert dispatcher.get_cache_stats()["stale_puts"] == 1
+
+        # same with a full invalidation while the run is in flight
+        started.clear()
+        release.clear()
+        dispatcher.invalidate_cache()
+        worker = threading.Thread(target=lambda: results.append(dispatcher.dispatch("search_file", {}, None)))
+        worker.start()
+        assert started.wait(2)
+        dispatcher.invalidate_cache()
+        release.set()
+        worker.join(2)
+        assert not dispatcher.is_cached("search_file", {})
+        assert dispatcher.get_cache_stats()["stale_puts"] == 2
+        dispatcher.shutdown()
+
+        print("  ✅ Invalidation during a run OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Invalidation during a run failed: {e}")
+        return False
+
+
+def test_system_status_served_from_cache():
+    """system_status pays cpu_percent(interval=1) once per TTL, not per request"""
+    print("🧪 Testing system_status cache...")
+    try:
+        dispatcher = _dispatcher()
+        from skills.system.system_status import SystemStatusSkill
+
+        dispatcher.register("system_status", SystemStatusSkill)
+        start = time.perf_counter()
+        first = dispatcher.dispatch("system_status", {}, None)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(20):
+            again = dispatcher.dispatch("system_status", {"noise": "ignored"}, None)
+        warm = (time.perf_counter() - start) / 20
+
+        assert cold >= 0.9, cold
+        assert warm < 0.01, warm
+        assert again["cached"] and again["result"]["cpu"] == first["result"]["cpu"]
+        dispatcher.shutdown()
+
+        print(f"  ✅ system_status cache OK ({cold * 1000:.0f}ms cold, {warm * 1000:.3f}ms cached)")
+        return True
+    except Exception as e:
+        print(f"  ❌ system_status cache failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [
+        test_ttl_key_and_lru(),
+        test_invalidating_events(),
+        test_invalidation_during_run(),
+        test_system_status_served_from_cache(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
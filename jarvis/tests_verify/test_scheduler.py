@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Scheduler tests
+Early wake-up, off-thread execution, cancellation, misfire policies and stats
+"""
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _wait(predicate, timeout=2.0):
+    end = time.time() + timeout
+    while time.time() < end:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_wakes_for_earlier_job():
+    """A job added with an earlier deadline runs on time, not after the pending one"""
+    print("🧪 Testing early wake-up...")
+    try:
+        from core.lifecycle.runtime import Scheduler
+
+        sched = Scheduler()
+        sched.start()
+        sched.schedule_every(10, lambda: None)
+        fired = []
+        start = time.perf_counter()
+        sched.schedule_after(0.05, lambda: fired.append(time.perf_counter() - start))
+        assert _wait(lambda: fired, timeout=1.0), "job never ran"
+        sched.stop()
+
+        assert fired[0] < 0.2, fired
+        print(f"  ✅ Early wake-up OK ({fired[0] * 1000:.0f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Early wake-up failed: {e}")
+        return False
+
+
+def test_slow_job_does_not_block_others():
+    """Jobs run on the worker pool; a slow job doesn't delay a fast one"""
+    print("🧪 Testing off-thread execution...")
+    try:
+        from core.lifecycle.runtime import Scheduler
+
+        sched = Scheduler(workers=2)
+        threads, fast_runs = set(), []
+        sched.schedule_every(0.05, lambda: time.sleep(1.0), first_run=0)
+        fast = sched.schedule_every(0.05, lambda: (threads.add(threading.current_thread().name),
+                                                   fast_runs.append(1)))
+        sched.start()
+        time.sleep(0.5)
+        sched.stop(wait=False)
+
+        assert len(fast_runs) >= 6, fast_runs
+        assert all(name.startswith("SchedulerWorker") for name in threads), threads
+        assert fast.stats()["lateness_ms"]["max"] < 100, fast.stats()
+        print(f"  ✅ Off-thread execution OK ({len(fast_runs)} fast runs while slow job ran)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Off-thread execution failed: {e}")
+        return False
+
+
+def test_cancel_handles():
+    """schedule_every/schedule_at return handles that stop further runs"""
+    print("🧪 Testing cancellable handles...")
+    try:
+        from core.lifecycle.runtime import Scheduler
+
+        sched = Scheduler()
+        sched.start()
+        runs, once, fired = [], [], []
+        job = sched.schedule_every(0.02, lambda: runs.append(1))
+        pending = sched.schedule_at(time.time() + 0.1, lambda: once.append(1))
+        oneshot = sched.schedule_after(0.01, lambda: fired.append(1))
+        assert oneshot.next_run is not None
+        assert _wait(lambda: len(runs) >= 3 and fired)
+        assert _wait(lambda: oneshot.next_run is None)  # fired and finished, not a past time
+        assert job.cancel() and pending.cancel()
+        assert not job.cancel()
+        count = len(runs)
+        time.sleep(0.2)
+        sched.stop()
+
+        assert len(runs) <= count + 1, (count, len(runs))
+        assert once == [], once
+        assert job.next_run is None
+        assert sched.get_stats()["jobs"] == 0, sched.get_stats()
+        print("  ✅ Cancellable handles OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Cancellable handles failed: {e}")
+        return False
+
+
+def test_misfire_policies():
+    """Overlapping slots are coalesced/skipped; catch_up replays missed slots"""
+    print("🧪 Testing misfire policies...")
+    try:
+        from core.lifecycle.runtime import Scheduler
+        from core.lifecycle.runtime.scheduler import MISFIRE_SKIP, MISFIRE_CATCH_UP
+
+        sched = Scheduler(workers=4)
+        counts = {"coalesce": 0, "skip": 0, "catch_up": 0}
+
+        def slow(name):
+            counts[name] += 1
+            time.sleep(0.1)
+
+        coalesce = sched.schedule_every(0.02, slow, "coalesce", first_run=0)
+        skip = sched.schedule_every(0.02, slow, "skip", first_run=0, misfire=MISFIRE_SKIP)
+        catch_up = sched.schedule_every(0.02, slow, "catch_up", first_run=0, misfire=MISFIRE_CATCH_UP)
+        sched.start()
+        time.sleep(0.45)
+        for job in (coalesce, skip, catch_up):
+            job.cancel()
+        sched.stop()
+
+        # 0.1s runs on a 0.02s grid: ~5 runs, the rest dropped
+        assert 3 <= counts["coalesce"] <= 6, counts
+        assert coalesce.overlapped + coalesce.skipped > 10, coalesce.stats()
+        assert 3 <= counts["skip"] <= 6, counts
+        # catch_up never drops a slot, it runs them back to back
+        assert catch_up.skipped == 0 and catch_up.overlapped == 0, catch_up.stats()
+        assert catch_up.stats()["drift_ms"]["max"] > 100, catch_up.stats()
+        print(f"  ✅ Misfire policies OK {counts}")
+        return True
+    except Exception as e:
+        print(f"  ❌ Misfire policies failed: {e}")
+        return False
+
+
+def test_jitter_and_drift_stats():
+    """Fixed-rate slots don't drift; jitter stays within bounds"""
+    print("🧪 Testing jitter and drift stats...")
+    try:
+        from core.lifecycle.runtime import Scheduler
+
+        sched = Scheduler()
+        sched.start()
+        plain = sched.schedule_every(0.02, lambda: time.sleep(0.005), name="plain")
+        jittered = sched.schedule_every(0.02, lambda: None, jitter=0.01, name="jittered")
+        time.sleep(0.5)
+        stats = {s["name"]: s for s in sched.get_stats()["per_job"]}
+        sched.stop()
+
+        # fixed rate: 0.5s / 0.02s ≈ 25 runs even though each run takes 5ms
+        assert stats["plain"]["runs"] >= 20, stats["plain"]
+        assert stats["plain"]["drift_ms"]["max"] < 20, stats["plain"]
+        assert stats["jittered"]["drift_ms"]["max"] <= 30, stats["jittered"]
+        assert jittered.runs >= 15, jittered.stats()
+        print(f"  ✅ Jitter and drift OK (plain max drift {stats['plain']['drift_ms']['max']:.1f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Jitter and drift failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [
+        test_wakes_for_earlier_job(),
+        test_slow_job_does_not_block_others(),
+        test_cancel_handles(),
+        test_misfire_policies(),
+        test_jitter_and_drift_stats(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+SkillDispatcher tests
+Real deadlines, per-skill concurrency caps, cooperative cancellation,
+singleton skill lifecycle, cached pre_check results and single-flight
+coalescing
+"""
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class EchoSkill:
+    def run(self, entities, core):
+        return {"success": True, "echo": entities.get("text")}
+
+
+class HangingSkill:
+    """Blocks until released or cancelled"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.exited = threading.Event()
+        self.saw_cancel = False
+
+    def run(self, entities, core, cancel_token=None):
+        try:
+            while not self.release.is_set():
+                if cancel_token.wait(0.01):
+                    self.saw_cancel = True
+                    return {"success": False}
+            return {"success": True}
+        finally:
+            self.exited.set()
+
+
+def test_timeout_is_enforced():
+    """A hung skill returns SkillTimeoutError at its deadline and is cancelled"""
+    print("🧪 Testing skill deadline...")
+    try:
+        from system.core.exceptions import SkillTimeoutError
+        from skills.actions.dispatcher import SkillDispatcher
+
+        dispatcher = SkillDispatcher(timeout_seconds=5.0, max_workers=2)
+        hanging = HangingSkill()
+        dispatcher.register("hang", hanging, timeout=0.2)
+        dispatcher.register("echo", EchoSkill())
+
+        start = time.time()
+        try:
+            dispatcher.dispatch("hang", {}, None)
+            raise AssertionError("no timeout raised")
+        except SkillTimeoutError:
+            elapsed = time.time() - start
+        assert 0.15 < elapsed < 0.6, elapsed
+        assert hanging.exited.wait(1.0) and hanging.saw_cancel
+
+        stats = dispatcher.get_skill_performance("hang")
+        assert stats["timeouts"] == 1 and stats["failures"] == 1, stats
+        assert stats["timeout_rate"] == "100.0%", stats
+        assert dispatcher.dispatch("echo", {"text": "hola"}, None)["result"]["echo"] == "hola"
+        assert dispatcher.get_execution_stats()["echo"]["timeouts"] == 0
+        dispatcher.shutdown()
+
+        print(f"  ✅ Deadline OK ({elapsed * 1000:.0f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Deadline failed: {e}")
+        return False
+
+
+def test_skill_timeout_error_is_not_a_deadline():
+    """A TimeoutError raised by the skill itself is a skill failure, not a deadline breach; a result at the deadline is kept"""
+    print("🧪 Testing skill-raised TimeoutError...")
+    try:
+        from system.core.exceptions import SkillError, SkillTimeoutError
+        from skills.actions.dispatcher import SkillDispatcher
+
+        seen = {}
+
+        class SocketSkill:
+            def run(self, entities, core, cancel_token=None):
+                seen["token"] = cancel_token
+                raise TimeoutError("timed out")  # e.g. socket.timeout, well inside the deadline
+
+        dispatcher = SkillDispatcher(timeout_seconds=5.0, max_workers=2)
+        dispatcher.register("socket", SocketSkill())
+        try:
+            dispatcher.dispatch("socket", {}, None)
+            raise AssertionError("no error raised")
+        except SkillTimeoutError:
+            raise AssertionError("reported as a deadline breach")
+        except SkillError as e:
+            assert "timed out" in str(e), e
+        assert not seen["token"].cancelled
+        stats = dispatcher.get_skill_performance("socket")
+        assert stats["timeouts"] == 0 and stats["failures"] == 1, stats
+
+        # a skill that finishes right as the wait times out returns its value
+        from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+        class LateFuture(Future):
+            def result(self, timeout=None):
+                if timeout is not None:
+                    raise FutureTimeoutError()  # the wait gave up just before done() was checked
+                return super().result()
+
+        class InlineExecutor:
+            def submit(self, fn):
+                future = LateFuture()
+                future.set_result(fn())
+                return future
+
+        class QuickSkill:
+            def run(self, entities, core):
+                return {"success": True, "value": 42}
+
+        pool, dispatcher.executor = dispatcher.executor, InlineExecutor()
+        dispatcher.register("quick", QuickSkill())
+        response = dispatcher.dispatch("quick", {}, None)
+        dispatcher.executor = pool
+        assert response["success"] and response["result"]["value"] == 42, response
+        dispatcher.shutdown()
+
+        print("  ✅ Skill-raised TimeoutError OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Skill-raised TimeoutError failed: {e}")
+        return False
+
+
+def test_concurrency_cap():
+    """A skill over its cap times out waiting for a slot; other skills keep running"""
+    print("🧪 Testing per-skill concurrency caps...")
+    try:
+        from system.core.exceptions import SkillTimeoutError
+        from skills.actions.dispatcher import SkillDispatcher
+
+        dispatcher = SkillDispatcher(timeout_seconds=2.0, max_workers=4)
+        hanging = HangingSkill()
+        dispatcher.register("hang", hanging, max_concurrency=1)
+        dispatcher.register("echo", EchoSkill())
+        assert dispatcher.get_limits("echo") == (2.0, 3)  # default leaves one worker free
+
+        first = threading.Thread(target=lambda: dispatcher.dispatch("hang", {}, None), daemon=True)
+        first.start()
+        time.sleep(0.05)
+        assert [r["intent"] for r in dispatcher.get_inflight()] == ["hang"]
+
+        dispatcher._limits["hang"] = (0.1, 1)
+        try:
+            dispatcher.dispatch("hang", {}, None)
+            raise AssertionError("second run got a slot")
+        except SkillTimeoutError as e:
+            assert e.context.get("reason") == "concurrency_limit", e.context
+
+        results = [dispatcher.dispatch("echo", {"text": i}, None) for i in range(5)]
+        assert all(r["success"] for r in results)
+
+        hanging.release.set()
+        first.join(1.0)
+        assert dispatcher.get_inflight() == []
+        assert dispatcher.get_execution_stats()["hang"]["timeouts"] == 1
+        dispatcher.shutdown()
+
+        print("  ✅ Concurrency caps OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Concurrency caps failed: {e}")
+        return False
+
+
+def test_cancel_token_and_nesting():
+    """Skills see their token; nested dispatches run inline under the outer deadline"""
+    print("🧪 Testing cancel token and nested dispatch...")
+    try:
+        from system.core.exceptions import SkillError  # noqa: F401 (package import order)
+        from skills.actions.dispatcher import SkillDispatcher, current_cancel_token
+
+        dispatcher = SkillDispatcher(timeout_seconds=1.0, max_workers=1)
+        seen = {}
+
+        class Inner:
+            def run(self, entities, core):
+                seen["inner_token"] = current_cancel_token()
+                seen["inner_thread"] = threading.current_thread().name
+                return {"success": True}
+
+        class Outer:
+            def run(self, entities, core):
+                seen["outer_token"] = current_cancel_token()
+                seen["outer_thread"] = threading.current_thread().name
+                # single worker: a pool round-trip here would deadlock until the deadline
+                return dispatcher.dispatch("inner", {}, core)
+
+        dispatcher.register("inner", Inner())
+        dispatcher.register("outer", Outer())
+        start = time.time()
+        result = dispatcher.dispatch("outer", {}, None)
+        assert result["success"] and time.time() - start < 0.5
+        assert seen["outer_token"] is seen["inner_token"] is not None
+        assert seen["outer_thread"] == seen["inner_thread"] != threading.current_thread().name
+        assert current_cancel_token() is None
+
+        # async dispatches don't starve the single skill worker either
+        task_ids = [dispatcher.dispatch_async("inner", {}) for _ in range(3)]
+        assert all(dispatcher.get_async_result(t, timeout=2.0)["success"] for t in task_ids)
+        dispatcher.shutdown()
+
+        # skills import the token helpers on their own, as the manifest's lazy import does
+        import subprocess
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        probe = subprocess.run([sys.executable, "-c", "import skills.research.search_file"],
+                               cwd=root, capture_output=True, text=True)
+        assert probe.returncode == 0, probe.stderr.strip().splitlines()[-1:]
+
+        print("  ✅ Cancel token and nesting OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Cancel token and nesting failed: {e}")
+        return False
+
+
+def test_singleton_lifecycle_and_pre_check_cache():
+    """Class-registered skills are built and warmed up once; pre_check is cached for its TTL"""
+    print("🧪 Testing skill lifecycle and pre_check cache...")
+    try:
+        from system.core.exceptions import SkillDependencyError
+        from skills.actions.dispatcher import SkillDispatcher
+
+        calls = {"init": 0, "warmup": 0, "close": 0, "pre_check": 0}
+
+        class Managed:
+            ok = True
+
+            def __init__(self):
+                calls["init"] += 1
+
+            def warmup(self):
+                calls["warmup"] += 1
+
+            def close(self):
+                calls["close"] += 1
+
+            def pre_check(self, entities):
+                calls["pre_check"] += 1
+                return (Managed.ok, None if Managed.ok else "falta dependencia")
+
+            def run(self, entities, core):
+                return {"success": True, "instance": id(self)}
+
+        class Broken:
+            def __init__(self):
+                raise RuntimeError("boom")
+
+            def run(self, entities, core):
+                return {"success": True}
+
+        dispatcher = SkillDispatcher(pre_check_ttl=0.2)
+        dispatcher.register("managed", Managed)
+        dispatcher.register("broken", Broken)
+        assert calls["init"] == 0  # lazy
+
+        ids = {dispatcher.dispatch("managed", {}, None)["result"]["instance"] for _ in range(50)}
+        assert len(ids) == 1, ids
+        assert calls == {"init": 1, "warmup": 1, "close": 0, "pre_check": 1}, calls
+        assert dispatcher.get_lifecycle_stats()["pre_check_hits"] == 49
+
+        # a failing pre_check is cached too, until the TTL expires or it's invalidated
+        Managed.ok = False
+        time.sleep(0.25)
+        for _ in range(3):
+            try:
+                dispatcher.dispatch("managed", {}, None)
+                raise AssertionError("pre_check failure not raised")
+            except SkillDependencyError:
+                pass
+        assert calls["pre_check"] == 2, calls
+        Managed.ok = True
+        dispatcher.invalidate_pre_check("managed")
+        assert dispatcher.dispatch("managed", {}, None)["success"]
+        assert calls["pre_check"] == 3 and calls["init"] == 1, calls
+
+        try:
+            dispatcher.dispatch("broken", {}, None)
+            raise AssertionError("construction failure not raised")
+        except SkillDependencyError as e:
+            assert "boom" in str(e)
+
+        dispatcher.shutdown()
+        assert calls["close"] == 1, calls
+        assert dispatcher.get_lifecycle_stats()["live_instances"] == 0
+
+        print("  ✅ Lifecycle and pre_check cache OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Lifecycle and pre_check cache failed: {e}")
+        return False
+
+
+def test_single_flight_coalescing():
+    """Concurrent identical dispatches of side-effect-free skills share one run"""
+    print("🧪 Testing single-flight coalescing...")
+    try:
+        from system.core.exceptions import SkillTimeoutError
+        from skills.actions.dispatcher import SkillDispatcher
+
+        runs = {"read": 0, "write": 0, "slow": 0}
+        gate = threading.Event()
+
+        class Read:
+            side_effects = False
+
+            def run(self, entities, core):
+                runs["read"] += 1
+                gate.wait(1.0)
+                return {"success": True, "value": entities["q"]}
+
+        class Write:
+            def run(self, entities, core):
+                runs["write"] += 1
+                gate.wait(1.0)
+                return {"success": True}
+
+        class Slow:
+            side_effects = False
+
+            def run(self, entities, core, cancel_token=None):
+                runs["slow"] += 1
+                cancel_token.wait(5.0)
+                return {"success": True}
+
+        dispatcher = SkillDispatcher(max_workers=8)
+        dispatcher.register("read", Read())
+        dispatcher.register("write", Write())
+        dispatcher.register("slow", Slow(), timeout=0.2)
+
+        results, errors = [], []
+
+        def call(intent, entities):
+            try:
+                results.append(dispatcher.dispatch(intent, entities, None))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call, args=("read", {"q": "a"})) for _ in range(6)]
+        threads += [threading.Thread(target=call, args=("read", {"q": "b"})) for _ in range(2)]
+        threads += [threading.Thread(target=call, args=("write", {"q": "a"})) for _ in range(3)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        gate.set()
+        for t in threads:
+            t.join(2.0)
+
+        assert not errors, errors
+        assert runs["read"] == 2 and runs["write"] == 3, runs
+        reads = [r for r in results if r["intent"] == "read"]
+        assert sorted(r["result"]["value"] for r in reads) == ["a"] * 6 + ["b"] * 2
+        assert sum(1 for r in reads if r.get("coalesced")) == 6
+        stats = dispatcher.get_coalescing_stats()
+        assert stats["coalesced"] == 6 and stats["leaders"] == 2 and stats["in_flight"] == 0, stats
+        assert stats["by_intent"] == {"read": 6}, stats
+
+        # the leader's timeout reaches every follower
+        errors.clear()
+        threads = [threading.Thread(target=call, args=("slow", {})) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(2.0)
+        assert len(errors) == 4 and all(isinstance(e, SkillTimeoutError) for e in errors), errors
+        assert runs["slow"] == 1, runs
+        assert dispatcher.get_execution_stats()["slow"]["timeouts"] == 1
+        dispatcher.shutdown()
+
+        print(f"  ✅ Coalescing OK ({stats['coalesced']} coalesced)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Coalescing failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [
+        test_timeout_is_enforced(),
+        test_skill_timeout_error_is_not_a_deadline(),
+        test_concurrency_cap(),
+        test_cancel_token_and_nesting(),
+        test_singleton_lifecycle_and_pre_check_cache(),
+        test_single_flight_coalescing(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Skill manifest tests
+Manifest in sync with the skill classes, NLU built without importing any
+skill, lazy import/instantiation on first dispatch and the import report
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_manifest_matches_code():
+    """Every entry imports (winreg included) and matches its class' patterns/hints/policies"""
+    print("🧪 Testing manifest vs skill classes...")
+    try:
+        from system.core.exceptions import SkillError  # noqa: F401 (package import order)
+        from skills.actions.manifest import load_manifest, build_manifest, COSTS
+
+        manifest = load_manifest()
+        built = json.loads(json.dumps(build_manifest(manifest)))
+        stale = [intent for intent in built if built[intent] != manifest[intent]]
+        assert not stale, f"run `python -m skills.actions.manifest --write` ({stale})"
+        assert all(entry["cost"] in COSTS for entry in manifest.values())
+        assert manifest["search_file"]["max_concurrency"] == 1
+        assert manifest["research_skill"]["async"] and not manifest["research_skill"]["side_effects"]
+        assert "open_app_advanced" in manifest
+
+        print(f"  ✅ Manifest OK ({len(manifest)} skills)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Manifest check failed: {e}")
+        return False
+
+
+def test_nlu_without_skill_imports():
+    """The NLU built from the manifest imports no skill module and predicts like the classes do"""
+    print("🧪 Testing NLU from manifest...")
+    try:
+        script = (
+            "import sys, json\n"
+            "import system.core\n"
+            "from brain.nlu.benchmark import build_pipeline, load_corpus\n"
+            "p = build_pipeline()\n"
+            "imported = sorted(m for m in sys.modules if m.startswith('skills.')\n"
+            "                  and not m.startswith(('skills.actions', 'skills.system.logging'))\n"
+            "                  and m not in ('skills.system',))\n"
+            "preds = {}\n"
+            "for text, _, _ in load_corpus(p.skills_registry):\n"
+            "    clean = p.norm.run(text)\n"
+            "    preds[text] = p.intent.parse_with_confidence(clean, p.entities.extract(clean))[0]\n"
+            "print(json.dumps({'imported': imported, 'preds': preds}))\n"
+        )
+        out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True,
+                             text=True, timeout=120)
+        data = json.loads(out.stdout.strip().splitlines()[-1])
+        assert data["imported"] == [], data["imported"]
+
+        from skills.actions.manifest import lazy_registry
+        from brain.nlu.benchmark import build_pipeline
+
+        classes = {intent: skill.load() for intent, skill in lazy_registry().items()}
+        pipeline = build_pipeline(classes)
+        for text, expected in data["preds"].items():
+            clean = pipeline.norm.run(text)
+            got = pipeline.intent.parse_with_confidence(clean, pipeline.entities.extract(clean))[0]
+            assert got == expected, (text, got, expected)
+
+        print(f"  ✅ NLU from manifest OK ({len(data['preds'])} inputs, 0 skill imports)")
+        return True
+    except Exception as e:
+        print(f"  ❌ NLU from manifest failed: {e}")
+        return False
+
+
+def test_lazy_dispatch_and_report():
+    """Skills import and instantiate on first dispatch, with init args from the core"""
+    print("🧪 Testing lazy dispatch...")
+    try:
+        from system.core.exceptions import SkillDependencyError
+        from skills.actions.dispatcher import SkillDispatcher
+        from skills.actions.manifest import LazySkill, lazy_registry, import_report, format_import_report
+
+        class Core:
+            class logger:
+                logger = "core-logger"
+
+        manifest = {
+            "get_time": {"module": "skills.system.get_time", "class": "GetTimeSkill",
+                         "patterns": ["hora"], "side_effects": False},
+            "health": {"module": "skills.system.analyze_system_health", "class": "AnalyzeSystemHealthSkill",
+                       "init": ["logger.logger"], "cache_policy": {"ttl": 30.0, "key": None}},
+            "broken": {"module": "skills.does_not_exist", "class": "Nope", "timeout_seconds": 7},
+        }
+        registry = lazy_registry(manifest, context=Core())
+        dispatcher = SkillDispatcher()
+        for intent, skill in registry.items():
+            dispatcher.register(intent, skill)
+
+        assert dispatcher.get_limits("broken")[0] == 7
+        assert dispatcher.get_cache_stats()["cached_skills"] == ["health"]
+        assert [row["status"] for row in import_report(registry)] == ["lazy"] * 3
+
+        assert dispatcher.dispatch("get_time", {}, None)["success"]
+        assert registry["get_time"].loaded and registry["get_time"].import_ms is not None
+        assert dispatcher.get_instance("health").logger == "core-logger"
+        assert dispatcher.get_skill_info("health")["class"] == "AnalyzeSystemHealthSkill"
+
+        for _ in range(2):
+            try:
+                dispatcher.dispatch("broken", {}, None)
+                raise AssertionError("broken import should fail")
+            except SkillDependencyError as e:
+                assert "Import error" in str(e), e
+
+        report = {row["intent"]: row for row in import_report(registry)}
+        assert report["get_time"]["status"] == "loaded"
+        assert report["broken"]["status"] == "failed" and "ModuleNotFoundError" in report["broken"]["error"]
+        text = format_import_report(list(report.values()))
+        assert text.startswith("2/3 skills imported") and "broken: FAILED" in text, text
+        assert repr(registry["broken"]).endswith("(failed)>")
+        assert isinstance(dispatcher.skills["get_time"], LazySkill)  # registry entry stays the placeholder
+        dispatcher.shutdown()
+
+        print("  ✅ Lazy dispatch OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Lazy dispatch failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [
+        test_manifest_matches_code(),
+        test_nlu_without_skill_imports(),
+        test_lazy_dispatch_and_report(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
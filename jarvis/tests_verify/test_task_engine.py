@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Unified task engine tests
+Priority queues on fixed workers, retries on timers (no sleeping worker),
+timeouts, the process backend, and both BackgroundTaskManagers sharing one
+engine (thread cap, statuses, wait_for_task, JarvisCore.submit_background_task)
+"""
+
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _Quiet:
+    def info(self, msg):
+        pass
+
+    warning = debug = info
+
+
+def _engine(**kwargs):
+    from system.core.task_engine import TaskEngine
+    return TaskEngine(logger=_Quiet(), **kwargs)
+
+
+def test_priority_order():
+    """Higher priority first, equal priorities in submission order"""
+    print("🧪 Testing priority order...")
+    try:
+        engine = _engine(workers=1)
+        order = []
+        for i in range(3):
+            engine.submit(order.append, args=(f"low{i}",))
+        engine.submit(order.append, args=("high",), priority=9)
+        engine.submit(order.append, args=("mid",), priority=5)
+        engine.start()
+        last = engine.submit(order.append, args=("last",), priority=-1)
+        assert engine.wait(last.task_id, 2) is not None
+        assert order == ["high", "mid", "low0", "low1", "low2", "last"], order
+        assert last.status == "completed" and last.attempts == 1
+        engine.stop()
+
+        print("  ✅ Priority order OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Priority order failed: {e}")
+        return False
+
+
+def test_retry_backoff_frees_the_worker():
+    """A failing task waits for its retry on a timer; the single worker keeps running other tasks"""
+    print("🧪 Testing retries on timers...")
+    try:
+        engine = _engine(workers=1)
+        engine.start()
+        attempts = []
+
+        def flaky():
+            attempts.append(time.perf_counter())
+            if len(attempts) < 3:
+                raise RuntimeError("not yet")
+            return "ok"
+
+        task = engine.submit(flaky, max_retries=3, backoff=0.2, backoff_factor=1.0)
+        time.sleep(0.05)
+        assert task.status == "retrying", task.status
+        start = time.perf_counter()
+        quick = engine.submit(lambda: "quick")
+        assert engine.wait(quick.task_id, 1) is not None
+        assert (time.perf_counter() - start) * 1000 < 100  # not stuck behind the backoff
+
+        assert engine.wait(task.task_id, 2) is not None
+        assert task.status == "completed" and task.result == "ok" and task.attempts == 3
+        gaps = [b - a for a, b in zip(attempts, attempts[1:])]
+        assert all(gap >= 0.19 for gap in gaps), gaps
+
+        def always():
+            raise ValueError("nope")
+
+        failed = engine.submit(always, max_retries=1, backoff=0.01)
+        assert engine.wait(failed.task_id, 2) is not None
+        assert failed.status == "failed" and failed.attempts == 2 and failed.error == "nope"
+        stats = engine.get_stats()
+        assert stats["retries"] == 3 and stats["failed"] == 1, stats
+        engine.stop()
+
+        print(f"  ✅ Retries OK (gaps {[round(g * 1000) for g in gaps]}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Retries failed: {e}")
+        return False
+
+
+def test_timeout():
+    """An overrunning attempt times out at its deadline; its late result is discarded"""
+    print("🧪 Testing timeouts...")
+    try:
+        engine = _engine(workers=2)
+        engine.start()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.3 if len(calls) == 1 else 0.0)
+            return len(calls)
+
+        start = time.perf_counter()
+        timed_out = engine.submit(time.sleep, args=(0.3,), timeout=0.05)
+        assert engine.wait(timed_out.task_id, 1) is not None
+        elapsed = (time.perf_counter() - start) * 1000
+        assert timed_out.status == "timeout" and elapsed < 200, (timed_out.status, elapsed)
+        assert "timeout" in timed_out.error.lower()
+
+        retried = engine.submit(slow, timeout=0.05, max_retries=1, backoff=0.01)
+        assert engine.wait(retried.task_id, 1) is not None
+        assert retried.status == "completed" and retried.result == 2, retried.to_dict()
+        time.sleep(0.3)
+        assert retried.result == 2  # the first attempt's late return didn't overwrite it
+        assert engine.get_stats()["timeouts"] == 2
+        engine.stop()
+
+        print(f"  ✅ Timeouts OK ({elapsed:.0f}ms for a 50ms limit)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Timeouts failed: {e}")
+        return False
+
+
+def test_process_backend():
+    """CPU-bound work runs on the process pool, apart from the thread workers"""
+    print("🧪 Testing process backend...")
+    try:
+        engine = _engine(workers=1, process_workers=2)
+        engine.start()
+        tasks = [engine.submit(math.factorial, args=(n,), backend="process") for n in (500, 600, 700)]
+        for task in tasks:
+            assert engine.wait(task.task_id, 30) is not None, task
+        assert [task.result for task in tasks] == [math.factorial(n) for n in (500, 600, 700)]
+
+        bad = engine.submit(math.factorial, args=(-1,), backend="process")
+        assert engine.wait(bad.task_id, 30) is not None and bad.status == "failed"
+        try:
+            engine.submit(len, backend="gpu")
+            raise AssertionError("unknown backend accepted")
+        except ValueError:
+            pass
+        engine.stop()
+
+        print("  ✅ Process backend OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Process backend failed: {e}")
+        return False
+
+
+def test_shared_engine_adapters():
+    """Both managers run on one engine: thread count stays capped, statuses map through"""
+    print("🧪 Testing adapters on a shared engine...")
+    try:
+        from system.core.background_tasks import BackgroundTaskManager
+        from system.pc_authority.background_task_manager import (
+            BackgroundTaskManager as PCTaskManager, TaskStatus)
+
+        engine = _engine(workers=3)
+        core_manager = BackgroundTaskManager(logger=_Quiet(), engine=engine)
+        pc_manager = PCTaskManager(engine=engine)
+        core_manager.start()
+        before = threading.active_count()
+
+        peak = []
+        lock = threading.Lock()
+        running = [0]
+
+        def work():
+            with lock:
+                running[0] += 1
+                peak.append(running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        ids = [core_manager.submit("core", work) for _ in range(10)]
+        for i in range(10):
+            pc_manager.submit_task(f"pc{i}", "pc", work)
+        assert threading.active_count() == before  # no thread per task
+        for task_id in ids:
+            assert core_manager.wait_for_task(task_id, 2000) is not None
+        for i in range(10):
+            result = pc_manager.wait_for_task(f"pc{i}", timeout=2)
+            assert result is not None and result.success, result
+        assert max(peak) <= 3, max(peak)
+
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise RuntimeError("first try fails")
+            return "fine"
+
+        pc_manager.submit_task("flaky", "flaky", flaky, max_retries=3)
+        time.sleep(0.05)
+        status = pc_manager.get_task_status("flaky")
+        assert status["status"] == TaskStatus.QUEUED.value and status["retry_count"] == 1, status
+        result = pc_manager.wait_for_task("flaky", timeout=3)  # after the 1s backoff
+        assert result.success and result.output == "fine"
+
+        pc_manager.submit_task("stuck", "stuck", time.sleep, args=(0.3,), max_retries=1, timeout=0.05)
+        result = pc_manager.wait_for_task("stuck", timeout=2)
+        assert not result.success and pc_manager.get_task_status("stuck")["status"] == "failed"
+
+        pc_manager.submit_task("later", "later", time.sleep, args=(0.01,), priority=-5)
+        pc_manager.submit_task("blocker", "blocker", time.sleep, args=(0.2,))
+        assert pc_manager.cancel_task("later") or pc_manager.tasks["later"].status == TaskStatus.COMPLETED
+        stats = pc_manager.get_statistics()
+        assert stats["max_workers"] == 3 and stats["completed_count"] >= 11, stats
+        assert len(pc_manager.results_history) <= pc_manager.keep_results_count
+        assert engine.get_stats()["submitted"] == 24
+        core_manager.stop()
+        engine.stop()
+
+        print(f"  ✅ Shared engine OK (peak {max(peak)} concurrent on 3 workers)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Shared engine failed: {e}")
+        return False
+
+
+def test_core_submit_background_task():
+    """JarvisCore wires one TaskEngine; submit_background_task and --tasks work"""
+    print("🧪 Testing JarvisCore wiring...")
+    home, cwd = os.environ.get("HOME"), os.getcwd()
+    tmp = tempfile.TemporaryDirectory()
+    try:
+        # JarvisLogger writes under ~/Desktop and JarvisStorage() creates jarvis_data.db in the cwd
+        os.environ["HOME"] = tmp.name
+        os.makedirs(os.path.join(tmp.name, "Desktop"))
+        os.chdir(tmp.name)
+        from system.core.exceptions import SkillError  # noqa: F401 (package import order)
+        from system.core.engine import JarvisCore
+        from system.core.special_commands import SpecialCommandsHandler
+
+        core = JarvisCore({"name": "Jarvis", "version": "0.0.4"})
+        core.background_tasks.start()
+        assert core.task_manager.engine is core.task_engine is core.background_tasks.engine
+
+        task_id = core.submit_background_task("sum", "Sumar", sum, args=([1, 2, 3],))
+        assert task_id == "sum"
+        result = core.task_manager.wait_for_task("sum", timeout=2)
+        assert result is not None and result.success and result.output == "6"
+        tasks = core.get_background_tasks()
+        assert tasks and tasks[0]["task_id"] == "sum"
+        assert "sum" in SpecialCommandsHandler(core).handle_command("--tasks")
+        assert core.get_system_status()["task_engine"]["completed"] >= 1
+        core.background_tasks.stop()
+        core.task_engine.stop()
+
+        print("  ✅ JarvisCore wiring OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ JarvisCore wiring failed: {e}")
+        return False
+    finally:
+        os.chdir(cwd)
+        if home is not None:
+            os.environ["HOME"] = home
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    results = [
+        test_priority_order(),
+        test_retry_backoff_frees_the_worker(),
+        test_timeout(),
+        test_process_backend(),
+        test_shared_engine_adapters(),
+        test_core_submit_background_task(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
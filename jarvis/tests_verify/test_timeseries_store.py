@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Time-series store tests
+Fixed-record mmap ring files for DataCollector's system snapshots: O(1)
+appends that overwrite the oldest slot, raw plus the averaging tiers
+coarser than the sampling interval (recovered across restarts), NumPy reads and months of retention
+in constant disk space
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIELDS = ("cpu", "mem")
+
+
+def test_ring_wraps_in_order():
+    """A full ring overwrites the oldest records; reads come back in chronological order"""
+    print("🧪 Testing ring wrap-around...")
+    try:
+        from data.timeseries import TimeSeriesStore
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = TimeSeriesStore(tmp, "s", FIELDS, tiers=(("raw", 0, 100),))
+            size = os.path.getsize(os.path.join(tmp, "s.raw.ring"))
+            for i in range(250):
+                store.append(1000.0 + i, [i, i * 2])
+            data = store.read("raw")
+            assert list(data["timestamp"]) == [1000.0 + i for i in range(150, 250)]
+            assert list(data["mem"]) == [i * 2.0 for i in range(150, 250)]
+            assert store.latest() == {"timestamp": 1249.0, "cpu": 249.0, "mem": 498.0}
+            assert os.path.getsize(os.path.join(tmp, "s.raw.ring")) == size
+            store.close()
+
+            reopened = TimeSeriesStore(tmp, "s", FIELDS, tiers=(("raw", 0, 100),))
+            assert list(reopened.read("raw", since=1240)["cpu"]) == [float(i) for i in range(240, 250)]
+            reopened.close()
+            try:
+                TimeSeriesStore(tmp, "s", ("other",), tiers=(("raw", 0, 100),))
+                assert False, "different fields must be rejected"
+            except ValueError:
+                pass
+
+        print("  ✅ Ring wrap-around OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Ring wrap-around failed: {e}")
+        return False
+
+
+def test_downsampling_tiers():
+    """Aggregate tiers hold per-interval means; a restart mid-interval gives the same result"""
+    print("🧪 Testing downsampling tiers...")
+    try:
+        from data.timeseries import DEFAULT_TIERS, TimeSeriesStore, tiers_for_interval
+
+        # only tiers coarser than the sampling: a 1m tier over 5-minute snapshots would copy raw
+        assert [tier for tier, _, _ in DEFAULT_TIERS] == ["raw", "1h", "1d"] and DEFAULT_TIERS[0][2] == 8640
+        tiers = tiers_for_interval(10)
+        assert [tier for tier, _, _ in tiers] == ["raw", "1m", "1h", "1d"], tiers
+
+        def feed(store, points):
+            for ts in points:
+                store.append(ts, [ts % 60, 1.0])
+
+        points = [7200.0 + 10 * i for i in range(3 * 360 + 1)]  # 3 hours every 10s, plus one
+        with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+            straight = TimeSeriesStore(a, "s", FIELDS, tiers)
+            feed(straight, points)
+
+            restarted = TimeSeriesStore(b, "s", FIELDS, tiers)
+            feed(restarted, points[:500])
+            restarted.close()
+            restarted = TimeSeriesStore(b, "s", FIELDS, tiers)
+            feed(restarted, points[500:])
+
+            for store in (straight, restarted):
+                minutes = store.read("1m")
+                hours = store.read("1h")
+                assert len(minutes["timestamp"]) == 180 and len(hours["timestamp"]) == 3
+                assert set(minutes["cpu"]) == {25.0} and set(hours["mem"]) == {1.0}
+                assert list(hours["timestamp"]) == [7200.0, 10800.0, 14400.0]
+            assert list(straight.read("1m")["timestamp"]) == list(restarted.read("1m")["timestamp"])
+            straight.close()
+            restarted.close()
+
+        print("  ✅ Downsampling tiers OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Downsampling tiers failed: {e}")
+        return False
+
+
+def test_numpy_reads_and_fallback():
+    """read() returns NumPy arrays filtered by time and field; array('d') without NumPy"""
+    print("🧪 Testing reads...")
+    try:
+        from array import array
+        from data import timeseries
+        from data.timeseries import TimeSeriesStore
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = TimeSeriesStore(tmp, "s", FIELDS, tiers=(("raw", 0, 50),))
+            for i in range(80):
+                store.append(float(i), [i, -i])
+            if timeseries.NUMPY_AVAILABLE:
+                import numpy as np
+                data = store.read("raw", since=40, until=50, fields=["mem"])
+                assert isinstance(data["mem"], np.ndarray) and data["mem"].dtype == np.float64
+                assert set(data) == {"timestamp", "mem"} and data["mem"].sum() == -sum(range(40, 50))
+
+            saved = timeseries.NUMPY_AVAILABLE
+            timeseries.NUMPY_AVAILABLE = False
+            try:
+                plain = store.read("raw", since=40, until=50, fields=["mem"])
+            finally:
+                timeseries.NUMPY_AVAILABLE = saved
+            assert isinstance(plain["mem"], array) and list(plain["mem"]) == [-float(i) for i in range(40, 50)]
+            store.close()
+
+        print("  ✅ Reads OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Reads failed: {e}")
+        return False
+
+
+def test_months_of_data_constant_cost():
+    """Six months of 5-minute snapshots: constant file size, flat append cost, the 1h/1d tiers keep all of it"""
+    print("🧪 Testing months of retention...")
+    try:
+        from data.timeseries import TimeSeriesStore
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = TimeSeriesStore(tmp, "system", FIELDS)
+            sizes = sorted(os.path.getsize(os.path.join(tmp, n)) for n in os.listdir(tmp))
+            start = datetime(2026, 4, 1).timestamp()
+            n = 180 * 288
+            timings = []
+            for i in range(n):
+                t0 = time.perf_counter()
+                store.append(start + i * 300, [i % 100, 50.0])
+                timings.append(time.perf_counter() - t0)
+            first, last = sum(timings[:5000]) / 5000, sum(timings[-5000:]) / 5000
+            assert last < first * 3, (first, last)
+
+            stats = store.get_stats()
+            assert stats["raw"]["points"] == 8640 and stats["raw"]["written"] == n, stats
+            assert stats["1h"]["points"] == 180 * 24 - 1 and stats["1d"]["points"] == 179, stats
+            assert sorted(os.path.getsize(os.path.join(tmp, n)) for n in os.listdir(tmp)) == sizes
+
+            t0 = time.perf_counter()
+            hours = store.read("1h", since=start + 90 * 86400)
+            read_ms = (time.perf_counter() - t0) * 1000
+            assert len(hours["timestamp"]) == 90 * 24 - 1 and read_ms < 50, read_ms
+            store.close()
+
+        print(f"  ✅ Months of retention OK ({last * 1e6:.1f}µs per append after 6 months, "
+              f"90-day hourly read {read_ms:.1f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Months of retention failed: {e}")
+        return False
+
+
+def test_data_collector_snapshots():
+    """collect_system_snapshot doesn't block, appends to the ring and migrates system_metrics.json"""
+    print("🧪 Testing DataCollector snapshots...")
+    home = os.environ.get("HOME")
+    try:
+        from data.collector import DataCollector
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ["HOME"] = tmp
+            data_dir = os.path.join(tmp, "Desktop", "JarvisData")
+            os.makedirs(data_dir)
+            old = [{"timestamp": (datetime.now() - timedelta(hours=2, minutes=5 * i)).isoformat(),
+                    "cpu_percent": 10.0, "memory_percent": 20.0, "disk_percent": 30.0,
+                    "running_apps": 100, "network_io": {"bytes_sent": 1, "bytes_recv": 2}}
+                   for i in range(12, 0, -1)]
+            with open(os.path.join(data_dir, "system_metrics.json"), "w") as f:
+                json.dump({"snapshots": old}, f)
+
+            collector = DataCollector(consent=True)
+            assert not os.path.exists(os.path.join(data_dir, "system_metrics.json"))
+            with open(os.path.join(data_dir, "README.txt"), encoding="utf-8") as f:
+                readme = f.read()
+            assert "(raw 30 días; promedios por hora 2 años, por día 10 años)" in readme
+            assert "por minuto" not in readme and "(raw, 1h, 1d)" in readme
+            start = time.perf_counter()
+            snapshot = collector.collect_system_snapshot()
+            elapsed = time.perf_counter() - start
+            assert elapsed < 0.5 and set(snapshot) >= {"timestamp", "cpu_percent", "network_io"}, elapsed
+
+            history = collector.get_system_history("raw")
+            assert len(history["timestamp"]) == 13 and list(history["cpu_percent"][:12]) == [10.0] * 12
+            recent = collector.get_system_history("raw", since=datetime.now() - timedelta(minutes=1),
+                                                  fields=["memory_percent"])
+            assert list(recent["memory_percent"]) == [snapshot["memory_percent"]]
+            collector.close()
+
+            collector = DataCollector(consent=True)  # the migration is not repeated
+            assert len(collector.get_system_history("raw")["timestamp"]) == 13
+            collector.close()
+
+        print(f"  ✅ DataCollector snapshots OK (snapshot in {elapsed * 1000:.1f}ms)")
+        return True
+    except Exception as e:
+        print(f"  ❌ DataCollector snapshots failed: {e}")
+        return False
+    finally:
+        if home is not None:
+            os.environ["HOME"] = home
+
+
+if __name__ == "__main__":
+    results = [
+        test_ring_wraps_in_order(),
+        test_downsampling_tiers(),
+        test_numpy_reads_and_fallback(),
+        test_months_of_data_constant_cost(),
+        test_data_collector_snapshots(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)
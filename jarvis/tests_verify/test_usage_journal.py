@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Usage journal tests
+DataCollector.track_app_usage and ContextAwareness.record_interaction keep
+their state in memory and append one journal line per call; the JSON is
+rewritten (temp file + rename) only on flush — from a scheduler job or at
+shutdown — and a crash between flushes is recovered from the journal
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _wait(predicate, timeout=2.0):
+    end = time.time() + timeout
+    while time.time() < end:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def _lines(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def test_app_usage_in_memory():
+    """track_app_usage appends to the journal only; flush() rewrites app_usage.json atomically"""
+    print("🧪 Testing app usage counters...")
+    home = os.environ.get("HOME")
+    try:
+        from data.collector import DataCollector
+
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ["HOME"] = tmp
+            os.makedirs(os.path.join(tmp, "Desktop"))
+            collector = DataCollector(consent=True)
+            usage_file = collector.app_usage_file
+            before = usage_file.read_bytes()
+
+            for i in range(30):
+                collector.track_app_usage("chrome" if i % 3 else "spotify")
+            assert usage_file.read_bytes() == before  # not touched per call
+            assert len(_lines(collector.app_usage.journal_path)) == 30
+            assert collector.get_suggestions()[0] == "App frecuente: chrome (usado 20 veces)"
+
+            assert collector.flush() is True and collector.flush() is False  # dirty flag
+            apps = json.loads(usage_file.read_text())
+            assert apps["chrome"]["count"] == 20 and apps["spotify"]["count"] == 10, apps
+            assert _lines(collector.app_usage.journal_path) == []
+            assert not os.path.exists(str(usage_file) + ".tmp")
+
+            collector.track_app_usage("spotify")
+            collector.close()  # shutdown flushes
+            assert json.loads(usage_file.read_text())["spotify"]["count"] == 11
+
+        print("  ✅ App usage counters OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ App usage counters failed: {e}")
+        return False
+    finally:
+        if home is not None:
+            os.environ["HOME"] = home
+
+
+def test_crash_recovery():
+    """Journal lines written before a crash are replayed once, even if the journal outlived a flush"""
+    print("🧪 Testing crash recovery...")
+    try:
+        from data.journal import JournaledState
+        from skills.learning.context_awareness import ContextAwareness
+
+        with tempfile.TemporaryDirectory() as tmp:
+            crashed = ContextAwareness(data_dir=tmp)
+            for i in range(5):
+                crashed.record_interaction("get_time" if i % 2 else "open_app", f"input {i}", "")
+            with open(crashed.store.journal_path, "a", encoding="utf-8") as f:
+                f.write('{"seq": 6, "skill": "tru')  # torn last line
+            del crashed  # no flush / close: as if the process had died here
+
+            recovered = ContextAwareness(data_dir=tmp)
+            assert recovered.data["skill_frequency"] == {"open_app": 3, "get_time": 2}
+            assert len(recovered.data["last_interactions"]) == 5 and recovered.store.dirty
+
+            stale = _lines(recovered.store.journal_path)[:5]
+            recovered.close()
+            with open(recovered.store.journal_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(stale) + "\n")  # crash between the rename and the journal truncate
+            again = ContextAwareness(data_dir=tmp)
+            assert again.data["skill_frequency"] == {"open_app": 3, "get_time": 2}
+            assert len(again.data["last_interactions"]) == 5
+            again.close()
+
+            counters = JournaledState(os.path.join(tmp, "apps.json"), dict,
+                                      lambda state, op: state.__setitem__(op["app"], op["count"]))
+            counters.record({"app": "code", "count": 1})
+            counters.record({"app": "code", "count": 2})
+            assert JournaledState(counters.path, dict, counters.apply).state == {"code": 2}
+            counters.close()
+
+        print("  ✅ Crash recovery OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Crash recovery failed: {e}")
+        return False
+
+
+def test_instances_share_one_store():
+    """Two ContextAwareness on the same file share state: closing one never rolls back the other's flush"""
+    print("🧪 Testing shared store...")
+    try:
+        from skills.learning.context_awareness import ContextAwareness
+
+        with tempfile.TemporaryDirectory() as tmp:
+            leftover = ContextAwareness(data_dir=tmp)
+            for i in range(2):
+                leftover.record_interaction("get_time", f"input {i}", "")
+            del leftover  # died with 2 ops only in the journal
+
+            skill = ContextAwareness(data_dir=tmp)       # ContextAwarenessSkill's instance
+            prefetcher = ContextAwareness(data_dir=tmp)  # engine._create_prefetcher's instance
+            assert skill.store is prefetcher.store and skill.data["journal_seq"] == 2
+            for i in range(4):
+                skill.record_interaction("open_app", f"abrí {i}", "")
+            assert prefetcher.data["skill_frequency"]["open_app"] == 4
+            skill.flush()
+            prefetcher.close()
+            with open(skill.context_file, encoding="utf-8") as f:
+                assert json.load(f)["journal_seq"] == 6
+            prefetcher.close()  # idempotent: doesn't release the other owner's reference
+            skill.record_interaction("open_app", "abrí 4", "")
+            assert len(_lines(skill.store.journal_path)) == 1
+            skill.close()
+            with open(skill.context_file, encoding="utf-8") as f:
+                assert json.load(f)["journal_seq"] == 7
+
+        print("  ✅ Shared store OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Shared store failed: {e}")
+        return False
+
+
+def test_context_awareness_constant_cost():
+    """With 1000 interactions stored, recording one more costs a journal line, not a 1000-entry rewrite"""
+    print("🧪 Testing per-interaction cost...")
+    try:
+        from skills.learning.context_awareness import ContextAwareness
+
+        with tempfile.TemporaryDirectory() as tmp:
+            awareness = ContextAwareness(data_dir=tmp)
+            start = datetime(2026, 10, 1, 9)
+            for i in range(1200):
+                awareness.record_interaction(f"skill_{i % 7}", "x" * 200, "", start + timedelta(minutes=i))
+            awareness.flush()
+            snapshot_size = os.path.getsize(awareness.context_file)
+
+            t0 = time.perf_counter()
+            for i in range(200):
+                awareness.record_interaction("get_time", "qué hora es", "")
+            per_call_us = (time.perf_counter() - t0) / 200 * 1e6
+            assert os.path.getsize(awareness.context_file) == snapshot_size
+            assert os.path.getsize(awareness.store.journal_path) < 200 * 250
+            assert per_call_us < 500, per_call_us
+
+            assert len(awareness.data["last_interactions"]) == 1000
+            assert awareness.data["last_interactions"][-1]["input"] == "qué hora es"
+            assert awareness.get_context_summary()["total_interactions"] == 1000
+            awareness.close()
+            on_disk = ContextAwareness(data_dir=tmp)
+            assert on_disk.data["journal_seq"] == 1400 and on_disk.data["skill_frequency"]["get_time"] == 200
+            assert all(len(i["input"]) <= 100 for i in on_disk.data["last_interactions"])
+            on_disk.close()
+
+        print(f"  ✅ Per-interaction cost OK ({per_call_us:.0f}µs per record_interaction with 1000 stored)")
+        return True
+    except Exception as e:
+        print(f"  ❌ Per-interaction cost failed: {e}")
+        return False
+
+
+def test_scheduled_flush():
+    """A scheduler job flushes pending changes; nothing is written while the state is clean"""
+    print("🧪 Testing scheduled flush...")
+    try:
+        from core.lifecycle.runtime import Scheduler
+        from skills.learning.context_awareness import ContextAwareness
+
+        with tempfile.TemporaryDirectory() as tmp:
+            sched = Scheduler()
+            sched.start()
+            awareness = ContextAwareness(data_dir=tmp, scheduler=sched, flush_interval=0.05)
+            assert not os.listdir(tmp)  # reading/idle creates no files
+            awareness.record_interaction("open_app", "abrí chrome", "")
+            assert _wait(lambda: os.path.exists(awareness.context_file)), "never flushed"
+            assert _wait(lambda: not awareness.store.dirty)
+            flushes = awareness.store.get_stats()["flushes"]
+            time.sleep(0.2)
+            assert awareness.store.get_stats()["flushes"] == flushes  # clean: no rewrites
+            sched.stop()
+            awareness.close()
+            with open(awareness.context_file, encoding="utf-8") as f:
+                assert json.load(f)["skill_frequency"] == {"open_app": 1}
+
+        print("  ✅ Scheduled flush OK")
+        return True
+    except Exception as e:
+        print(f"  ❌ Scheduled flush failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    results = [
+        test_app_usage_in_memory(),
+        test_crash_recovery(),
+        test_instances_share_one_store(),
+        test_context_awareness_constant_cost(),
+        test_scheduled_flush(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} tests passed")
+    sys.exit(0 if all(results) else 1)